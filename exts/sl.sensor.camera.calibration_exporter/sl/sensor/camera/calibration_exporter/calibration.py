@@ -2,11 +2,12 @@
 import omni.usd
 import math
 import configparser
+import os
 from pxr import Gf, UsdGeom
 import platform
 import carb
 import random
-from typing import Tuple
+from typing import Optional, Tuple
 
 def quat_to_rodrigues(quat: Gf.Quatd):
     """
@@ -65,21 +66,21 @@ def get_camera_config(camera_model: str) -> Tuple[str, bool]:
     # Use get() to gracefully handle unknown models
     return camera_configs.get(camera_model, camera_configs["ZED_XONE_GS"])
 
-def write_stereo_calibration_file(left_prim_path: str, right_prim_path: str, serial_number: str, camera_model:str):
+def compute_stereo_calibration(left_prim_path: str, right_prim_path: str, camera_model: str) -> Optional[configparser.ConfigParser]:
     """
     Computes the relative transform between left and right camera prims
-    and writes a stereo calibration file.
+    as the STEREO and SIM sections of a calibration file, or None if the prims are invalid.
     """
     stage = omni.usd.get_context().get_stage()
     if stage is None:
         carb.log_warn("No stage loaded")
-        return
+        return None
 
     left_prim = stage.GetPrimAtPath(left_prim_path)
     right_prim = stage.GetPrimAtPath(right_prim_path)
     if not left_prim or not right_prim:
         carb.log_warn("Invalid prim paths")
-        return
+        return None
 
     is_camera = False
     if left_prim.IsA(UsdGeom.Camera) and right_prim.IsA(UsdGeom.Camera):
@@ -114,7 +115,7 @@ def write_stereo_calibration_file(left_prim_path: str, right_prim_path: str, ser
 
     if left_xform is None or right_xform is None:
         carb.log_warn("Prims do not have transform attributes")
-        return
+        return None
 
     # Convert USD GfMatrix4d to translation + rotation (Euler)
     def decompose_gf_matrix(mat):
@@ -152,11 +153,23 @@ def write_stereo_calibration_file(left_prim_path: str, right_prim_path: str, ser
     cfg['SIM'] = {}
     cfg['SIM']['is_4mm'] = "1" if is_4mm else "0"
     cfg['SIM']['camera_model'] = cam_model
+    return cfg
+
+def write_stereo_calibration_file(left_prim_path: str, right_prim_path: str, serial_number: str, camera_model:str,
+                                  output_dir: Optional[str] = None) -> Optional[str]:
+    """
+    Writes the stereo calibration of two camera prims to SN<serial_number>.conf, in the ZED SDK settings folder
+    unless output_dir is given. Returns the path of the file, or None if the calibration could not be computed.
+    """
+    cfg = compute_stereo_calibration(left_prim_path, right_prim_path, camera_model)
+    if cfg is None:
+        return None
 
     # Write to file
-    full_path = get_calibration_file_path() + f"SN{serial_number}.conf"
+    full_path = os.path.join(output_dir, f"SN{serial_number}.conf") if output_dir else get_calibration_file_path() + f"SN{serial_number}.conf"
 
     with open(full_path, 'w') as f:
         cfg.write(f)
 
     carb.log_warn(f"Stereo calibration file saved to {full_path}")
+    return full_path
@@ -0,0 +1,84 @@
+# Frame rate of the dataset export (ZEDAnnotator export_dir) against the number of encoding worker processes.
+#
+# Stereo frames of synthetic content are written with DatasetWriter as fast as they are accepted, blocking when
+# queue_depth frames are being encoded, so that the frame rate is bound by the workers. Images are smooth gradients
+# with noise, which compress about like rendered images. Does not need Isaac Sim:
+#   python dataset_export_benchmark.py --output /tmp/zed_export [--resolution 1920 1200] [--workers 1 2 4 8]
+#                                      [--formats png jpg] [--frames 200]
+
+import argparse
+import os
+import shutil
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "sl", "sensor", "camera"))
+
+from dataset_export import DatasetWriter
+
+
+def make_frames(width: int, height: int, count: int) -> list:
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    frames = []
+    for i in range(count):
+        image = np.empty((height, width, 4), dtype=np.uint8)
+        image[..., 0] = (x + 3 * i) % 256
+        image[..., 1] = (y + 5 * i) % 256
+        image[..., 2] = np.clip((x + y) / 2 + rng.normal(0, 4, (height, width)), 0, 255)
+        image[..., 3] = 255
+        frames.append(image)
+    return frames
+
+
+def run(output: str, image_format: str, workers: int, frames: list, frame_count: int, queue_depth: int) -> dict:
+    shutil.rmtree(output, ignore_errors=True)
+    writer = DatasetWriter(output, image_format, workers, queue_depth, block=True)
+    imu = [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 9.81, 0.0, 0.0, 0.0]
+
+    start = time.perf_counter()
+    write_time = 0.0
+    for i in range(frame_count):
+        call_start = time.perf_counter()
+        writer.write(i, i / 30.0, frames[i % len(frames)], frames[(i + 1) % len(frames)], imu)
+        write_time += time.perf_counter() - call_start
+    writer.close()
+    elapsed = time.perf_counter() - start
+
+    stats = writer.get_stats()
+    return {
+        "fps": stats["framesWritten"] / elapsed,
+        "errors": stats["errors"],
+        "mb_per_frame": stats["bytesWritten"] / max(1, stats["framesWritten"]) / 1e6,
+        "write_ms": 1e3 * write_time / frame_count,
+    }
+
+
+# Worker processes may import this script again
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output", required=True, help="Folder the frames are written to, erased before every run")
+    parser.add_argument("--resolution", type=int, nargs=2, default=[1920, 1200])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--formats", nargs="+", default=["png", "jpg"])
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--queue-depth", type=int, default=0, help="Frames encoded at a time, twice the workers by default")
+    args = parser.parse_args()
+
+    width, height = args.resolution
+    frames = make_frames(width, height, 8)
+
+    print(f"Stereo {width}x{height}, {args.frames} frames, {os.cpu_count()} CPUs")
+    print(f"{'format':>6} {'workers':>8} {'frames/s':>9} {'MB/frame':>9} {'write ms':>9} {'errors':>7}")
+    for image_format in args.formats:
+        for workers in args.workers:
+            queue_depth = args.queue_depth or 2 * workers
+            result = run(args.output, image_format, workers, frames, args.frames, queue_depth)
+            print(
+                f"{image_format:>6} {workers:>8} {result['fps']:>9.1f} {result['mb_per_frame']:>9.2f} "
+                f"{result['write_ms']:>9.2f} {result['errors']:>7}"
+            )
+    shutil.rmtree(args.output, ignore_errors=True)
@@ -0,0 +1,190 @@
+// Microbenchmark comparing the sl::FrameQueue the streaming thread waits on with the previous 100 us polling loop.
+//
+// A producer publishes frames at a fixed rate, a consumer waits for them and records the wakeup latency
+// (time between the push of a frame and the consumer getting it) and the CPU time it burns while idle.
+//
+// Build and run (Linux):
+//   g++ -O2 -std=c++17 -pthread -I../include frame_queue_benchmark.cpp -o frame_queue_benchmark
+//   ./frame_queue_benchmark [fps=60] [seconds=5] [streamers=8]
+
+#include <algorithm>
+#include <array>
+#include <atomic>
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <ctime>
+#include <memory>
+#include <thread>
+#include <vector>
+
+#include "frame_queue.hpp"
+
+namespace
+{
+    using Clock = std::chrono::steady_clock;
+
+    struct Frame {
+        Clock::time_point written;
+    };
+
+    // Double buffer polled by the streaming thread before sl::FrameQueue, kept here as the reference
+    template <typename T>
+    class PollingDoubleBuffer {
+    private:
+        std::array<std::shared_ptr<T>, 2> buffers_;
+        std::atomic<int> front_index_{ 0 };
+        std::atomic<int> frame_index_{ 0 };
+
+    public:
+        PollingDoubleBuffer() {
+            buffers_[0] = std::make_shared<T>();
+            buffers_[1] = std::make_shared<T>();
+        }
+
+        void write(std::shared_ptr<T> data) {
+            int back_index = 1 - front_index_.load(std::memory_order_relaxed);
+            std::atomic_store_explicit(&buffers_[back_index], std::move(data), std::memory_order_release);
+            front_index_.store(back_index, std::memory_order_release);
+            frame_index_.fetch_add(1, std::memory_order_release);
+        }
+
+        std::shared_ptr<T> wait_and_read(std::atomic<bool>& shouldStop, int& frameIndex) {
+            while (true) {
+                int current_index = frame_index_.load(std::memory_order_acquire);
+                if (current_index != frameIndex) {
+                    frameIndex = current_index;
+                    int index = front_index_.load(std::memory_order_acquire);
+                    return std::atomic_load_explicit(&buffers_[index], std::memory_order_acquire);
+                }
+                if (shouldStop.load(std::memory_order_acquire)) {
+                    return nullptr;
+                }
+                std::this_thread::sleep_for(std::chrono::microseconds(100));
+            }
+        }
+
+        void notify_stop() {}
+    };
+
+    // sl::FrameQueue as used by the streaming thread, behind the interface of the polling double buffer
+    template <typename T, sl::OverflowPolicy Policy>
+    class QueueBuffer {
+    private:
+        sl::FrameQueue<T> queue_;
+        std::atomic<bool> producer_stop_{ false };
+
+    public:
+        QueueBuffer() {
+            queue_.configure(Policy, 4);
+        }
+
+        void write(std::shared_ptr<T> data) {
+            queue_.push(std::move(data), producer_stop_);
+        }
+
+        std::shared_ptr<T> wait_and_read(std::atomic<bool>& shouldStop, int& /*frameIndex*/) {
+            return queue_.wait_and_pop(shouldStop);
+        }
+
+        void notify_stop() {
+            queue_.notify_stop();
+        }
+    };
+
+    double threadCpuSeconds()
+    {
+        timespec ts;
+        clock_gettime(CLOCK_THREAD_CPUTIME_ID, &ts);
+        return ts.tv_sec + ts.tv_nsec * 1e-9;
+    }
+
+    struct Result {
+        std::vector<double> latencies_us;
+        double consumer_cpu_s{ 0.0 };
+    };
+
+    template <typename Buffer>
+    Result runStreamer(int fps, double seconds)
+    {
+        Buffer buffer;
+        std::atomic<bool> should_stop{ false };
+        Result result;
+
+        std::thread consumer([&] {
+            const double cpu_start = threadCpuSeconds();
+            int frame_index = 0;
+            while (!should_stop.load()) {
+                auto frame = buffer.wait_and_read(should_stop, frame_index);
+                if (!frame)
+                    continue;
+                const auto latency = std::chrono::duration<double, std::micro>(Clock::now() - frame->written);
+                result.latencies_us.push_back(latency.count());
+            }
+            result.consumer_cpu_s = threadCpuSeconds() - cpu_start;
+        });
+
+        const auto period = std::chrono::duration_cast<Clock::duration>(std::chrono::duration<double>(1.0 / fps));
+        const int frame_count = static_cast<int>(fps * seconds);
+        auto next = Clock::now();
+        for (int i = 0; i < frame_count; i++) {
+            next += period;
+            std::this_thread::sleep_until(next);
+            auto frame = std::make_shared<Frame>();
+            frame->written = Clock::now();
+            buffer.write(std::move(frame));
+        }
+
+        should_stop.store(true);
+        buffer.notify_stop();
+        consumer.join();
+        return result;
+    }
+
+    template <typename Buffer>
+    void runBenchmark(const char* name, int fps, double seconds, int streamers)
+    {
+        std::vector<Result> results(streamers);
+        std::vector<std::thread> threads;
+        for (int i = 0; i < streamers; i++) {
+            threads.emplace_back([&, i] { results[i] = runStreamer<Buffer>(fps, seconds); });
+        }
+        for (auto& t : threads) {
+            t.join();
+        }
+
+        std::vector<double> latencies;
+        double cpu = 0.0;
+        for (const auto& r : results) {
+            latencies.insert(latencies.end(), r.latencies_us.begin(), r.latencies_us.end());
+            cpu += r.consumer_cpu_s;
+        }
+        std::sort(latencies.begin(), latencies.end());
+
+        double mean = 0.0;
+        for (double l : latencies) {
+            mean += l;
+        }
+        mean /= std::max<size_t>(latencies.size(), 1);
+        auto percentile = [&](double p) {
+            return latencies.empty() ? 0.0 : latencies[static_cast<size_t>(p * (latencies.size() - 1))];
+        };
+
+        printf("%-12s frames %6zu | wakeup latency us: mean %7.1f p50 %7.1f p99 %7.1f max %8.1f | consumer CPU %5.2f%% of one core per streamer\n",
+            name, latencies.size(), mean, percentile(0.5), percentile(0.99), percentile(1.0),
+            100.0 * cpu / (seconds * streamers));
+    }
+}
+
+int main(int argc, char** argv)
+{
+    const int fps = argc > 1 ? std::atoi(argv[1]) : 60;
+    const double seconds = argc > 2 ? std::atof(argv[2]) : 5.0;
+    const int streamers = argc > 3 ? std::atoi(argv[3]) : 8;
+
+    printf("%d streamers at %d fps for %.1f s\n", streamers, fps, seconds);
+    runBenchmark<PollingDoubleBuffer<Frame>>("polling", fps, seconds, streamers);
+    runBenchmark<QueueBuffer<Frame, sl::OverflowPolicy::LATEST>>("queue LATEST", fps, seconds, streamers);
+    runBenchmark<QueueBuffer<Frame, sl::OverflowPolicy::FIFO>>("queue FIFO", fps, seconds, streamers);
+    return 0;
+}
@@ -0,0 +1,90 @@
+# Time taken to build the streaming graphs of ZED camera fleets, one graph edit per camera (ZEDAnnotator.build_graph)
+# against a single edit for the whole fleet (ZEDAnnotator.build_graphs).
+#
+# For every camera count and mode, a new stage is filled with ZED cameras referenced from a camera USD, and their
+# annotators are created with defer_graph, which sets up the cameras and render products only. The streaming graphs are
+# then built and the next app update, which compiles the changed graph, is timed as well: both freeze the UI. The
+# timeline is not played, so the ZED SDK is not needed.
+#
+# Run with the Isaac Sim python:
+#   ./python.sh graph_build_benchmark.py --camera-usd <ext>/data/usd/ZED_XM.usdc --camera-model ZED_XM \
+#       [--counts 1 8 32] [--headless]
+
+import argparse
+import os
+import time
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--camera-usd", required=True, help="USD of the ZED camera referenced for every camera")
+parser.add_argument("--camera-model", default="ZED_XM")
+parser.add_argument("--resolution", default="SVGA")
+parser.add_argument("--counts", type=int, nargs="+", default=[1, 8, 32])
+parser.add_argument("--headless", action="store_true")
+args = parser.parse_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": args.headless})
+
+import omni.kit.app
+
+extension_manager = omni.kit.app.get_app().get_extension_manager()
+extension_manager.add_path(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+extension_manager.set_extension_enabled_immediate("sl.sensor.camera", True)
+
+from isaacsim.core.utils.stage import add_reference_to_stage, create_new_stage
+from pxr import Sdf, UsdGeom
+
+from sl.sensor.camera.annotators import ZEDAnnotator
+
+
+def run(camera_count: int, batched: bool) -> dict:
+    create_new_stage()
+    simulation_app.update()
+
+    camera_prims = []
+    for i in range(camera_count):
+        path = f"/World/ZED_{i}"
+        prim = add_reference_to_stage(args.camera_usd, path)
+        UsdGeom.XformCommonAPI(prim).SetTranslate((0.3 * i, 0.0, 1.0))
+        camera_prims.append([Sdf.Path(path)])
+    simulation_app.update()
+
+    start = time.perf_counter()
+    annotators = [
+        ZEDAnnotator(camera_prim, args.camera_model, 30000 + 2 * i, args.resolution, defer_graph=True)
+        for i, camera_prim in enumerate(camera_prims)
+    ]
+    setup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if batched:
+        ZEDAnnotator.build_graphs(annotators)
+    else:
+        for annotator in annotators:
+            annotator.build_graph(annotator._cams)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    simulation_app.update()
+    update = time.perf_counter() - start
+
+    built = sum(1 for annotator in annotators if annotator.zed_ is not None and annotator.zed_.is_valid())
+    for annotator in annotators:
+        annotator.destroy()
+    simulation_app.update()
+    return {"setup_ms": 1e3 * setup, "build_ms": 1e3 * build, "update_ms": 1e3 * update, "built": built}
+
+
+print(f"{args.camera_model} {args.resolution}")
+print(f"{'cameras':>8} {'mode':>10} {'setup ms':>9} {'graph ms':>9} {'update ms':>10} {'per camera':>11} {'built':>6}")
+for camera_count in args.counts:
+    for batched in (False, True):
+        result = run(camera_count, batched)
+        print(
+            f"{camera_count:>8} {'fleet' if batched else 'per camera':>10} {result['setup_ms']:>9.1f} "
+            f"{result['build_ms']:>9.1f} {result['update_ms']:>10.1f} "
+            f"{(result['build_ms'] + result['update_ms']) / camera_count:>11.2f} {result['built']:>6}"
+        )
+
+simulation_app.close()
@@ -0,0 +1,261 @@
+// Check and benchmark of the high-rate IMU channel (plugins/nodes/ZEDImuChannel.h) against a ZED streaming library,
+// typically the stand-in library of stub/, without Isaac Sim.
+//
+// The check replays tests/test_high_rate_imu.py: 30 frames at 60 fps carrying their own IMU inputs, and one channel
+// sample per frame pushed by the ZED IMU Stream node. OmniGraph does not order the IMU Stream node against the ZED
+// Stream node, so both orders are run, with and without the ingest thread draining between two evaluations, and the
+// last samples given with a frame and to ingest_imu are checked like the test does.
+//
+// The benchmark then streams frames at the camera frame rate while samples are pushed at several IMU rates in real
+// time, reports the samples ingested, superseded by a frame and dropped, and checks from the call log of the stub that
+// the frames and samples reach the ZED SDK in timestamp order.
+//
+// Build and run (Linux), with the USD of the Kit SDK for the pxr Gf types (<usd> is _build/target-deps/usd/release):
+//   g++ -O2 -std=c++17 -shared -fPIC -pthread -I../include ../stub/sl_zed_stub.cpp -o libsl_zed_stub.so
+//   g++ -O2 -std=c++17 -pthread -I../include -I../plugins/nodes -I<usd>/include high_rate_imu_benchmark.cpp \
+//       -L<usd>/lib -lusd_gf -lusd_tf -ldl -o high_rate_imu_benchmark
+//   ./high_rate_imu_benchmark ./libsl_zed_stub.so [fps=60] [seconds=2]
+
+#include <cmath>
+#include <cstdio>
+#include <cstdlib>
+#include <fstream>
+#include <sstream>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include <dlfcn.h>
+#include <unistd.h>
+
+#include <pxr/base/gf/matrix4d.h>
+#include <pxr/base/gf/quatd.h>
+#include <pxr/base/gf/vec3d.h>
+
+PXR_NAMESPACE_USING_DIRECTIVE
+
+#define CARB_LOG_INFO(...) ((void)0)
+#define CARB_LOG_WARN(...) (std::fprintf(stderr, __VA_ARGS__), std::fprintf(stderr, "\n"))
+#define CARB_LOG_ERROR(...) (std::fprintf(stderr, __VA_ARGS__), std::fprintf(stderr, "\n"))
+
+#include "zed_interface_loader.hpp"
+#include "ZEDImuChannel.h"
+
+using namespace sl::sensor::camera;
+
+namespace
+{
+    using Clock = std::chrono::steady_clock;
+    using LastImuFn = bool (*)(unsigned short, long long*, float*, long long*, float*);
+
+    // Streamer timestamp offset, like the one of the ZED Stream node
+    constexpr long long kTimestampOffsetNs = 1000;
+
+    int g_failures = 0;
+
+    void check(bool condition, const char* what)
+    {
+        if (!condition) {
+            printf("  FAILED: %s\n", what);
+            g_failures++;
+        }
+    }
+
+    // IMU sample carried by a frame, like CameraStream::submitSlot: the last one of the channel, or the frame inputs
+    void streamFrame(sl::ZedStreamer& zed_streamer, int streamer_id, ImuChannel& channel, double timestamp,
+        const GfVec3d& frame_linear_acceleration, std::vector<unsigned char>& image)
+    {
+        const long long ts_ns = static_cast<long long>(timestamp * 1000000000) + kTimestampOffsetNs;
+        ImuSample sample;
+        if (!channel.frameSample(ts_ns, sample)) {
+            sample = makeImuSample(timestamp, GfQuatd(1.0, 0.0, 0.0, 0.0), frame_linear_acceleration, GfVec3d(0.0, 0.0, 0.0));
+        }
+        zed_streamer.stream(sl::INPUT_FORMAT::BGR, streamer_id, image.data(), nullptr, ts_ns,
+            sample.orientation[0], sample.orientation[1], sample.orientation[2], sample.orientation[3],
+            sample.linear_acceleration[0], sample.linear_acceleration[1], sample.linear_acceleration[2]);
+    }
+
+    void pushSample(ImuChannel& channel, double timestamp)
+    {
+        channel.push(makeImuSample(timestamp, GfQuatd(1.0, 0.0, 0.0, 0.0), GfVec3d(0.0, 0.0, 9.81), GfVec3d(0.0, 0.0, 0.0)));
+    }
+
+    void runCheck(sl::ZedStreamer& zed_streamer, LastImuFn last_imu, int streamer_id, unsigned short port, bool imu_first,
+        bool drained)
+    {
+        printf("%s node first, ingest thread %s between evaluations\n", imu_first ? "IMU" : "ZED",
+            drained ? "drained" : "not drained");
+
+        std::vector<unsigned char> image(64 * 40 * 3);
+        ImuChannel channel(zed_streamer, streamer_id, 256, kTimestampOffsetNs);
+        channel.start();
+
+        // Frames at 60 fps after the warmup of the test, with linear acceleration inputs ignored once samples are pushed
+        const double warmup_time = 1.0;
+        for (int frame = 1; frame <= 30; frame++) {
+            const double timestamp = warmup_time + frame / 60.0;
+            if (imu_first) {
+                pushSample(channel, timestamp);
+                streamFrame(zed_streamer, streamer_id, channel, timestamp, GfVec3d(1.0, 2.0, 3.0), image);
+            } else {
+                streamFrame(zed_streamer, streamer_id, channel, timestamp, GfVec3d(1.0, 2.0, 3.0), image);
+                pushSample(channel, timestamp);
+            }
+            if (drained) {
+                std::this_thread::sleep_for(std::chrono::milliseconds(2));
+            }
+        }
+        std::this_thread::sleep_for(std::chrono::milliseconds(100));
+        channel.stop();
+
+        long long frame_ts = 0, ingested_ts = 0;
+        float frame_imu[7], ingested_imu[7];
+        check(last_imu(port, &frame_ts, frame_imu, &ingested_ts, ingested_imu), "last IMU samples of the streamer");
+        const double frame_acc = std::sqrt(frame_imu[4] * frame_imu[4] + frame_imu[5] * frame_imu[5] + frame_imu[6] * frame_imu[6]);
+        bool same_values = true;
+        for (int i = 0; i < 7; i++) {
+            same_values = same_values && std::fabs(frame_imu[i] - ingested_imu[i]) < 1e-5f;
+        }
+        printf("  frame ts %lld, ingested ts %lld, frame acceleration %.4f, same values %s | ingested %llu superseded %llu\n",
+            frame_ts, ingested_ts, frame_acc, same_values ? "yes" : "no",
+            static_cast<unsigned long long>(channel.ingestedCount()), static_cast<unsigned long long>(channel.supersededCount()));
+
+        check(std::fabs(frame_acc - 9.81) < 1e-4, "frames carry the channel samples");
+        check(frame_ts >= ingested_ts, "no sample ingested after the last frame");
+        check(ingested_ts == 0 || same_values, "ingested samples are the channel samples");
+    }
+
+    struct LogEntry {
+        std::string function;
+        int streamer_id;
+        long long timestamp_ns;
+    };
+
+    std::vector<LogEntry> readLog(const std::string& path)
+    {
+        std::vector<LogEntry> entries;
+        std::ifstream file(path);
+        std::string line;
+        std::getline(file, line); // header
+        while (std::getline(file, line)) {
+            std::stringstream ss(line);
+            std::string field;
+            LogEntry entry;
+            std::getline(ss, field, ',');
+            std::getline(ss, entry.function, ',');
+            std::getline(ss, field, ',');
+            entry.streamer_id = std::atoi(field.c_str());
+            std::getline(ss, field, ',');
+            entry.timestamp_ns = std::atoll(field.c_str());
+            entries.push_back(entry);
+        }
+        return entries;
+    }
+
+    void runBenchmark(sl::ZedStreamer& zed_streamer, const std::string& log_path, int streamer_id, int fps, int imu_rate,
+        double seconds)
+    {
+        std::vector<unsigned char> image(64 * 40 * 3);
+        ImuChannel channel(zed_streamer, streamer_id, 256, kTimestampOffsetNs);
+        channel.start();
+
+        // Samples pushed at the IMU rate, and a frame streamed every time the camera frame rate allows one
+        const int steps = static_cast<int>(imu_rate * seconds);
+        const auto period = std::chrono::duration_cast<Clock::duration>(std::chrono::duration<double>(1.0 / imu_rate));
+        auto next = Clock::now();
+        int frames = 0;
+        for (int step = 1; step <= steps; step++) {
+            next += period;
+            std::this_thread::sleep_until(next);
+            const double timestamp = static_cast<double>(step) / imu_rate;
+            pushSample(channel, timestamp);
+            if (static_cast<int>(timestamp * fps + 1e-9) > frames) {
+                frames++;
+                streamFrame(zed_streamer, streamer_id, channel, timestamp, GfVec3d(1.0, 2.0, 3.0), image);
+            }
+        }
+        std::this_thread::sleep_for(std::chrono::milliseconds(100));
+        channel.stop();
+
+        // Frames and samples must not be earlier than the previous call of the streamer. A frame can follow the ingestion
+        // of the sample it carries, with the same timestamp.
+        LogEntry last{ "", streamer_id, -1 };
+        unsigned long long out_of_order = 0;
+        for (const LogEntry& entry : readLog(log_path)) {
+            if (entry.streamer_id != streamer_id || (entry.function != "ingest_imu" && entry.function != "stream_rgb"))
+                continue;
+            if (entry.timestamp_ns < last.timestamp_ns || (entry.timestamp_ns == last.timestamp_ns && entry.function == last.function))
+                out_of_order++;
+            last = entry;
+        }
+
+        printf("%5d Hz | frames %5d | samples ingested %6llu superseded %5llu dropped %5llu | out of order %llu\n",
+            imu_rate, frames, static_cast<unsigned long long>(channel.ingestedCount()),
+            static_cast<unsigned long long>(channel.supersededCount()),
+            static_cast<unsigned long long>(channel.droppedCount()), out_of_order);
+        check(out_of_order == 0, "frames and samples in timestamp order");
+        check(channel.ingestedCount() + channel.supersededCount() + channel.droppedCount() == static_cast<uint64_t>(steps),
+            "every sample ingested, superseded or dropped");
+    }
+}
+
+int main(int argc, char** argv)
+{
+    if (argc < 2) {
+        printf("usage: %s <libsl_zed_stub path> [fps=60] [seconds=2]\n", argv[0]);
+        return 1;
+    }
+    const int fps = argc > 2 ? std::atoi(argv[2]) : 60;
+    const double seconds = argc > 3 ? std::atof(argv[3]) : 2.0;
+
+    // Call log of the stub, read when the library is loaded
+    const std::string log_path = "/tmp/high_rate_imu_benchmark_" + std::to_string(getpid()) + ".csv";
+    setenv("SL_ZED_STUB_LOG", log_path.c_str(), 1);
+
+    sl::ZedStreamer zed_streamer;
+    if (!zed_streamer.load_lib(argv[1]) || !zed_streamer.isZEDSDKCompatible()) {
+        printf("Could not load a compatible ZED library from %s\n", argv[1]);
+        return 1;
+    }
+    zed_streamer.load_api();
+
+    // Same library instance as the one loaded by the streamer
+    void* stub = dlopen(argv[1], RTLD_NOW | RTLD_NOLOAD);
+    LastImuFn last_imu = stub ? reinterpret_cast<LastImuFn>(dlsym(stub, "sl_zed_stub_last_imu")) : nullptr;
+    if (!last_imu) {
+        printf("%s is not the stand-in ZED library\n", argv[1]);
+        return 1;
+    }
+
+    // One streamer per run, so that the last samples and the call log of a run are its own
+    const bool orders[4][2] = { { true, true }, { true, false }, { false, true }, { false, false } };
+    const int imu_rates[] = { 200, 400, 1000 };
+    const int streamers = 4 + static_cast<int>(sizeof(imu_rates) / sizeof(imu_rates[0]));
+    for (int i = 0; i < streamers; i++) {
+        sl::StreamingParameters params;
+        params.port = 30100 + 2 * i;
+        params.fps = fps;
+        if (zed_streamer.initStreamer(i, &params) <= 0) {
+            printf("Streamer %d initialization failed\n", i);
+            return 1;
+        }
+    }
+
+    for (int i = 0; i < 4; i++) {
+        runCheck(zed_streamer, last_imu, i, static_cast<unsigned short>(30100 + 2 * i), orders[i][0], orders[i][1]);
+    }
+
+    printf("\nFrames at %d fps for %.1f s\n", fps, seconds);
+    for (int i = 0; i < 3; i++) {
+        runBenchmark(zed_streamer, log_path, 4 + i, fps, imu_rates[i], seconds);
+    }
+
+    for (int i = 0; i < streamers; i++) {
+        zed_streamer.closeStreamer(i);
+    }
+    zed_streamer.destroyInstance();
+    std::remove(log_path.c_str());
+
+    printf("\n%s\n", g_failures == 0 ? "All checks passed" : "Some checks failed");
+    return g_failures == 0 ? 0 : 1;
+}
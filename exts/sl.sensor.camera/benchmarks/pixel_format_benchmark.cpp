@@ -0,0 +1,197 @@
+// Checks the conversions of the ZED Stream node (sl::convertPixels, the CPU reference of the CUDA kernels, and
+// sl::packPixels out of place and in place) against per-byte references written from their definition, and compares
+// their throughput with the plain copy of the 4 bytes per pixel image. Also prints the bytes per frame copied from the
+// GPU for every layout. The CUDA kernels compute the same bytes as sl::convertPixels, from the same per-pixel code.
+//
+// Build and run (Linux):
+//   g++ -O2 -std=c++17 -I../include pixel_format_benchmark.cpp -o pixel_format_benchmark
+//   ./pixel_format_benchmark [width=1920] [height=1200] [iterations=200]
+
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <random>
+#include <vector>
+
+#include "pixel_format.hpp"
+
+namespace
+{
+    using Clock = std::chrono::steady_clock;
+
+    void packPixelsReference(const unsigned char* src, unsigned char* dst, size_t pixel_count)
+    {
+        for (size_t i = 0; i < pixel_count; i++) {
+            dst[i * 3 + 0] = src[i * 4 + 0];
+            dst[i * 3 + 1] = src[i * 4 + 1];
+            dst[i * 3 + 2] = src[i * 4 + 2];
+        }
+    }
+
+    // Compares both implementations on every pixel count up to max_pixels, to cover the tail of the 4-pixel loop
+    bool checkPacking(size_t max_pixels)
+    {
+        std::mt19937 rng(42);
+        std::vector<unsigned char> src(max_pixels * sl::kRgbaPixelSize);
+        for (auto& byte : src) {
+            byte = static_cast<unsigned char>(rng());
+        }
+
+        for (size_t pixels = 0; pixels <= max_pixels; pixels++) {
+            // One guard byte after the packed pixels, which must not be written
+            std::vector<unsigned char> expected(pixels * sl::kPackedPixelSize + 1, 0xA5);
+            std::vector<unsigned char> actual(expected.size(), 0xA5);
+            packPixelsReference(src.data(), expected.data(), pixels);
+            sl::packPixels(src.data(), actual.data(), pixels);
+            if (expected != actual) {
+                printf("packPixels differs from the reference for %zu pixels\n", pixels);
+                return false;
+            }
+
+            // In place
+            std::vector<unsigned char> in_place(src.begin(), src.begin() + pixels * sl::kRgbaPixelSize);
+            sl::packPixels(in_place.data(), in_place.data(), pixels);
+            if (!std::equal(expected.begin(), expected.end() - 1, in_place.begin())) {
+                printf("packPixels in place differs from the reference for %zu pixels\n", pixels);
+                return false;
+            }
+        }
+        return true;
+    }
+
+    // BT.601 limited range, rounded to the nearest with floating point
+    unsigned char luma(int r, int g, int b) { return static_cast<unsigned char>(std::floor((66 * r + 129 * g + 25 * b + 128) / 256.0) + 16); }
+    unsigned char chromaU(int r, int g, int b) { return static_cast<unsigned char>(std::floor((-38 * r - 74 * g + 112 * b + 128) / 256.0) + 128); }
+    unsigned char chromaV(int r, int g, int b) { return static_cast<unsigned char>(std::floor((112 * r - 94 * g - 18 * b + 128) / 256.0) + 128); }
+
+    // One output byte at a time, chroma from the rounded average color of the pixels sharing it
+    std::vector<unsigned char> convertReference(sl::PixelLayout layout, const unsigned char* src, size_t src_pitch, size_t width, size_t height)
+    {
+        std::vector<unsigned char> dst(sl::convertedSize(layout, width, height));
+        auto pixel = [&](size_t x, size_t y) { return src + y * src_pitch + x * sl::kRgbaPixelSize; };
+        auto average = [&](size_t x, size_t y, size_t columns, size_t rows, int channel) {
+            int sum = 0;
+            for (size_t dy = 0; dy < rows; dy++)
+                for (size_t dx = 0; dx < columns; dx++)
+                    sum += pixel(x + dx, y + dy)[channel];
+            const int count = static_cast<int>(columns * rows);
+            return (sum + count / 2) / count;
+        };
+        for (size_t y = 0; y < height; y++) {
+            for (size_t x = 0; x < width; x++) {
+                const unsigned char* p = pixel(x, y);
+                const size_t i = y * width + x;
+                switch (layout) {
+                case sl::PixelLayout::RGB:
+                    dst[i * 3 + 0] = p[0];
+                    dst[i * 3 + 1] = p[1];
+                    dst[i * 3 + 2] = p[2];
+                    break;
+                case sl::PixelLayout::BGR:
+                    dst[i * 3 + 0] = p[2];
+                    dst[i * 3 + 1] = p[1];
+                    dst[i * 3 + 2] = p[0];
+                    break;
+                case sl::PixelLayout::YUYV: {
+                    dst[i * 2] = luma(p[0], p[1], p[2]);
+                    const size_t pair_x = x & ~size_t(1);
+                    const int r = average(pair_x, y, 2, 1, 0), g = average(pair_x, y, 2, 1, 1), b = average(pair_x, y, 2, 1, 2);
+                    dst[i * 2 + 1] = x % 2 == 0 ? chromaU(r, g, b) : chromaV(r, g, b);
+                    break;
+                }
+                case sl::PixelLayout::NV12:
+                    dst[i] = luma(p[0], p[1], p[2]);
+                    if (x % 2 == 0 && y % 2 == 0) {
+                        const int r = average(x, y, 2, 2, 0), g = average(x, y, 2, 2, 1), b = average(x, y, 2, 2, 2);
+                        dst[width * height + y / 2 * width + x] = chromaU(r, g, b);
+                        dst[width * height + y / 2 * width + x + 1] = chromaV(r, g, b);
+                    }
+                    break;
+                default:
+                    std::memcpy(dst.data() + i * sl::kRgbaPixelSize, p, sl::kRgbaPixelSize);
+                    break;
+                }
+            }
+        }
+        return dst;
+    }
+
+    constexpr sl::PixelLayout kLayouts[] = { sl::PixelLayout::RGBA, sl::PixelLayout::RGB, sl::PixelLayout::BGR,
+        sl::PixelLayout::YUYV, sl::PixelLayout::NV12 };
+
+    // Every layout on contiguous and pitched images, as the tiles of a side by side or tiled render product
+    bool checkConversions()
+    {
+        std::mt19937 rng(7);
+        const size_t sizes[][2] = { { 2, 2 }, { 6, 4 }, { 66, 10 }, { 130, 34 } };
+        for (const auto& size : sizes) {
+            for (size_t padding : { size_t(0), size_t(40) }) {
+                const size_t width = size[0], height = size[1];
+                const size_t pitch = width * sl::kRgbaPixelSize + padding;
+                std::vector<unsigned char> src(pitch * height);
+                for (auto& byte : src) {
+                    byte = static_cast<unsigned char>(rng());
+                }
+                for (sl::PixelLayout layout : kLayouts) {
+                    const std::vector<unsigned char> expected = convertReference(layout, src.data(), pitch, width, height);
+                    std::vector<unsigned char> actual(expected.size() + 1, 0xA5);
+                    sl::convertPixels(layout, src.data(), pitch, width, height, actual.data());
+                    if (!std::equal(expected.begin(), expected.end(), actual.begin()) || actual.back() != 0xA5) {
+                        printf("convertPixels to %s differs from the reference for %zux%zu pixels, row pitch %zu\n",
+                            sl::pixelLayoutName(layout), width, height, pitch);
+                        return false;
+                    }
+                }
+            }
+        }
+        return true;
+    }
+
+    template <typename Fn>
+    double measureGBps(Fn fn, size_t bytes, int iterations)
+    {
+        fn();
+        const auto start = Clock::now();
+        for (int i = 0; i < iterations; i++) {
+            fn();
+        }
+        const double elapsed = std::chrono::duration<double>(Clock::now() - start).count();
+        return bytes * static_cast<double>(iterations) / elapsed * 1e-9;
+    }
+}
+
+int main(int argc, char** argv)
+{
+    const size_t width = argc > 1 ? std::atoi(argv[1]) : 1920;
+    const size_t height = argc > 2 ? std::atoi(argv[2]) : 1200;
+    const int iterations = argc > 3 ? std::atoi(argv[3]) : 200;
+
+    if (!checkPacking(67) || !checkConversions()) {
+        return 1;
+    }
+
+    const size_t pixels = width * height;
+    std::vector<unsigned char> rgba(pixels * sl::kRgbaPixelSize, 0x7F);
+    std::vector<unsigned char> copy(rgba.size());
+    const size_t row_size = width * sl::kRgbaPixelSize;
+
+    // Throughput is given in bytes read from the 4 bytes per pixel image
+    const double memcpy_gbps = measureGBps([&] { std::memcpy(copy.data(), rgba.data(), rgba.size()); }, rgba.size(), iterations);
+    const double packed_gbps = measureGBps([&] { sl::packPixels(rgba.data(), copy.data(), pixels); }, rgba.size(), iterations);
+
+    printf("%zux%zu, %zu bytes per frame\n", width, height, rgba.size());
+    printf("memcpy               %6.2f GB/s (%.3f ms per frame)\n", memcpy_gbps, rgba.size() / memcpy_gbps * 1e-6);
+    printf("sl::packPixels       %6.2f GB/s (%.3f ms per frame)\n", packed_gbps, rgba.size() / packed_gbps * 1e-6);
+    printf("\nsl::convertPixels, and the bytes copied from the GPU once converted by the CUDA kernels:\n");
+    for (sl::PixelLayout layout : kLayouts) {
+        const size_t converted = sl::convertedSize(layout, width, height);
+        const double gbps = measureGBps([&] { sl::convertPixels(layout, rgba.data(), row_size, width, height, copy.data()); },
+            rgba.size(), iterations);
+        printf("%-5s %6.2f GB/s (%.3f ms per frame), %zu bytes copied (%.0f%%)\n", sl::pixelLayoutName(layout), gbps,
+            rgba.size() / gbps * 1e-6, converted, 100.0 * converted / rgba.size());
+    }
+    return 0;
+}
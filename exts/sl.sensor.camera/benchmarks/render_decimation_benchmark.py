@@ -0,0 +1,100 @@
+# Per-frame time of a mixed-rate ZED rig rendering every camera on every simulated frame, against each camera rendering
+# only the frames its frame rate streams (render_decimation option of ZEDAnnotator).
+#
+# The rig holds one camera at the fast frame rate and the others at the slow one. The simulation is stepped with
+# rendering at the rate of the fast camera; frame times are measured after a warmup long enough for the ZED nodes to open
+# their streamers, and reported with the frames rendered and streamed by a slow camera.
+#
+# Run with the Isaac Sim python, with the stand-in ZED library so that encoding does not bound the frame rate:
+#   SL_ZED_LIBRARY=<ext>/bin/libsl_zed_stub.so ./python.sh render_decimation_benchmark.py \
+#       --camera-usd <ext>/data/usd/ZED_XM.usdc --camera-model ZED_XM [--slow-counts 1 4 8] [--headless]
+
+import argparse
+import os
+import statistics
+import time
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--camera-usd", required=True, help="USD of the ZED camera referenced for every camera")
+parser.add_argument("--camera-model", default="ZED_XM")
+parser.add_argument("--resolution", default="HD1200")
+parser.add_argument("--fast-fps", type=int, default=60)
+parser.add_argument("--slow-fps", type=int, default=15)
+parser.add_argument("--slow-counts", type=int, nargs="+", default=[1, 4, 8], help="Slow cameras next to the fast one")
+parser.add_argument("--warmup-steps", type=int, default=120)
+parser.add_argument("--steps", type=int, default=600)
+parser.add_argument("--headless", action="store_true")
+args = parser.parse_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": args.headless})
+
+import omni.kit.app
+
+extension_manager = omni.kit.app.get_app().get_extension_manager()
+extension_manager.add_path(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+extension_manager.set_extension_enabled_immediate("sl.sensor.camera", True)
+
+from isaacsim.core.api import World
+from isaacsim.core.utils.stage import add_reference_to_stage, create_new_stage
+from pxr import Sdf, UsdGeom
+
+from sl.sensor.camera.annotators import ZEDAnnotator
+
+
+def run(slow_count: int, decimation: bool) -> dict:
+    create_new_stage()
+    world = World(stage_units_in_meters=1.0, rendering_dt=1.0 / args.fast_fps)
+
+    frame_rates = [args.fast_fps] + [args.slow_fps] * slow_count
+    camera_prims = []
+    for i in range(len(frame_rates)):
+        path = f"/World/ZED_{i}"
+        prim = add_reference_to_stage(args.camera_usd, path)
+        UsdGeom.XformCommonAPI(prim).SetTranslate((0.3 * i, 0.0, 1.0))
+        camera_prims.append([Sdf.Path(path)])
+
+    world.reset()
+    annotators = [
+        ZEDAnnotator(camera_prim, args.camera_model, 30000 + 2 * i, args.resolution, fps, render_decimation=decimation)
+        for i, (camera_prim, fps) in enumerate(zip(camera_prims, frame_rates))
+    ]
+
+    for _ in range(args.warmup_steps):
+        world.step(render=True)
+    streamed_before = annotators[-1].get_stream_stats().get("framesStreamed", 0)
+    rendered_before = annotators[-1].get_render_stats().get("framesRendered", args.warmup_steps)
+
+    frame_times = []
+    for _ in range(args.steps):
+        start = time.perf_counter()
+        world.step(render=True)
+        frame_times.append(time.perf_counter() - start)
+    streamed = annotators[-1].get_stream_stats().get("framesStreamed", 0) - streamed_before
+    rendered = annotators[-1].get_render_stats().get("framesRendered", args.warmup_steps + args.steps) - rendered_before
+
+    for annotator in annotators:
+        annotator.destroy()
+    world.stop()
+    world.clear_instance()
+    return {
+        "frame_ms": 1e3 * statistics.mean(frame_times),
+        "p95_ms": 1e3 * statistics.quantiles(frame_times, n=20)[-1],
+        "slow_rendered": rendered,
+        "slow_streamed": streamed,
+    }
+
+
+print(f"{args.camera_model} {args.resolution}, one camera at {args.fast_fps} fps and the others at {args.slow_fps} fps, "
+      f"{args.steps} steps")
+print(f"{'slow cameras':>12} {'decimation':>11} {'frame ms':>9} {'p95 ms':>8} {'slow rendered':>14} {'slow streamed':>14}")
+for slow_count in args.slow_counts:
+    for decimation in (False, True):
+        result = run(slow_count, decimation)
+        print(
+            f"{slow_count:>12} {'on' if decimation else 'off':>11} {result['frame_ms']:>9.2f} {result['p95_ms']:>8.2f} "
+            f"{result['slow_rendered']:>14} {result['slow_streamed']:>14}"
+        )
+
+simulation_app.close()
@@ -0,0 +1,164 @@
+// Throughput and backpressure benchmark of the asynchronous streaming path against a ZED streaming library,
+// typically the stand-in library of stub/ with an artificial encode latency.
+//
+// For every overflow policy, a producer publishes host frames at a fixed rate to each streamer through a
+// sl::FrameQueue, and one streaming thread per streamer calls ZedStreamer::stream like the ZED Stream node does.
+//
+// Build and run (Linux):
+//   g++ -O2 -std=c++17 -shared -fPIC -pthread -I../include ../stub/sl_zed_stub.cpp -o libsl_zed_stub.so
+//   g++ -O2 -std=c++17 -pthread -I../include streaming_benchmark.cpp -ldl -o streaming_benchmark
+//   SL_ZED_STUB_ENCODE_LATENCY_US=20000 ./streaming_benchmark ./libsl_zed_stub.so [fps=60] [seconds=3] [streamers=4] [depth=4]
+
+#include <cstdio>
+#include <cstdlib>
+#include <memory>
+#include <thread>
+#include <vector>
+
+#define CARB_LOG_INFO(...) ((void)0)
+#define CARB_LOG_WARN(...) ((void)0)
+#define CARB_LOG_ERROR(...) (std::fprintf(stderr, __VA_ARGS__), std::fprintf(stderr, "\n"))
+
+#include "zed_interface_loader.hpp"
+#include "frame_queue.hpp"
+
+namespace
+{
+    using Clock = std::chrono::steady_clock;
+
+    struct Frame {
+        std::vector<unsigned char> left;
+        long long timestamp_ns{ 0 };
+    };
+
+    struct Result {
+        sl::FrameQueue<Frame>::Stats queue;
+        unsigned long long streamed{ 0 };
+        unsigned long long errors{ 0 };
+    };
+
+    Result runStreamer(sl::ZedStreamer& zed_streamer, int streamer_id, sl::OverflowPolicy policy, size_t depth,
+        int fps, double seconds, size_t frame_size)
+    {
+        sl::FrameQueue<Frame> queue;
+        queue.configure(policy, depth);
+        std::atomic<bool> should_stop{ false };
+        std::atomic<unsigned long long> streamed{ 0 };
+        std::atomic<unsigned long long> errors{ 0 };
+
+        std::thread consumer([&] {
+            while (!should_stop.load()) {
+                auto frame = queue.wait_and_pop(should_stop);
+                if (!frame)
+                    continue;
+                const int status = zed_streamer.stream(sl::INPUT_FORMAT::BGR, streamer_id, frame->left.data(), nullptr,
+                    frame->timestamp_ns, 1.f, 0.f, 0.f, 0.f, 0.f, 0.f, 0.f);
+                if (status > 0)
+                    streamed++;
+                else
+                    errors++;
+            }
+        });
+
+        const auto period = std::chrono::duration_cast<Clock::duration>(std::chrono::duration<double>(1.0 / fps));
+        const int frame_count = static_cast<int>(fps * seconds);
+        auto next = Clock::now();
+        for (int i = 0; i < frame_count; i++) {
+            next += period;
+            std::this_thread::sleep_until(next);
+            auto frame = std::make_shared<Frame>();
+            frame->left.resize(frame_size);
+            frame->timestamp_ns = static_cast<long long>(i) * 1000000000LL / fps;
+            queue.push(std::move(frame), should_stop);
+        }
+
+        // Let the streaming thread drain the queue before stopping it
+        auto pending = [&] {
+            const auto stats = queue.stats();
+            return stats.pushed - stats.coalesced > streamed + errors;
+        };
+        while (pending()) {
+            std::this_thread::sleep_for(std::chrono::milliseconds(1));
+        }
+        should_stop.store(true);
+        queue.notify_stop();
+        consumer.join();
+
+        Result result;
+        result.queue = queue.stats();
+        result.streamed = streamed;
+        result.errors = errors;
+        return result;
+    }
+
+    void runBenchmark(sl::ZedStreamer& zed_streamer, const char* name, sl::OverflowPolicy policy, size_t depth,
+        int fps, double seconds, int streamers)
+    {
+        std::vector<Result> results(streamers);
+        std::vector<std::thread> threads;
+        const auto start = Clock::now();
+        for (int i = 0; i < streamers; i++) {
+            threads.emplace_back([&, i] {
+                results[i] = runStreamer(zed_streamer, i, policy, depth, fps, seconds, 1920 * 1200 * 4);
+            });
+        }
+        for (auto& t : threads) {
+            t.join();
+        }
+        const double elapsed = std::chrono::duration<double>(Clock::now() - start).count();
+
+        Result total;
+        for (const auto& r : results) {
+            total.queue.pushed += r.queue.pushed;
+            total.queue.dropped += r.queue.dropped;
+            total.queue.coalesced += r.queue.coalesced;
+            total.queue.blocked += r.queue.blocked;
+            total.streamed += r.streamed;
+            total.errors += r.errors;
+        }
+
+        printf("%-7s streamed %6llu (%6.1f fps per streamer) | errors %5llu | dropped %6llu coalesced %6llu blocked %6llu | %.2f s\n",
+            name, total.streamed, total.streamed / (elapsed * streamers), total.errors,
+            static_cast<unsigned long long>(total.queue.dropped), static_cast<unsigned long long>(total.queue.coalesced),
+            static_cast<unsigned long long>(total.queue.blocked), elapsed);
+    }
+}
+
+int main(int argc, char** argv)
+{
+    if (argc < 2) {
+        printf("usage: %s <libsl_zed path> [fps=60] [seconds=3] [streamers=4] [depth=4]\n", argv[0]);
+        return 1;
+    }
+    const int fps = argc > 2 ? std::atoi(argv[2]) : 60;
+    const double seconds = argc > 3 ? std::atof(argv[3]) : 3.0;
+    const int streamers = argc > 4 ? std::atoi(argv[4]) : 4;
+    const size_t depth = argc > 5 ? std::atoi(argv[5]) : 4;
+
+    sl::ZedStreamer zed_streamer;
+    if (!zed_streamer.load_lib(argv[1]) || !zed_streamer.isZEDSDKCompatible()) {
+        printf("Could not load a compatible ZED library from %s\n", argv[1]);
+        return 1;
+    }
+    zed_streamer.load_api();
+
+    for (int i = 0; i < streamers; i++) {
+        sl::StreamingParameters params;
+        params.port = 30000 + 2 * i;
+        if (zed_streamer.initStreamer(i, &params) <= 0) {
+            printf("Streamer %d initialization failed\n", i);
+            return 1;
+        }
+    }
+
+    printf("%d streamers at %d fps for %.1f s, queue depth %zu\n", streamers, fps, seconds, depth);
+    runBenchmark(zed_streamer, "LATEST", sl::OverflowPolicy::LATEST, depth, fps, seconds, streamers);
+    runBenchmark(zed_streamer, "FIFO", sl::OverflowPolicy::FIFO, depth, fps, seconds, streamers);
+    runBenchmark(zed_streamer, "BLOCK", sl::OverflowPolicy::BLOCK, depth, fps, seconds, streamers);
+
+    for (int i = 0; i < streamers; i++) {
+        zed_streamer.closeStreamer(i);
+    }
+    zed_streamer.destroyInstance();
+    return 0;
+}
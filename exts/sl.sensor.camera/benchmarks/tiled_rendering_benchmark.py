@@ -0,0 +1,103 @@
+# Simulation frame rate of ZED camera fleets streamed with one render product per eye, and with one tiled render
+# product shared by every camera (ZEDAnnotator.create_tiled), streamed by one ZED Stream node per camera or by a single
+# ZED Multi Stream node (batch_streaming, the default of create_tiled).
+#
+# For every camera count and mode, a new stage is filled with ZED cameras referenced from a camera USD, the annotators
+# are created, and the simulation is stepped with rendering. The frame rate is measured after a warmup long enough for
+# the ZED nodes to open their streamers, and the frames streamed by each camera are reported to check that every
+# camera streams.
+#
+# Run with the Isaac Sim python, with the stand-in ZED library so that encoding does not bound the frame rate:
+#   SL_ZED_LIBRARY=<ext>/bin/libsl_zed_stub.so ./python.sh tiled_rendering_benchmark.py \
+#       --camera-usd <ext>/data/usd/ZED_XM.usdc --camera-model ZED_XM [--counts 1 2 4 8 16] [--steps 300] [--headless]
+
+import argparse
+import os
+import time
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--camera-usd", required=True, help="USD of the ZED camera referenced for every camera")
+parser.add_argument("--camera-model", default="ZED_XM")
+parser.add_argument("--resolution", default="SVGA")
+parser.add_argument("--fps", type=int, default=30)
+parser.add_argument("--counts", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+parser.add_argument("--warmup-steps", type=int, default=120)
+parser.add_argument("--steps", type=int, default=300)
+parser.add_argument("--headless", action="store_true")
+args = parser.parse_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": args.headless})
+
+import omni.kit.app
+
+extension_manager = omni.kit.app.get_app().get_extension_manager()
+extension_manager.add_path(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+extension_manager.set_extension_enabled_immediate("sl.sensor.camera", True)
+
+from isaacsim.core.api import World
+from isaacsim.core.utils.stage import add_reference_to_stage, create_new_stage
+from pxr import Sdf, UsdGeom
+
+from sl.sensor.camera.annotators import ZEDAnnotator
+
+
+def run(camera_count: int, mode: str) -> dict:
+    create_new_stage()
+    world = World(stage_units_in_meters=1.0)
+
+    camera_prims = []
+    for i in range(camera_count):
+        path = f"/World/ZED_{i}"
+        prim = add_reference_to_stage(args.camera_usd, path)
+        UsdGeom.XformCommonAPI(prim).SetTranslate((0.3 * i, 0.0, 1.0))
+        camera_prims.append([Sdf.Path(path)])
+
+    world.reset()
+    if mode != "per-eye":
+        annotators = ZEDAnnotator.create_tiled(
+            camera_prims, args.camera_model, resolution=args.resolution, fps=args.fps, batch_streaming=mode == "batched"
+        )
+    else:
+        annotators = [
+            ZEDAnnotator(camera_prim, args.camera_model, 30000 + 2 * i, args.resolution, args.fps)
+            for i, camera_prim in enumerate(camera_prims)
+        ]
+
+    for _ in range(args.warmup_steps):
+        world.step(render=True)
+
+    streamed_before = [annotator.get_stream_stats().get("framesStreamed", 0) for annotator in annotators]
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        world.step(render=True)
+    elapsed = time.perf_counter() - start
+    streamed = [
+        annotator.get_stream_stats().get("framesStreamed", 0) - before
+        for annotator, before in zip(annotators, streamed_before)
+    ]
+
+    for annotator in annotators:
+        annotator.destroy()
+    world.stop()
+    world.clear_instance()
+
+    return {
+        "sim_fps": args.steps / elapsed,
+        "min_streamed": min(streamed) if streamed else 0,
+        "max_streamed": max(streamed) if streamed else 0,
+    }
+
+
+print(f"{args.camera_model} {args.resolution} at {args.fps} fps, {args.steps} rendered steps")
+print(f"{'cameras':>8} {'mode':>9} {'sim fps':>9} {'frames streamed per camera':>28}")
+for camera_count in args.counts:
+    for mode in ("per-eye", "tiled", "batched"):
+        result = run(camera_count, mode)
+        print(
+            f"{camera_count:>8} {mode:>9} {result['sim_fps']:>9.1f} "
+            f"{result['min_streamed']:>13} - {result['max_streamed']}"
+        )
+
+simulation_app.close()
@@ -0,0 +1,95 @@
+# Per-frame time of ZED camera fleets triggered by one sync gate and time nodes per camera, against one set shared by
+# every camera (share_time_nodes option of ZEDAnnotator).
+#
+# For every camera count and mode, a new stage is filled with ZED cameras referenced from a camera USD, the annotators
+# are created, and the simulation is stepped with rendering. Frame times are measured after a warmup long enough for
+# the ZED nodes to open their streamers, and the number of nodes in the synthetic data graph is reported with them.
+#
+# Run with the Isaac Sim python, with the stand-in ZED library so that encoding does not bound the frame rate:
+#   SL_ZED_LIBRARY=<ext>/bin/libsl_zed_stub.so ./python.sh time_nodes_benchmark.py \
+#       --camera-usd <ext>/data/usd/ZED_XM.usdc --camera-model ZED_XM [--counts 1 8 32] [--steps 300] [--headless]
+
+import argparse
+import os
+import statistics
+import time
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--camera-usd", required=True, help="USD of the ZED camera referenced for every camera")
+parser.add_argument("--camera-model", default="ZED_XM")
+parser.add_argument("--resolution", default="SVGA")
+parser.add_argument("--fps", type=int, default=30)
+parser.add_argument("--counts", type=int, nargs="+", default=[1, 8, 32])
+parser.add_argument("--warmup-steps", type=int, default=120)
+parser.add_argument("--steps", type=int, default=300)
+parser.add_argument("--headless", action="store_true")
+args = parser.parse_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": args.headless})
+
+import omni.kit.app
+
+extension_manager = omni.kit.app.get_app().get_extension_manager()
+extension_manager.add_path(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+extension_manager.set_extension_enabled_immediate("sl.sensor.camera", True)
+
+from isaacsim.core.api import World
+from isaacsim.core.utils.stage import add_reference_to_stage, create_new_stage
+from pxr import Sdf, UsdGeom
+
+from sl.sensor.camera.annotators import ZEDAnnotator
+
+
+def run(camera_count: int, shared: bool) -> dict:
+    create_new_stage()
+    world = World(stage_units_in_meters=1.0)
+
+    camera_prims = []
+    for i in range(camera_count):
+        path = f"/World/ZED_{i}"
+        prim = add_reference_to_stage(args.camera_usd, path)
+        UsdGeom.XformCommonAPI(prim).SetTranslate((0.3 * i, 0.0, 1.0))
+        camera_prims.append([Sdf.Path(path)])
+
+    world.reset()
+    annotators = [
+        ZEDAnnotator(camera_prim, args.camera_model, 30000 + 2 * i, args.resolution, args.fps, share_time_nodes=shared)
+        for i, camera_prim in enumerate(camera_prims)
+    ]
+    graph_nodes = len(annotators[0].graph.get_nodes())
+
+    for _ in range(args.warmup_steps):
+        world.step(render=True)
+
+    frame_times = []
+    for _ in range(args.steps):
+        start = time.perf_counter()
+        world.step(render=True)
+        frame_times.append(time.perf_counter() - start)
+    streamed = min(annotator.get_stream_stats().get("framesStreamed", 0) for annotator in annotators)
+
+    for annotator in annotators:
+        annotator.destroy()
+    world.stop()
+    world.clear_instance()
+    return {
+        "frame_ms": 1e3 * statistics.mean(frame_times),
+        "p95_ms": 1e3 * statistics.quantiles(frame_times, n=20)[-1],
+        "graph_nodes": graph_nodes,
+        "min_streamed": streamed,
+    }
+
+
+print(f"{args.camera_model} {args.resolution} at {args.fps} fps, {args.steps} steps")
+print(f"{'cameras':>8} {'time nodes':>11} {'frame ms':>9} {'p95 ms':>8} {'graph nodes':>12} {'min streamed':>13}")
+for camera_count in args.counts:
+    for shared in (False, True):
+        result = run(camera_count, shared)
+        print(
+            f"{camera_count:>8} {'shared' if shared else 'per camera':>11} {result['frame_ms']:>9.2f} "
+            f"{result['p95_ms']:>8.2f} {result['graph_nodes']:>12} {result['min_streamed']:>13}"
+        )
+
+simulation_app.close()
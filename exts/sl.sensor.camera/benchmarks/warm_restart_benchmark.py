@@ -0,0 +1,93 @@
+# Play-to-first-frame time of a ZED camera across timeline STOP/PLAY cycles, rebuilding its annotator on every Play
+# (cold) or parking it on Stop and resuming it on Play (warm restart, Warm Restart input of the ZED Camera Helper nodes).
+#
+# For every cycle, the timeline is played, the annotator is built or resumed, and the simulation is stepped with
+# rendering until the ZED node streams its first frame. The ZED node opens its streamer after one simulated second,
+# which is part of both measures.
+#
+# Run with the Isaac Sim python, with the stand-in ZED library so that encoding does not bound the frame rate:
+#   SL_ZED_LIBRARY=<ext>/bin/libsl_zed_stub.so ./python.sh warm_restart_benchmark.py \
+#       --camera-usd <ext>/data/usd/ZED_XM.usdc --camera-model ZED_XM [--cycles 5] [--headless]
+
+import argparse
+import os
+import statistics
+import time
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--camera-usd", required=True, help="USD of the ZED camera")
+parser.add_argument("--camera-model", default="ZED_XM")
+parser.add_argument("--resolution", default="HD1200")
+parser.add_argument("--fps", type=int, default=30)
+parser.add_argument("--cycles", type=int, default=5)
+parser.add_argument("--max-steps", type=int, default=600)
+parser.add_argument("--headless", action="store_true")
+args = parser.parse_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": args.headless})
+
+import omni.kit.app
+
+extension_manager = omni.kit.app.get_app().get_extension_manager()
+extension_manager.add_path(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+extension_manager.set_extension_enabled_immediate("sl.sensor.camera", True)
+
+from isaacsim.core.api import World
+from isaacsim.core.utils.stage import add_reference_to_stage, create_new_stage
+from pxr import Sdf
+
+from sl.sensor.camera.annotators import ZEDAnnotator
+
+
+def run(warm: bool) -> list:
+    create_new_stage()
+    world = World(stage_units_in_meters=1.0)
+    add_reference_to_stage(args.camera_usd, "/World/ZED")
+    world.reset()
+    world.stop()
+
+    annotator = None
+    cycles = []
+    for _ in range(args.cycles):
+        world.play()
+        start = time.perf_counter()
+        if annotator is not None and annotator.parked:
+            annotator.resume()
+        else:
+            annotator = ZEDAnnotator([Sdf.Path("/World/ZED")], args.camera_model, 30000, args.resolution, args.fps)
+        setup = time.perf_counter() - start
+
+        steps = 0
+        while annotator.get_stream_stats().get("framesStreamed", 0) == 0 and steps < args.max_steps:
+            world.step(render=True)
+            steps += 1
+        cycles.append({"setup_ms": 1e3 * setup, "first_frame_ms": 1e3 * (time.perf_counter() - start), "steps": steps})
+
+        world.stop()
+        if warm:
+            annotator.park()
+        else:
+            annotator.destroy()
+            annotator = None
+
+    if annotator is not None:
+        annotator.destroy()
+    world.clear_instance()
+    return cycles
+
+
+print(f"{args.camera_model} {args.resolution} at {args.fps} fps, {args.cycles} STOP/PLAY cycles")
+print(f"{'mode':>5} {'setup ms':>9} {'first frame ms':>15} {'first cycle':>12} {'steps':>6}")
+for warm in (False, True):
+    cycles = run(warm)
+    # The first cycle builds the annotator in both modes
+    later = cycles[1:] or cycles
+    print(
+        f"{'warm' if warm else 'cold':>5} {statistics.mean(c['setup_ms'] for c in later):>9.1f} "
+        f"{statistics.mean(c['first_frame_ms'] for c in later):>15.1f} {cycles[0]['first_frame_ms']:>12.1f} "
+        f"{max(c['steps'] for c in later):>6}"
+    )
+
+simulation_app.close()
@@ -0,0 +1,145 @@
+#ifndef FRAME_QUEUE_HPP
+#define FRAME_QUEUE_HPP
+
+#include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <cstdint>
+#include <deque>
+#include <memory>
+#include <mutex>
+#include <string>
+
+namespace sl
+{
+    // Behavior of the FrameQueue when the consumer falls behind the producer
+    enum class OverflowPolicy
+    {
+        LATEST = 0, // Only the most recent frame is kept, pending frames are coalesced into the new one
+        FIFO = 1,   // Every frame is kept up to the queue depth, frames pushed to a full queue are dropped
+        BLOCK = 2   // The producer waits until the consumer frees a place in the queue
+    };
+
+    inline OverflowPolicy overflowPolicyFromString(const std::string& policy_str)
+    {
+        if (policy_str == "FIFO")
+            return OverflowPolicy::FIFO;
+        if (policy_str == "BLOCK")
+            return OverflowPolicy::BLOCK;
+        return OverflowPolicy::LATEST;
+    }
+
+    // Bounded single producer / single consumer frame queue with a configurable overflow policy.
+    template <typename T>
+    class FrameQueue {
+    public:
+        struct Stats {
+            uint64_t pushed{ 0 };    // frames accepted in the queue
+            uint64_t dropped{ 0 };   // frames discarded because the queue was full
+            uint64_t coalesced{ 0 }; // pending frames replaced by a newer one (LATEST)
+            uint64_t blocked{ 0 };   // frames for which the producer had to wait (BLOCK)
+        };
+
+        // Must be called before the producer and consumer threads start
+        void configure(OverflowPolicy policy, size_t depth) {
+            std::lock_guard<std::mutex> lock(mutex_);
+            policy_ = policy;
+            depth_ = policy == OverflowPolicy::LATEST ? 1 : std::max<size_t>(depth, 1);
+            queue_.clear();
+            stats_ = Stats();
+        }
+
+        OverflowPolicy policy() const { return policy_; }
+
+        // Number of frames the queue can hold
+        size_t depth() const { return depth_; }
+
+        // Producer: returns false if the frame was dropped
+        bool push(std::shared_ptr<T> data, std::atomic<bool>& shouldStop) {
+            {
+                std::unique_lock<std::mutex> lock(mutex_);
+                if (queue_.size() >= depth_) {
+                    switch (policy_) {
+                    case OverflowPolicy::LATEST:
+                        stats_.coalesced += queue_.size();
+                        queue_.clear();
+                        break;
+                    case OverflowPolicy::FIFO:
+                        stats_.dropped++;
+                        return false;
+                    case OverflowPolicy::BLOCK:
+                        stats_.blocked++;
+                        not_full_.wait(lock, [&] {
+                            return queue_.size() < depth_ || shouldStop.load(std::memory_order_acquire);
+                        });
+                        if (queue_.size() >= depth_) {
+                            stats_.dropped++;
+                            return false;
+                        }
+                        break;
+                    }
+                }
+                queue_.push_back(std::move(data));
+                stats_.pushed++;
+            }
+            not_empty_.notify_one();
+            return true;
+        }
+
+        // Producer: account for a frame dropped before it could be pushed
+        void recordDropped() {
+            std::lock_guard<std::mutex> lock(mutex_);
+            stats_.dropped++;
+        }
+
+        // Consumer: wait for the oldest frame. Returns nullptr once shouldStop is raised and the queue is empty.
+        std::shared_ptr<T> wait_and_pop(std::atomic<bool>& shouldStop) {
+            std::shared_ptr<T> data;
+            {
+                std::unique_lock<std::mutex> lock(mutex_);
+                not_empty_.wait(lock, [&] {
+                    return !queue_.empty() || shouldStop.load(std::memory_order_acquire);
+                });
+                if (queue_.empty())
+                    return nullptr;
+
+                data = std::move(queue_.front());
+                queue_.pop_front();
+            }
+            not_full_.notify_one();
+            return data;
+        }
+
+        // Wake up both sides, must be called after raising the stop flag
+        void notify_stop() {
+            std::lock_guard<std::mutex> lock(mutex_);
+            not_empty_.notify_all();
+            not_full_.notify_all();
+        }
+
+        // Release the pending frames
+        void clear() {
+            {
+                std::lock_guard<std::mutex> lock(mutex_);
+                queue_.clear();
+            }
+            not_full_.notify_all();
+        }
+
+        Stats stats() const {
+            std::lock_guard<std::mutex> lock(mutex_);
+            return stats_;
+        }
+
+    private:
+        OverflowPolicy policy_{ OverflowPolicy::LATEST };
+        size_t depth_{ 1 };
+        std::deque<std::shared_ptr<T>> queue_;
+        Stats stats_;
+        mutable std::mutex mutex_;
+        std::condition_variable not_empty_;
+        std::condition_variable not_full_;
+    };
+}
+
+#endif // FRAME_QUEUE_HPP
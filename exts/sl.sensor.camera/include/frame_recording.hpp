@@ -0,0 +1,310 @@
+#ifndef FRAME_RECORDING_HPP
+#define FRAME_RECORDING_HPP
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <string>
+#include <vector>
+
+#ifdef _WIN32
+#ifndef NOMINMAX
+#define NOMINMAX
+#endif
+#include <windows.h>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+#include "types_c.h"
+
+namespace sl
+{
+    // File mapped in memory, read-write when created, read-only when opened
+    class MappedFile {
+    public:
+        MappedFile() = default;
+        MappedFile(const MappedFile&) = delete;
+        MappedFile& operator=(const MappedFile&) = delete;
+
+        ~MappedFile()
+        {
+            close();
+        }
+
+        // Creates or truncates the file to size bytes, all zero
+        bool create(const std::string& path, size_t size)
+        {
+            close();
+#ifdef _WIN32
+            file_ = CreateFileA(path.c_str(), GENERIC_READ | GENERIC_WRITE, FILE_SHARE_READ, nullptr, CREATE_ALWAYS,
+                FILE_ATTRIBUTE_NORMAL, nullptr);
+            if (file_ == INVALID_HANDLE_VALUE)
+                return false;
+            mapping_ = CreateFileMappingA(file_, nullptr, PAGE_READWRITE, static_cast<DWORD>(static_cast<uint64_t>(size) >> 32),
+                static_cast<DWORD>(size & 0xFFFFFFFFu), nullptr);
+            data_ = mapping_ ? static_cast<unsigned char*>(MapViewOfFile(mapping_, FILE_MAP_WRITE, 0, 0, size)) : nullptr;
+#else
+            fd_ = ::open(path.c_str(), O_RDWR | O_CREAT | O_TRUNC, 0644);
+            if (fd_ < 0)
+                return false;
+            if (ftruncate(fd_, static_cast<off_t>(size)) == 0) {
+                void* data = mmap(nullptr, size, PROT_READ | PROT_WRITE, MAP_SHARED, fd_, 0);
+                data_ = data != MAP_FAILED ? static_cast<unsigned char*>(data) : nullptr;
+            }
+#endif
+            size_ = size;
+            if (!data_) {
+                close();
+                return false;
+            }
+            return true;
+        }
+
+        bool open(const std::string& path)
+        {
+            close();
+#ifdef _WIN32
+            file_ = CreateFileA(path.c_str(), GENERIC_READ, FILE_SHARE_READ | FILE_SHARE_WRITE, nullptr, OPEN_EXISTING,
+                FILE_ATTRIBUTE_NORMAL, nullptr);
+            LARGE_INTEGER size{};
+            if (file_ == INVALID_HANDLE_VALUE || !GetFileSizeEx(file_, &size) || size.QuadPart == 0) {
+                close();
+                return false;
+            }
+            size_ = static_cast<size_t>(size.QuadPart);
+            mapping_ = CreateFileMappingA(file_, nullptr, PAGE_READONLY, 0, 0, nullptr);
+            data_ = mapping_ ? static_cast<unsigned char*>(MapViewOfFile(mapping_, FILE_MAP_READ, 0, 0, 0)) : nullptr;
+#else
+            fd_ = ::open(path.c_str(), O_RDONLY);
+            struct stat status {};
+            if (fd_ < 0 || fstat(fd_, &status) != 0 || status.st_size == 0) {
+                close();
+                return false;
+            }
+            size_ = static_cast<size_t>(status.st_size);
+            void* data = mmap(nullptr, size_, PROT_READ, MAP_SHARED, fd_, 0);
+            data_ = data != MAP_FAILED ? static_cast<unsigned char*>(data) : nullptr;
+#endif
+            if (!data_) {
+                close();
+                return false;
+            }
+            return true;
+        }
+
+        void close()
+        {
+#ifdef _WIN32
+            if (data_)
+                UnmapViewOfFile(data_);
+            if (mapping_)
+                CloseHandle(mapping_);
+            if (file_ != INVALID_HANDLE_VALUE)
+                CloseHandle(file_);
+            mapping_ = nullptr;
+            file_ = INVALID_HANDLE_VALUE;
+#else
+            if (data_)
+                munmap(data_, size_);
+            if (fd_ >= 0)
+                ::close(fd_);
+            fd_ = -1;
+#endif
+            data_ = nullptr;
+            size_ = 0;
+        }
+
+        unsigned char* data() const { return data_; }
+        size_t size() const { return size_; }
+
+    private:
+#ifdef _WIN32
+        HANDLE file_{ INVALID_HANDLE_VALUE };
+        HANDLE mapping_{ nullptr };
+#else
+        int fd_{ -1 };
+#endif
+        unsigned char* data_{ nullptr };
+        size_t size_{ 0 };
+    };
+
+    // A recording is a fixed-size file: this header, then an index of slot_count entries, then slot_count slots of
+    // slot_size bytes holding the left image followed by the right one. Frames are written to the slots as a ring,
+    // the oldest one being overwritten once the file is full.
+    struct RecordingHeader {
+        char magic[8];
+        uint32_t version;
+        uint32_t stereo;
+        int32_t image_width;
+        int32_t image_height;
+        int32_t fps;
+        int32_t input_format;
+        int32_t serial_number;
+        uint32_t alpha_channel_included;
+        uint64_t slot_count;
+        uint64_t slot_size;
+        uint64_t index_offset;
+        uint64_t data_offset;
+        // Number of frames written so far, the next one goes to the slot frames_written % slot_count
+        uint64_t frames_written;
+    };
+
+    // Index entry of a slot, as the frame was handed to the ZED SDK
+    struct RecordedFrame {
+        // Order of the frame in the recording from 1, 0 for a slot not written or being overwritten
+        uint64_t sequence;
+        int64_t timestamp_ns;
+        uint64_t left_size;
+        uint64_t right_size;
+        // Converted IMU sample: orientation (w, x, y, z) then linear acceleration (x, y, z)
+        float imu[7];
+        int32_t stream_status;
+    };
+
+    constexpr char kRecordingMagic[8] = { 'Z', 'E', 'D', 'R', 'E', 'C', 0, 0 };
+    constexpr uint32_t kRecordingVersion = 1;
+
+    // Appends the frames of one streamer to a recording, from a single thread at a time. The recording layout is set by
+    // the first frame, later frames larger than it are not recorded.
+    class FrameRecorder {
+    public:
+        FrameRecorder(std::string path, size_t file_size)
+            : path_(std::move(path))
+            , file_size_(file_size)
+        {
+        }
+
+        const std::string& path() const { return path_; }
+        uint64_t recordedCount() const { return header() ? header()->frames_written : 0; }
+        uint64_t droppedCount() const { return dropped_; }
+        uint64_t slotCount() const { return header() ? header()->slot_count : 0; }
+
+        // Returns false if the frame could not be recorded
+        bool append(const StreamingParameters& params, bool stereo, const unsigned char* left, size_t left_size,
+            const unsigned char* right, size_t right_size, int64_t timestamp_ns, const float imu[7], int stream_status)
+        {
+            if (!file_.data() && !create(params, stereo, left_size + right_size)) {
+                dropped_++;
+                return false;
+            }
+
+            RecordingHeader* recording = header();
+            if (left_size + right_size > recording->slot_size) {
+                dropped_++;
+                return false;
+            }
+
+            // The entry is invalidated while its slot is overwritten, so an interrupted recording stays readable
+            const uint64_t slot = recording->frames_written % recording->slot_count;
+            RecordedFrame& entry = index()[slot];
+            entry.sequence = 0;
+
+            unsigned char* data = file_.data() + recording->data_offset + slot * recording->slot_size;
+            std::memcpy(data, left, left_size);
+            if (right && right_size > 0) {
+                std::memcpy(data + left_size, right, right_size);
+            }
+
+            entry.timestamp_ns = timestamp_ns;
+            entry.left_size = left_size;
+            entry.right_size = right ? right_size : 0;
+            std::memcpy(entry.imu, imu, sizeof(entry.imu));
+            entry.stream_status = stream_status;
+            entry.sequence = ++recording->frames_written;
+            return true;
+        }
+
+        void close()
+        {
+            file_.close();
+        }
+
+    private:
+        bool create(const StreamingParameters& params, bool stereo, size_t slot_size)
+        {
+            const size_t index_offset = sizeof(RecordingHeader);
+            const size_t slot_count = file_size_ > index_offset && slot_size > 0 ?
+                (file_size_ - index_offset) / (sizeof(RecordedFrame) + slot_size) : 0;
+            if (slot_count == 0 || !file_.create(path_, file_size_))
+                return false;
+
+            RecordingHeader* recording = header();
+            std::memcpy(recording->magic, kRecordingMagic, sizeof(kRecordingMagic));
+            recording->version = kRecordingVersion;
+            recording->stereo = stereo ? 1 : 0;
+            recording->image_width = params.image_width;
+            recording->image_height = params.image_height;
+            recording->fps = params.fps;
+            recording->input_format = static_cast<int32_t>(params.input_format);
+            recording->serial_number = params.serial_number;
+            recording->alpha_channel_included = params.alpha_channel_included ? 1 : 0;
+            recording->slot_count = slot_count;
+            recording->slot_size = slot_size;
+            recording->index_offset = index_offset;
+            recording->data_offset = index_offset + slot_count * sizeof(RecordedFrame);
+            recording->frames_written = 0;
+            return true;
+        }
+
+        RecordingHeader* header() const { return reinterpret_cast<RecordingHeader*>(file_.data()); }
+        RecordedFrame* index() const { return reinterpret_cast<RecordedFrame*>(file_.data() + header()->index_offset); }
+
+        std::string path_;
+        size_t file_size_;
+        MappedFile file_;
+        uint64_t dropped_{ 0 };
+    };
+
+    // Reads the frames of a recording, oldest first
+    class FrameRecordingReader {
+    public:
+        // Returns false if the file is not a valid recording
+        bool open(const std::string& path)
+        {
+            frames_.clear();
+            if (!file_.open(path) || file_.size() < sizeof(RecordingHeader))
+                return false;
+
+            const RecordingHeader& recording = header();
+            if (std::memcmp(recording.magic, kRecordingMagic, sizeof(kRecordingMagic)) != 0 || recording.version != kRecordingVersion)
+                return false;
+            if (recording.slot_count == 0 || recording.index_offset < sizeof(RecordingHeader) ||
+                recording.data_offset < recording.index_offset + recording.slot_count * sizeof(RecordedFrame) ||
+                recording.data_offset + recording.slot_count * recording.slot_size > file_.size())
+                return false;
+
+            const auto* index = reinterpret_cast<const RecordedFrame*>(file_.data() + recording.index_offset);
+            for (uint64_t slot = 0; slot < recording.slot_count; slot++) {
+                const RecordedFrame& entry = index[slot];
+                if (entry.sequence != 0 && entry.left_size + entry.right_size <= recording.slot_size) {
+                    frames_.push_back(Frame{ &entry, file_.data() + recording.data_offset + slot * recording.slot_size });
+                }
+            }
+            std::sort(frames_.begin(), frames_.end(), [](const Frame& a, const Frame& b) {
+                return a.entry->sequence < b.entry->sequence;
+            });
+            return true;
+        }
+
+        struct Frame {
+            const RecordedFrame* entry;
+            const unsigned char* left;
+
+            const unsigned char* right() const { return entry->right_size > 0 ? left + entry->left_size : nullptr; }
+        };
+
+        const RecordingHeader& header() const { return *reinterpret_cast<const RecordingHeader*>(file_.data()); }
+        const std::vector<Frame>& frames() const { return frames_; }
+
+    private:
+        MappedFile file_;
+        std::vector<Frame> frames_;
+    };
+}
+
+#endif // FRAME_RECORDING_HPP
@@ -0,0 +1,204 @@
+#ifndef PINNED_BUFFER_POOL_HPP
+#define PINNED_BUFFER_POOL_HPP
+
+#include <cstddef>
+#include <cstdint>
+#include <mutex>
+#include <new>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+#include <cuda/include/cuda_runtime_api.h>
+
+namespace sl
+{
+    class PinnedBufferPool;
+
+    // Host staging buffer leased from the PinnedBufferPool. The buffer goes back to the pool when destroyed.
+    class HostBuffer {
+    public:
+        HostBuffer() = default;
+
+        HostBuffer(const HostBuffer&) = delete;
+        HostBuffer& operator=(const HostBuffer&) = delete;
+
+        HostBuffer(HostBuffer&& other) noexcept
+        {
+            swap(other);
+        }
+
+        HostBuffer& operator=(HostBuffer&& other) noexcept
+        {
+            if (this != &other) {
+                reset();
+                swap(other);
+            }
+            return *this;
+        }
+
+        ~HostBuffer()
+        {
+            reset();
+        }
+
+        unsigned char* get() const { return data_; }
+        size_t size() const { return size_; }
+        bool isPinned() const { return pinned_; }
+        explicit operator bool() const { return data_ != nullptr; }
+
+        // Give the buffer back to the pool
+        inline void reset();
+
+    private:
+        friend class PinnedBufferPool;
+
+        HostBuffer(unsigned char* data, size_t size, bool pinned)
+            : data_(data), size_(size), pinned_(pinned)
+        {
+        }
+
+        void swap(HostBuffer& other) noexcept
+        {
+            std::swap(data_, other.data_);
+            std::swap(size_, other.size_);
+            std::swap(pinned_, other.pinned_);
+        }
+
+        unsigned char* data_{ nullptr };
+        size_t size_{ 0 };
+        bool pinned_{ false };
+    };
+
+    // Process-wide pool of page-locked host buffers keyed by size.
+    // Pageable memory turns cudaMemcpyAsync into a staged synchronous copy, so staging buffers are pinned
+    // once and reused across node instances and STOP/PLAY cycles.
+    // If pinning fails (e.g. locked memory limit reached), a pageable buffer is returned instead.
+    class PinnedBufferPool {
+    public:
+        struct Stats {
+            uint64_t hits{ 0 };
+            uint64_t misses{ 0 };
+            uint64_t pinning_failures{ 0 };
+            uint64_t bytes_pinned{ 0 };
+            uint64_t bytes_pageable{ 0 };
+            uint64_t bytes_idle{ 0 };
+        };
+
+        // The pool is never destroyed: freeing pinned memory during static destruction races the CUDA runtime teardown.
+        // Call trim() on extension shutdown instead.
+        static PinnedBufferPool& instance()
+        {
+            static PinnedBufferPool* pool = new PinnedBufferPool();
+            return *pool;
+        }
+
+        HostBuffer acquire(size_t size)
+        {
+            if (size == 0)
+                return HostBuffer();
+
+            {
+                std::lock_guard<std::mutex> lock(mutex_);
+                auto it = free_blocks_.find(size);
+                if (it != free_blocks_.end() && !it->second.empty()) {
+                    Block block = it->second.back();
+                    it->second.pop_back();
+                    stats_.hits++;
+                    stats_.bytes_idle -= size;
+                    return HostBuffer(block.data, size, block.pinned);
+                }
+                stats_.misses++;
+            }
+
+            // Allocate outside the lock, cudaHostAlloc can take milliseconds for large buffers
+            void* data = nullptr;
+            bool pinned = cudaHostAlloc(&data, size, cudaHostAllocPortable) == cudaSuccess;
+            if (!pinned) {
+                // Clear the sticky error left by the failed allocation
+                cudaGetLastError();
+                data = new (std::nothrow) unsigned char[size];
+                if (!data) {
+                    CARB_LOG_ERROR("[ZED] Unable to allocate a %zu bytes staging buffer", size);
+                    return HostBuffer();
+                }
+            }
+
+            std::lock_guard<std::mutex> lock(mutex_);
+            if (pinned) {
+                stats_.bytes_pinned += size;
+            }
+            else {
+                stats_.pinning_failures++;
+                stats_.bytes_pageable += size;
+                CARB_LOG_WARN("[ZED] Unable to pin a %zu bytes staging buffer, falling back to pageable memory", size);
+            }
+            return HostBuffer(static_cast<unsigned char*>(data), size, pinned);
+        }
+
+        // Free every buffer currently idle in the pool. Leased buffers are unaffected.
+        void trim()
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            for (auto& entry : free_blocks_) {
+                for (const Block& block : entry.second) {
+                    freeBlock(block, entry.first);
+                }
+            }
+            free_blocks_.clear();
+            stats_.bytes_idle = 0;
+        }
+
+        Stats stats() const
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            return stats_;
+        }
+
+    private:
+        friend class HostBuffer;
+
+        struct Block {
+            unsigned char* data;
+            bool pinned;
+        };
+
+        PinnedBufferPool() = default;
+
+        void release(unsigned char* data, size_t size, bool pinned)
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            free_blocks_[size].push_back({ data, pinned });
+            stats_.bytes_idle += size;
+        }
+
+        // Must be called with the mutex held
+        void freeBlock(const Block& block, size_t size)
+        {
+            if (block.pinned) {
+                cudaFreeHost(block.data);
+                stats_.bytes_pinned -= size;
+            }
+            else {
+                delete[] block.data;
+                stats_.bytes_pageable -= size;
+            }
+        }
+
+        mutable std::mutex mutex_;
+        std::unordered_map<size_t, std::vector<Block>> free_blocks_;
+        Stats stats_;
+    };
+
+    void HostBuffer::reset()
+    {
+        if (data_) {
+            PinnedBufferPool::instance().release(data_, size_, pinned_);
+        }
+        data_ = nullptr;
+        size_ = 0;
+        pinned_ = false;
+    }
+}
+
+#endif // PINNED_BUFFER_POOL_HPP
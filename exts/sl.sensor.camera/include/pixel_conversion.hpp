@@ -0,0 +1,73 @@
+#ifndef PIXEL_CONVERSION_HPP
+#define PIXEL_CONVERSION_HPP
+
+// Conversions of the RGBA pixels rendered by the rgb annotator to the layouts handed to the ZED SDK without alpha
+// channel. They are shared by the CUDA kernels of kernels/pixel_format_kernels.cu and by their CPU reference in
+// pixel_format.hpp, so this header is plain C++ that NVRTC compiles without the standard library.
+
+#if defined(__CUDACC__)
+#define SL_PIXEL_FN __host__ __device__ inline
+#else
+#define SL_PIXEL_FN inline
+#endif
+
+namespace sl
+{
+    namespace pixel
+    {
+        // BT.601 limited range, with the integer coefficients of most video encoders. The offsets are added before
+        // the shift so that it never applies to a negative value.
+        SL_PIXEL_FN unsigned char lumaOf(int r, int g, int b)
+        {
+            return static_cast<unsigned char>(((66 * r + 129 * g + 25 * b + 128) >> 8) + 16);
+        }
+
+        SL_PIXEL_FN unsigned char chromaUOf(int r, int g, int b)
+        {
+            return static_cast<unsigned char>((-38 * r - 74 * g + 112 * b + 128 * 256 + 128) >> 8);
+        }
+
+        SL_PIXEL_FN unsigned char chromaVOf(int r, int g, int b)
+        {
+            return static_cast<unsigned char>((112 * r - 94 * g - 18 * b + 128 * 256 + 128) >> 8);
+        }
+
+        // One RGBA pixel to 3 bytes, in BGR order when bgr is set
+        SL_PIXEL_FN void packPixel(const unsigned char* rgba, unsigned char* dst, bool bgr)
+        {
+            dst[0] = rgba[bgr ? 2 : 0];
+            dst[1] = rgba[1];
+            dst[2] = rgba[bgr ? 0 : 2];
+        }
+
+        // Two horizontally adjacent RGBA pixels to YUYV 4:2:2, Y0 U Y1 V, their chroma taken from their average color
+        SL_PIXEL_FN void yuyvPair(const unsigned char* rgba, unsigned char* dst)
+        {
+            const int r = (rgba[0] + rgba[4] + 1) >> 1;
+            const int g = (rgba[1] + rgba[5] + 1) >> 1;
+            const int b = (rgba[2] + rgba[6] + 1) >> 1;
+            dst[0] = lumaOf(rgba[0], rgba[1], rgba[2]);
+            dst[1] = chromaUOf(r, g, b);
+            dst[2] = lumaOf(rgba[4], rgba[5], rgba[6]);
+            dst[3] = chromaVOf(r, g, b);
+        }
+
+        // A block of 2x2 RGBA pixels to NV12 4:2:0: two luma bytes in each of the rows y_top and y_bottom, and the
+        // U V pair of the chroma plane taken from the average color of the block
+        SL_PIXEL_FN void nv12Block(const unsigned char* rgba_top, const unsigned char* rgba_bottom,
+            unsigned char* y_top, unsigned char* y_bottom, unsigned char* uv)
+        {
+            const int r = (rgba_top[0] + rgba_top[4] + rgba_bottom[0] + rgba_bottom[4] + 2) >> 2;
+            const int g = (rgba_top[1] + rgba_top[5] + rgba_bottom[1] + rgba_bottom[5] + 2) >> 2;
+            const int b = (rgba_top[2] + rgba_top[6] + rgba_bottom[2] + rgba_bottom[6] + 2) >> 2;
+            y_top[0] = lumaOf(rgba_top[0], rgba_top[1], rgba_top[2]);
+            y_top[1] = lumaOf(rgba_top[4], rgba_top[5], rgba_top[6]);
+            y_bottom[0] = lumaOf(rgba_bottom[0], rgba_bottom[1], rgba_bottom[2]);
+            y_bottom[1] = lumaOf(rgba_bottom[4], rgba_bottom[5], rgba_bottom[6]);
+            uv[0] = chromaUOf(r, g, b);
+            uv[1] = chromaVOf(r, g, b);
+        }
+    }
+}
+
+#endif // PIXEL_CONVERSION_HPP
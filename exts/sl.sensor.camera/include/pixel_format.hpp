@@ -0,0 +1,152 @@
+#ifndef PIXEL_FORMAT_HPP
+#define PIXEL_FORMAT_HPP
+
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+
+#include "pixel_conversion.hpp"
+
+namespace sl
+{
+    // Bytes per pixel of the images rendered by the rgb annotator, and once their alpha channel is dropped
+    constexpr size_t kRgbaPixelSize = 4;
+    constexpr size_t kPackedPixelSize = 3;
+
+    // Size of an image of 4 bytes per pixel once packed to 3 bytes per pixel
+    inline size_t packedSize(size_t rgba_size)
+    {
+        return rgba_size / kRgbaPixelSize * kPackedPixelSize;
+    }
+
+    // Drops the alpha channel of pixel_count pixels of 4 bytes, keeping the first three bytes of every pixel in their
+    // order: the RGB layout.
+    // dst may be src: packed pixels are never written past the source pixels not read yet.
+    inline void packPixels(const unsigned char* src, unsigned char* dst, size_t pixel_count)
+    {
+        // 4 pixels (16 bytes) at a time with two 8-byte loads, repacked into 12 bytes with shifts on little-endian
+        // hosts: close to memcpy speed without SIMD intrinsics
+        size_t i = 0;
+        for (; i + 4 <= pixel_count; i += 4) {
+            uint64_t first, second;
+            std::memcpy(&first, src + i * kRgbaPixelSize, sizeof(first));
+            std::memcpy(&second, src + i * kRgbaPixelSize + sizeof(first), sizeof(second));
+            const uint64_t low = (first & 0xFFFFFFull) | ((first >> 8) & 0xFFFFFF000000ull) | (second << 48);
+            const uint32_t high = static_cast<uint32_t>(((second >> 16) & 0xFFull) | ((second >> 24) & 0xFFFFFF00ull));
+            std::memcpy(dst + i * kPackedPixelSize, &low, sizeof(low));
+            std::memcpy(dst + i * kPackedPixelSize + sizeof(low), &high, sizeof(high));
+        }
+        for (; i < pixel_count; i++) {
+            std::memmove(dst + i * kPackedPixelSize, src + i * kRgbaPixelSize, kPackedPixelSize);
+        }
+    }
+
+    // Layout of the images handed to the ZED SDK: the rendered pixels with their alpha channel, or converted without it
+    // to the layout of the input format of the streamer, 3 bytes per pixel for RGB and BGR, 2 for YUYV (YUV 4:2:2) and
+    // 1.5 for NV12 (a luma plane followed by a plane of interleaved U V pairs, YUV 4:2:0)
+    enum class PixelLayout
+    {
+        RGBA,
+        RGB,
+        BGR,
+        YUYV,
+        NV12
+    };
+
+    inline const char* pixelLayoutName(PixelLayout layout)
+    {
+        switch (layout) {
+        case PixelLayout::RGB:
+            return "RGB";
+        case PixelLayout::BGR:
+            return "BGR";
+        case PixelLayout::YUYV:
+            return "YUYV";
+        case PixelLayout::NV12:
+            return "NV12";
+        default:
+            return "RGBA";
+        }
+    }
+
+    // Whether an image of width x height pixels can be converted to the layout, chroma is shared by pixel pairs or blocks
+    inline bool fitsLayout(PixelLayout layout, size_t width, size_t height)
+    {
+        if (layout == PixelLayout::YUYV)
+            return width % 2 == 0;
+        if (layout == PixelLayout::NV12)
+            return width % 2 == 0 && height % 2 == 0;
+        return true;
+    }
+
+    // Size of an image of width x height pixels in the layout
+    inline size_t convertedSize(PixelLayout layout, size_t width, size_t height)
+    {
+        const size_t pixels = width * height;
+        switch (layout) {
+        case PixelLayout::RGB:
+        case PixelLayout::BGR:
+            return pixels * kPackedPixelSize;
+        case PixelLayout::YUYV:
+            return pixels * 2;
+        case PixelLayout::NV12:
+            return pixels + pixels / 2;
+        default:
+            return pixels * kRgbaPixelSize;
+        }
+    }
+
+    // CPU conversion of width x height RGBA pixels, whose rows are src_pitch bytes apart, to a contiguous image in the
+    // layout. Used for host images and as the reference of the CUDA kernels, computing the same bytes. The image must
+    // fit the layout.
+    inline void convertPixels(PixelLayout layout, const unsigned char* src, size_t src_pitch, size_t width, size_t height,
+        unsigned char* dst)
+    {
+        const size_t row_size = width * kRgbaPixelSize;
+        const bool contiguous = src_pitch == row_size;
+        switch (layout) {
+        case PixelLayout::RGBA:
+            for (size_t y = 0; y < (contiguous ? 1 : height); y++) {
+                std::memcpy(dst + y * row_size, src + y * src_pitch, contiguous ? row_size * height : row_size);
+            }
+            break;
+        case PixelLayout::RGB:
+            for (size_t y = 0; y < (contiguous ? 1 : height); y++) {
+                packPixels(src + y * src_pitch, dst + y * width * kPackedPixelSize, contiguous ? width * height : width);
+            }
+            break;
+        case PixelLayout::BGR:
+            for (size_t y = 0; y < height; y++) {
+                const unsigned char* row = src + y * src_pitch;
+                unsigned char* out = dst + y * width * kPackedPixelSize;
+                for (size_t x = 0; x < width; x++) {
+                    pixel::packPixel(row + x * kRgbaPixelSize, out + x * kPackedPixelSize, true);
+                }
+            }
+            break;
+        case PixelLayout::YUYV:
+            for (size_t y = 0; y < height; y++) {
+                const unsigned char* row = src + y * src_pitch;
+                unsigned char* out = dst + y * width * 2;
+                for (size_t x = 0; x < width; x += 2) {
+                    pixel::yuyvPair(row + x * kRgbaPixelSize, out + x * 2);
+                }
+            }
+            break;
+        case PixelLayout::NV12: {
+            unsigned char* uv_plane = dst + width * height;
+            for (size_t y = 0; y < height; y += 2) {
+                const unsigned char* top = src + y * src_pitch;
+                const unsigned char* bottom = top + src_pitch;
+                for (size_t x = 0; x < width; x += 2) {
+                    pixel::nv12Block(top + x * kRgbaPixelSize, bottom + x * kRgbaPixelSize, dst + y * width + x,
+                        dst + (y + 1) * width + x, uv_plane + y / 2 * width + x);
+                }
+            }
+            break;
+        }
+        }
+    }
+}
+
+#endif // PIXEL_FORMAT_HPP
@@ -0,0 +1,323 @@
+// Generated by tools/embed_ptx.py from kernels/pixel_format_kernels.cu, do not edit.
+// PTX for compute_52, loaded by plugins/nodes/ZEDPixelConversion.h.
+
+#pragma once
+
+namespace sl
+{
+    inline const char* const kPixelFormatKernelsPtx =
+        "//\n"
+        "// Generated by NVIDIA NVVM Compiler\n"
+        "//\n"
+        "// Compiler Build ID: CL-31833905\n"
+        "// Cuda compilation tools, release 11.8, V11.8.89\n"
+        "// Based on NVVM 7.0.1\n"
+        "//\n"
+        "\n"
+        ".version 7.8\n"
+        ".target sm_52\n"
+        ".address_size 64\n"
+        "\n"
+        "    // .globl    rgbaToPacked\n"
+        "\n"
+        ".visible .entry rgbaToPacked(\n"
+        "    .param .u64 rgbaToPacked_param_0,\n"
+        "    .param .u64 rgbaToPacked_param_1,\n"
+        "    .param .u64 rgbaToPacked_param_2,\n"
+        "    .param .u32 rgbaToPacked_param_3,\n"
+        "    .param .u32 rgbaToPacked_param_4,\n"
+        "    .param .u32 rgbaToPacked_param_5\n"
+        ")\n"
+        "{\n"
+        "    .reg .pred     %p<5>;\n"
+        "    .reg .b16     %rs<4>;\n"
+        "    .reg .b32     %r<12>;\n"
+        "    .reg .b64     %rd<22>;\n"
+        "\n"
+        "\n"
+        "    ld.param.u64     %rd1, [rgbaToPacked_param_0];\n"
+        "    ld.param.u64     %rd2, [rgbaToPacked_param_1];\n"
+        "    ld.param.u64     %rd3, [rgbaToPacked_param_2];\n"
+        "    ld.param.u32     %r3, [rgbaToPacked_param_3];\n"
+        "    ld.param.u32     %r5, [rgbaToPacked_param_4];\n"
+        "    ld.param.u32     %r4, [rgbaToPacked_param_5];\n"
+        "    mov.u32     %r6, %ctaid.x;\n"
+        "    mov.u32     %r7, %ntid.x;\n"
+        "    mov.u32     %r8, %tid.x;\n"
+        "    mad.lo.s32     %r1, %r6, %r7, %r8;\n"
+        "    mov.u32     %r9, %ntid.y;\n"
+        "    mov.u32     %r10, %ctaid.y;\n"
+        "    mov.u32     %r11, %tid.y;\n"
+        "    mad.lo.s32     %r2, %r10, %r9, %r11;\n"
+        "    setp.ge.u32     %p1, %r1, %r3;\n"
+        "    setp.ge.u32     %p2, %r2, %r5;\n"
+        "    or.pred      %p3, %p1, %p2;\n"
+        "    @%p3 bra     $L__BB0_2;\n"
+        "\n"
+        "    cvta.to.global.u64     %rd4, %rd1;\n"
+        "    cvt.u64.u32     %rd5, %r2;\n"
+        "    mul.lo.s64     %rd6, %rd5, %rd2;\n"
+        "    cvt.u64.u32     %rd7, %r1;\n"
+        "    mul.wide.u32     %rd8, %r1, 4;\n"
+        "    add.s64     %rd9, %rd6, %rd8;\n"
+        "    mul.wide.u32     %rd10, %r3, %r2;\n"
+        "    add.s64     %rd11, %rd10, %rd7;\n"
+        "    mul.lo.s64     %rd12, %rd11, 3;\n"
+        "    cvta.to.global.u64     %rd13, %rd3;\n"
+        "    add.s64     %rd14, %rd13, %rd12;\n"
+        "    setp.ne.s32     %p4, %r4, 0;\n"
+        "    selp.b64     %rd15, 2, 0, %p4;\n"
+        "    add.s64     %rd16, %rd15, %rd9;\n"
+        "    add.s64     %rd17, %rd4, %rd16;\n"
+        "    ld.global.u8     %rs1, [%rd17];\n"
+        "    st.global.u8     [%rd14], %rs1;\n"
+        "    add.s64     %rd18, %rd4, %rd9;\n"
+        "    ld.global.u8     %rs2, [%rd18+1];\n"
+        "    st.global.u8     [%rd14+1], %rs2;\n"
+        "    selp.b64     %rd19, 0, 2, %p4;\n"
+        "    add.s64     %rd20, %rd19, %rd9;\n"
+        "    add.s64     %rd21, %rd4, %rd20;\n"
+        "    ld.global.u8     %rs3, [%rd21];\n"
+        "    st.global.u8     [%rd14+2], %rs3;\n"
+        "\n"
+        "$L__BB0_2:\n"
+        "    ret;\n"
+        "\n"
+        "}\n"
+        "    // .globl    rgbaToYuyv\n"
+        ".visible .entry rgbaToYuyv(\n"
+        "    .param .u64 rgbaToYuyv_param_0,\n"
+        "    .param .u64 rgbaToYuyv_param_1,\n"
+        "    .param .u64 rgbaToYuyv_param_2,\n"
+        "    .param .u32 rgbaToYuyv_param_3,\n"
+        "    .param .u32 rgbaToYuyv_param_4\n"
+        ")\n"
+        "{\n"
+        "    .reg .pred     %p<4>;\n"
+        "    .reg .b16     %rs<9>;\n"
+        "    .reg .b32     %r<45>;\n"
+        "    .reg .b64     %rd<16>;\n"
+        "\n"
+        "\n"
+        "    ld.param.u64     %rd1, [rgbaToYuyv_param_0];\n"
+        "    ld.param.u64     %rd2, [rgbaToYuyv_param_1];\n"
+        "    ld.param.u64     %rd3, [rgbaToYuyv_param_2];\n"
+        "    ld.param.u32     %r3, [rgbaToYuyv_param_3];\n"
+        "    ld.param.u32     %r4, [rgbaToYuyv_param_4];\n"
+        "    mov.u32     %r5, %ctaid.x;\n"
+        "    mov.u32     %r6, %ntid.x;\n"
+        "    mov.u32     %r7, %tid.x;\n"
+        "    mad.lo.s32     %r1, %r5, %r6, %r7;\n"
+        "    mov.u32     %r8, %ntid.y;\n"
+        "    mov.u32     %r9, %ctaid.y;\n"
+        "    mov.u32     %r10, %tid.y;\n"
+        "    mad.lo.s32     %r2, %r9, %r8, %r10;\n"
+        "    shr.u32     %r11, %r3, 1;\n"
+        "    setp.ge.u32     %p1, %r1, %r11;\n"
+        "    setp.ge.u32     %p2, %r2, %r4;\n"
+        "    or.pred      %p3, %p2, %p1;\n"
+        "    @%p3 bra     $L__BB1_2;\n"
+        "\n"
+        "    cvta.to.global.u64     %rd4, %rd1;\n"
+        "    cvt.u64.u32     %rd5, %r2;\n"
+        "    mul.lo.s64     %rd6, %rd5, %rd2;\n"
+        "    mul.wide.u32     %rd7, %r1, 8;\n"
+        "    add.s64     %rd8, %rd6, %rd7;\n"
+        "    add.s64     %rd9, %rd4, %rd8;\n"
+        "    mul.wide.u32     %rd10, %r3, %r2;\n"
+        "    mul.wide.u32     %rd11, %r1, 2;\n"
+        "    add.s64     %rd12, %rd10, %rd11;\n"
+        "    shl.b64     %rd13, %rd12, 1;\n"
+        "    cvta.to.global.u64     %rd14, %rd3;\n"
+        "    add.s64     %rd15, %rd14, %rd13;\n"
+        "    ld.global.u8     %r12, [%rd9];\n"
+        "    ld.global.u8     %r13, [%rd9+4];\n"
+        "    add.s32     %r14, %r12, %r13;\n"
+        "    add.s32     %r15, %r14, 1;\n"
+        "    shr.u32     %r16, %r15, 1;\n"
+        "    ld.global.u8     %rs1, [%rd9+1];\n"
+        "    cvt.u32.u16     %r17, %rs1;\n"
+        "    ld.global.u8     %r18, [%rd9+5];\n"
+        "    add.s32     %r19, %r17, %r18;\n"
+        "    add.s32     %r20, %r19, 1;\n"
+        "    shr.u32     %r21, %r20, 1;\n"
+        "    ld.global.u8     %r22, [%rd9+2];\n"
+        "    ld.global.u8     %r23, [%rd9+6];\n"
+        "    add.s32     %r24, %r22, %r23;\n"
+        "    add.s32     %r25, %r24, 1;\n"
+        "    shr.u32     %r26, %r25, 1;\n"
+        "    mul.wide.u16     %r27, %rs1, 129;\n"
+        "    mad.lo.s32     %r28, %r12, 66, %r27;\n"
+        "    add.s32     %r29, %r28, 128;\n"
+        "    mad.lo.s32     %r30, %r22, 25, %r29;\n"
+        "    cvt.u16.u32     %rs2, %r30;\n"
+        "    shr.u16     %rs3, %rs2, 8;\n"
+        "    add.s16     %rs4, %rs3, 16;\n"
+        "    st.global.u8     [%rd15], %rs4;\n"
+        "    mad.lo.s32     %r31, %r16, -38, 32896;\n"
+        "    mad.lo.s32     %r32, %r21, -74, %r31;\n"
+        "    mad.lo.s32     %r33, %r26, 112, %r32;\n"
+        "    shr.u32     %r34, %r33, 8;\n"
+        "    st.global.u8     [%rd15+1], %r34;\n"
+        "    ld.global.u8     %r35, [%rd9+4];\n"
+        "    ld.global.u8     %rs5, [%rd9+5];\n"
+        "    ld.global.u8     %r36, [%rd9+6];\n"
+        "    mul.wide.u16     %r37, %rs5, 129;\n"
+        "    mad.lo.s32     %r38, %r35, 66, %r37;\n"
+        "    add.s32     %r39, %r38, 128;\n"
+        "    mad.lo.s32     %r40, %r36, 25, %r39;\n"
+        "    cvt.u16.u32     %rs6, %r40;\n"
+        "    shr.u16     %rs7, %rs6, 8;\n"
+        "    add.s16     %rs8, %rs7, 16;\n"
+        "    st.global.u8     [%rd15+2], %rs8;\n"
+        "    mad.lo.s32     %r41, %r16, 150, %r31;\n"
+        "    mad.lo.s32     %r42, %r21, -94, %r41;\n"
+        "    mad.lo.s32     %r43, %r26, -18, %r42;\n"
+        "    shr.u32     %r44, %r43, 8;\n"
+        "    st.global.u8     [%rd15+3], %r44;\n"
+        "\n"
+        "$L__BB1_2:\n"
+        "    ret;\n"
+        "\n"
+        "}\n"
+        "    // .globl    rgbaToNv12\n"
+        ".visible .entry rgbaToNv12(\n"
+        "    .param .u64 rgbaToNv12_param_0,\n"
+        "    .param .u64 rgbaToNv12_param_1,\n"
+        "    .param .u64 rgbaToNv12_param_2,\n"
+        "    .param .u32 rgbaToNv12_param_3,\n"
+        "    .param .u32 rgbaToNv12_param_4\n"
+        ")\n"
+        "{\n"
+        "    .reg .pred     %p<4>;\n"
+        "    .reg .b16     %rs<17>;\n"
+        "    .reg .b32     %r<70>;\n"
+        "    .reg .b64     %rd<24>;\n"
+        "\n"
+        "\n"
+        "    ld.param.u64     %rd1, [rgbaToNv12_param_0];\n"
+        "    ld.param.u64     %rd2, [rgbaToNv12_param_1];\n"
+        "    ld.param.u64     %rd3, [rgbaToNv12_param_2];\n"
+        "    ld.param.u32     %r3, [rgbaToNv12_param_3];\n"
+        "    ld.param.u32     %r4, [rgbaToNv12_param_4];\n"
+        "    mov.u32     %r5, %ntid.x;\n"
+        "    mov.u32     %r6, %ctaid.x;\n"
+        "    mov.u32     %r7, %tid.x;\n"
+        "    mad.lo.s32     %r1, %r6, %r5, %r7;\n"
+        "    mov.u32     %r8, %ntid.y;\n"
+        "    mov.u32     %r9, %ctaid.y;\n"
+        "    mov.u32     %r10, %tid.y;\n"
+        "    mad.lo.s32     %r2, %r9, %r8, %r10;\n"
+        "    shr.u32     %r11, %r3, 1;\n"
+        "    setp.ge.u32     %p1, %r1, %r11;\n"
+        "    shr.u32     %r12, %r4, 1;\n"
+        "    setp.ge.u32     %p2, %r2, %r12;\n"
+        "    or.pred      %p3, %p1, %p2;\n"
+        "    @%p3 bra     $L__BB2_2;\n"
+        "\n"
+        "    cvta.to.global.u64     %rd4, %rd3;\n"
+        "    mul.wide.u32     %rd5, %r1, 2;\n"
+        "    cvt.u64.u32     %rd6, %r2;\n"
+        "    mul.wide.u32     %rd7, %r2, 2;\n"
+        "    mul.lo.s64     %rd8, %rd7, %rd2;\n"
+        "    mul.wide.u32     %rd9, %r1, 8;\n"
+        "    add.s64     %rd10, %rd8, %rd9;\n"
+        "    cvta.to.global.u64     %rd11, %rd1;\n"
+        "    add.s64     %rd12, %rd11, %rd10;\n"
+        "    cvt.u64.u32     %rd13, %r3;\n"
+        "    mul.lo.s64     %rd14, %rd7, %rd13;\n"
+        "    add.s64     %rd15, %rd14, %rd5;\n"
+        "    add.s64     %rd16, %rd4, %rd15;\n"
+        "    cvt.u64.u32     %rd17, %r4;\n"
+        "    add.s64     %rd18, %rd17, %rd6;\n"
+        "    mul.lo.s64     %rd19, %rd18, %rd13;\n"
+        "    add.s64     %rd20, %rd19, %rd5;\n"
+        "    add.s64     %rd21, %rd4, %rd20;\n"
+        "    add.s64     %rd22, %rd12, %rd2;\n"
+        "    add.s64     %rd23, %rd16, %rd13;\n"
+        "    ld.global.u8     %r13, [%rd12];\n"
+        "    ld.global.u8     %r14, [%rd12+4];\n"
+        "    ld.global.u8     %r15, [%rd22];\n"
+        "    ld.global.u8     %r16, [%rd22+4];\n"
+        "    add.s32     %r17, %r13, %r14;\n"
+        "    add.s32     %r18, %r17, %r15;\n"
+        "    add.s32     %r19, %r18, %r16;\n"
+        "    add.s32     %r20, %r19, 2;\n"
+        "    shr.u32     %r21, %r20, 2;\n"
+        "    ld.global.u8     %rs1, [%rd12+1];\n"
+        "    cvt.u32.u16     %r22, %rs1;\n"
+        "    ld.global.u8     %r23, [%rd12+5];\n"
+        "    ld.global.u8     %r24, [%rd22+1];\n"
+        "    ld.global.u8     %r25, [%rd22+5];\n"
+        "    add.s32     %r26, %r22, %r23;\n"
+        "    add.s32     %r27, %r26, %r24;\n"
+        "    add.s32     %r28, %r27, %r25;\n"
+        "    add.s32     %r29, %r28, 2;\n"
+        "    shr.u32     %r30, %r29, 2;\n"
+        "    ld.global.u8     %r31, [%rd12+2];\n"
+        "    ld.global.u8     %r32, [%rd12+6];\n"
+        "    ld.global.u8     %r33, [%rd22+2];\n"
+        "    ld.global.u8     %r34, [%rd22+6];\n"
+        "    add.s32     %r35, %r31, %r32;\n"
+        "    add.s32     %r36, %r35, %r33;\n"
+        "    add.s32     %r37, %r36, %r34;\n"
+        "    add.s32     %r38, %r37, 2;\n"
+        "    shr.u32     %r39, %r38, 2;\n"
+        "    mul.wide.u16     %r40, %rs1, 129;\n"
+        "    mad.lo.s32     %r41, %r13, 66, %r40;\n"
+        "    add.s32     %r42, %r41, 128;\n"
+        "    mad.lo.s32     %r43, %r31, 25, %r42;\n"
+        "    cvt.u16.u32     %rs2, %r43;\n"
+        "    shr.u16     %rs3, %rs2, 8;\n"
+        "    add.s16     %rs4, %rs3, 16;\n"
+        "    st.global.u8     [%rd16], %rs4;\n"
+        "    ld.global.u8     %r44, [%rd12+4];\n"
+        "    ld.global.u8     %rs5, [%rd12+5];\n"
+        "    ld.global.u8     %r45, [%rd12+6];\n"
+        "    mul.wide.u16     %r46, %rs5, 129;\n"
+        "    mad.lo.s32     %r47, %r44, 66, %r46;\n"
+        "    add.s32     %r48, %r47, 128;\n"
+        "    mad.lo.s32     %r49, %r45, 25, %r48;\n"
+        "    cvt.u16.u32     %rs6, %r49;\n"
+        "    shr.u16     %rs7, %rs6, 8;\n"
+        "    add.s16     %rs8, %rs7, 16;\n"
+        "    st.global.u8     [%rd16+1], %rs8;\n"
+        "    ld.global.u8     %r50, [%rd22];\n"
+        "    ld.global.u8     %rs9, [%rd22+1];\n"
+        "    ld.global.u8     %r51, [%rd22+2];\n"
+        "    mul.wide.u16     %r52, %rs9, 129;\n"
+        "    mad.lo.s32     %r53, %r50, 66, %r52;\n"
+        "    add.s32     %r54, %r53, 128;\n"
+        "    mad.lo.s32     %r55, %r51, 25, %r54;\n"
+        "    cvt.u16.u32     %rs10, %r55;\n"
+        "    shr.u16     %rs11, %rs10, 8;\n"
+        "    add.s16     %rs12, %rs11, 16;\n"
+        "    st.global.u8     [%rd23], %rs12;\n"
+        "    ld.global.u8     %r56, [%rd22+4];\n"
+        "    ld.global.u8     %rs13, [%rd22+5];\n"
+        "    ld.global.u8     %r57, [%rd22+6];\n"
+        "    mul.wide.u16     %r58, %rs13, 129;\n"
+        "    mad.lo.s32     %r59, %r56, 66, %r58;\n"
+        "    add.s32     %r60, %r59, 128;\n"
+        "    mad.lo.s32     %r61, %r57, 25, %r60;\n"
+        "    cvt.u16.u32     %rs14, %r61;\n"
+        "    shr.u16     %rs15, %rs14, 8;\n"
+        "    add.s16     %rs16, %rs15, 16;\n"
+        "    st.global.u8     [%rd23+1], %rs16;\n"
+        "    mad.lo.s32     %r62, %r21, -38, 32896;\n"
+        "    mad.lo.s32     %r63, %r30, -74, %r62;\n"
+        "    mad.lo.s32     %r64, %r39, 112, %r63;\n"
+        "    shr.u32     %r65, %r64, 8;\n"
+        "    st.global.u8     [%rd21], %r65;\n"
+        "    mad.lo.s32     %r66, %r21, 150, %r62;\n"
+        "    mad.lo.s32     %r67, %r30, -94, %r66;\n"
+        "    mad.lo.s32     %r68, %r39, -18, %r67;\n"
+        "    shr.u32     %r69, %r68, 8;\n"
+        "    st.global.u8     [%rd21+1], %r69;\n"
+        "\n"
+        "$L__BB2_2:\n"
+        "    ret;\n"
+        "\n"
+        "}\n"
+        "\n";
+}
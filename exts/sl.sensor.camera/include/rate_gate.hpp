@@ -0,0 +1,59 @@
+#ifndef RATE_GATE_HPP
+#define RATE_GATE_HPP
+
+#include <algorithm>
+
+namespace sl
+{
+    // Decimates a stream of timestamps (in seconds) down to a target rate.
+    // Accepted timestamps follow a fixed schedule so the average rate matches the target even when the
+    // input rate is not a multiple of it (e.g. 400 Hz out of a 600 Hz physics step).
+    class RateGate {
+    public:
+        // A rate of 0 accepts every new timestamp
+        void setRate(double rate_hz)
+        {
+            period_ = rate_hz > 0.0 ? 1.0 / rate_hz : 0.0;
+        }
+
+        void reset()
+        {
+            next_time_ = 0.0;
+            last_time_ = -1.0;
+        }
+
+        bool accept(double timestamp)
+        {
+            // Time went backwards: the simulation was restarted
+            if (timestamp < last_time_)
+                reset();
+
+            if (timestamp <= last_time_)
+                return false;
+
+            if (last_time_ < 0.0)
+                next_time_ = timestamp;
+
+            // Tolerance absorbs the floating point error accumulated by the simulation clock
+            if (timestamp + period_ * 1e-3 < next_time_)
+                return false;
+
+            // A timestamp that missed a whole period follows a pause or a jump of the simulation clock: the schedule
+            // restarts one period after it, so the missed timestamps are not caught up in a burst. Timestamps late
+            // by less than a period keep the schedule, which holds the average rate of fractional decimations.
+            if (timestamp >= next_time_ + period_)
+                next_time_ = timestamp + period_;
+            else
+                next_time_ += period_;
+            last_time_ = timestamp;
+            return true;
+        }
+
+    private:
+        double period_{ 0.0 };
+        double next_time_{ 0.0 };
+        double last_time_{ -1.0 };
+    };
+}
+
+#endif // RATE_GATE_HPP
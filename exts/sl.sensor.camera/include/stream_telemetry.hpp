@@ -0,0 +1,146 @@
+#ifndef STREAM_TELEMETRY_HPP
+#define STREAM_TELEMETRY_HPP
+
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+
+namespace sl
+{
+    // Snapshot of the streaming performance of one camera. Times are in milliseconds.
+    struct StreamStats {
+        double stream_fps{ 0.0 };
+        double copy_time_ms{ 0.0 };
+        double copy_time_avg_ms{ 0.0 };
+        double stream_call_time_ms{ 0.0 };
+        double stream_call_time_avg_ms{ 0.0 };
+        double stall_time_ms{ 0.0 };
+        int last_stream_status{ 0 };
+        uint64_t frames_streamed{ 0 };
+        uint64_t frames_skipped{ 0 };
+        uint64_t frames_gated{ 0 };
+        uint64_t frames_dropped{ 0 };
+    };
+
+    // Performance counters updated by the thread calling the streamer and read from the graph evaluation thread.
+    // Only one thread records copies and stream calls, frame counters can be recorded and read from any thread.
+    class StreamTelemetry {
+    public:
+        using Clock = std::chrono::steady_clock;
+
+        // Weight of the newest sample in the moving averages
+        static constexpr double kEwmaAlpha = 0.1;
+
+        static double elapsedMs(Clock::time_point start, Clock::time_point end = Clock::now())
+        {
+            return std::chrono::duration<double, std::milli>(end - start).count();
+        }
+
+        void recordCopy(double time_ms)
+        {
+            copy_time_ms_.store(time_ms, std::memory_order_relaxed);
+            copy_time_avg_ms_.store(ewma(copy_time_avg_ms_.load(std::memory_order_relaxed), time_ms), std::memory_order_relaxed);
+        }
+
+        void recordStreamCall(double time_ms, int status)
+        {
+            stream_call_time_ms_.store(time_ms, std::memory_order_relaxed);
+            stream_call_time_avg_ms_.store(ewma(stream_call_time_avg_ms_.load(std::memory_order_relaxed), time_ms), std::memory_order_relaxed);
+            last_stream_status_.store(status, std::memory_order_relaxed);
+            frames_streamed_.fetch_add(1, std::memory_order_relaxed);
+
+            // Achieved frame rate, measured over windows of at least one second
+            const auto now = Clock::now();
+            window_frames_++;
+            const double window_ms = elapsedMs(window_start_, now);
+            if (window_ms >= 1000.0) {
+                stream_fps_.store(window_frames_ * 1000.0 / window_ms, std::memory_order_relaxed);
+                window_start_ = now;
+                window_frames_ = 0;
+            }
+        }
+
+        // Time spent waiting for frame copies to complete
+        void recordStall(double time_ms)
+        {
+            stall_time_ms_.store(stall_time_ms_.load(std::memory_order_relaxed) + time_ms, std::memory_order_relaxed);
+        }
+
+        // Frame already streamed (same timestamp)
+        void recordSkipped()
+        {
+            frames_skipped_.fetch_add(1, std::memory_order_relaxed);
+        }
+
+        // Frame not due yet at the frame rate of the streamer
+        void recordGated()
+        {
+            frames_gated_.fetch_add(1, std::memory_order_relaxed);
+        }
+
+        // Frame that never reached the streamer
+        void recordDropped(uint64_t count = 1)
+        {
+            frames_dropped_.fetch_add(count, std::memory_order_relaxed);
+        }
+
+        StreamStats snapshot() const
+        {
+            StreamStats stats;
+            stats.stream_fps = stream_fps_.load(std::memory_order_relaxed);
+            stats.copy_time_ms = copy_time_ms_.load(std::memory_order_relaxed);
+            stats.copy_time_avg_ms = copy_time_avg_ms_.load(std::memory_order_relaxed);
+            stats.stream_call_time_ms = stream_call_time_ms_.load(std::memory_order_relaxed);
+            stats.stream_call_time_avg_ms = stream_call_time_avg_ms_.load(std::memory_order_relaxed);
+            stats.stall_time_ms = stall_time_ms_.load(std::memory_order_relaxed);
+            stats.last_stream_status = last_stream_status_.load(std::memory_order_relaxed);
+            stats.frames_streamed = frames_streamed_.load(std::memory_order_relaxed);
+            stats.frames_skipped = frames_skipped_.load(std::memory_order_relaxed);
+            stats.frames_gated = frames_gated_.load(std::memory_order_relaxed);
+            stats.frames_dropped = frames_dropped_.load(std::memory_order_relaxed);
+            return stats;
+        }
+
+        // Must not be called while another thread records
+        void reset()
+        {
+            stream_fps_ = 0.0;
+            copy_time_ms_ = 0.0;
+            copy_time_avg_ms_ = 0.0;
+            stream_call_time_ms_ = 0.0;
+            stream_call_time_avg_ms_ = 0.0;
+            stall_time_ms_ = 0.0;
+            last_stream_status_ = 0;
+            frames_streamed_ = 0;
+            frames_skipped_ = 0;
+            frames_gated_ = 0;
+            frames_dropped_ = 0;
+            window_start_ = Clock::now();
+            window_frames_ = 0;
+        }
+
+    private:
+        static double ewma(double average, double sample)
+        {
+            return average == 0.0 ? sample : average + kEwmaAlpha * (sample - average);
+        }
+
+        std::atomic<double> stream_fps_{ 0.0 };
+        std::atomic<double> copy_time_ms_{ 0.0 };
+        std::atomic<double> copy_time_avg_ms_{ 0.0 };
+        std::atomic<double> stream_call_time_ms_{ 0.0 };
+        std::atomic<double> stream_call_time_avg_ms_{ 0.0 };
+        std::atomic<double> stall_time_ms_{ 0.0 };
+        std::atomic<int> last_stream_status_{ 0 };
+        std::atomic<uint64_t> frames_streamed_{ 0 };
+        std::atomic<uint64_t> frames_skipped_{ 0 };
+        std::atomic<uint64_t> frames_gated_{ 0 };
+        std::atomic<uint64_t> frames_dropped_{ 0 };
+
+        // Only accessed by the recording thread
+        Clock::time_point window_start_{ Clock::now() };
+        uint64_t window_frames_{ 0 };
+    };
+}
+
+#endif // STREAM_TELEMETRY_HPP
@@ -0,0 +1,169 @@
+#ifndef STREAMER_REGISTRY_HPP
+#define STREAMER_REGISTRY_HPP
+
+#include <algorithm>
+#include <cstdint>
+#include <functional>
+#include <map>
+#include <mutex>
+#include <string>
+#include <unordered_map>
+#include <unordered_set>
+#include <vector>
+
+namespace sl
+{
+    // Process-wide allocator of streamer IDs and virtual camera serial numbers, safe to use from any thread.
+    //
+    // Each camera model has a pool of serial numbers: the known serials of the model, followed by serials generated
+    // deterministically with the same leading digits, so the same scene always gets the same serial numbers.
+    // Generated serials never match a known serial nor a serial of another pool, models sharing leading digits
+    // (e.g. ZED_X and ZED_X_4MM) included. Leasing and releasing a serial number or a streamer ID is O(1).
+    //
+    // Whether the ZED SDK accepts generated serials is only known from the validator given to leaseSerialNumber(),
+    // typically ZedStreamer::isSNValid. A model whose generated serials are rejected is limited to its known serials.
+    class StreamerRegistry {
+    public:
+        // Checks whether a serial number is accepted, typically by the ZED SDK
+        using SerialValidator = std::function<bool(int)>;
+
+        StreamerRegistry(const std::map<std::string, std::vector<int>>& known_serials, size_t pool_size)
+        {
+            // Built at once, in model name order, so that the serials of every pool are disjoint and do not depend on
+            // the order in which the models are first used
+            std::unordered_set<int> used;
+            for (const auto& known : known_serials) {
+                used.insert(known.second.begin(), known.second.end());
+            }
+            for (const auto& known : known_serials) {
+                const size_t generated_count = pool_size > known.second.size() ? pool_size - known.second.size() : 0;
+                std::vector<int> serials = generateSerialNumbers(known.first, known.second, generated_count, used);
+                // Leased from the back: known serials first, in the order they were always given, then generated ones
+                std::reverse(serials.begin(), serials.end());
+                serials.insert(serials.end(), known.second.begin(), known.second.end());
+                pools_[known.first] = std::move(serials);
+            }
+        }
+
+        // Lowest streamer ID never used, or the most recently released one
+        int leaseStreamerId() {
+            std::lock_guard<std::mutex> lock(mutex_);
+            if (!free_ids_.empty()) {
+                const int id = free_ids_.back();
+                free_ids_.pop_back();
+                return id;
+            }
+            return next_id_++;
+        }
+
+        void releaseStreamerId(int id) {
+            std::lock_guard<std::mutex> lock(mutex_);
+            if (id >= 0 && id < next_id_) {
+                free_ids_.push_back(id);
+            }
+        }
+
+        // Next free serial number of the camera model, or -1 if the pool is exhausted or the model unknown.
+        // Serial numbers rejected by the validator are never leased again.
+        int leaseSerialNumber(const std::string& camera_model, const SerialValidator& is_valid = nullptr) {
+            std::lock_guard<std::mutex> lock(mutex_);
+            auto found = pools_.find(camera_model);
+            if (found == pools_.end())
+                return -1;
+            std::vector<int>* pool = &found->second;
+
+            while (!pool->empty()) {
+                const int serial_number = pool->back();
+                pool->pop_back();
+                if (leased_.count(serial_number))
+                    continue; // reserved as a virtual camera serial number in the meantime
+                if (is_valid && !is_valid(serial_number))
+                    continue;
+                leased_.insert(serial_number);
+                leased_models_[serial_number] = camera_model;
+                return serial_number;
+            }
+            return -1;
+        }
+
+        // Marks a serial number chosen by the user (virtual cameras) as used. Returns false if it is already used.
+        bool reserveSerialNumber(int serial_number) {
+            std::lock_guard<std::mutex> lock(mutex_);
+            return leased_.insert(serial_number).second;
+        }
+
+        // Gives back a leased or reserved serial number. Returns false if it was not in use.
+        bool releaseSerialNumber(int serial_number) {
+            std::lock_guard<std::mutex> lock(mutex_);
+            if (leased_.erase(serial_number) == 0)
+                return false;
+
+            auto model = leased_models_.find(serial_number);
+            if (model != leased_models_.end()) {
+                pools_[model->second].push_back(serial_number);
+                leased_models_.erase(model);
+            }
+            return true;
+        }
+
+        size_t leasedSerialCount() const {
+            std::lock_guard<std::mutex> lock(mutex_);
+            return leased_.size();
+        }
+
+        // Serial numbers generated for a model, after its known serials. Serials in used are skipped, and the generated
+        // ones are added to it.
+        static std::vector<int> generateSerialNumbers(const std::string& camera_model, const std::vector<int>& known, size_t count,
+            std::unordered_set<int>& used) {
+            std::vector<int> serials;
+            if (known.empty() || count == 0)
+                return serials;
+
+            // Keep the leading digits of the model, serials of the model have the same number of digits
+            const int sample = known.front();
+            int digits = 0;
+            for (int value = sample; value > 0; value /= 10)
+                digits++;
+            int scale = 1;
+            for (int i = 0; i < 7 && i < digits - 1; i++)
+                scale *= 10;
+            const int prefix = sample / scale;
+
+            used.insert(known.begin(), known.end());
+            uint64_t state = fnv1a(camera_model);
+            while (serials.size() < count) {
+                const int serial_number = prefix * scale + static_cast<int>(splitmix64(state) % static_cast<uint64_t>(scale));
+                if (used.insert(serial_number).second) {
+                    serials.push_back(serial_number);
+                }
+            }
+            return serials;
+        }
+
+    private:
+        // Stable across platforms and runs, unlike std::hash
+        static uint64_t fnv1a(const std::string& text) {
+            uint64_t hash = 0xCBF29CE484222325ULL;
+            for (unsigned char c : text) {
+                hash = (hash ^ c) * 0x100000001B3ULL;
+            }
+            return hash;
+        }
+
+        static uint64_t splitmix64(uint64_t& state) {
+            uint64_t z = (state += 0x9E3779B97F4A7C15ULL);
+            z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+            z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+            return z ^ (z >> 31);
+        }
+
+        mutable std::mutex mutex_;
+        std::map<std::string, std::vector<int>> pools_;
+        std::unordered_set<int> leased_;
+        std::unordered_map<int, std::string> leased_models_;
+        std::vector<int> free_ids_;
+        int next_id_{ 0 };
+    };
+}
+
+#endif // STREAMER_REGISTRY_HPP
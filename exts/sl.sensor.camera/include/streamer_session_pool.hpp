@@ -0,0 +1,275 @@
+#ifndef STREAMER_SESSION_POOL_HPP
+#define STREAMER_SESSION_POOL_HPP
+
+#include <algorithm>
+#include <chrono>
+#include <condition_variable>
+#include <cstdint>
+#include <functional>
+#include <map>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <tuple>
+#include <utility>
+#include <vector>
+
+namespace sl
+{
+    // Configuration of a streamer, a parked session is only reused for an identical one
+    struct StreamerSessionKey {
+        unsigned short port{ 0 };
+        std::string camera_model;
+        // Given serial number of a virtual camera, -1 for a serial number allocated from the camera model
+        int serial_number{ -1 };
+        int width{ 0 };
+        int height{ 0 };
+        int fps{ 0 };
+        int codec_type{ 0 };
+        int transport_layer_mode{ 0 };
+        int input_format{ 0 };
+        int bitrate{ 0 };
+        int chunk_size{ 0 };
+        bool alpha_channel_included{ false };
+
+        bool operator<(const StreamerSessionKey& other) const
+        {
+            return std::tie(port, camera_model, serial_number, width, height, fps, codec_type, transport_layer_mode, input_format,
+                       bitrate, chunk_size, alpha_channel_included) <
+                std::tie(other.port, other.camera_model, other.serial_number, other.width, other.height, other.fps, other.codec_type,
+                    other.transport_layer_mode, other.input_format, other.bitrate, other.chunk_size, other.alpha_channel_included);
+        }
+    };
+
+    // Initialized streamer of the ZED SDK, with the streamer ID and serial number it holds
+    struct StreamerSession {
+        int streamer_id{ -1 };
+        int serial_number{ 0 };
+        // Last timestamp streamed, a session taken over streams later timestamps only
+        uint64_t last_timestamp_ns{ 0 };
+        // Closes the streamer and releases its streamer ID and serial number, called once when the session is evicted
+        std::function<void()> close;
+    };
+
+    // Process-wide pool of idle streamers. Initializing a streamer creates an encoder session in the ZED SDK, which is
+    // slow, so a stream stopping parks its streamer here and the next stream with the same configuration takes it over.
+    // Parked sessions are closed after their idle timeout by a thread running while the pool holds sessions, or by flush().
+    class StreamerSessionPool {
+    public:
+        using Clock = std::chrono::steady_clock;
+
+        struct Stats {
+            uint64_t hits{ 0 };
+            uint64_t misses{ 0 };
+            uint64_t parked{ 0 };
+            uint64_t evicted{ 0 };
+            uint64_t flushed{ 0 };
+            size_t idle{ 0 };
+        };
+
+        // Never destroyed, like the ZED SDK library the sessions hold. Call flush() on extension shutdown instead.
+        static StreamerSessionPool& instance()
+        {
+            static StreamerSessionPool* pool = new StreamerSessionPool();
+            return *pool;
+        }
+
+        // Removes the session parked with key, returns false if there is none
+        bool take(const StreamerSessionKey& key, StreamerSession& session)
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            auto it = sessions_.find(key);
+            if (it == sessions_.end()) {
+                stats_.misses++;
+                return false;
+            }
+            session = std::move(it->second.session);
+            sessions_.erase(it);
+            stats_.hits++;
+            return true;
+        }
+
+        bool contains(const StreamerSessionKey& key) const
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            return sessions_.count(key) > 0;
+        }
+
+        // Keeps the session for idle_timeout, or closes it right away if the timeout is zero.
+        // A session already parked with the same key is closed.
+        void park(const StreamerSessionKey& key, StreamerSession session, std::chrono::milliseconds idle_timeout)
+        {
+            if (idle_timeout.count() <= 0) {
+                closeSession(session);
+                return;
+            }
+
+            StreamerSession replaced;
+            {
+                std::lock_guard<std::mutex> lock(mutex_);
+                auto it = sessions_.find(key);
+                if (it != sessions_.end()) {
+                    replaced = std::move(it->second.session);
+                    sessions_.erase(it);
+                }
+                sessions_[key] = Entry{ std::move(session), Clock::now() + idle_timeout };
+                stats_.parked++;
+
+                if (!reaper_running_) {
+                    if (reaper_.joinable()) {
+                        reaper_.join();
+                    }
+                    reaper_running_ = true;
+                    reaper_ = std::thread(&StreamerSessionPool::reaperThreadFunc, this);
+                }
+            }
+            cv_.notify_all();
+            closeSession(replaced);
+        }
+
+        // Closes the sessions idle since their timeout, returns how many were closed
+        size_t evictIdle(Clock::time_point now = Clock::now())
+        {
+            std::vector<StreamerSession> expired;
+            {
+                std::lock_guard<std::mutex> lock(mutex_);
+                expired = takeExpired(now);
+                stats_.evicted += expired.size();
+            }
+            for (auto& session : expired) {
+                closeSession(session);
+            }
+            return expired.size();
+        }
+
+        // Closes the parked sessions whose key matches, e.g. those holding a port needed by another configuration.
+        // Returns how many were closed.
+        size_t evict(const std::function<bool(const StreamerSessionKey&)>& match)
+        {
+            std::vector<StreamerSession> matched;
+            {
+                std::lock_guard<std::mutex> lock(mutex_);
+                for (auto it = sessions_.begin(); it != sessions_.end();) {
+                    if (match(it->first)) {
+                        matched.push_back(std::move(it->second.session));
+                        it = sessions_.erase(it);
+                    }
+                    else {
+                        ++it;
+                    }
+                }
+                stats_.evicted += matched.size();
+            }
+            for (auto& session : matched) {
+                closeSession(session);
+            }
+            return matched.size();
+        }
+
+        // Closes every parked session and stops the eviction thread, returns how many sessions were closed
+        size_t flush()
+        {
+            std::vector<StreamerSession> flushed;
+            {
+                std::lock_guard<std::mutex> lock(mutex_);
+                for (auto& entry : sessions_) {
+                    flushed.push_back(std::move(entry.second.session));
+                }
+                sessions_.clear();
+                stats_.flushed += flushed.size();
+            }
+            cv_.notify_all();
+            for (auto& session : flushed) {
+                closeSession(session);
+            }
+
+            // The eviction thread exits once it sees the pool empty, unless a session was parked again meanwhile
+            std::thread reaper;
+            {
+                std::unique_lock<std::mutex> lock(mutex_);
+                cv_.wait(lock, [&] { return !reaper_running_ || !sessions_.empty(); });
+                if (!reaper_running_) {
+                    reaper = std::move(reaper_);
+                }
+            }
+            if (reaper.joinable()) {
+                reaper.join();
+            }
+            return flushed.size();
+        }
+
+        Stats stats() const
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            Stats stats = stats_;
+            stats.idle = sessions_.size();
+            return stats;
+        }
+
+    private:
+        struct Entry {
+            StreamerSession session;
+            Clock::time_point deadline;
+        };
+
+        StreamerSessionPool() = default;
+
+        static void closeSession(StreamerSession& session)
+        {
+            if (session.close) {
+                session.close();
+                session.close = nullptr;
+            }
+        }
+
+        // Must be called with the mutex held
+        std::vector<StreamerSession> takeExpired(Clock::time_point now)
+        {
+            std::vector<StreamerSession> expired;
+            for (auto it = sessions_.begin(); it != sessions_.end();) {
+                if (it->second.deadline <= now) {
+                    expired.push_back(std::move(it->second.session));
+                    it = sessions_.erase(it);
+                }
+                else {
+                    ++it;
+                }
+            }
+            return expired;
+        }
+
+        // Sleeps until the next deadline, and exits once the pool is empty
+        void reaperThreadFunc()
+        {
+            std::unique_lock<std::mutex> lock(mutex_);
+            while (!sessions_.empty()) {
+                Clock::time_point next = Clock::time_point::max();
+                for (const auto& entry : sessions_) {
+                    next = std::min(next, entry.second.deadline);
+                }
+                cv_.wait_until(lock, next);
+
+                std::vector<StreamerSession> expired = takeExpired(Clock::now());
+                stats_.evicted += expired.size();
+                if (!expired.empty()) {
+                    lock.unlock();
+                    for (auto& session : expired) {
+                        closeSession(session);
+                    }
+                    lock.lock();
+                }
+            }
+            reaper_running_ = false;
+            cv_.notify_all();
+        }
+
+        mutable std::mutex mutex_;
+        std::condition_variable cv_;
+        std::map<StreamerSessionKey, Entry> sessions_;
+        std::thread reaper_;
+        bool reaper_running_{ false };
+        Stats stats_;
+    };
+}
+
+#endif // STREAMER_SESSION_POOL_HPP
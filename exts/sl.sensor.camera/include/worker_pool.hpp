@@ -0,0 +1,109 @@
+#ifndef WORKER_POOL_HPP
+#define WORKER_POOL_HPP
+
+#include <condition_variable>
+#include <cstddef>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace sl
+{
+    // Fixed set of threads running the iterations of a parallel loop. Only one thread may call run() at a time.
+    class WorkerPool {
+    public:
+        explicit WorkerPool(size_t thread_count = 0) {
+            resize(thread_count);
+        }
+
+        ~WorkerPool() {
+            resize(0);
+        }
+
+        WorkerPool(const WorkerPool&) = delete;
+        WorkerPool& operator=(const WorkerPool&) = delete;
+
+        // Number of pool threads, the thread calling run() also executes iterations
+        size_t size() const { return threads_.size(); }
+
+        // Must not be called during run()
+        void resize(size_t thread_count) {
+            if (thread_count == threads_.size())
+                return;
+
+            {
+                std::lock_guard<std::mutex> lock(mutex_);
+                stop_ = true;
+            }
+            work_.notify_all();
+            for (auto& thread : threads_) {
+                thread.join();
+            }
+            threads_.clear();
+
+            stop_ = false;
+            for (size_t i = 0; i < thread_count; i++) {
+                threads_.emplace_back(&WorkerPool::workerFunc, this);
+            }
+        }
+
+        // Runs task(i) for every i in [0, count) and returns once all of them completed
+        void run(size_t count, const std::function<void(size_t)>& task) {
+            if (count == 0)
+                return;
+
+            std::unique_lock<std::mutex> lock(mutex_);
+            task_ = &task;
+            count_ = count;
+            next_ = 0;
+            remaining_ = count;
+            lock.unlock();
+            work_.notify_all();
+
+            lock.lock();
+            while (next_ < count_) {
+                runNext(lock);
+            }
+            done_.wait(lock, [&] { return remaining_ == 0; });
+            task_ = nullptr;
+            count_ = 0;
+            next_ = 0;
+        }
+
+    private:
+        // Called with the lock held, releases it while the iteration runs
+        void runNext(std::unique_lock<std::mutex>& lock) {
+            const size_t index = next_++;
+            const auto* task = task_;
+            lock.unlock();
+            (*task)(index);
+            lock.lock();
+            if (--remaining_ == 0) {
+                done_.notify_all();
+            }
+        }
+
+        void workerFunc() {
+            std::unique_lock<std::mutex> lock(mutex_);
+            while (true) {
+                work_.wait(lock, [&] { return stop_ || next_ < count_; });
+                if (stop_)
+                    return;
+                runNext(lock);
+            }
+        }
+
+        std::vector<std::thread> threads_;
+        std::mutex mutex_;
+        std::condition_variable work_;
+        std::condition_variable done_;
+        const std::function<void(size_t)>* task_{ nullptr };
+        size_t count_{ 0 };
+        size_t next_{ 0 };
+        size_t remaining_{ 0 };
+        bool stop_{ false };
+    };
+}
+
+#endif // WORKER_POOL_HPP
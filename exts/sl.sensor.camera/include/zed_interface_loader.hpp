@@ -1,6 +1,10 @@
 #ifndef ZED_INTERFACE_LOADER_HPP
 #define ZED_INTERFACE_LOADER_HPP
 
+#include <atomic>
+#include <cstdlib>
+#include <memory>
+#include <mutex>
 #include <string>
 #include <iostream>
 
@@ -26,49 +30,29 @@ using LibHandle = void*;
 
 namespace sl
 {
-    // Simple double buffer for frame data
-    template <typename T>
-    class DoubleBuffer {
-    private:
-        std::array<std::shared_ptr<T>, 2> buffers_;
-        std::atomic<int> front_index_{ 0 };
-        std::atomic<int> frame_index_{ 0 }; // frame index counter to detect new data
-
-    public:
-        DoubleBuffer() {
-            buffers_[0] = std::make_shared<T>();
-            buffers_[1] = std::make_shared<T>();
-        }
-
-        // Producer: write and increment version to signal new data
-        void write(std::shared_ptr<T> data) {
-            int back_index = 1 - front_index_.load(std::memory_order_relaxed);
-            buffers_[back_index] = std::move(data);
-
-            // Swap buffer and signal version
-            front_index_.store(back_index, std::memory_order_release);
-            frame_index_.fetch_add(1, std::memory_order_release);
+    // Environment variable overriding the path of the ZED SDK streaming library, e.g. to use the stand-in library
+    constexpr const char* kZedLibraryEnvVar = "SL_ZED_LIBRARY";
+
+    // Path of the ZED SDK streaming library loaded by the nodes
+    inline std::string zedLibraryPath()
+    {
+        const char* env_path = std::getenv(kZedLibraryEnvVar);
+        if (env_path && *env_path)
+        {
+            CARB_LOG_INFO("[ZED] Using ZED library %s from %s", env_path, kZedLibraryEnvVar);
+            return env_path;
         }
 
-        // Consumer: wait until version changes
-        std::shared_ptr<T> wait_and_read(std::atomic<bool>& shouldStop, int& frameIndex) {
-            while (true) {
-                int current_index = frame_index_.load(std::memory_order_acquire);
-                if (current_index != frameIndex) {
-                    frameIndex = current_index;
-                    int index = front_index_.load(std::memory_order_acquire);
-                    return buffers_[index];
-                }
-
-                if (shouldStop.load(std::memory_order_acquire)) {
-                    return nullptr;
-                }
-
-                // Yield or sleep lightly to reduce CPU usage
-                std::this_thread::sleep_for(std::chrono::microseconds(100));
-            }
-        }
-    };
+        std::string prefix = "";
+        std::string suffix = "";
+#ifndef _WIN32
+        prefix = "lib";
+        suffix = ".so";
+#else
+        suffix = "64.dll";
+#endif
+        return prefix + "sl_zed" + suffix;
+    }
 
     class ZedStreamer {
     private:
@@ -96,6 +80,9 @@ namespace sl
 
         bool loaded;
 
+        // Set once a streamer was initialized, until the ZED SDK instance is destroyed
+        std::atomic<bool> instance_created{ false };
+
     public:
         ZedStreamer() : hLibrary(nullptr), loaded(false) {
             get_sdk_version = nullptr;
@@ -223,7 +210,11 @@ namespace sl
             }
             CARB_LOG_WARN("Initializing streamer with ID %d on port %d", streamer_id, streaming_params->port);
 
-            return init_streamer(streamer_id, streaming_params);
+            const int status = init_streamer(streamer_id, streaming_params);
+            if (status > 0) {
+                instance_created = true;
+            }
+            return status;
         }
 
         int stream(sl::INPUT_FORMAT input, int streamer_id, unsigned char* left, unsigned char* right,
@@ -264,6 +255,12 @@ namespace sl
                 return;
             }
             destroy_instance();
+            instance_created = false;
+        }
+
+        // Whether a streamer was initialized since the ZED SDK instance was last destroyed
+        bool hasInstance() const {
+            return instance_created;
         }
 
         int* getVirtualCameraIdentifiers(int* size_out) {
@@ -294,5 +291,37 @@ namespace sl
         }
     };
 
+    // ZED SDK library shared by every node of the process. It is loaded, checked and bound on the first call, then
+    // stays loaded as long as a node holds a reference. Releasing the last reference destroys the ZED SDK instance and
+    // unloads the library, so a node that stops can no longer pull the symbols from under the other ones.
+    // Returns nullptr if the library cannot be loaded or its version is not compatible.
+    inline std::shared_ptr<ZedStreamer> acquireZedLibrary()
+    {
+        // Recursive, the last reference can be released by a failed acquisition below
+        static std::recursive_mutex mutex;
+        static std::weak_ptr<ZedStreamer> shared_library;
+
+        std::lock_guard<std::recursive_mutex> lock(mutex);
+        if (auto library = shared_library.lock())
+            return library;
+
+        std::shared_ptr<ZedStreamer> library(new ZedStreamer(), [](ZedStreamer* zed_streamer) {
+            std::lock_guard<std::recursive_mutex> release_lock(mutex);
+            if (zed_streamer->hasInstance()) {
+                zed_streamer->destroyInstance();
+            }
+            delete zed_streamer;
+        });
+
+        const std::string lib_name = zedLibraryPath();
+        if (!library->load_lib(lib_name) || !library->isZEDSDKCompatible())
+            return nullptr;
+
+        library->load_api();
+        shared_library = library;
+        CARB_LOG_INFO("[ZED] Successfully found and loaded ZED SDK from %s", lib_name.c_str());
+        return library;
+    }
+
 }
 #endif // ZED_INTERFACE_LOADER_HPP
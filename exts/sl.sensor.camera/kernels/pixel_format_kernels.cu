@@ -0,0 +1,47 @@
+// Conversions of the ZED Stream node from the RGBA images rendered on the GPU to the layout handed to the ZED SDK,
+// run before the device to host copy so that only the converted bytes cross PCIe. The per-pixel code is shared with
+// the CPU reference of pixel_format.hpp.
+//
+// The plugin is built without nvcc: this file is compiled to PTX with NVRTC by tools/embed_ptx.py, which writes
+// include/pixel_format_kernels_ptx.h, and the PTX is loaded at run time by plugins/nodes/ZEDPixelConversion.h.
+// Regenerate the header after any change to this file or to pixel_conversion.hpp.
+
+#include "pixel_conversion.hpp"
+
+// One thread per pixel, RGBA to 3 bytes per pixel in RGB or BGR order
+extern "C" __global__ void rgbaToPacked(const unsigned char* src, unsigned long long src_pitch, unsigned char* dst,
+    unsigned int width, unsigned int height, int bgr)
+{
+    const unsigned int x = blockIdx.x * blockDim.x + threadIdx.x;
+    const unsigned int y = blockIdx.y * blockDim.y + threadIdx.y;
+    if (x >= width || y >= height)
+        return;
+    sl::pixel::packPixel(src + y * src_pitch + x * 4ull, dst + (static_cast<unsigned long long>(y) * width + x) * 3ull, bgr != 0);
+}
+
+// One thread per pair of pixels, RGBA to YUYV 4:2:2
+extern "C" __global__ void rgbaToYuyv(const unsigned char* src, unsigned long long src_pitch, unsigned char* dst,
+    unsigned int width, unsigned int height)
+{
+    const unsigned int pair = blockIdx.x * blockDim.x + threadIdx.x;
+    const unsigned int y = blockIdx.y * blockDim.y + threadIdx.y;
+    if (pair >= width / 2 || y >= height)
+        return;
+    sl::pixel::yuyvPair(src + y * src_pitch + pair * 8ull, dst + (static_cast<unsigned long long>(y) * width + pair * 2ull) * 2ull);
+}
+
+// One thread per block of 2x2 pixels, RGBA to NV12
+extern "C" __global__ void rgbaToNv12(const unsigned char* src, unsigned long long src_pitch, unsigned char* dst,
+    unsigned int width, unsigned int height)
+{
+    const unsigned int block_x = blockIdx.x * blockDim.x + threadIdx.x;
+    const unsigned int block_y = blockIdx.y * blockDim.y + threadIdx.y;
+    if (block_x >= width / 2 || block_y >= height / 2)
+        return;
+    const unsigned long long x = block_x * 2ull;
+    const unsigned long long y = block_y * 2ull;
+    const unsigned char* top = src + y * src_pitch + x * 4ull;
+    unsigned char* y_top = dst + y * width + x;
+    unsigned char* uv = dst + static_cast<unsigned long long>(width) * height + block_y * static_cast<unsigned long long>(width) + x;
+    sl::pixel::nv12Block(top, top + src_pitch, y_top, y_top + width, uv);
+}
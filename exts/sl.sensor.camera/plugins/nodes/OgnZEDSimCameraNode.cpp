@@ -14,266 +14,162 @@
 #include <mutex>
 #include <atomic>
 #include <memory>
+#include <array>
+#include <vector>
 
 #include <OgnZEDSimCameraNodeDatabase.h>
-#include <cuda/include/cuda_runtime_api.h>
-#include "zed_interface_loader.hpp"
-#include "types_c.h"
+#include "frame_queue.hpp"
+#include "ZEDCameraStream.h"
 
 // Helpers to explicit shorten names you know you will use
 using omni::graph::core::Type;
 using omni::graph::core::BaseDataType;
 
-#define CUDA_CHECK(call)                                                   \
-do {                                                                       \
-    cudaError_t err = call;                                                \
-    if (err != cudaSuccess) {                                              \
-        fprintf(stderr, "CUDA error at %s %d: %s\n", __FILE__, __LINE__,   \
-                cudaGetErrorString(err));                                  \
-        /* Instead of exiting, log the error and continue */               \
-        return true;                                                       \
-    }                                                                      \
-} while (0)
-
 namespace sl {
     namespace sensor{
         namespace camera {
 
-            static int streamer_id = 0;
-
-            // Data struct shared to the streaming thread
-            struct FrameData {
-                const void* raw_ptr_left{ nullptr };
-                const void* raw_ptr_right{ nullptr };
-                const size_t data_size_left{ 0 };
-                const size_t data_size_right{ 0 };
-                GfQuatd quaternion;
-                GfVec3d linear_acceleration;
-                double timestamp;
-                bool valid = false;
-
-                FrameData() = default;
-
-                FrameData(const void* left_ptr, size_t left_size,
-                    const void* right_ptr = nullptr, size_t right_size = 0)
-                    : raw_ptr_left(left_ptr)
-                    , raw_ptr_right(right_ptr)
-                    , data_size_left(left_size)
-                    , data_size_right(right_size)
-                {
-                }
-            };
-
-            // List of available SN per camera model
-            static std::map<std::string, std::vector<int>> available_zed_cameras = {
-                {"ZED_X",   { 40976320, 41116066, 49123828, 45626933 }},
-                {"ZED_X_4MM", { 47890353,45263213,47800035,47706147 }},
-                {"ZED_XM",   { 57890353,55263213,57800035,57706147 }},
-                {"ZED_XM_4MM",   { 50179396,52835616,59695059,55043860 }},
-                {"ZED_XONE_UHD",   { 312015765, 312817871,315177501, 313382320 }},
-                {"ZED_XONE_GS",   { 305221009, 305952675, 307526942, 307184845 }},
-                {"ZED_XONE_GS_4MM",   {300605725, 302696256, 302485375, 307845777 }}
-            };
-
-            // List of currently opened cameras
-            static std::map<std::string, std::vector<int>> remaining_serial_numbers = {};
-
-            // Try to open a new streamer given a camera model. Check if a serial number is still available among the list.
-            static int addStreamer(const std::string& camera_model)
-            {
-                if (remaining_serial_numbers[camera_model].size() > 0)
-                {
-                    int serial_number = remaining_serial_numbers[camera_model][remaining_serial_numbers[camera_model].size() - 1];
-                    remaining_serial_numbers[camera_model].pop_back();
-                    return serial_number;
-                }
-
-                CARB_LOG_FATAL("[ZED] Maximum number of %s camera reached!", camera_model.c_str());
-                return -1;
-            }
-
-            static int removeStreamer(const std::string& camera_model, int serial_number)
-            {
-                // If the serial number is already in the list, do not add it again
-                if (std::find(remaining_serial_numbers[camera_model].begin(),
-                    remaining_serial_numbers[camera_model].end(),
-                    serial_number) != remaining_serial_numbers[camera_model].end())
-                {
-                    CARB_LOG_ERROR("[ZED] Trying to remove invalid serial number %d for camera model %s",
-                        serial_number, camera_model.c_str());
-                    return -1;
-                }
-                remaining_serial_numbers[camera_model].push_back(serial_number);
-                return 0;
-            }
-
-            static int transportLayerModeToInt(const std::string& mode_str)
-            {
-                if (mode_str == "NETWORK")
-                    return 0;
-                else if (mode_str == "IPC")
-                    return 1;
-                else if (mode_str == "BOTH")
-                    return 2;
-                else
-                {
-                    CARB_LOG_WARN("[ZED] Invalid transport layer mode string %s, defaulting to RTP_ONLY", mode_str.c_str());
-                    return 0;
-                }
-            }
+            // Number of preallocated frame slots used by the asynchronous streaming mode, in addition to the queue depth.
+            // The streaming thread holds one slot and the graph evaluation thread fills another one. Each frame slot has
+            // its own staging slot in the CameraStream, holding the copy of its images.
+            static constexpr size_t kExtraFrameSlotCount = 2;
 
             class OgnZEDSimCameraNode
             {
-                sl::StreamingParameters m_zedStreamerParams;
-                sl::ZedStreamer m_zedStreamer;
-                cudaStream_t m_cudaStream;
-                bool m_cudaStreamNotCreated{ true };
+                // ZED SDK library shared with the other nodes, it stays loaded until the last of them is released
+                std::shared_ptr<sl::ZedStreamer> m_zedStreamer;
+                CameraStream m_cameraStream;
+                LazyCudaStream m_cudaStream;
+                LazyCudaStream m_cudaStreamRight;
+                bool m_splitEyeStreams{ false };
+                bool m_sideBySide{ false };
+
+                // Tiles of the camera when its images are part of a tiled image, not tiled with 0 tile columns
+                unsigned int m_tileColumns{ 0 };
+                int m_tileLeft{ 0 };
+                int m_tileRight{ -1 };
                 int m_zedStreamerInitStatus{ -1 };
-                bool m_stereo_camera{ true };
                 bool m_valid{ false };
-                double previous_timestamp{ 0.0f };
 
                 // Threading members
+                bool m_asyncStreaming{ false };
                 std::thread m_streamingThread;
                 std::atomic<bool> m_shouldStop{ false };
-                sl::DoubleBuffer<FrameData> m_frameBuffer;
-                unsigned int m_streamer_id{ 0 };
+                sl::FrameQueue<FrameData> m_frameQueue;
+                std::vector<std::shared_ptr<FrameData>> m_frameSlots;
 
-                size_t allocated_size_left{0};
-                size_t allocated_size_right{0};
-                std::unique_ptr<unsigned char[]> data_ptr_left{nullptr};
-                std::unique_ptr<unsigned char[]> data_ptr_right{nullptr};
+                // High-rate IMU path, fed by the ZED IMU Stream node at physics step rate
+                std::shared_ptr<ImuChannel> m_imuChannel;
 
-                static const pxr::GfMatrix4d rotation_matrix;
-                static const pxr::GfMatrix4d inv_rotation_matrix;
+                // Session pooling: the streamer is parked with its key on stop, and reused by the next stream with the same key
+                bool m_sessionPooling{ false };
+                sl::StreamerSessionKey m_sessionKey;
+                std::chrono::milliseconds m_sessionIdleTimeout{ 0 };
 
-                static void streamFrame(OgnZEDSimCameraNode& state, const std::shared_ptr<FrameData>& current_frame)
+                static void streamFrame(OgnZEDSimCameraNode& state, const FrameData& current_frame)
                 {
-                    if (!current_frame || !current_frame->valid)
+                    if (!current_frame.valid)
                         return;
 
-                    // Avoid streaming the same frame multiple times
-                    if (current_frame->timestamp <= state.previous_timestamp)
-                        return;
-
-                    state.previous_timestamp = current_frame->timestamp;
-
-                    const size_t data_size_left{ current_frame->data_size_left };
-
-                    const void* raw_ptr_left{ current_frame->raw_ptr_left };
-                    const void* raw_ptr_right{ current_frame->raw_ptr_right };
-                    const size_t data_size_right{ current_frame->data_size_right };
+                    CameraStream& camera_stream = state.m_cameraStream;
+                    LazyCudaStream* right_stream = state.m_splitEyeStreams ? &state.m_cudaStreamRight : nullptr;
 
-                    const double timestamp = current_frame->timestamp;
-                    const auto quaternion = current_frame->quaternion;
-                    const auto linear_acceleration = current_frame->linear_acceleration;
-                    const auto cudaStream = state.m_cudaStream;
-
-                    GfQuatd quat = quaternion.GetNormalized();
-
-                    pxr::GfMatrix4d orientation_mat;
-                    orientation_mat.SetRotate(quat);
-
-                    pxr::GfMatrix4d lin_acc_mat;
-                    lin_acc_mat.SetTranslate(linear_acceleration);
-
-                    GfQuatd converted_orientation = (rotation_matrix * orientation_mat * inv_rotation_matrix).GetOrthonormalized().ExtractRotationQuat();
-
-                    GfVec3d converted_lin_acc = (rotation_matrix * lin_acc_mat * inv_rotation_matrix).GetOrthonormalized().ExtractTranslation();
-
-                    // Resize buffers only if needed
-                    if (state.data_ptr_left == nullptr || state.allocated_size_left < data_size_left) {
-                        state.data_ptr_left = std::make_unique<unsigned char[]>(data_size_left);
-                        state.allocated_size_left = data_size_left;
-                    }
-                    if (state.m_stereo_camera && (state.data_ptr_right == nullptr || state.allocated_size_right < data_size_right)) {
-                        state.data_ptr_right = std::make_unique<unsigned char[]>(data_size_right);
-                        state.allocated_size_right = data_size_right;
-                    }
-
-                    // Copy data from GPU to CPU
-                    cudaError_t err_left = cudaMemcpyAsync(state.data_ptr_left.get(),
-                        raw_ptr_left,
-                        data_size_left, cudaMemcpyDeviceToHost, cudaStream);
-
-                    cudaError_t err_right = cudaSuccess;
-
-                    if (state.m_stereo_camera)
-                    {
-                        err_right = cudaMemcpyAsync(state.data_ptr_right.get(),
-                            raw_ptr_right,
-                            data_size_right, cudaMemcpyDeviceToHost, cudaStream);
+                    // The copies of this frame overlap the encoding of the previous ones
+                    if (camera_stream.pipelineDepth() > 1) {
+                        camera_stream.pushPipelined(current_frame, state.m_cudaStream, right_stream);
+                        return;
                     }
 
-                    if (err_left != cudaSuccess || err_right != cudaSuccess) {
-                        CARB_LOG_ERROR("CUDA memcpy error in streaming thread: %s",
-                            cudaGetErrorString(err_left != cudaSuccess ? err_left : err_right));
+                    // Host images can only be streamed in place before compute returns
+                    if (!camera_stream.stage(current_frame, true, state.m_cudaStream, right_stream))
                         return;
-                    }
 
                     // Wait for GPU operations to complete
-                    cudaError_t sync_err = cudaStreamSynchronize(cudaStream);
-                    if (sync_err != cudaSuccess) {
-                        CARB_LOG_ERROR("[ZED] CUDA stream synchronization error: %s", cudaGetErrorString(sync_err));
-                        return;
+                    if (camera_stream.hasDeviceCopy()) {
+                        const auto stall_start = sl::StreamTelemetry::Clock::now();
+                        const bool synchronized = state.m_cudaStream.synchronize() && (!right_stream || right_stream->synchronize());
+                        camera_stream.telemetry().recordStall(sl::StreamTelemetry::elapsedMs(stall_start));
+                        if (!synchronized) {
+                            camera_stream.discardStaged();
+                            return;
+                        }
                     }
 
-                    // Stream the data immediately
-                    unsigned long long ts_ns = static_cast<unsigned long long>(timestamp * 1000000000);
-
-                    int stream_status = state.m_zedStreamer.stream(state.m_zedStreamerParams.input_format, state.m_streamer_id,
-                        state.data_ptr_left.get(),
-                        state.data_ptr_right.get(),
-                        ts_ns,
-                        static_cast<float>(converted_orientation.GetReal()),
-                        -static_cast<float>(converted_orientation.GetImaginary()[0]),
-                        -static_cast<float>(converted_orientation.GetImaginary()[1]),
-                        static_cast<float>(converted_orientation.GetImaginary()[2]),
-                        static_cast<float>(converted_lin_acc[0]),
-                        static_cast<float>(converted_lin_acc[1]),
-                        static_cast<float>(converted_lin_acc[2]));
+                    camera_stream.submit(current_frame);
                 }
 
-                static void streamingThreadFunc(OgnZEDSimCameraNode& state) {
-                    int frame_index = -1;
+                void writeOutputs(OgnZEDSimCameraNodeDatabase& db) const
+                {
+                    const sl::StreamStats stats = getStats();
+                    db.outputs.streamFps() = stats.stream_fps;
+                    db.outputs.copyTime() = stats.copy_time_ms;
+                    db.outputs.copyTimeAverage() = stats.copy_time_avg_ms;
+                    db.outputs.streamCallTime() = stats.stream_call_time_ms;
+                    db.outputs.streamCallTimeAverage() = stats.stream_call_time_avg_ms;
+                    db.outputs.stallTime() = stats.stall_time_ms;
+                    db.outputs.streamStatus() = stats.last_stream_status;
+                    db.outputs.framesStreamed() = stats.frames_streamed;
+                    db.outputs.framesSkipped() = stats.frames_skipped;
+                    db.outputs.framesGated() = stats.frames_gated;
+                    db.outputs.framesDropped() = stats.frames_dropped;
+                }
 
+                // Frames were copied into their staging slot by compute, the streaming thread only waits for the device
+                // copies and encodes. The slot stays held until the frame is submitted.
+                static void streamingThreadFunc(OgnZEDSimCameraNode& state) {
                     while (!state.m_shouldStop.load())
                     {
-                        auto current_frame = state.m_frameBuffer.wait_and_read(state.m_shouldStop, frame_index);
+                        auto current_frame = state.m_frameQueue.wait_and_pop(state.m_shouldStop);
                         if (!current_frame || !current_frame->valid)
                         {
                             continue;
                         }
 
-                        streamFrame(state, current_frame);
+                        state.m_cameraStream.submitStaged(current_frame->staging_slot);
+                    }
+                }
+
+                // Returns a preallocated frame slot that is neither queued nor being streamed,
+                // or nullptr if all the slots are in use.
+                std::shared_ptr<FrameData> acquireFrameSlot()
+                {
+                    for (const auto& slot : m_frameSlots)
+                    {
+                        // Only this thread can queue a slot, so a slot held by the pool alone stays free
+                        if (slot.use_count() == 1)
+                        {
+                            std::atomic_thread_fence(std::memory_order_acquire);
+                            return slot;
+                        }
                     }
+                    return nullptr;
                 }
 
 public:
 
+                // Streaming performance of this camera since the streamer was initialized
+                sl::StreamStats getStats() const
+                {
+                    sl::StreamStats stats = m_cameraStream.telemetry().snapshot();
+                    if (m_asyncStreaming)
+                    {
+                        // Frames discarded by the overflow policy never reach the streamer
+                        const auto queue_stats = m_frameQueue.stats();
+                        stats.frames_dropped += queue_stats.dropped + queue_stats.coalesced;
+                    }
+                    return stats;
+                }
+
                 OgnZEDSimCameraNode()
                 {
                     m_zedStreamerInitStatus = 0;
-                    m_cudaStreamNotCreated = true;
                     m_shouldStop = false;
 
-                    remaining_serial_numbers = available_zed_cameras;
-
-                    // Load zed streamer lib and init the streamer
-                    std::string prefix = "";
-                    std::string suffix = "";
-#ifndef _WIN32
-                    prefix = "lib";
-                    suffix = ".so";
-#else
-                    suffix = "64.dll";
-#endif
-                    std::string lib_name = prefix + "sl_zed" + suffix;
-
-                    if (m_zedStreamer.load_lib(lib_name) && m_zedStreamer.isZEDSDKCompatible())
+                    // Load zed streamer lib, or share the one already loaded by another node
+                    m_zedStreamer = sl::acquireZedLibrary();
+                    if (m_zedStreamer)
                     {
                         m_valid = true;
-                        CARB_LOG_INFO("[ZED] Successfully found and loaded ZED SDK");
                     }
                     else
                     {
@@ -288,34 +184,79 @@ public:
 
                 void stop()
                 {
-                    remaining_serial_numbers = available_zed_cameras;
-
                     // Stop the streaming thread
                     m_shouldStop.store(true, std::memory_order_release);
+                    m_frameQueue.notify_stop();
 
                     if (m_streamingThread.joinable()) {
                         m_streamingThread.join();
                     }
 
-                    // Clean up ZED streamer
+                    // Stop the high-rate IMU path before the streamer goes away
+                    if (m_imuChannel) {
+                        ImuChannelRegistry::remove(m_cameraStream.port());
+                        m_cameraStream.setImuChannel(nullptr);
+                        m_imuChannel->stop();
+                        CARB_LOG_INFO("[ZED] Streamer %d ingested %llu IMU samples, %llu dropped, %llu streamed with frames",
+                            m_cameraStream.streamerId(),
+                            static_cast<unsigned long long>(m_imuChannel->ingestedCount()),
+                            static_cast<unsigned long long>(m_imuChannel->droppedCount()),
+                            static_cast<unsigned long long>(m_imuChannel->supersededCount()));
+                        m_imuChannel.reset();
+                    }
+
+                    if (m_asyncStreaming) {
+                        const auto queue_stats = m_frameQueue.stats();
+                        CARB_LOG_INFO("[ZED] Streamer %d frame queue: %llu queued, %llu dropped, %llu coalesced, %llu blocked",
+                            m_cameraStream.streamerId(),
+                            static_cast<unsigned long long>(queue_stats.pushed),
+                            static_cast<unsigned long long>(queue_stats.dropped),
+                            static_cast<unsigned long long>(queue_stats.coalesced),
+                            static_cast<unsigned long long>(queue_stats.blocked));
+                        m_frameQueue.clear();
+                        m_asyncStreaming = false;
+                    }
+
+                    // Clean up ZED streamer, and give the staging buffers back to the pool so the next PLAY reuses them.
+                    // The ZED SDK instance is shared, it is destroyed with the last reference to the library.
                     if (m_zedStreamerInitStatus == 1) {
-                        m_zedStreamer.closeStreamer(m_streamer_id);
-                        m_zedStreamer.destroyInstance();
+                        if (const auto& recorder = m_cameraStream.recorder()) {
+                            CARB_LOG_INFO("[ZED] Streamer %d recorded %llu frames to %s (%llu kept, %llu not recorded)",
+                                m_cameraStream.streamerId(), static_cast<unsigned long long>(recorder->recordedCount()), recorder->path().c_str(),
+                                static_cast<unsigned long long>(std::min(recorder->recordedCount(), recorder->slotCount())),
+                                static_cast<unsigned long long>(recorder->droppedCount()));
+                        }
+                        if (m_sessionPooling) {
+                            CARB_LOG_INFO("[ZED] Streamer %d parked in the session pool for %.1f s", m_cameraStream.streamerId(),
+                                m_sessionIdleTimeout.count() / 1000.0);
+                            m_cameraStream.park(m_zedStreamer, m_sessionKey, m_sessionIdleTimeout);
+                        } else {
+                            m_cameraStream.close();
+                        }
 
                         m_zedStreamerInitStatus = 0;
                     }
 
-                    // Clean up CUDA stream if it was created
-                    if (!m_cudaStreamNotCreated) {
-                        cudaError_t err = cudaStreamDestroy(m_cudaStream);
-                        if (err != cudaSuccess) {
-                            CARB_LOG_ERROR("[ZED] Error destroying CUDA stream in destructor: %s", cudaGetErrorString(err));
-                        }
+                    // Clean up CUDA streams if they were created
+                    m_cudaStream.destroy();
+                    m_cudaStreamRight.destroy();
+
+                    const auto pool_stats = sl::PinnedBufferPool::instance().stats();
+                    CARB_LOG_INFO("[ZED] Staging buffer pool: %llu hits, %llu misses, %llu bytes pinned, %llu bytes pageable",
+                        static_cast<unsigned long long>(pool_stats.hits),
+                        static_cast<unsigned long long>(pool_stats.misses),
+                        static_cast<unsigned long long>(pool_stats.bytes_pinned),
+                        static_cast<unsigned long long>(pool_stats.bytes_pageable));
+                    if (m_sessionPooling) {
+                        const auto session_stats = sl::StreamerSessionPool::instance().stats();
+                        CARB_LOG_INFO("[ZED] Streamer session pool: %llu hits, %llu misses, %llu evicted, %zu idle",
+                            static_cast<unsigned long long>(session_stats.hits),
+                            static_cast<unsigned long long>(session_stats.misses),
+                            static_cast<unsigned long long>(session_stats.evicted), session_stats.idle);
                     }
 
-                    m_zedStreamer.unload();
+                    m_zedStreamer.reset();
                     m_valid = false;
-                    streamer_id -= 1;
                 }
 
 
@@ -331,145 +272,229 @@ public:
                     // Done once, init the streamer and start a stream
                     if (state.m_zedStreamerInitStatus != 1)
                     {
-                        float warmup = 1.0f;
-                        if (db.inputs.simulationTime() < warmup) return true;
+                        const bool stereo_camera = db.inputs.tileColumns() > 0 ? db.inputs.tileRight() >= 0 : (db.inputs.sideBySide() ||
+                            (db.inputs.bufferSizeRight() > 0 && reinterpret_cast<void*>(db.inputs.dataPtrRight()) != nullptr));
 
-                        state.m_zedStreamer.load_api();
+                        std::string camera_model = db.inputs.cameraModel();
+                        unsigned short port = db.inputs.port();
 
-                        state.m_stereo_camera = db.inputs.bufferSizeRight() > 0 && reinterpret_cast<void*>(db.inputs.dataPtrRight()) != nullptr;
+                        sl::StreamingParameters params = makeStreamingParameters(
+                            db.tokenToString(db.inputs.transportLayerMode()), stereo_camera,
+                            db.inputs.fps(), db.inputs.width(), db.inputs.height(), db.inputs.bitrate(), db.inputs.chunkSize(), port);
+                        params.alpha_channel_included = !db.inputs.packPixels();
 
-                        std::string camera_model = db.inputs.cameraModel();
-                        if (!state.m_stereo_camera)
+                        // A parked streamer is already initialized, it streams from the first rendered frame
+                        state.m_sessionPooling = db.inputs.sessionPooling();
+                        state.m_sessionKey = makeSessionKey(camera_model, db.inputs.serialNumber(), params);
+                        state.m_sessionIdleTimeout = std::chrono::milliseconds(static_cast<long long>(
+                            std::max(0.0, db.inputs.sessionIdleTimeout()) * 1000.0));
+                        const bool pooled = state.m_sessionPooling && sl::StreamerSessionPool::instance().contains(state.m_sessionKey);
+
+                        float warmup = 1.0f;
+                        if (!pooled && db.inputs.simulationTime() < warmup) return true;
+                        if (pooled && db.inputs.dataPtrLeft() == 0) return true;
+
+                        if (!stereo_camera)
                         {
                             CARB_LOG_INFO("[ZED] Opening mono camera %s", camera_model.c_str());
                         } else {
                             CARB_LOG_INFO("[ZED] Opening stereo camera %s", camera_model.c_str());
                         }
 
-                        unsigned short port = db.inputs.port();
-
-                        int serial_number = -1;
-                        if (camera_model == "VIRTUAL_ZED_X")
+                        const std::string location_str = db.tokenToString(db.inputs.inputLocation());
+                        const InputLocation input_location = inputLocationFromString(location_str);
+                        const sl::PixelLayout yuv_layout = yuvLayoutFromString(db.tokenToString(db.inputs.yuvLayout()));
+                        if (pooled && state.m_cameraStream.reuse(*state.m_zedStreamer, state.m_sessionKey, params, stereo_camera, input_location,
+                                yuv_layout))
                         {
-                            serial_number = std::stoi(db.inputs.serialNumber());
+                            state.m_zedStreamerInitStatus = 1;
                         }
                         else
                         {
-                            serial_number = addStreamer(camera_model);
+                            evictConflictingSessions(state.m_sessionKey);
+                            if (!state.m_cameraStream.allocateSerialNumber(*state.m_zedStreamer, camera_model, db.inputs.serialNumber())) {
+                                state.m_valid = false;
+                                return false;
+                            }
+                            state.m_zedStreamerInitStatus = state.m_cameraStream.init(*state.m_zedStreamer, params, stereo_camera, input_location,
+                                yuv_layout);
                         }
 
-                        if (serial_number <= 0) {
-                            state.m_valid = false;
-                            return false;
-                        } else if (!state.m_zedStreamer.isSNValid(serial_number)) {
-                            state.m_valid = false;
+                        if (state.m_zedStreamerInitStatus > 0)
+                        {
+                            const int camera_streamer_id = state.m_cameraStream.streamerId();
+                            CARB_LOG_INFO("[ZED] Streamer %d reads %s images, streamed as %s", camera_streamer_id, location_str.c_str(),
+                                sl::pixelLayoutName(state.m_cameraStream.layout()));
 
-                            if (camera_model == "VIRTUAL_ZED_X")
+                            if (db.inputs.highRateImu())
                             {
-                                CARB_LOG_FATAL("[ZED] Invalid streamer configuration %d ! Make sure the SN starts with 11XXXXXXX",
-                                    serial_number);
+                                state.m_imuChannel = std::make_shared<ImuChannel>(*state.m_zedStreamer, camera_streamer_id, db.inputs.imuQueueSize(),
+                                    state.m_cameraStream.timestampOffsetNs());
+                                state.m_imuChannel->start();
+                                state.m_cameraStream.setImuChannel(state.m_imuChannel);
+                                ImuChannelRegistry::add(port, state.m_imuChannel);
+                                CARB_LOG_INFO("[ZED] High-rate IMU enabled for streamer %d", camera_streamer_id);
                             }
-                            else
+
+                            const std::string recording_path = db.inputs.recordingPath();
+                            if (!recording_path.empty())
                             {
-                                CARB_LOG_FATAL("[ZED] Invalid streamer configuration %d !",
-                                    serial_number);
+                                const size_t recording_size = static_cast<size_t>(db.inputs.recordingSize()) << 20;
+                                state.m_cameraStream.setRecorder(std::make_shared<sl::FrameRecorder>(recording_path, recording_size));
+                                CARB_LOG_INFO("[ZED] Streamer %d records its frames to %s (%u MiB)", camera_streamer_id,
+                                    recording_path.c_str(), db.inputs.recordingSize());
                             }
 
-                            removeStreamer(camera_model, serial_number);
-                            return false;
-                        }
-
-                        int transport_layer_mode = transportLayerModeToInt(db.tokenToString(db.inputs.transportLayerMode()));
-
-#ifdef _WIN32
-                        // 0 = Network, 1 = IPC, 2 = Both
-                        transport_layer_mode = 0;
-
-                        CARB_LOG_WARN("[ZED] IPC mode is not available on Windows. Switching back to network streaming...");
-#endif
-                        // Use YUV format for IPC or mono cameras
-                        bool use_yuv = transport_layer_mode > 0 || !state.m_stereo_camera;
-                        state.m_zedStreamerParams.alpha_channel_included = true;
-                        state.m_zedStreamerParams.codec_type = 1;
-                        state.m_zedStreamerParams.fps = db.inputs.fps();
-                        state.m_zedStreamerParams.image_height = db.inputs.height();
-                        state.m_zedStreamerParams.image_width = db.inputs.width();
-                        state.m_zedStreamerParams.bitrate = db.inputs.bitrate();
-                        state.m_zedStreamerParams.chunk_size = db.inputs.chunkSize();
-                        state.m_zedStreamerParams.mode = 1;
-                        state.m_zedStreamerParams.transport_layer_mode = transport_layer_mode;
-                        state.m_zedStreamerParams.input_format = use_yuv ? sl::INPUT_FORMAT::YUV : sl::INPUT_FORMAT::BGR;
-                        state.m_zedStreamerParams.serial_number = serial_number;
-                        state.m_zedStreamerParams.port = port;
-                        state.m_zedStreamerParams.verbose = 0;
-                        state.m_streamer_id = streamer_id++;
-                        state.m_zedStreamerInitStatus = state.m_zedStreamer.initStreamer(state.m_streamer_id, &state.m_zedStreamerParams);
-
-                        if (state.m_zedStreamerInitStatus > 0)
-                        {
-                            CARB_LOG_INFO("[ZED] ZED Streamer initialized successfully with ID %d", state.m_streamer_id);
-
-                            // Create CUDA stream
-                            CUDA_CHECK(cudaStreamCreate(&state.m_cudaStream));
-                            state.m_cudaStreamNotCreated = false;
+                            state.m_splitEyeStreams = stereo_camera && db.inputs.splitEyeStreams();
+                            state.m_sideBySide = db.inputs.sideBySide();
+                            state.m_tileColumns = db.inputs.tileColumns();
+                            state.m_tileLeft = db.inputs.tileLeft();
+                            state.m_tileRight = db.inputs.tileRight();
+                            if (state.m_tileColumns > 0)
+                            {
+                                CARB_LOG_INFO("[ZED] Streamer %d reads tiles %d and %d of a tiled image of %u columns", camera_streamer_id,
+                                    state.m_tileLeft, state.m_tileRight, state.m_tileColumns);
+                            }
+                            else if (state.m_sideBySide)
+                            {
+                                CARB_LOG_INFO("[ZED] Streamer %d reads both eyes from one side-by-side image", camera_streamer_id);
+                            }
+                            state.m_asyncStreaming = db.inputs.asyncStreaming();
+                            state.m_cameraStream.setPipelineDepth(db.inputs.pipelineDepth());
+                            if (!state.m_asyncStreaming && (state.m_cameraStream.pipelineDepth() > 1 || state.m_splitEyeStreams))
+                            {
+                                CARB_LOG_INFO("[ZED] Streamer %d copies frames with a pipeline depth of %zu, %s", camera_streamer_id,
+                                    state.m_cameraStream.pipelineDepth(), state.m_splitEyeStreams ? "one CUDA stream per eye" : "one CUDA stream");
+                            }
 
-                            // Start streaming thread
-                            // state.m_streamingThread = std::thread(&OgnZEDSimCameraNode::streamingThreadFunc, std::ref(state));
+                            // Start streaming thread, the graph evaluation thread then only copies the frames
+                            if (state.m_asyncStreaming)
+                            {
+                                const std::string policy_str = db.tokenToString(db.inputs.overflowPolicy());
+                                state.m_frameQueue.configure(sl::overflowPolicyFromString(policy_str), db.inputs.queueDepth());
+
+                                // Preallocate every slot the queue and the streaming thread can hold at once, each with its staging
+                                // slot. The frames are copied before they are queued, so Pipeline Depth is not used.
+                                state.m_frameSlots.resize(state.m_frameQueue.depth() + kExtraFrameSlotCount);
+                                state.m_cameraStream.setPipelineDepth(state.m_frameSlots.size());
+                                for (size_t i = 0; i < state.m_frameSlots.size(); i++)
+                                {
+                                    state.m_frameSlots[i] = std::make_shared<FrameData>();
+                                    state.m_frameSlots[i]->staging_slot = i;
+                                }
+
+                                CARB_LOG_INFO("[ZED] Asynchronous streaming enabled for streamer %d (%s policy, depth %zu)",
+                                    camera_streamer_id, policy_str.c_str(), state.m_frameQueue.depth());
+                                state.m_shouldStop.store(false, std::memory_order_release);
+                                state.m_streamingThread = std::thread(&OgnZEDSimCameraNode::streamingThreadFunc, std::ref(state));
+                            }
                         }
                         else {
-                            CARB_LOG_ERROR("Error during zed streamer initialization %d", state.m_zedStreamerInitStatus);
-                            removeStreamer(camera_model, serial_number);
                             return false;
                         }
                     }
                     else
                     {
                         // Get frame data pointers and sizes
-                        const size_t data_size_left{ db.inputs.bufferSizeLeft() };
-                        const void* raw_ptr_left{ reinterpret_cast<void*>(db.inputs.dataPtrLeft()) };
-                        const size_t data_size_right{ db.inputs.bufferSizeRight() };
-                        const void* raw_ptr_right{ reinterpret_cast<void*>(db.inputs.dataPtrRight()) };
+                        FrameData images(
+                            reinterpret_cast<void*>(db.inputs.dataPtrLeft()), db.inputs.bufferSizeLeft(),
+                            reinterpret_cast<void*>(db.inputs.dataPtrRight()), db.inputs.bufferSizeRight()
+                        );
 
-                        if (!raw_ptr_left)
+                        if (!images.raw_ptr_left)
                         {
                             CARB_LOG_ERROR("[ZED] Left image is not valid");
                             return false;
                         }
 
-                        if (state.m_stereo_camera && data_size_left != data_size_right)
+                        const sl::StreamingParameters& params = state.m_cameraStream.params();
+                        if (state.m_tileColumns > 0)
+                        {
+                            const size_t image_size = images.data_size_left;
+                            if (!sliceTiles(images, state.m_tileColumns, params.image_width, params.image_height, state.m_tileLeft, state.m_tileRight))
+                            {
+                                CARB_LOG_ERROR("[ZED] Tiles %d and %d are not in the tiled image of %zu bytes and %u columns",
+                                    state.m_tileLeft, state.m_tileRight, image_size, state.m_tileColumns);
+                                return false;
+                            }
+                        }
+                        else if (state.m_sideBySide)
+                        {
+                            const size_t image_size = images.data_size_left;
+                            if (!splitSideBySide(images, params.image_height))
+                            {
+                                CARB_LOG_ERROR("[ZED] Side-by-side image of %zu bytes does not hold two images of height %u",
+                                    image_size, params.image_height);
+                                return false;
+                            }
+                        }
+                        else if (state.m_cameraStream.isStereo() && images.data_size_left != images.data_size_right)
                         {
                             CARB_LOG_ERROR("[ZED] Left and Right images have different sizes");
                             return false;
                         }
 
-                        // Prepare new frame data (just pointers and metadata)
-                        auto new_frame = std::make_shared<FrameData>(
-                            raw_ptr_left, data_size_left,
-                            state.m_stereo_camera ? raw_ptr_right : nullptr,
-                            state.m_stereo_camera ? data_size_right : 0
-                        );
+                        // Frames already streamed or above the streamer frame rate are neither copied nor queued
+                        if (!state.m_cameraStream.accept(db.inputs.simulationTime()))
+                        {
+                            state.writeOutputs(db);
+                            return true;
+                        }
 
-                        new_frame->timestamp = db.inputs.simulationTime();
-                        new_frame->valid = true;
-                        new_frame->quaternion = db.inputs.orientation();
-                        new_frame->linear_acceleration = db.inputs.linearAcceleration();
+                        if (state.m_asyncStreaming)
+                        {
+                            // Copy the images into a preallocated slot before they are rendered again, the streaming thread
+                            // waits for the device copies and encodes
+                            auto new_frame = state.acquireFrameSlot();
+                            if (!new_frame)
+                            {
+                                CARB_LOG_WARN("[ZED] No free frame slot for streamer %d, frame skipped", state.m_cameraStream.streamerId());
+                                state.m_frameQueue.recordDropped();
+                            }
+                            else
+                            {
+                                new_frame->raw_ptr_left = images.raw_ptr_left;
+                                new_frame->data_size_left = images.data_size_left;
+                                new_frame->raw_ptr_right = state.m_cameraStream.isStereo() ? images.raw_ptr_right : nullptr;
+                                new_frame->data_size_right = state.m_cameraStream.isStereo() ? images.data_size_right : 0;
+                                new_frame->row_pitch = images.row_pitch;
+                                new_frame->timestamp = db.inputs.simulationTime();
+                                new_frame->valid = true;
+                                new_frame->quaternion = db.inputs.orientation();
+                                new_frame->linear_acceleration = db.inputs.linearAcceleration();
+
+                                // Hand the frame to the streaming thread, following the configured overflow policy
+                                LazyCudaStream* right_stream = state.m_splitEyeStreams ? &state.m_cudaStreamRight : nullptr;
+                                if (state.m_cameraStream.stageInSlot(new_frame->staging_slot, *new_frame, state.m_cudaStream, right_stream))
+                                {
+                                    state.m_frameQueue.push(std::move(new_frame), state.m_shouldStop);
+                                }
+                            }
+                        }
+                        else
+                        {
+                            // Prepare new frame data (just pointers and metadata)
+                            FrameData new_frame(
+                                images.raw_ptr_left, images.data_size_left,
+                                state.m_cameraStream.isStereo() ? images.raw_ptr_right : nullptr,
+                                state.m_cameraStream.isStereo() ? images.data_size_right : 0
+                            );
+                            new_frame.row_pitch = images.row_pitch;
+
+                            new_frame.timestamp = db.inputs.simulationTime();
+                            new_frame.valid = true;
+                            new_frame.quaternion = db.inputs.orientation();
+                            new_frame.linear_acceleration = db.inputs.linearAcceleration();
+
+                            streamFrame(state, new_frame);
+                        }
 
-                        // Write frame to the double buffer
-                        streamFrame(state, new_frame);
+                        state.writeOutputs(db);
                     }
                     return true;
                 }
             };
 
-            const pxr::GfMatrix4d OgnZEDSimCameraNode::rotation_matrix{
-                0, -1, 0, 0,
-                0, 0, -1, 0,
-                1, 0, 0, 0,
-                0, 0, 0, 1
-                        };
-
-            const pxr::GfMatrix4d OgnZEDSimCameraNode::inv_rotation_matrix = rotation_matrix.GetInverse();
-
             // This macro provides the information necessary to OmniGraph that lets it automatically register and deregister
             // your node type definition.
             REGISTER_OGN_NODE()
@@ -0,0 +1,51 @@
+// Copyright (c) 2022, NVIDIA CORPORATION. All rights reserved.
+//
+// NVIDIA CORPORATION and its licensors retain all intellectual property
+// and proprietary rights in and to this software, related documentation
+// and any modifications thereto.  Any use, reproduction, disclosure or
+// distribution of this software and related documentation without an express
+// license agreement from NVIDIA CORPORATION is strictly prohibited.
+//
+
+#include <OgnZEDSimImuNodeDatabase.h>
+#include "ZEDImuChannel.h"
+#include "rate_gate.hpp"
+
+namespace sl {
+    namespace sensor{
+        namespace camera {
+
+            class OgnZEDSimImuNode
+            {
+                sl::RateGate m_rateGate;
+                uint64_t m_samplesSent{ 0 };
+
+public:
+                // called on every physics step
+                static bool compute(OgnZEDSimImuNodeDatabase& db)
+                {
+                    auto& state = db.perInstanceState<OgnZEDSimImuNode>();
+
+                    // The channel only exists once the ZED Stream node on this port has started streaming
+                    auto channel = ImuChannelRegistry::find(db.inputs.port());
+                    if (!channel)
+                        return true;
+
+                    const double sim_time = db.inputs.simulationTime();
+                    state.m_rateGate.setRate(db.inputs.imuRate());
+                    if (!state.m_rateGate.accept(sim_time))
+                        return true;
+
+                    channel->push(makeImuSample(sim_time, db.inputs.orientation(),
+                        db.inputs.linearAcceleration(), db.inputs.angularVelocity()));
+                    state.m_samplesSent++;
+                    db.outputs.samplesSent() = state.m_samplesSent;
+                    return true;
+                }
+            };
+
+            REGISTER_OGN_NODE()
+
+        } // camera
+    } // sensor
+} // sl
@@ -0,0 +1,348 @@
+// Copyright (c) 2022, NVIDIA CORPORATION. All rights reserved.
+//
+// NVIDIA CORPORATION and its licensors retain all intellectual property
+// and proprietary rights in and to this software, related documentation
+// and any modifications thereto.  Any use, reproduction, disclosure or
+// distribution of this software and related documentation without an express
+// license agreement from NVIDIA CORPORATION is strictly prohibited.
+//
+
+#include <algorithm>
+#include <memory>
+#include <vector>
+
+#include <OgnZEDSimMultiCameraNodeDatabase.h>
+#include "worker_pool.hpp"
+#include "ZEDCameraStream.h"
+
+namespace sl {
+    namespace sensor{
+        namespace camera {
+
+            class OgnZEDSimMultiCameraNode
+            {
+                // One loaded ZED SDK and one CUDA stream serve every camera, the library is shared with the other nodes
+                std::shared_ptr<sl::ZedStreamer> m_zedStreamer;
+                LazyCudaStream m_cudaStream;
+                bool m_valid{ false };
+                bool m_initialized{ false };
+
+                std::vector<std::unique_ptr<CameraStream>> m_cameras;
+                std::vector<FrameData> m_frames;
+                std::vector<char> m_staged;
+
+                // Tiles of every camera when their images are part of one tiled image, not tiled with 0 tile columns
+                unsigned int m_tileColumns{ 0 };
+                std::vector<int> m_tilesLeft;
+                std::vector<int> m_tilesRight;
+
+                // High-rate IMU path of each camera, fed by the ZED IMU Stream node using its port. Null for the cameras
+                // that could not be opened, or when High-Rate IMU is disabled.
+                std::vector<std::shared_ptr<ImuChannel>> m_imuChannels;
+
+                // Submits the frames of the cameras in parallel, with the graph evaluation thread
+                sl::WorkerPool m_encoderPool;
+
+                void open(OgnZEDSimMultiCameraNodeDatabase& db)
+                {
+                    const auto& camera_models = db.inputs.cameraModels();
+                    const auto& serial_numbers = db.inputs.serialNumbers();
+                    const auto& ports = db.inputs.ports();
+                    const auto& buffer_sizes_right = db.inputs.bufferSizesRight();
+                    const auto& data_ptrs_right = db.inputs.dataPtrsRight();
+                    const auto& tiles_left = db.inputs.tilesLeft();
+                    const auto& tiles_right = db.inputs.tilesRight();
+                    const std::string transport_layer_mode = db.tokenToString(db.inputs.transportLayerMode());
+                    const InputLocation input_location = inputLocationFromString(db.tokenToString(db.inputs.inputLocation()));
+                    const sl::PixelLayout yuv_layout = yuvLayoutFromString(db.tokenToString(db.inputs.yuvLayout()));
+
+                    m_tileColumns = db.inputs.tileColumns();
+                    m_tilesLeft.assign(ports.size(), 0);
+                    m_tilesRight.assign(ports.size(), -1);
+                    if (m_tileColumns > 0)
+                    {
+                        for (size_t i = 0; i < ports.size(); i++)
+                        {
+                            m_tilesLeft[i] = i < tiles_left.size() ? tiles_left[i] : static_cast<int>(i);
+                            m_tilesRight[i] = i < tiles_right.size() ? tiles_right[i] : -1;
+                        }
+                    }
+
+                    m_imuChannels.assign(ports.size(), nullptr);
+                    size_t opened = 0;
+                    for (size_t i = 0; i < ports.size(); i++)
+                    {
+                        auto camera = std::make_unique<CameraStream>();
+
+                        const std::string camera_model = i < camera_models.size() ? db.tokenToString(camera_models[i]) : "ZED_X";
+                        const std::string serial_number = i < serial_numbers.size() ? db.tokenToString(serial_numbers[i]) : "-1";
+                        const bool stereo_camera = m_tileColumns > 0 ? m_tilesRight[i] >= 0 :
+                            i < buffer_sizes_right.size() && buffer_sizes_right[i] > 0 && i < data_ptrs_right.size() && data_ptrs_right[i] != 0;
+                        const unsigned short port = ports[i];
+
+                        sl::StreamingParameters params = makeStreamingParameters(transport_layer_mode, stereo_camera,
+                            db.inputs.fps(), db.inputs.width(), db.inputs.height(), db.inputs.bitrate(), db.inputs.chunkSize(), port);
+                        params.alpha_channel_included = !db.inputs.packPixels();
+                        evictConflictingSessions(makeSessionKey(camera_model, serial_number, params));
+                        if (camera->allocateSerialNumber(*m_zedStreamer, camera_model, serial_number))
+                        {
+                            camera->init(*m_zedStreamer, params, stereo_camera, input_location, yuv_layout);
+                        }
+
+                        if (camera->isOpen()) {
+                            CARB_LOG_INFO("[ZED] Opening %s camera %s on port %u, streamed as %s", stereo_camera ? "stereo" : "mono",
+                                camera_model.c_str(), static_cast<unsigned int>(port), sl::pixelLayoutName(camera->layout()));
+                            if (db.inputs.highRateImu())
+                            {
+                                auto imu_channel = std::make_shared<ImuChannel>(*m_zedStreamer, camera->streamerId(), db.inputs.imuQueueSize(),
+                                    camera->timestampOffsetNs());
+                                imu_channel->start();
+                                camera->setImuChannel(imu_channel);
+                                ImuChannelRegistry::add(port, imu_channel);
+                                m_imuChannels[i] = std::move(imu_channel);
+                            }
+                            opened++;
+                        } else {
+                            CARB_LOG_ERROR("[ZED] Could not open camera %zu (%s) on port %u",
+                                i, camera_model.c_str(), static_cast<unsigned int>(port));
+                        }
+                        m_cameras.push_back(std::move(camera));
+                    }
+
+                    m_frames.resize(m_cameras.size());
+                    m_staged.assign(m_cameras.size(), 0);
+
+                    // The graph evaluation thread submits frames too
+                    const size_t encoder_threads = db.inputs.encoderThreads() > 0 ?
+                        std::min<size_t>(db.inputs.encoderThreads(), m_cameras.size()) : m_cameras.size();
+                    m_encoderPool.resize(encoder_threads > 0 ? encoder_threads - 1 : 0);
+
+                    CARB_LOG_INFO("[ZED] Multi stream opened %zu of %zu cameras with %zu encoder threads",
+                        opened, m_cameras.size(), encoder_threads);
+                    if (m_tileColumns > 0)
+                    {
+                        CARB_LOG_INFO("[ZED] Multi stream reads the cameras from a tiled image of %u columns", m_tileColumns);
+                    }
+                    if (db.inputs.highRateImu())
+                    {
+                        CARB_LOG_INFO("[ZED] High-rate IMU enabled for the cameras of the multi stream");
+                    }
+                    m_valid = opened > 0;
+                    m_initialized = true;
+                }
+
+                void streamFrames(OgnZEDSimMultiCameraNodeDatabase& db)
+                {
+                    const auto& buffer_sizes_left = db.inputs.bufferSizesLeft();
+                    const auto& buffer_sizes_right = db.inputs.bufferSizesRight();
+                    const auto& data_ptrs_left = db.inputs.dataPtrsLeft();
+                    const auto& data_ptrs_right = db.inputs.dataPtrsRight();
+                    const auto& orientations = db.inputs.orientations();
+                    const auto& linear_accelerations = db.inputs.linearAccelerations();
+                    const double simulation_time = db.inputs.simulationTime();
+
+                    // Stage every camera first, device copies are all enqueued on the same CUDA stream
+                    bool device_copy = false;
+                    for (size_t i = 0; i < m_cameras.size(); i++)
+                    {
+                        m_staged[i] = 0;
+                        CameraStream& camera = *m_cameras[i];
+                        if (!camera.isOpen() || !camera.accept(simulation_time))
+                            continue;
+
+                        FrameData& frame = m_frames[i];
+                        if (m_tileColumns > 0)
+                        {
+                            frame = FrameData(reinterpret_cast<void*>(db.inputs.dataPtr()), db.inputs.bufferSize());
+                            if (!frame.raw_ptr_left)
+                            {
+                                CARB_LOG_ERROR("[ZED] Tiled image is not valid");
+                                continue;
+                            }
+
+                            const sl::StreamingParameters& params = camera.params();
+                            if (!sliceTiles(frame, m_tileColumns, params.image_width, params.image_height, m_tilesLeft[i], m_tilesRight[i]))
+                            {
+                                CARB_LOG_ERROR("[ZED] Tiles %d and %d of camera %zu are not in the tiled image of %llu bytes and %u columns",
+                                    m_tilesLeft[i], m_tilesRight[i], i, static_cast<unsigned long long>(db.inputs.bufferSize()), m_tileColumns);
+                                continue;
+                            }
+                        }
+                        else
+                        {
+                            const void* raw_ptr_left = i < data_ptrs_left.size() ? reinterpret_cast<void*>(data_ptrs_left[i]) : nullptr;
+                            const size_t data_size_left = i < buffer_sizes_left.size() ? buffer_sizes_left[i] : 0;
+                            const void* raw_ptr_right = i < data_ptrs_right.size() ? reinterpret_cast<void*>(data_ptrs_right[i]) : nullptr;
+                            const size_t data_size_right = i < buffer_sizes_right.size() ? buffer_sizes_right[i] : 0;
+
+                            if (!raw_ptr_left)
+                            {
+                                CARB_LOG_ERROR("[ZED] Left image of camera %zu is not valid", i);
+                                continue;
+                            }
+
+                            if (camera.isStereo() && data_size_left != data_size_right)
+                            {
+                                CARB_LOG_ERROR("[ZED] Left and Right images of camera %zu have different sizes", i);
+                                continue;
+                            }
+
+                            frame = FrameData(
+                                raw_ptr_left, data_size_left,
+                                camera.isStereo() ? raw_ptr_right : nullptr,
+                                camera.isStereo() ? data_size_right : 0
+                            );
+                        }
+                        frame.timestamp = simulation_time;
+                        frame.valid = true;
+                        frame.quaternion = i < orientations.size() ? GfQuatd(orientations[i]) : GfQuatd(1.0, 0.0, 0.0, 0.0);
+                        frame.linear_acceleration = i < linear_accelerations.size() ? GfVec3d(linear_accelerations[i]) : GfVec3d(0.0, 0.0, 0.0);
+
+                        // Host images stay valid until every camera is submitted, before compute returns
+                        if (camera.stage(frame, true, m_cudaStream))
+                        {
+                            m_staged[i] = 1;
+                            device_copy = device_copy || camera.hasDeviceCopy();
+                        }
+                    }
+
+                    // Wait once for the copies of every camera
+                    if (device_copy && !m_cudaStream.synchronize())
+                    {
+                        for (size_t i = 0; i < m_cameras.size(); i++)
+                        {
+                            if (m_staged[i] && m_cameras[i]->hasDeviceCopy()) {
+                                m_cameras[i]->discardStaged();
+                                m_staged[i] = 0;
+                            }
+                        }
+                    }
+
+                    m_encoderPool.run(m_cameras.size(), [this](size_t i) {
+                        if (m_staged[i]) {
+                            m_cameras[i]->submit(m_frames[i]);
+                        }
+                    });
+                }
+
+                void writeOutputs(OgnZEDSimMultiCameraNodeDatabase& db) const
+                {
+                    const size_t camera_count = m_cameras.size();
+                    auto& stream_statuses = db.outputs.streamStatuses();
+                    auto& stream_fps = db.outputs.streamFps();
+                    auto& frames_streamed = db.outputs.framesStreamed();
+                    auto& frames_gated = db.outputs.framesGated();
+                    auto& frames_dropped = db.outputs.framesDropped();
+                    stream_statuses.resize(camera_count);
+                    stream_fps.resize(camera_count);
+                    frames_streamed.resize(camera_count);
+                    frames_gated.resize(camera_count);
+                    frames_dropped.resize(camera_count);
+
+                    for (size_t i = 0; i < camera_count; i++)
+                    {
+                        const sl::StreamStats stats = m_cameras[i]->telemetry().snapshot();
+                        stream_statuses[i] = m_cameras[i]->isOpen() ? stats.last_stream_status : -1;
+                        stream_fps[i] = stats.stream_fps;
+                        frames_streamed[i] = stats.frames_streamed;
+                        frames_gated[i] = stats.frames_gated;
+                        frames_dropped[i] = stats.frames_dropped;
+                    }
+                }
+
+public:
+                OgnZEDSimMultiCameraNode()
+                {
+                    // Load zed streamer lib once for every camera, or share the one already loaded by another node
+                    m_zedStreamer = sl::acquireZedLibrary();
+                    if (m_zedStreamer)
+                    {
+                        m_valid = true;
+                    }
+                    else
+                    {
+                        CARB_LOG_ERROR("[ZED] Error while loading ZED SDK. Make sure a compatible version is installed");
+                    }
+                }
+
+                ~OgnZEDSimMultiCameraNode()
+                {
+                    stop();
+                }
+
+                void stop()
+                {
+                    // Stop the high-rate IMU paths before the streamers go away
+                    for (size_t i = 0; i < m_imuChannels.size(); i++)
+                    {
+                        if (!m_imuChannels[i])
+                            continue;
+                        ImuChannelRegistry::remove(m_cameras[i]->port());
+                        m_cameras[i]->setImuChannel(nullptr);
+                        m_imuChannels[i]->stop();
+                        CARB_LOG_INFO("[ZED] Streamer %d ingested %llu IMU samples, %llu dropped, %llu streamed with frames",
+                            m_cameras[i]->streamerId(),
+                            static_cast<unsigned long long>(m_imuChannels[i]->ingestedCount()),
+                            static_cast<unsigned long long>(m_imuChannels[i]->droppedCount()),
+                            static_cast<unsigned long long>(m_imuChannels[i]->supersededCount()));
+                    }
+                    m_imuChannels.clear();
+
+                    // Close every streamer, the ZED SDK instance is destroyed with the last reference to the library
+                    for (auto& camera : m_cameras)
+                    {
+                        camera->close();
+                    }
+                    m_cameras.clear();
+                    m_frames.clear();
+                    m_staged.clear();
+                    m_encoderPool.resize(0);
+
+                    m_cudaStream.destroy();
+
+                    m_zedStreamer.reset();
+                    m_valid = false;
+                    m_initialized = false;
+                }
+
+                // called every time new frames are rendered
+                static bool compute(OgnZEDSimMultiCameraNodeDatabase& db)
+                {
+                    auto& state = db.perInstanceState<OgnZEDSimMultiCameraNode>();
+                    if (!state.m_valid || !db.inputs.stream()) {
+                        CARB_LOG_WARN("INVALID STATE OR STREAMING DISABLED");
+                        return false;
+                    }
+
+                    // Done once, init the streamers of every camera
+                    if (!state.m_initialized)
+                    {
+                        float warmup = 1.0f;
+                        if (db.inputs.simulationTime() < warmup) return true;
+
+                        state.open(db);
+                        if (!state.m_valid)
+                            return false;
+                    }
+                    else
+                    {
+                        if (db.inputs.ports().size() != state.m_cameras.size())
+                        {
+                            CARB_LOG_ERROR("[ZED] The number of cameras changed while streaming (%zu instead of %zu)",
+                                db.inputs.ports().size(), state.m_cameras.size());
+                            return false;
+                        }
+
+                        state.streamFrames(db);
+                    }
+
+                    state.writeOutputs(db);
+                    return true;
+                }
+            };
+
+            REGISTER_OGN_NODE()
+
+        } // camera
+    } // sensor
+} // sl
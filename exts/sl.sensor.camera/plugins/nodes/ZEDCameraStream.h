@@ -0,0 +1,1022 @@
+// Streaming state of one ZED camera, used by the ZED Stream node.
+
+#pragma once
+
+#include <algorithm>
+#include <chrono>
+#include <cstdlib>
+#include <cstring>
+#include <map>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include <cuda/include/cuda_runtime_api.h>
+#include "zed_interface_loader.hpp"
+#include "frame_recording.hpp"
+#include "pinned_buffer_pool.hpp"
+#include "pixel_format.hpp"
+#include "rate_gate.hpp"
+#include "stream_telemetry.hpp"
+#include "streamer_registry.hpp"
+#include "streamer_session_pool.hpp"
+#include "types_c.h"
+#include "ZEDImuChannel.h"
+#include "ZEDPixelConversion.h"
+
+namespace sl {
+    namespace sensor {
+        namespace camera {
+
+            // Data struct shared to the streaming thread
+            struct FrameData {
+                const void* raw_ptr_left{ nullptr };
+                const void* raw_ptr_right{ nullptr };
+                size_t data_size_left{ 0 };
+                size_t data_size_right{ 0 };
+                // Bytes from one row of the images to the next, 0 when their rows are contiguous. Pitched images are
+                // part of a larger one, e.g. the eyes of a side-by-side image, and hold data_size bytes of pixels.
+                size_t row_pitch{ 0 };
+                GfQuatd quaternion;
+                GfVec3d linear_acceleration;
+                double timestamp;
+                bool valid = false;
+                // Asynchronous streaming: staging slot of the CameraStream holding the images of the frame
+                size_t staging_slot{ 0 };
+
+                FrameData() = default;
+
+                FrameData(const void* left_ptr, size_t left_size,
+                    const void* right_ptr = nullptr, size_t right_size = 0)
+                    : raw_ptr_left(left_ptr)
+                    , raw_ptr_right(right_ptr)
+                    , data_size_left(left_size)
+                    , data_size_right(right_size)
+                {
+                }
+            };
+
+            // Splits the left image of the frame, holding both eyes side by side in one image of twice the width as rendered
+            // by a tiled render product of the two eyes. Each eye is then addressed in place by its offset and the row pitch
+            // of the whole image. Returns false if the image cannot be split into two eyes of the given height.
+            inline bool splitSideBySide(FrameData& frame, unsigned int height)
+            {
+                const size_t image_size = frame.data_size_left;
+                if (height == 0 || image_size % (2 * static_cast<size_t>(height)) != 0)
+                    return false;
+
+                frame.row_pitch = image_size / height;
+                frame.raw_ptr_right = static_cast<const unsigned char*>(frame.raw_ptr_left) + frame.row_pitch / 2;
+                frame.data_size_left = image_size / 2;
+                frame.data_size_right = image_size / 2;
+                return true;
+            }
+
+            // Points the frame at the tiles of its eyes in the image held by its left image, made of tile_columns tiles
+            // per row of width x height pixels of 4 bytes, as rendered by a tiled render product shared by several
+            // cameras. Tiles are numbered row by row and addressed in place, a negative right tile means a mono camera.
+            // Returns false if a tile is not in the image.
+            inline bool sliceTiles(FrameData& frame, unsigned int tile_columns, unsigned int width, unsigned int height,
+                int tile_left, int tile_right)
+            {
+                const size_t tile_row_size = static_cast<size_t>(width) * sl::kRgbaPixelSize;
+                const size_t tile_size = tile_row_size * height;
+                if (tile_columns == 0 || tile_size == 0)
+                    return false;
+
+                // Only whole rows of tiles are rendered
+                const size_t tile_count = frame.data_size_left / (tile_size * tile_columns) * tile_columns;
+                const auto* image = static_cast<const unsigned char*>(frame.raw_ptr_left);
+                auto tile_image = [&](int tile) -> const void* {
+                    if (tile < 0 || static_cast<size_t>(tile) >= tile_count)
+                        return nullptr;
+                    const size_t tile_row = static_cast<size_t>(tile) / tile_columns;
+                    const size_t tile_column = static_cast<size_t>(tile) % tile_columns;
+                    return image + tile_row * tile_size * tile_columns + tile_column * tile_row_size;
+                };
+
+                const void* left = tile_image(tile_left);
+                const void* right = tile_right >= 0 ? tile_image(tile_right) : nullptr;
+                if (!left || (tile_right >= 0 && !right))
+                    return false;
+
+                frame.row_pitch = tile_row_size * tile_columns;
+                frame.raw_ptr_left = left;
+                frame.raw_ptr_right = right;
+                frame.data_size_left = tile_size;
+                frame.data_size_right = right ? tile_size : 0;
+                return true;
+            }
+
+            // List of available SN per camera model
+            inline std::map<std::string, std::vector<int>> available_zed_cameras = {
+                {"ZED_X",   { 40976320, 41116066, 49123828, 45626933 }},
+                {"ZED_X_4MM", { 47890353,45263213,47800035,47706147 }},
+                {"ZED_XM",   { 57890353,55263213,57800035,57706147 }},
+                {"ZED_XM_4MM",   { 50179396,52835616,59695059,55043860 }},
+                {"ZED_XONE_UHD",   { 312015765, 312817871,315177501, 313382320 }},
+                {"ZED_XONE_GS",   { 305221009, 305952675, 307526942, 307184845 }},
+                {"ZED_XONE_GS_4MM",   {300605725, 302696256, 302485375, 307845777 }}
+            };
+
+            // Number of serial numbers per camera model, overridden with the SL_ZED_SERIAL_POOL_SIZE environment variable
+            constexpr size_t kDefaultSerialPoolSize = 64;
+
+            // Streamer IDs and serial numbers of every node of the plugin, leased when a streamer opens and released when it closes
+            inline sl::StreamerRegistry& streamerRegistry()
+            {
+                static sl::StreamerRegistry registry(available_zed_cameras, [] {
+                    const char* pool_size = std::getenv("SL_ZED_SERIAL_POOL_SIZE");
+                    return pool_size && std::atoi(pool_size) > 0 ? static_cast<size_t>(std::atoi(pool_size)) : kDefaultSerialPoolSize;
+                }());
+                return registry;
+            }
+
+            inline int transportLayerModeToInt(const std::string& mode_str)
+            {
+                if (mode_str == "NETWORK")
+                    return 0;
+                else if (mode_str == "IPC")
+                    return 1;
+                else if (mode_str == "BOTH")
+                    return 2;
+                else
+                {
+                    CARB_LOG_WARN("[ZED] Invalid transport layer mode string %s, defaulting to RTP_ONLY", mode_str.c_str());
+                    return 0;
+                }
+            }
+
+            // Memory holding the images given to the node
+            enum class InputLocation
+            {
+                DEVICE = 0, // CUDA device memory, copied to the host before streaming
+                HOST = 1,   // Host memory, handed to the streamer without any CUDA call
+                AUTO = 2    // Detected for every frame from the pointer attributes
+            };
+
+            inline InputLocation inputLocationFromString(const std::string& location_str)
+            {
+                if (location_str == "HOST")
+                    return InputLocation::HOST;
+                if (location_str == "AUTO")
+                    return InputLocation::AUTO;
+                return InputLocation::DEVICE;
+            }
+
+            // Streaming parameters shared by every ZED camera, except for the serial number
+            inline sl::StreamingParameters makeStreamingParameters(const std::string& transport_layer_mode_str, bool stereo,
+                unsigned int fps, unsigned int width, unsigned int height, unsigned int bitrate, unsigned int chunk_size, unsigned short port)
+            {
+                int transport_layer_mode = transportLayerModeToInt(transport_layer_mode_str);
+
+#ifdef _WIN32
+                // 0 = Network, 1 = IPC, 2 = Both
+                transport_layer_mode = 0;
+
+                CARB_LOG_WARN("[ZED] IPC mode is not available on Windows. Switching back to network streaming...");
+#endif
+                // Use YUV format for IPC or mono cameras
+                bool use_yuv = transport_layer_mode > 0 || !stereo;
+
+                sl::StreamingParameters params;
+                params.alpha_channel_included = true;
+                params.codec_type = 1;
+                params.fps = fps;
+                params.image_height = height;
+                params.image_width = width;
+                params.bitrate = bitrate;
+                params.chunk_size = chunk_size;
+                params.mode = 1;
+                params.transport_layer_mode = transport_layer_mode;
+                params.input_format = use_yuv ? sl::INPUT_FORMAT::YUV : sl::INPUT_FORMAT::BGR;
+                params.serial_number = 0;
+                params.port = port;
+                params.verbose = 0;
+                return params;
+            }
+
+            // Layout of the YUV images handed to the ZED SDK without alpha channel
+            inline sl::PixelLayout yuvLayoutFromString(const std::string& layout_str)
+            {
+                return layout_str == "NV12" ? sl::PixelLayout::NV12 : sl::PixelLayout::YUYV;
+            }
+
+            // Layout of the images handed to the ZED SDK: the rendered RGBA images with alpha channel, or converted to the
+            // layout of the input format without it, yuv_layout for YUV
+            inline sl::PixelLayout stagedLayout(const sl::StreamingParameters& params, sl::PixelLayout yuv_layout)
+            {
+                if (params.alpha_channel_included)
+                    return sl::PixelLayout::RGBA;
+                switch (params.input_format) {
+                case sl::INPUT_FORMAT::RGB:
+                    return sl::PixelLayout::RGB;
+                case sl::INPUT_FORMAT::BGR:
+                    return sl::PixelLayout::BGR;
+                default:
+                    return yuv_layout;
+                }
+            }
+
+            // Configuration of a streamer in the session pool. Allocated serial numbers are leased anew by every stream, so
+            // only the serial number given to a virtual camera is part of the key.
+            inline sl::StreamerSessionKey makeSessionKey(const std::string& camera_model, const std::string& serial_number_str,
+                const sl::StreamingParameters& params)
+            {
+                sl::StreamerSessionKey key;
+                key.port = params.port;
+                key.camera_model = camera_model;
+                key.serial_number = camera_model == "VIRTUAL_ZED_X" ? std::atoi(serial_number_str.c_str()) : -1;
+                key.width = params.image_width;
+                key.height = params.image_height;
+                key.fps = params.fps;
+                key.codec_type = params.codec_type;
+                key.transport_layer_mode = params.transport_layer_mode;
+                key.input_format = static_cast<int>(params.input_format);
+                key.bitrate = params.bitrate;
+                key.chunk_size = params.chunk_size;
+                key.alpha_channel_included = params.alpha_channel_included;
+                return key;
+            }
+
+            // Closes the streamers parked with another configuration than key that hold its port or serial number,
+            // before a streamer is initialized for key
+            inline void evictConflictingSessions(const sl::StreamerSessionKey& key)
+            {
+                sl::StreamerSessionPool::instance().evict([&key](const sl::StreamerSessionKey& parked) {
+                    return parked.port == key.port || (key.serial_number > 0 && parked.serial_number == key.serial_number);
+                });
+            }
+
+            // CUDA stream created on the first device frame, so host-only pipelines never need a CUDA device
+            class LazyCudaStream {
+            public:
+                ~LazyCudaStream()
+                {
+                    destroy();
+                }
+
+                bool get(cudaStream_t& stream)
+                {
+                    if (!m_created) {
+                        cudaError_t err = cudaStreamCreate(&m_stream);
+                        if (err != cudaSuccess) {
+                            CARB_LOG_ERROR("[ZED] Error creating CUDA stream: %s", cudaGetErrorString(err));
+                            return false;
+                        }
+                        m_created = true;
+                    }
+                    stream = m_stream;
+                    return true;
+                }
+
+                // Wait for the copies enqueued on the stream
+                bool synchronize()
+                {
+                    if (!m_created)
+                        return true;
+
+                    cudaError_t err = cudaStreamSynchronize(m_stream);
+                    if (err != cudaSuccess) {
+                        CARB_LOG_ERROR("[ZED] CUDA stream synchronization error: %s", cudaGetErrorString(err));
+                        return false;
+                    }
+                    return true;
+                }
+
+                void destroy()
+                {
+                    if (!m_created)
+                        return;
+
+                    cudaError_t err = cudaStreamDestroy(m_stream);
+                    if (err != cudaSuccess) {
+                        CARB_LOG_ERROR("[ZED] Error destroying CUDA stream: %s", cudaGetErrorString(err));
+                    }
+                    m_created = false;
+                }
+
+            private:
+                cudaStream_t m_stream{};
+                bool m_created{ false };
+            };
+
+            // One streamer of the ZED SDK: serial number, staging buffers and telemetry.
+            // A frame is streamed in two steps, stage() then submit(), so that the copy of a frame can overlap the
+            // encoding of the previous one.
+            class CameraStream {
+            public:
+                // Picks the serial number of the streamer: given for virtual cameras, allocated from the model list otherwise
+                bool allocateSerialNumber(sl::ZedStreamer& zed_streamer, const std::string& camera_model, const std::string& serial_number_str)
+                {
+                    releaseSerialNumber();
+
+                    int serial_number = -1;
+                    if (camera_model == "VIRTUAL_ZED_X")
+                    {
+                        serial_number = std::stoi(serial_number_str);
+                        if (serial_number <= 0) {
+                            return false;
+                        } else if (!zed_streamer.isSNValid(serial_number)) {
+                            CARB_LOG_FATAL("[ZED] Invalid streamer configuration %d ! Make sure the SN starts with 11XXXXXXX",
+                                serial_number);
+                            return false;
+                        } else if (!streamerRegistry().reserveSerialNumber(serial_number)) {
+                            CARB_LOG_ERROR("[ZED] Serial number %d is already used by another camera", serial_number);
+                            return false;
+                        }
+                    }
+                    else
+                    {
+                        // Generated serials are only used if the ZED SDK accepts them, rejected ones are never tried again
+                        int rejected = 0;
+                        serial_number = streamerRegistry().leaseSerialNumber(camera_model, [&](int candidate) {
+                            if (zed_streamer.isSNValid(candidate))
+                                return true;
+                            rejected++;
+                            return false;
+                        });
+                        if (rejected > 0) {
+                            CARB_LOG_WARN("[ZED] %d serial numbers of %s camera rejected by the ZED SDK", rejected, camera_model.c_str());
+                        }
+                        if (serial_number <= 0) {
+                            CARB_LOG_FATAL("[ZED] Maximum number of %s camera reached!", camera_model.c_str());
+                            return false;
+                        }
+                    }
+
+                    m_cameraModel = camera_model;
+                    m_params.serial_number = serial_number;
+                    m_serialLeased = true;
+                    return true;
+                }
+
+                // Initializes the streamer with the allocated serial number. params is filled except for the serial number.
+                // Without params.alpha_channel_included, the images are converted to the layout of the input format before
+                // they are copied to the host, yuv_layout for YUV. Returns the initialization status, > 0 on success.
+                int init(sl::ZedStreamer& zed_streamer, const sl::StreamingParameters& params, bool stereo, InputLocation input_location,
+                    sl::PixelLayout yuv_layout = sl::PixelLayout::YUYV)
+                {
+                    configure(params, stereo, input_location, yuv_layout);
+                    m_streamerId = streamerRegistry().leaseStreamerId();
+
+                    const int status = zed_streamer.initStreamer(m_streamerId, &m_params);
+                    if (status <= 0)
+                    {
+                        CARB_LOG_ERROR("Error during zed streamer initialization %d", status);
+                        releaseSerialNumber();
+                        streamerRegistry().releaseStreamerId(m_streamerId);
+                        return status;
+                    }
+
+                    m_zedStreamer = &zed_streamer;
+                    m_telemetry.reset();
+                    CARB_LOG_INFO("[ZED] ZED Streamer initialized successfully with ID %d", m_streamerId);
+                    return status;
+                }
+
+                // Takes over the streamer parked with key by park(), instead of initializing one: the stream keeps the streamer
+                // ID and serial number of the session, and its timestamps follow the last one the session streamed since the
+                // simulation time starts over. Returns false if no streamer is parked with key.
+                bool reuse(sl::ZedStreamer& zed_streamer, const sl::StreamerSessionKey& key, const sl::StreamingParameters& params,
+                    bool stereo, InputLocation input_location, sl::PixelLayout yuv_layout = sl::PixelLayout::YUYV)
+                {
+                    sl::StreamerSession session;
+                    if (!sl::StreamerSessionPool::instance().take(key, session))
+                        return false;
+
+                    releaseSerialNumber();
+                    m_cameraModel = key.camera_model;
+                    m_params.serial_number = session.serial_number;
+                    configure(params, stereo, input_location, yuv_layout);
+                    m_serialLeased = true;
+                    m_streamerId = session.streamer_id;
+                    m_timestampOffsetNs = session.last_timestamp_ns;
+                    m_lastTimestampNs = session.last_timestamp_ns;
+
+                    m_zedStreamer = &zed_streamer;
+                    m_telemetry.reset();
+                    CARB_LOG_INFO("[ZED] ZED Streamer %d reused from the session pool", m_streamerId);
+                    return true;
+                }
+
+                ~CameraStream()
+                {
+                    destroySlotEvents();
+                }
+
+                // Like close(), but parks the streamer in the session pool for idle_timeout instead of closing it, so that the
+                // next stream with the same key reuses it. The parked streamer keeps a reference to library.
+                void park(const std::shared_ptr<sl::ZedStreamer>& library, const sl::StreamerSessionKey& key,
+                    std::chrono::milliseconds idle_timeout)
+                {
+                    dropPipelined();
+                    if (m_zedStreamer && library) {
+                        sl::StreamerSession session;
+                        session.streamer_id = m_streamerId;
+                        session.serial_number = m_params.serial_number;
+                        session.last_timestamp_ns = m_lastTimestampNs;
+                        session.close = [library, streamer_id = m_streamerId, serial_number = m_params.serial_number,
+                                            serial_leased = m_serialLeased] {
+                            library->closeStreamer(streamer_id);
+                            streamerRegistry().releaseStreamerId(streamer_id);
+                            if (serial_leased) {
+                                streamerRegistry().releaseSerialNumber(serial_number);
+                            }
+                        };
+
+                        // The session owns the streamer from now on
+                        m_zedStreamer = nullptr;
+                        m_serialLeased = false;
+                        sl::StreamerSessionPool::instance().park(key, std::move(session), idle_timeout);
+                    }
+                    close();
+                }
+
+                // Closes the streamer, the caller destroys the ZED SDK instance once all its streamers are closed.
+                // Frames still in flight in pipelined streaming are dropped.
+                void close()
+                {
+                    dropPipelined();
+                    if (m_zedStreamer) {
+                        m_zedStreamer->closeStreamer(m_streamerId);
+                        m_zedStreamer = nullptr;
+                        streamerRegistry().releaseStreamerId(m_streamerId);
+                    }
+                    releaseSerialNumber();
+                    if (m_recorder) {
+                        m_recorder->close();
+                        m_recorder.reset();
+                    }
+
+                    // Give the staging buffers back to the pool so the next PLAY reuses them
+                    destroySlotEvents();
+                    for (auto& slot : m_slots)
+                    {
+                        slot.staging_left.reset();
+                        slot.staging_right.reset();
+                        slot.converted_left.reset();
+                        slot.converted_right.reset();
+                        slot.left = nullptr;
+                        slot.right = nullptr;
+                    }
+                }
+
+                // Records every submitted frame into a recording, as it is handed to the ZED SDK. The recorder is closed
+                // with the streamer.
+                void setRecorder(std::shared_ptr<sl::FrameRecorder> recorder)
+                {
+                    m_recorder = std::move(recorder);
+                }
+
+                const std::shared_ptr<sl::FrameRecorder>& recorder() const { return m_recorder; }
+
+                // Frames carry the IMU samples of the channel instead of their own orientation and linear acceleration,
+                // which are only used until its first sample. nullptr goes back to those of the frames.
+                void setImuChannel(std::shared_ptr<ImuChannel> imu_channel) { m_imuChannel = std::move(imu_channel); }
+
+                bool isOpen() const { return m_zedStreamer != nullptr; }
+                bool isStereo() const { return m_stereo; }
+                int streamerId() const { return m_streamerId; }
+                // Added to the simulation timestamps of the frames, non-zero for a reused streamer
+                uint64_t timestampOffsetNs() const { return m_timestampOffsetNs; }
+                unsigned short port() const { return m_params.port; }
+                const sl::StreamingParameters& params() const { return m_params; }
+                sl::PixelLayout layout() const { return m_layout; }
+
+                sl::StreamTelemetry& telemetry() { return m_telemetry; }
+                const sl::StreamTelemetry& telemetry() const { return m_telemetry; }
+
+                // Whether a frame is streamed: its timestamp was not streamed yet and it is due at the frame rate of the
+                // streamer. Frames above the rate would be dropped by the ZED SDK, so they are never copied nor queued.
+                bool accept(double timestamp)
+                {
+                    // Avoid streaming the same frame multiple times
+                    if (timestamp <= m_previousTimestamp)
+                    {
+                        m_telemetry.recordSkipped();
+                        return false;
+                    }
+                    m_previousTimestamp = timestamp;
+
+                    if (!m_rateGate.accept(timestamp))
+                    {
+                        m_telemetry.recordGated();
+                        return false;
+                    }
+                    return true;
+                }
+
+                // Fills the staging buffers from host images, or enqueues their copy from device images on cuda_stream,
+                // and the copy of the right image on right_stream if given. Only called for frames accepted by accept().
+                // With zero_copy, host images are streamed in place and must stay valid until submit() returns.
+                // Returns false if the frame must not be submitted.
+                bool stage(const FrameData& frame, bool zero_copy, LazyCudaStream& cuda_stream, LazyCudaStream* right_stream = nullptr)
+                {
+                    return stageSlot(m_slots.front(), frame, zero_copy, cuda_stream, right_stream);
+                }
+
+                // Whether the staged frame waits for copies enqueued on the CUDA streams
+                bool hasDeviceCopy() const { return m_slots.front().device_pending; }
+
+                // Drops the staged frame, e.g. when its copies failed
+                void discardStaged()
+                {
+                    discardSlot(m_slots.front());
+                }
+
+                // Sends the staged frame to the ZED SDK, once the copies enqueued by stage() completed
+                int submit(const FrameData& frame)
+                {
+                    return submitSlot(m_slots.front(), frame);
+                }
+
+                // Number of frames in flight with pushPipelined(), at least 1. Drops the frames in flight.
+                void setPipelineDepth(size_t depth)
+                {
+                    dropPipelined();
+                    destroySlotEvents();
+                    m_slots.resize(std::max<size_t>(depth, 1));
+                }
+
+                size_t pipelineDepth() const { return m_slots.size(); }
+
+                // Pipelined streaming: stages the frame in a free slot, then submits the staged frames whose copies
+                // completed, oldest first. The copies of the new frame thus overlap the encoding of the previous ones.
+                // When every slot is in flight, waits for the oldest one and reports the wait as stall time.
+                // Images are always copied, they only need to stay valid until the copies enqueued here complete.
+                void pushPipelined(const FrameData& frame, LazyCudaStream& cuda_stream, LazyCudaStream* right_stream = nullptr)
+                {
+                    if (m_inFlight == m_slots.size()) {
+                        StagingSlot& oldest = m_slots[m_oldest];
+                        const auto stall_start = sl::StreamTelemetry::Clock::now();
+                        const bool copied = waitSlot(oldest);
+                        m_telemetry.recordStall(sl::StreamTelemetry::elapsedMs(stall_start));
+                        releaseOldest(copied);
+                    }
+
+                    StagingSlot& slot = m_slots[(m_oldest + m_inFlight) % m_slots.size()];
+                    if (stageSlot(slot, frame, false, cuda_stream, right_stream)) {
+                        slot.frame = frame;
+                        if (slot.device_pending && !recordSlotEvents(slot, cuda_stream, right_stream)) {
+                            discardSlot(slot);
+                        } else {
+                            m_inFlight++;
+                        }
+                    }
+
+                    while (m_inFlight > 0 && !isSlotPending(m_slots[m_oldest])) {
+                        releaseOldest(waitSlot(m_slots[m_oldest]));
+                    }
+                }
+
+                // Waits for the copies in flight and drops their frames, e.g. before the streamer is closed
+                void dropPipelined()
+                {
+                    while (m_inFlight > 0) {
+                        waitSlot(m_slots[m_oldest]);
+                        releaseOldest(false);
+                    }
+                    m_oldest = 0;
+
+                    // Frames staged by stageInSlot() and never submitted, e.g. coalesced by the frame queue
+                    for (auto& slot : m_slots) {
+                        waitSlot(slot);
+                        slot.copy_pending = false;
+                        slot.device_pending = false;
+                    }
+                }
+
+                // Asynchronous streaming, with one staging slot per frame slot of the node (see setPipelineDepth()):
+                // copies the frame into the staging slot before the images are rendered again. Host images are copied
+                // on the CPU, the copies of device images are enqueued on cuda_stream and right_stream and completed by
+                // CUDA events, so the images are read before any later work of the renderer on the device. The slot
+                // must not be queued for submitStaged(). Returns false if the frame must not be queued.
+                bool stageInSlot(size_t index, const FrameData& frame, LazyCudaStream& cuda_stream, LazyCudaStream* right_stream = nullptr)
+                {
+                    StagingSlot& slot = m_slots[index];
+                    // The copies of a frame coalesced or dropped after it was staged may still run
+                    waitSlot(slot);
+                    if (!stageSlot(slot, frame, false, cuda_stream, right_stream))
+                        return false;
+
+                    slot.frame = frame;
+                    if (slot.device_pending && !recordSlotEvents(slot, cuda_stream, right_stream)) {
+                        // Without events the copies are waited for here
+                        cuda_stream.synchronize();
+                        if (right_stream) {
+                            right_stream->synchronize();
+                        }
+                        discardSlot(slot);
+                        return false;
+                    }
+                    return true;
+                }
+
+                // Asynchronous streaming: waits for the copies of the frame staged in the slot by stageInSlot(), then
+                // sends it to the ZED SDK. The wait is reported as stall time.
+                void submitStaged(size_t index)
+                {
+                    StagingSlot& slot = m_slots[index];
+                    const auto stall_start = sl::StreamTelemetry::Clock::now();
+                    const bool copied = waitSlot(slot);
+                    if (slot.device_pending) {
+                        m_telemetry.recordStall(sl::StreamTelemetry::elapsedMs(stall_start));
+                    }
+                    if (copied) {
+                        submitSlot(slot, slot.frame);
+                    } else {
+                        discardSlot(slot);
+                    }
+                }
+
+            private:
+                // Settings shared by init() and reuse(), params is filled except for the serial number
+                void configure(const sl::StreamingParameters& params, bool stereo, InputLocation input_location, sl::PixelLayout yuv_layout)
+                {
+                    const int serial_number = m_params.serial_number;
+                    m_params = params;
+                    m_params.serial_number = serial_number;
+                    m_stereo = stereo;
+                    m_inputLocation = input_location;
+                    m_layout = stagedLayout(m_params, yuv_layout);
+                    m_previousTimestamp = 0.0;
+                    m_timestampOffsetNs = 0;
+                    m_lastTimestampNs = 0;
+                    m_rateGate.setRate(m_params.fps);
+                    m_rateGate.reset();
+                }
+
+                // Staging buffers and state of one frame between stage() and submit()
+                struct StagingSlot {
+                    // Host staging buffers, leased from the process-wide pinned buffer pool
+                    sl::HostBuffer staging_left;
+                    sl::HostBuffer staging_right;
+                    // Device images converted to the layout of the stream, before their copy to the staging buffers
+                    DeviceBuffer converted_left;
+                    DeviceBuffer converted_right;
+
+                    // Images of the staged frame, either the staging buffers or the input images in place
+                    unsigned char* left{ nullptr };
+                    unsigned char* right{ nullptr };
+                    bool copy_pending{ false };
+                    bool device_pending{ false };
+                    sl::StreamTelemetry::Clock::time_point copy_start;
+
+                    // Pipelined streaming only: frame metadata, and events recorded after the copies of each image
+                    FrameData frame;
+                    cudaEvent_t left_copied{};
+                    cudaEvent_t right_copied{};
+                    bool events_created{ false };
+                };
+
+                bool stageSlot(StagingSlot& slot, const FrameData& frame, bool zero_copy, LazyCudaStream& cuda_stream, LazyCudaStream* right_stream)
+                {
+                    slot.copy_pending = false;
+                    slot.device_pending = false;
+
+                    if (converts() && (!fitsLayout(frame.data_size_left) || (m_stereo && !fitsLayout(frame.data_size_right))))
+                    {
+                        CARB_LOG_ERROR("[ZED] Images of streamer %d are not %ux%u pixels of 4 bytes, they cannot be converted to its input format",
+                            m_streamerId, m_params.image_width, m_params.image_height);
+                        m_telemetry.recordDropped();
+                        return false;
+                    }
+
+                    if (frame.row_pitch != 0 && !fitsRowPitch(frame.data_size_left, frame.row_pitch))
+                    {
+                        CARB_LOG_ERROR("[ZED] Images of streamer %d do not fit their row pitch of %zu bytes", m_streamerId, frame.row_pitch);
+                        m_telemetry.recordDropped();
+                        return false;
+                    }
+
+                    // Converted and pitched images are always written to the staging buffers
+                    const bool on_device = isDevicePointer(frame.raw_ptr_left);
+                    const bool contiguous = frame.row_pitch == 0;
+                    if (!on_device && zero_copy && !converts() && contiguous)
+                    {
+                        slot.left = static_cast<unsigned char*>(const_cast<void*>(frame.raw_ptr_left));
+                        slot.right = static_cast<unsigned char*>(const_cast<void*>(frame.raw_ptr_right));
+                        return true;
+                    }
+
+                    // Lease staging buffers only if needed, previous ones go back to the pool
+                    const size_t staged_size_left = stagedSize(frame.data_size_left);
+                    const size_t staged_size_right = stagedSize(frame.data_size_right);
+                    if (!slot.staging_left || slot.staging_left.size() < staged_size_left) {
+                        slot.staging_left = sl::PinnedBufferPool::instance().acquire(staged_size_left);
+                    }
+                    if (m_stereo && (!slot.staging_right || slot.staging_right.size() < staged_size_right)) {
+                        slot.staging_right = sl::PinnedBufferPool::instance().acquire(staged_size_right);
+                    }
+                    if (!slot.staging_left || (m_stereo && !slot.staging_right)) {
+                        m_telemetry.recordDropped();
+                        return false;
+                    }
+                    slot.left = slot.staging_left.get();
+                    slot.right = slot.staging_right.get();
+
+                    slot.copy_start = sl::StreamTelemetry::Clock::now();
+                    slot.copy_pending = true;
+                    if (!on_device)
+                    {
+                        // Host images may be overwritten by the next render before they are encoded
+                        copyFromHost(slot.left, frame.raw_ptr_left, frame.data_size_left, frame.row_pitch);
+                        if (m_stereo)
+                        {
+                            copyFromHost(slot.right, frame.raw_ptr_right, frame.data_size_right, frame.row_pitch);
+                        }
+                        return true;
+                    }
+
+                    cudaStream_t stream{};
+                    cudaStream_t stream_right{};
+                    if (!cuda_stream.get(stream) || (m_stereo && right_stream && !right_stream->get(stream_right))) {
+                        discardSlot(slot);
+                        return false;
+                    }
+
+                    // Copy data from GPU to CPU, both images overlap when the right one has its own stream
+                    cudaError_t err_left = copyFromDevice(slot.left, slot.converted_left,
+                        frame.raw_ptr_left,
+                        frame.data_size_left, frame.row_pitch, stream);
+
+                    cudaError_t err_right = cudaSuccess;
+
+                    if (m_stereo)
+                    {
+                        err_right = copyFromDevice(slot.right, slot.converted_right,
+                            frame.raw_ptr_right,
+                            frame.data_size_right, frame.row_pitch, right_stream ? stream_right : stream);
+                    }
+
+                    if (err_left != cudaSuccess || err_right != cudaSuccess) {
+                        CARB_LOG_ERROR("CUDA memcpy error in streaming thread: %s",
+                            cudaGetErrorString(err_left != cudaSuccess ? err_left : err_right));
+                        discardSlot(slot);
+                        return false;
+                    }
+                    slot.device_pending = true;
+                    return true;
+                }
+
+                void discardSlot(StagingSlot& slot)
+                {
+                    slot.copy_pending = false;
+                    slot.device_pending = false;
+                    m_telemetry.recordDropped();
+                }
+
+                int submitSlot(StagingSlot& slot, const FrameData& frame)
+                {
+                    if (slot.copy_pending) {
+                        m_telemetry.recordCopy(sl::StreamTelemetry::elapsedMs(slot.copy_start));
+                        slot.copy_pending = false;
+                    }
+                    slot.device_pending = false;
+
+                    // Stream the data immediately
+                    unsigned long long ts_ns = static_cast<unsigned long long>(frame.timestamp * 1000000000) + m_timestampOffsetNs;
+                    m_lastTimestampNs = ts_ns;
+
+                    ImuSample imu_sample;
+                    if (!m_imuChannel || !m_imuChannel->frameSample(static_cast<long long>(ts_ns), imu_sample)) {
+                        imu_sample = makeImuSample(frame.timestamp, frame.quaternion, frame.linear_acceleration, GfVec3d(0.0, 0.0, 0.0));
+                    }
+                    const float imu[7] = {
+                        imu_sample.orientation[0], imu_sample.orientation[1], imu_sample.orientation[2], imu_sample.orientation[3],
+                        imu_sample.linear_acceleration[0], imu_sample.linear_acceleration[1], imu_sample.linear_acceleration[2]
+                    };
+
+                    const auto stream_start = sl::StreamTelemetry::Clock::now();
+                    int stream_status = m_zedStreamer->stream(m_params.input_format, m_streamerId,
+                        slot.left,
+                        slot.right,
+                        ts_ns,
+                        imu[0], imu[1], imu[2], imu[3],
+                        imu[4], imu[5], imu[6]);
+                    m_telemetry.recordStreamCall(sl::StreamTelemetry::elapsedMs(stream_start), stream_status);
+
+                    // Images handed to the ZED SDK stay valid until submit returns
+                    if (m_recorder) {
+                        m_recorder->append(m_params, m_stereo, slot.left, stagedSize(frame.data_size_left),
+                            m_stereo ? slot.right : nullptr, m_stereo ? stagedSize(frame.data_size_right) : 0,
+                            static_cast<int64_t>(ts_ns), imu, stream_status);
+                    }
+                    return stream_status;
+                }
+
+                bool recordSlotEvents(StagingSlot& slot, LazyCudaStream& cuda_stream, LazyCudaStream* right_stream)
+                {
+                    if (!slot.events_created)
+                    {
+                        cudaError_t err = cudaEventCreateWithFlags(&slot.left_copied, cudaEventDisableTiming);
+                        if (err == cudaSuccess) {
+                            err = cudaEventCreateWithFlags(&slot.right_copied, cudaEventDisableTiming);
+                            if (err != cudaSuccess) {
+                                cudaEventDestroy(slot.left_copied);
+                            }
+                        }
+                        if (err != cudaSuccess) {
+                            CARB_LOG_ERROR("[ZED] Error creating CUDA event: %s", cudaGetErrorString(err));
+                            return false;
+                        }
+                        slot.events_created = true;
+                    }
+
+                    // Both streams were created by stageSlot()
+                    cudaStream_t stream{};
+                    cudaStream_t stream_right{};
+                    cuda_stream.get(stream);
+                    const bool split = m_stereo && right_stream && right_stream->get(stream_right);
+                    cudaError_t err = cudaEventRecord(slot.left_copied, stream);
+                    if (err == cudaSuccess) {
+                        err = cudaEventRecord(slot.right_copied, split ? stream_right : stream);
+                    }
+                    if (err != cudaSuccess) {
+                        CARB_LOG_ERROR("[ZED] Error recording CUDA event: %s", cudaGetErrorString(err));
+                        return false;
+                    }
+                    return true;
+                }
+
+                // Whether the copies of the slot are still running on the GPU
+                bool isSlotPending(const StagingSlot& slot) const
+                {
+                    if (!slot.device_pending)
+                        return false;
+                    return cudaEventQuery(slot.left_copied) == cudaErrorNotReady || cudaEventQuery(slot.right_copied) == cudaErrorNotReady;
+                }
+
+                // Returns false if the copies of the slot failed
+                bool waitSlot(const StagingSlot& slot) const
+                {
+                    if (!slot.device_pending)
+                        return true;
+
+                    cudaError_t err = cudaEventSynchronize(slot.left_copied);
+                    if (err == cudaSuccess) {
+                        err = cudaEventSynchronize(slot.right_copied);
+                    }
+                    if (err != cudaSuccess) {
+                        CARB_LOG_ERROR("[ZED] CUDA event synchronization error: %s", cudaGetErrorString(err));
+                        return false;
+                    }
+                    return true;
+                }
+
+                // Submits the oldest frame in flight, or drops it if its copies failed
+                void releaseOldest(bool copied)
+                {
+                    StagingSlot& slot = m_slots[m_oldest];
+                    if (copied) {
+                        submitSlot(slot, slot.frame);
+                    } else {
+                        discardSlot(slot);
+                    }
+                    m_oldest = (m_oldest + 1) % m_slots.size();
+                    m_inFlight--;
+                }
+
+                void destroySlotEvents()
+                {
+                    for (auto& slot : m_slots)
+                    {
+                        if (slot.events_created) {
+                            cudaEventDestroy(slot.left_copied);
+                            cudaEventDestroy(slot.right_copied);
+                            slot.events_created = false;
+                        }
+                    }
+                }
+
+                // Whether the images are converted to another layout than the rendered one
+                bool converts() const { return m_layout != sl::PixelLayout::RGBA; }
+
+                // Width of an image of data_size bytes made of image_height rows of RGBA pixels
+                size_t imageWidth(size_t data_size) const
+                {
+                    return m_params.image_height != 0 ? data_size / sl::kRgbaPixelSize / m_params.image_height : 0;
+                }
+
+                // Whether an image of data_size bytes is made of image_height rows of RGBA pixels that fit the layout
+                bool fitsLayout(size_t data_size) const
+                {
+                    const size_t width = imageWidth(data_size);
+                    return width != 0 && width * sl::kRgbaPixelSize * m_params.image_height == data_size &&
+                        sl::fitsLayout(m_layout, width, m_params.image_height);
+                }
+
+                // Size of an image handed to the ZED SDK, once converted to the layout of the stream
+                size_t stagedSize(size_t data_size) const
+                {
+                    return converts() ? sl::convertedSize(m_layout, imageWidth(data_size), m_params.image_height) : data_size;
+                }
+
+                // Whether images of data_size bytes are made of image_height rows that fit the row pitch
+                bool fitsRowPitch(size_t data_size, size_t row_pitch) const
+                {
+                    const size_t rows = m_params.image_height;
+                    if (rows == 0 || data_size % rows != 0 || data_size / rows > row_pitch)
+                        return false;
+                    return !converts() || row_pitch % sl::kRgbaPixelSize == 0;
+                }
+
+                void copyFromHost(unsigned char* dst, const void* src, size_t data_size, size_t row_pitch) const
+                {
+                    const unsigned char* src_row = static_cast<const unsigned char*>(src);
+                    if (converts()) {
+                        const size_t width = imageWidth(data_size);
+                        sl::convertPixels(m_layout, src_row, row_pitch != 0 ? row_pitch : width * sl::kRgbaPixelSize, width,
+                            m_params.image_height, dst);
+                        return;
+                    }
+
+                    // Contiguous images are copied as a single row
+                    const size_t rows = row_pitch != 0 ? m_params.image_height : 1;
+                    const size_t row_size = data_size / rows;
+                    for (size_t row = 0; row < rows; row++, src_row += row_pitch, dst += row_size) {
+                        std::memcpy(dst, src_row, row_size);
+                    }
+                }
+
+                // Device images to convert go through converted, only the converted bytes are copied to the host
+                cudaError_t copyFromDevice(unsigned char* dst, DeviceBuffer& converted, const void* src, size_t data_size, size_t row_pitch,
+                    cudaStream_t stream) const
+                {
+                    if (converts()) {
+                        const size_t width = imageWidth(data_size);
+                        const size_t converted_size = stagedSize(data_size);
+                        cudaError_t err = converted.reserve(converted_size);
+                        if (err == cudaSuccess) {
+                            err = DevicePixelConverter::instance().convert(m_layout, src,
+                                row_pitch != 0 ? row_pitch : width * sl::kRgbaPixelSize, width, m_params.image_height, converted.get(), stream);
+                        }
+                        if (err != cudaSuccess)
+                            return err;
+                        return cudaMemcpyAsync(dst, converted.get(), converted_size, cudaMemcpyDeviceToHost, stream);
+                    }
+
+                    if (row_pitch != 0)
+                        return copyPitchedFromDevice(dst, src, data_size, row_pitch, stream);
+
+                    return cudaMemcpyAsync(dst, src, data_size, cudaMemcpyDeviceToHost, stream);
+                }
+
+                // Copies the rows of an image that is part of a larger one into a contiguous staging buffer, still
+                // with a single copy: the copy engine skips the rest of every source row
+                cudaError_t copyPitchedFromDevice(unsigned char* dst, const void* src, size_t data_size, size_t row_pitch, cudaStream_t stream) const
+                {
+                    const size_t rows = m_params.image_height;
+                    const size_t row_size = data_size / rows;
+                    return cudaMemcpy2DAsync(dst, row_size, src, row_pitch, row_size, rows, cudaMemcpyDeviceToHost, stream);
+                }
+
+                void releaseSerialNumber()
+                {
+                    if (m_serialLeased) {
+                        streamerRegistry().releaseSerialNumber(m_params.serial_number);
+                        m_serialLeased = false;
+                    }
+                }
+
+                bool isDevicePointer(const void* ptr) const
+                {
+                    if (m_inputLocation != InputLocation::AUTO)
+                        return m_inputLocation == InputLocation::DEVICE;
+
+                    // Fails without a CUDA device or for memory unknown to CUDA, both meaning host memory
+                    cudaPointerAttributes attributes;
+                    if (cudaPointerGetAttributes(&attributes, ptr) != cudaSuccess) {
+                        cudaGetLastError();
+                        return false;
+                    }
+                    return attributes.type == cudaMemoryTypeDevice || attributes.type == cudaMemoryTypeManaged;
+                }
+
+                sl::ZedStreamer* m_zedStreamer{ nullptr };
+                std::string m_cameraModel;
+                sl::StreamingParameters m_params;
+                bool m_serialLeased{ false };
+                int m_streamerId{ 0 };
+                bool m_stereo{ true };
+                InputLocation m_inputLocation{ InputLocation::DEVICE };
+                sl::PixelLayout m_layout{ sl::PixelLayout::RGBA };
+                double m_previousTimestamp{ 0.0 };
+                uint64_t m_timestampOffsetNs{ 0 };
+                uint64_t m_lastTimestampNs{ 0 };
+                sl::RateGate m_rateGate;
+
+                // One slot for stage() and submit(), pipelined streaming uses them all as a ring
+                std::vector<StagingSlot> m_slots = std::vector<StagingSlot>(1);
+                size_t m_oldest{ 0 };
+                size_t m_inFlight{ 0 };
+
+                sl::StreamTelemetry m_telemetry;
+                std::shared_ptr<sl::FrameRecorder> m_recorder;
+                std::shared_ptr<ImuChannel> m_imuChannel;
+            };
+
+        } // camera
+    } // sensor
+} // sl
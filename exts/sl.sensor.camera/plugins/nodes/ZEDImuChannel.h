@@ -0,0 +1,268 @@
+// High-rate IMU channel shared between the ZED Stream node, which owns the streamer,
+// and the ZED IMU Stream node, which samples the IMU on every physics step.
+
+#pragma once
+
+#include <atomic>
+#include <condition_variable>
+#include <cstdint>
+#include <deque>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+#include "zed_interface_loader.hpp"
+
+namespace sl {
+    namespace sensor {
+        namespace camera {
+
+            // Isaac Sim (X forward, Y left, Z up) to ZED SDK IMU frame
+            inline const pxr::GfMatrix4d& imuRotationMatrix()
+            {
+                static const pxr::GfMatrix4d rotation_matrix{
+                    0, -1, 0, 0,
+                    0, 0, -1, 0,
+                    1, 0, 0, 0,
+                    0, 0, 0, 1
+                };
+                return rotation_matrix;
+            }
+
+            inline const pxr::GfMatrix4d& imuInvRotationMatrix()
+            {
+                static const pxr::GfMatrix4d inv_rotation_matrix = imuRotationMatrix().GetInverse();
+                return inv_rotation_matrix;
+            }
+
+            inline GfQuatd convertImuOrientation(const GfQuatd& quaternion)
+            {
+                pxr::GfMatrix4d orientation_mat;
+                orientation_mat.SetRotate(quaternion.GetNormalized());
+                return (imuRotationMatrix() * orientation_mat * imuInvRotationMatrix()).GetOrthonormalized().ExtractRotationQuat();
+            }
+
+            // Used for linear acceleration and angular velocity
+            inline GfVec3d convertImuVector(const GfVec3d& vector)
+            {
+                pxr::GfMatrix4d vector_mat;
+                vector_mat.SetTranslate(vector);
+                return (imuRotationMatrix() * vector_mat * imuInvRotationMatrix()).GetOrthonormalized().ExtractTranslation();
+            }
+
+            // IMU sample already converted to the ZED SDK frame
+            struct ImuSample {
+                long long timestamp_ns{ 0 };
+                float angular_velocity[3]{ 0.f, 0.f, 0.f };
+                float linear_acceleration[3]{ 0.f, 0.f, 0.f };
+                float orientation[4]{ 1.f, 0.f, 0.f, 0.f }; // w, x, y, z
+            };
+
+            // Convert an Isaac Sim IMU reading to a ZED SDK sample, with the same axis conventions as the image stream
+            inline ImuSample makeImuSample(double timestamp, const GfQuatd& orientation,
+                const GfVec3d& linear_acceleration, const GfVec3d& angular_velocity)
+            {
+                const GfQuatd converted_orientation = convertImuOrientation(orientation);
+                const GfVec3d converted_lin_acc = convertImuVector(linear_acceleration);
+                const GfVec3d converted_ang_vel = convertImuVector(angular_velocity);
+
+                ImuSample sample;
+                sample.timestamp_ns = static_cast<long long>(timestamp * 1000000000);
+                for (int i = 0; i < 3; i++)
+                {
+                    sample.linear_acceleration[i] = static_cast<float>(converted_lin_acc[i]);
+                    sample.angular_velocity[i] = static_cast<float>(converted_ang_vel[i]);
+                }
+                sample.orientation[0] = static_cast<float>(converted_orientation.GetReal());
+                sample.orientation[1] = -static_cast<float>(converted_orientation.GetImaginary()[0]);
+                sample.orientation[2] = -static_cast<float>(converted_orientation.GetImaginary()[1]);
+                sample.orientation[3] = static_cast<float>(converted_orientation.GetImaginary()[2]);
+                return sample;
+            }
+
+            // Bounded queue of IMU samples drained in batches by a worker thread calling ZedStreamer::ingestIMU,
+            // independently from image encoding. When the queue is full the oldest sample is discarded.
+            // timestamp_offset_ns is added to the timestamps of the samples, like to the images of the streamer.
+            // The ZED SDK also takes an IMU sample with every image: frames take it from the channel, see frameSample(),
+            // so that the ZED SDK receives a single series of samples, in timestamp order.
+            class ImuChannel {
+            public:
+                ImuChannel(sl::ZedStreamer& streamer, int streamer_id, size_t capacity, uint64_t timestamp_offset_ns = 0)
+                    : m_streamer(streamer)
+                    , m_streamerId(streamer_id)
+                    , m_capacity(capacity > 0 ? capacity : 1)
+                    , m_timestampOffsetNs(static_cast<long long>(timestamp_offset_ns))
+                {
+                }
+
+                ~ImuChannel()
+                {
+                    stop();
+                }
+
+                void start()
+                {
+                    m_shouldStop.store(false, std::memory_order_release);
+                    m_thread = std::thread(&ImuChannel::ingestThreadFunc, this);
+                }
+
+                void stop()
+                {
+                    {
+                        std::lock_guard<std::mutex> lock(m_mutex);
+                        m_shouldStop.store(true, std::memory_order_release);
+                    }
+                    m_cv.notify_all();
+                    if (m_thread.joinable()) {
+                        m_thread.join();
+                    }
+                }
+
+                void push(const ImuSample& sample)
+                {
+                    {
+                        std::lock_guard<std::mutex> lock(m_mutex);
+                        if (m_samples.size() >= m_capacity) {
+                            m_samples.pop_front();
+                            m_dropped++;
+                        }
+                        m_samples.push_back(sample);
+                        m_latest = sample;
+                        m_hasLatest = true;
+                    }
+                    m_cv.notify_one();
+                }
+
+                // IMU sample carried by the frame streamed at timestamp_ns (offset included): the last one pushed.
+                // Samples not ingested yet and not later than the frame are then skipped, the ZED SDK would receive
+                // them out of order. Returns false before the first sample.
+                bool frameSample(long long timestamp_ns, ImuSample& sample)
+                {
+                    // Waits for a sample being ingested, it must reach the ZED SDK before the frame
+                    std::lock_guard<std::mutex> ingest_lock(m_ingestMutex);
+                    std::lock_guard<std::mutex> lock(m_mutex);
+                    if (timestamp_ns > m_streamedNs.load(std::memory_order_relaxed)) {
+                        m_streamedNs.store(timestamp_ns, std::memory_order_release);
+                    }
+                    if (!m_hasLatest)
+                        return false;
+                    sample = m_latest;
+                    return true;
+                }
+
+                uint64_t ingestedCount() const { return m_ingested.load(std::memory_order_relaxed); }
+
+                uint64_t droppedCount() const
+                {
+                    std::lock_guard<std::mutex> lock(m_mutex);
+                    return m_dropped;
+                }
+
+                // Samples skipped because a frame carrying a later sample was streamed first
+                uint64_t supersededCount() const { return m_superseded.load(std::memory_order_relaxed); }
+
+            private:
+                void ingestThreadFunc()
+                {
+                    std::vector<ImuSample> batch;
+                    batch.reserve(m_capacity);
+
+                    while (true)
+                    {
+                        {
+                            std::unique_lock<std::mutex> lock(m_mutex);
+                            m_cv.wait(lock, [&] {
+                                return !m_samples.empty() || m_shouldStop.load(std::memory_order_acquire);
+                            });
+                            if (m_shouldStop.load(std::memory_order_acquire))
+                                return;
+
+                            // Take every pending sample at once, the producer is never blocked while ingesting
+                            batch.assign(m_samples.begin(), m_samples.end());
+                            m_samples.clear();
+                        }
+
+                        size_t ingested = 0;
+                        for (const ImuSample& sample : batch)
+                        {
+                            // Held from the check to the ingestion, a frame streamed in between would be earlier
+                            std::lock_guard<std::mutex> ingest_lock(m_ingestMutex);
+                            if (sample.timestamp_ns + m_timestampOffsetNs <= m_streamedNs.load(std::memory_order_acquire)) {
+                                m_superseded.fetch_add(1, std::memory_order_relaxed);
+                                continue;
+                            }
+                            ingested++;
+                            int status = m_streamer.ingestIMU(m_streamerId, sample.timestamp_ns + m_timestampOffsetNs,
+                                sample.angular_velocity[0], sample.angular_velocity[1], sample.angular_velocity[2],
+                                sample.linear_acceleration[0], sample.linear_acceleration[1], sample.linear_acceleration[2],
+                                sample.orientation[0], sample.orientation[1], sample.orientation[2], sample.orientation[3]);
+                            if (status < 0) {
+                                CARB_LOG_WARN("[ZED] IMU ingestion failed for streamer %d (%d)", m_streamerId, status);
+                            }
+                        }
+                        m_ingested.fetch_add(ingested, std::memory_order_relaxed);
+                    }
+                }
+
+                sl::ZedStreamer& m_streamer;
+                const int m_streamerId;
+                const size_t m_capacity;
+                const long long m_timestampOffsetNs;
+
+                std::thread m_thread;
+                std::atomic<bool> m_shouldStop{ false };
+                mutable std::mutex m_mutex;
+                // Orders the ingestion of a sample against the frames, see frameSample()
+                std::mutex m_ingestMutex;
+                std::condition_variable m_cv;
+                std::deque<ImuSample> m_samples;
+                uint64_t m_dropped{ 0 };
+                ImuSample m_latest;
+                bool m_hasLatest{ false };
+                // Timestamp of the last frame streamed with a sample of the channel
+                std::atomic<long long> m_streamedNs{ 0 };
+                std::atomic<uint64_t> m_ingested{ 0 };
+                std::atomic<uint64_t> m_superseded{ 0 };
+            };
+
+            // Process-wide lookup of the IMU channels by streaming port
+            class ImuChannelRegistry {
+            public:
+                static void add(unsigned int port, std::shared_ptr<ImuChannel> channel)
+                {
+                    std::lock_guard<std::mutex> lock(mutex());
+                    channels()[port] = std::move(channel);
+                }
+
+                static void remove(unsigned int port)
+                {
+                    std::lock_guard<std::mutex> lock(mutex());
+                    channels().erase(port);
+                }
+
+                static std::shared_ptr<ImuChannel> find(unsigned int port)
+                {
+                    std::lock_guard<std::mutex> lock(mutex());
+                    auto it = channels().find(port);
+                    return it != channels().end() ? it->second : nullptr;
+                }
+
+            private:
+                static std::mutex& mutex()
+                {
+                    static std::mutex registry_mutex;
+                    return registry_mutex;
+                }
+
+                static std::map<unsigned int, std::shared_ptr<ImuChannel>>& channels()
+                {
+                    static std::map<unsigned int, std::shared_ptr<ImuChannel>> registry_channels;
+                    return registry_channels;
+                }
+            };
+
+        } // camera
+    } // sensor
+} // sl
@@ -0,0 +1,219 @@
+// Conversion of the device images of the ZED Stream node to the layout handed to the ZED SDK, before their copy to
+// the host. The kernels of kernels/pixel_format_kernels.cu are embedded as PTX and loaded with the CUDA driver API,
+// reached through the CUDA runtime, so the plugin needs neither nvcc to build nor a link to the driver library.
+
+#pragma once
+
+#include <map>
+#include <mutex>
+#include <utility>
+
+#include <cuda/include/cuda.h>
+#include <cuda/include/cuda_runtime_api.h>
+#include "pixel_format.hpp"
+#include "pixel_format_kernels_ptx.h"
+
+namespace sl {
+    namespace sensor {
+        namespace camera {
+
+            // Device memory holding the converted images of a staging slot until their copy to the host completed
+            class DeviceBuffer {
+            public:
+                DeviceBuffer() = default;
+                DeviceBuffer(const DeviceBuffer&) = delete;
+                DeviceBuffer& operator=(const DeviceBuffer&) = delete;
+
+                DeviceBuffer(DeviceBuffer&& other) noexcept
+                {
+                    std::swap(m_data, other.m_data);
+                    std::swap(m_size, other.m_size);
+                }
+
+                DeviceBuffer& operator=(DeviceBuffer&& other) noexcept
+                {
+                    if (this != &other) {
+                        reset();
+                        std::swap(m_data, other.m_data);
+                        std::swap(m_size, other.m_size);
+                    }
+                    return *this;
+                }
+
+                ~DeviceBuffer()
+                {
+                    reset();
+                }
+
+                // Grows the buffer to at least size bytes, its content is lost
+                cudaError_t reserve(size_t size)
+                {
+                    if (m_size >= size)
+                        return cudaSuccess;
+                    reset();
+                    cudaError_t err = cudaMalloc(&m_data, size);
+                    if (err != cudaSuccess) {
+                        m_data = nullptr;
+                        return err;
+                    }
+                    m_size = size;
+                    return cudaSuccess;
+                }
+
+                void reset()
+                {
+                    if (m_data) {
+                        cudaFree(m_data);
+                        m_data = nullptr;
+                        m_size = 0;
+                    }
+                }
+
+                unsigned char* get() const { return static_cast<unsigned char*>(m_data); }
+
+            private:
+                void* m_data{ nullptr };
+                size_t m_size{ 0 };
+            };
+
+            // Process-wide launcher of the conversion kernels, whose module is loaded once per device
+            class DevicePixelConverter {
+            public:
+                static DevicePixelConverter& instance()
+                {
+                    static DevicePixelConverter converter;
+                    return converter;
+                }
+
+                // Enqueues on stream the conversion of width x height RGBA pixels of device memory, src_pitch bytes from
+                // one row to the next, into the contiguous image dst of sl::convertedSize(layout, width, height) bytes.
+                // Computes the same bytes as sl::convertPixels(). The image must fit the layout, RGBA is not converted.
+                // The CUDA context of the device must be current, as it is after any CUDA runtime call on the thread.
+                cudaError_t convert(sl::PixelLayout layout, const void* src, size_t src_pitch, size_t width, size_t height,
+                    void* dst, cudaStream_t stream)
+                {
+                    const Kernels* kernels = load();
+                    if (!kernels)
+                        return cudaErrorInvalidKernelImage;
+
+                    unsigned long long pitch = src_pitch;
+                    unsigned int kernel_width = static_cast<unsigned int>(width);
+                    unsigned int kernel_height = static_cast<unsigned int>(height);
+                    int bgr = layout == sl::PixelLayout::BGR ? 1 : 0;
+                    void* args[] = { &src, &pitch, &dst, &kernel_width, &kernel_height, &bgr };
+
+                    // Threads of the kernels: one per pixel, pair of pixels or block of 2x2 pixels
+                    CUfunction function = nullptr;
+                    size_t threads_x = width;
+                    size_t threads_y = height;
+                    switch (layout) {
+                    case sl::PixelLayout::RGB:
+                    case sl::PixelLayout::BGR:
+                        function = kernels->packed;
+                        break;
+                    case sl::PixelLayout::YUYV:
+                        function = kernels->yuyv;
+                        threads_x = width / 2;
+                        break;
+                    case sl::PixelLayout::NV12:
+                        function = kernels->nv12;
+                        threads_x = width / 2;
+                        threads_y = height / 2;
+                        break;
+                    default:
+                        return cudaErrorInvalidValue;
+                    }
+
+                    const unsigned int grid_x = static_cast<unsigned int>((threads_x + kBlockWidth - 1) / kBlockWidth);
+                    const unsigned int grid_y = static_cast<unsigned int>((threads_y + kBlockHeight - 1) / kBlockHeight);
+                    if (grid_x == 0 || grid_y == 0)
+                        return cudaSuccess;
+
+                    const CUresult result = m_launchKernel(function, grid_x, grid_y, 1, kBlockWidth, kBlockHeight, 1, 0,
+                        reinterpret_cast<CUstream>(stream), args, nullptr);
+                    if (result != CUDA_SUCCESS) {
+                        CARB_LOG_ERROR("[ZED] Error %d launching the pixel conversion kernel", static_cast<int>(result));
+                        return cudaErrorLaunchFailure;
+                    }
+                    return cudaSuccess;
+                }
+
+            private:
+                static constexpr unsigned int kBlockWidth = 32;
+                static constexpr unsigned int kBlockHeight = 8;
+
+                using ModuleLoadDataFn = CUresult (CUDAAPI*)(CUmodule*, const void*);
+                using ModuleGetFunctionFn = CUresult (CUDAAPI*)(CUfunction*, CUmodule, const char*);
+                using LaunchKernelFn = CUresult (CUDAAPI*)(CUfunction, unsigned int, unsigned int, unsigned int, unsigned int,
+                    unsigned int, unsigned int, unsigned int, CUstream, void**, void**);
+
+                struct Kernels {
+                    CUfunction packed{ nullptr };
+                    CUfunction yuyv{ nullptr };
+                    CUfunction nv12{ nullptr };
+                };
+
+                // Kernels of the current device, loaded on first use. Modules are kept until the process exits, their
+                // context may be gone when static objects are destroyed.
+                const Kernels* load()
+                {
+                    int device = 0;
+                    if (cudaGetDevice(&device) != cudaSuccess)
+                        return nullptr;
+
+                    std::lock_guard<std::mutex> lock(m_mutex);
+                    auto found = m_kernels.find(device);
+                    if (found != m_kernels.end())
+                        return found->second.packed ? &found->second : nullptr;
+
+                    // A failed load is not retried, every frame would log it again
+                    Kernels& kernels = m_kernels[device];
+                    if (!m_launchKernel && !loadDriverFunctions())
+                        return nullptr;
+
+                    CUmodule module = nullptr;
+                    CUresult result = m_moduleLoadData(&module, sl::kPixelFormatKernelsPtx);
+                    Kernels loaded;
+                    if (result == CUDA_SUCCESS)
+                        result = m_moduleGetFunction(&loaded.packed, module, "rgbaToPacked");
+                    if (result == CUDA_SUCCESS)
+                        result = m_moduleGetFunction(&loaded.yuyv, module, "rgbaToYuyv");
+                    if (result == CUDA_SUCCESS)
+                        result = m_moduleGetFunction(&loaded.nv12, module, "rgbaToNv12");
+                    if (result != CUDA_SUCCESS) {
+                        CARB_LOG_ERROR("[ZED] Error %d loading the pixel conversion kernels on device %d", static_cast<int>(result), device);
+                        return nullptr;
+                    }
+                    kernels = loaded;
+                    return &kernels;
+                }
+
+                bool loadDriverFunctions()
+                {
+                    void* module_load_data = nullptr;
+                    void* module_get_function = nullptr;
+                    void* launch_kernel = nullptr;
+                    if (cudaGetDriverEntryPoint("cuModuleLoadData", &module_load_data, cudaEnableDefault) != cudaSuccess ||
+                        cudaGetDriverEntryPoint("cuModuleGetFunction", &module_get_function, cudaEnableDefault) != cudaSuccess ||
+                        cudaGetDriverEntryPoint("cuLaunchKernel", &launch_kernel, cudaEnableDefault) != cudaSuccess ||
+                        !module_load_data || !module_get_function || !launch_kernel) {
+                        cudaGetLastError();
+                        CARB_LOG_ERROR("[ZED] CUDA driver functions of the pixel conversion kernels not found");
+                        return false;
+                    }
+                    m_moduleLoadData = reinterpret_cast<ModuleLoadDataFn>(module_load_data);
+                    m_moduleGetFunction = reinterpret_cast<ModuleGetFunctionFn>(module_get_function);
+                    m_launchKernel = reinterpret_cast<LaunchKernelFn>(launch_kernel);
+                    return true;
+                }
+
+                std::mutex m_mutex;
+                std::map<int, Kernels> m_kernels;
+                ModuleLoadDataFn m_moduleLoadData{ nullptr };
+                ModuleGetFunctionFn m_moduleGetFunction{ nullptr };
+                LaunchKernelFn m_launchKernel{ nullptr };
+            };
+
+        } // camera
+    } // sensor
+} // sl
@@ -16,6 +16,9 @@
 #include <omni/graph/core/ogn/Database.h>
 #include <omni/graph/core/ogn/Registration.h>
 
+#include "pinned_buffer_pool.hpp"
+#include "streamer_session_pool.hpp"
+
 // Standard plugin definitions required by Carbonite.
 const struct carb::PluginImplDesc pluginImplDesc = { "sl.sensor.camera.plugin",
                                                      "", "Stereolabs",
@@ -53,6 +56,12 @@ public:
         // This macro walks the list of registered node type definitions and deregisters all of them. This is required
         // for hot reload to work.
         RELEASE_OGN_NODES()
+
+        // Close the streamers parked by stopped nodes, with the last references to the ZED SDK library
+        sl::StreamerSessionPool::instance().flush();
+
+        // Free the pinned staging buffers kept alive across node instances
+        sl::PinnedBufferPool::instance().trim();
     }
 
 private:
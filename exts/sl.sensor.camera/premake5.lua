@@ -53,3 +53,32 @@ project_ext_plugin(ext, ogn.plugin_project)
     add_ogn_dependencies(ogn)
 
     cppdialect "C++17"
+
+-- --------------------------------------------------------------------------------------------------------------
+-- Stand-in for the ZED SDK streaming library, used instead of it when SL_ZED_LIBRARY points to it.
+-- It lets the streaming path run and be benchmarked without a ZED SDK or a GPU.
+project "sl_zed_stub"
+    kind "SharedLib"
+    language "C++"
+    cppdialect "C++17"
+    targetdir (ext.target_dir.."/bin")
+    files { "stub/*.cpp" }
+    includedirs { "include/" }
+
+    filter "system:linux"
+        links { "pthread" }
+    filter {}
+
+-- --------------------------------------------------------------------------------------------------------------
+-- Streams a recording of the ZED Stream node to the ZED SDK again, without Isaac Sim.
+project "zed_replay"
+    kind "ConsoleApp"
+    language "C++"
+    cppdialect "C++17"
+    targetdir (ext.target_dir.."/bin")
+    files { "tools/*.cpp" }
+    includedirs { "include/" }
+
+    filter "system:linux"
+        links { "dl" }
+    filter {}
@@ -1,19 +1,370 @@
 # SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: MIT
 
+import configparser
+import math
+import os
+
 import carb
+import numpy as np
 import omni.graph.core as og
 import omni.replicator.core as rep
 from omni.replicator.core.scripts.utils import viewport_manager
 from isaacsim.core.utils.prims import is_prim_path_valid, get_prim_at_path
+import omni.kit.app
+import omni.timeline
 import omni.usd
 from omni.syntheticdata import SyntheticData, SyntheticDataStage
+from pxr import Sdf, Usd
 
+from .render_decimation import RenderDecimator
 from .utils import get_camera_model, is_stereo_camera, is_4mm_camera, get_resolution, get_focal_length, get_pixel_size
 
 # Shared across all streamer classes to ensure port uniqueness
 used_ports = set()
 
+class ZEDTiledRenderProduct:
+    """
+    Render product shared by several ZED cameras of the same resolution, with one tile per eye.
+
+    A single rgb annotator reads every camera, and the ZED node of each camera reads its tiles in place.
+    It is destroyed with the last ZEDAnnotator using it.
+    """
+
+    def __init__(self, camera_paths, resolution, device = "cuda", name = None):
+        """
+        camera_paths are the cameras of every eye, numbered in this order row by row in the tiled image.
+        Tiles are laid out like the tiled render product: ceil(sqrt(n)) columns, and as many rows as needed.
+        """
+        self.camera_paths = list(camera_paths)
+        self.columns = math.ceil(math.sqrt(len(self.camera_paths)))
+        self._rp = rep.create.render_product_tiled(
+            cameras=self.camera_paths, tile_resolution=resolution, name=name
+        )
+        self.path = self._rp.path
+        self.rgb_annot = rep.AnnotatorRegistry.get_annotator("rgb", device=device)
+        self.rgb_annot.attach(self.path)
+        self._users = 0
+        # Whether each camera decimating its rendering needs the next frame rendered, see ZEDAnnotator render_decimation
+        self._render_requests = {}
+        self._render_updates = True
+
+    def tile_of(self, camera_path: str) -> int:
+        """Tile of a camera in the tiled image, or -1 if it is not rendered in it."""
+        return self.camera_paths.index(camera_path) if camera_path in self.camera_paths else -1
+
+    def acquire(self) -> None:
+        self._users += 1
+
+    def request_render(self, user, enabled) -> None:
+        """
+        Renders the tiled image on the next frames if any camera decimating its rendering needs them, and on every frame
+        when none does. enabled None removes the request of user.
+        """
+        if enabled is None:
+            self._render_requests.pop(user, None)
+        else:
+            self._render_requests[user] = enabled
+        render_updates = any(self._render_requests.values()) or not self._render_requests
+        if self._rp is not None and render_updates != self._render_updates:
+            self._rp.hydra_texture.set_updates_enabled(render_updates)
+            self._render_updates = render_updates
+
+    def release(self) -> None:
+        self._users -= 1
+        if self._users <= 0 and self._rp is not None:
+            self.rgb_annot.detach(self.path)
+            self._rp.destroy()
+            self._rp = None
+            carb.log_info(f"[ZED] Tiled render product {self.path} destroyed.")
+
+class ZEDTimeNodes:
+    """
+    Sync gate and time nodes of the synthetic data graph, shared by the ZED cameras streamed from it.
+
+    The sync gate passes once the annotators of every camera connected to it delivered the frame, and triggers the IMU
+    and ZED nodes of each camera, which all read the simulation and system time nodes. The nodes are created with the
+    first camera using them and removed with the last one.
+    """
+
+    NODE_TYPES = {
+        "sync": "omni.graph.action.RationalTimeSyncGate",
+        "sim_time": "isaacsim.core.nodes.IsaacReadSimulationTime",
+        "sys_time": "isaacsim.core.nodes.IsaacReadSystemTime",
+    }
+
+    # By graph path and node name suffix
+    _instances = {}
+
+    def __init__(self, graph_path: str, suffix: str):
+        self.graph_path = graph_path
+        self.names = {role: f"{role}_{suffix}" for role in ZEDTimeNodes.NODE_TYPES}
+        self.paths = {role: f"{graph_path}/{name}" for role, name in self.names.items()}
+        self._users = 0
+        # Annotator exec outputs connected to the sync gate, with the number of cameras they trigger
+        self._exec_sources = {}
+
+    @staticmethod
+    def get(graph_path: str, suffix: str) -> "ZEDTimeNodes":
+        key = (graph_path, suffix)
+        if key not in ZEDTimeNodes._instances:
+            ZEDTimeNodes._instances[key] = ZEDTimeNodes(graph_path, suffix)
+        return ZEDTimeNodes._instances[key]
+
+    def attr(self, role: str, name: str) -> str:
+        return f"{self.paths[role]}.{name}"
+
+    def validate(self, graph) -> None:
+        """Forgets the cameras using the nodes if they were removed with the graph, e.g. when a new stage is opened."""
+        if self._users > 0 and not graph.get_node(self.paths["sync"]).is_valid():
+            self._users = 0
+            self._exec_sources = {}
+
+    def acquire(self, graph, exec_sources, edit: dict, stale_paths: list) -> None:
+        """
+        Adds to edit the creation of the nodes if no camera uses them yet, and the connection of the exec outputs of
+        the annotators of a camera to the sync gate.
+        """
+        keys = og.Controller.Keys
+        if self._users == 0:
+            stage = omni.usd.get_context().get_stage()
+            for role, node_type in ZEDTimeNodes.NODE_TYPES.items():
+                if graph.get_node(self.paths[role]).is_valid():
+                    edit.setdefault(keys.DELETE_NODES, []).append(self.paths[role])
+                elif stage.GetPrimAtPath(self.paths[role]):
+                    # Remove stale prim if it exists from a previous session
+                    stale_paths.append(self.paths[role])
+                edit.setdefault(keys.CREATE_NODES, []).append((self.names[role], node_type))
+
+            dispatcher_path = f"{self.graph_path}/PostProcessDispatcher"
+            edit.setdefault(keys.CONNECT, []).extend([
+                # connect dispatch to sync node
+                (f"{dispatcher_path}.outputs:referenceTimeDenominator", self.attr("sync", "inputs:rationalTimeDenominator")),
+                (f"{dispatcher_path}.outputs:referenceTimeNumerator", self.attr("sync", "inputs:rationalTimeNumerator")),
+                (self.attr("sync", "outputs:rationalTimeDenominator"), self.attr("sim_time", "inputs:referenceTimeDenominator")),
+                (self.attr("sync", "outputs:rationalTimeNumerator"), self.attr("sim_time", "inputs:referenceTimeNumerator")),
+            ])
+            edit.setdefault(keys.SET_VALUES, []).append((f"{self.graph_path}/DispatchSync.inputs:enabled", True))
+        self._users += 1
+
+        for source in exec_sources:
+            if self._exec_sources.get(source, 0) == 0:
+                edit.setdefault(keys.CONNECT, []).append((source, self.attr("sync", "inputs:execIn")))
+            self._exec_sources[source] = self._exec_sources.get(source, 0) + 1
+
+    def release(self, graph, exec_sources) -> None:
+        """Disconnects the annotators of a camera from the sync gate, and removes the nodes with the last camera."""
+        keys = og.Controller.Keys
+        if self._users == 0:
+            return
+        self._users -= 1
+        disconnect = []
+        for source in exec_sources:
+            count = self._exec_sources.get(source, 0) - 1
+            if count > 0:
+                self._exec_sources[source] = count
+            else:
+                self._exec_sources.pop(source, None)
+                disconnect.append((source, self.attr("sync", "inputs:execIn")))
+
+        if not graph.is_valid() or not graph.get_node(self.paths["sync"]).is_valid():
+            self._users = 0
+            self._exec_sources = {}
+        elif self._users == 0:
+            nodes = [path for path in self.paths.values() if graph.get_node(path).is_valid()]
+            og.Controller.edit(graph, {keys.DELETE_NODES: nodes})
+            carb.log_info(f"[ZED] Time nodes {', '.join(self.names.values())} removed with their last camera.")
+        elif disconnect:
+            og.Controller.edit(graph, {keys.DISCONNECT: disconnect})
+
+class ZEDRenderDecimation:
+    """
+    Render decimation of the ZED cameras triggered by the same sync gate, see ZEDAnnotator render_decimation.
+
+    The sync gate passes once every camera connected to it delivered the frame, so its cameras must render the same
+    frames: they follow one RenderDecimator, reset with the first camera and joined by the cameras starting later,
+    instead of a schedule each starting on the frame its camera starts. The decision is taken once per frame, before
+    the update, and applied to every camera.
+    """
+
+    # By time nodes suffix, see ZEDAnnotator._time_nodes_suffix()
+    _instances = {}
+
+    def __init__(self, suffix: str, fps: float):
+        self.suffix = suffix
+        self.decimator = RenderDecimator(fps)
+        self.annotators = []
+        self._sub = None
+
+    @staticmethod
+    def get(suffix: str, fps: float) -> "ZEDRenderDecimation":
+        if suffix not in ZEDRenderDecimation._instances:
+            ZEDRenderDecimation._instances[suffix] = ZEDRenderDecimation(suffix, fps)
+        return ZEDRenderDecimation._instances[suffix]
+
+    def add(self, annotator) -> None:
+        """Renders the camera of annotator on the schedule of the others, which starts over with the first camera."""
+        if annotator in self.annotators:
+            return
+        if not self.annotators:
+            self.decimator.reset()
+            # Before the update, so that the decision applies to the frame rendered by this update
+            self._sub = omni.kit.app.get_app().get_pre_update_event_stream().create_subscription_to_pop(
+                self._on_update, name=f"zed_render_decimation_{self.suffix}"
+            )
+        self.annotators.append(annotator)
+
+    def remove(self, annotator) -> None:
+        """Stops deciding for the camera of annotator, the schedule being dropped with the last camera."""
+        if annotator not in self.annotators:
+            return
+        self.annotators.remove(annotator)
+        if not self.annotators:
+            if self._sub is not None:
+                self._sub.unsubscribe()
+                self._sub = None
+            if ZEDRenderDecimation._instances.get(self.suffix) is self:
+                del ZEDRenderDecimation._instances[self.suffix]
+
+    def update(self, playing: bool, simulation_time: float) -> bool:
+        """Decides whether the cameras render the next frame, given the time of the previous one, and applies it."""
+        # Rendered on every frame while the timeline is stopped or paused, like without decimation
+        render_updates = self.decimator.should_render(simulation_time) if playing else True
+        for annotator in self.annotators:
+            annotator._apply_render_updates(render_updates)
+        return render_updates
+
+    def _on_update(self, event) -> None:
+        timeline = omni.timeline.get_timeline_interface()
+        self.update(timeline.is_playing(), timeline.get_current_time())
+
+class ZEDStreamBatch:
+    """
+    ZED Multi Stream node streaming the cameras of a tiled render product, instead of one ZED Stream node per camera.
+
+    The node reads the tile of every camera in the shared image, stages them all on one CUDA stream, waits once for the
+    copies and submits the frames in parallel. The IMU of each camera is sent by its ZED IMU Stream node. The node is
+    rebuilt for the remaining cameras when one of them stops streaming, and removed with the last one.
+    """
+
+    def __init__(self, annotators):
+        self.annotators = list(annotators)
+        first = self.annotators[0]
+        self.graph = first.graph
+        self.name = f"zed_multi_{first.port}"
+        self.path = f"{first._graph_path}/{self.name}"
+        self.node = None
+        for annotator in self.annotators:
+            annotator._batch = self
+
+    @staticmethod
+    def can_batch(annotator) -> bool:
+        """Whether the camera only uses settings of the ZED Stream node that the ZED Multi Stream node supports."""
+        return (annotator.tiled_render is not None and annotator.batch_streaming and "Left" in annotator.annotators
+                and annotator.share_time_nodes and not annotator.async_streaming and annotator.pipeline_depth <= 1
+                and not annotator.session_pooling)
+
+    @staticmethod
+    def group(annotators) -> list:
+        """Batches the annotators of each tiled render product streamed with the same settings, two cameras at least."""
+        groups = {}
+        for annotator in annotators:
+            if ZEDStreamBatch.can_batch(annotator):
+                key = (id(annotator.tiled_render), annotator._time_nodes_suffix(), annotator.resolution, annotator.fps,
+                       annotator.transport_layer_mode, annotator.bitrate, annotator.chunk_size, annotator.device,
+                       annotator.pack_pixels, annotator.yuv_layout)
+                groups.setdefault(key, []).append(annotator)
+        return [ZEDStreamBatch(members) for members in groups.values() if len(members) > 1]
+
+    def graph_edit(self, edit: dict, stale_paths: list) -> None:
+        """Adds to edit the node streaming the cameras of the batch, replacing the previous one."""
+        keys = og.Controller.Keys
+        if self.graph.get_node(self.path).is_valid():
+            edit.setdefault(keys.DELETE_NODES, []).append(self.path)
+        elif omni.usd.get_context().get_stage().GetPrimAtPath(self.path):
+            stale_paths.append(self.path)
+        edit.setdefault(keys.CREATE_NODES, []).append((self.name, "sl.sensor.camera.OgnZEDSimMultiCameraNode"))
+
+        first = self.annotators[0]
+        time_nodes = first._time_nodes
+        ptr_node = first.tiled_render.rgb_annot.get_node()
+        edit.setdefault(keys.CONNECT, []).extend([
+            (time_nodes.attr("sim_time", "outputs:simulationTime"), f"{self.path}.inputs:simulationTime"),
+            (time_nodes.attr("sync", "outputs:execOut"), f"{self.path}.inputs:execIn"),
+            (ptr_node.get_attribute("outputs:dataPtr"), f"{self.path}.inputs:dataPtr"),
+            (ptr_node.get_attribute("outputs:bufferSize"), f"{self.path}.inputs:bufferSize"),
+        ])
+
+        inputs = {
+            "stream": True,
+            "cameraModels": ["VIRTUAL_ZED_X" if annotator.custom_stereo else annotator.camera_model for annotator in self.annotators],
+            "serialNumbers": [annotator.serial_number if annotator.serial_number else "-1" for annotator in self.annotators],
+            "ports": [annotator.port for annotator in self.annotators],
+            "tileColumns": first.tiled_render.columns,
+            "tilesLeft": [annotator.tiles[0] for annotator in self.annotators],
+            "tilesRight": [annotator.tiles[1] for annotator in self.annotators],
+            "width": first.resolution[0],
+            "height": first.resolution[1],
+            "fps": first.fps,
+            "bitrate": first.bitrate,
+            "chunkSize": first.chunk_size,
+            "transportLayerMode": first.transport_layer_mode,
+            "inputLocation": ZEDAnnotator.INPUT_LOCATIONS[first.device],
+            "packPixels": first.pack_pixels,
+            "yuvLayout": first.yuv_layout,
+            "highRateImu": True,
+        }
+        edit.setdefault(keys.SET_VALUES, []).extend((f"{self.path}.inputs:{name}", value) for name, value in inputs.items())
+
+    def get_stream_stats(self, annotator) -> dict:
+        """Streaming performance of a camera of the batch, from the array outputs of the node."""
+        if self.node is None or not self.node.is_valid():
+            return {}
+        index = self.annotators.index(annotator)
+        names = {"streamFps": "streamFps", "streamStatus": "streamStatuses", "framesStreamed": "framesStreamed",
+                 "framesGated": "framesGated", "framesDropped": "framesDropped"}
+        stats = {}
+        for name, output in names.items():
+            values = self.node.get_attribute(f"outputs:{output}").get()
+            if values is not None and index < len(values):
+                stats[name] = values[index]
+        return stats
+
+    def release(self, annotator) -> None:
+        """Removes a camera from the batch, the node streaming the others again, and removes the node with the last one."""
+        if annotator not in self.annotators:
+            return
+        self.annotators.remove(annotator)
+        annotator._batch = None
+
+        time_nodes = annotator._time_nodes
+        if not self.graph.is_valid() or time_nodes is None or not self.graph.get_node(time_nodes.paths["sync"]).is_valid():
+            # Removed with the graph, e.g. when a new stage is opened
+            for remaining in self.annotators:
+                remaining._batch = None
+            self.annotators = []
+            self.node = None
+            return
+
+        if not self.annotators:
+            if self.graph.get_node(self.path).is_valid():
+                og.Controller.edit(self.graph, {og.Controller.Keys.DELETE_NODES: [self.path]})
+            self.node = None
+            carb.log_info(f"[ZED] Multi stream node {self.name} removed with its last camera.")
+            return
+
+        edit = {}
+        stale_paths = []
+        self.graph_edit(edit, stale_paths)
+        if stale_paths:
+            stage = omni.usd.get_context().get_stage()
+            with Sdf.ChangeBlock():
+                for path in stale_paths:
+                    stage.RemovePrim(path)
+        og.Controller.edit(self.graph, edit)
+        self.node = og.Controller.node(self.path)
+        carb.log_info(f"[ZED] Multi stream node {self.name} rebuilt for {len(self.annotators)} cameras.")
+
 class ZEDAnnotator:
     """
     Captures camera data and streams it to the ZED SDK.
@@ -23,6 +374,12 @@ class ZEDAnnotator:
     - OGN node mode (C++ implementation)
     """
 
+    # ZED node input location for each annotator device
+    INPUT_LOCATIONS = {"cuda": "DEVICE", "cpu": "HOST"}
+
+    # Resolution names of the ZED SDK calibration files
+    CALIBRATION_RESOLUTIONS = {"HD1200": "FHD1200", "HD1080": "FHD", "SVGA": "SVGA", "QHDPLUS": "QHDPLUS"}
+
     def __init__(
         self,
         camera_prim,
@@ -33,7 +390,27 @@ class ZEDAnnotator:
         bitrate = 10000,
         chunk_size = 4096,
         transport_layer_mode = "BOTH",
-        virtual_serial_number = None
+        virtual_serial_number = None,
+        async_streaming = False,
+        overflow_policy = "LATEST",
+        queue_depth = 4,
+        imu_rate = 0,
+        device = "cuda",
+        pack_pixels = False,
+        yuv_layout = "YUYV",
+        pipeline_depth = 1,
+        side_by_side = False,
+        tiled_render = None,
+        export_dir = None,
+        export_format = "png",
+        export_workers = 4,
+        export_queue_depth = 8,
+        session_pooling = False,
+        session_idle_timeout = 30.0,
+        defer_graph = False,
+        share_time_nodes = True,
+        render_decimation = False,
+        batch_streaming = True
         ):
 
         """
@@ -41,11 +418,58 @@ class ZEDAnnotator:
         camera_prim can be a list of:
           - a single prim (stereo or mono)
           - two prims (custom stereo made of two monos)
+        async_streaming moves the frame copy and encoding to a dedicated streaming thread,
+        overflow_policy ("LATEST", "FIFO" or "BLOCK") and queue_depth define what happens when it falls behind.
+        imu_rate (in Hz) samples the IMU on physics steps and sends it independently from the images, 0 disables it.
+        device ("cuda" or "cpu") is where the annotators write the images, "cpu" streams without any CUDA copy.
+        pack_pixels converts the images on the GPU to the input format of the streamer before they are copied to the host:
+        packed BGR, 3 bytes per pixel instead of 4, or YUV in the yuv_layout ("YUYV" or "NV12") for IPC and mono cameras.
+        pipeline_depth (2 or more) overlaps the copy of each frame with the encoding of the previous one.
+        side_by_side renders both eyes of a stereo camera into one tiled render product, read by a single annotator.
+        tiled_render is a ZEDTiledRenderProduct shared with other cameras and holding the eyes of this one,
+        see create_tiled().
+        export_dir switches to export mode: instead of being streamed, the frames are written to this folder with their
+        simulation time and IMU sample, and the camera calibration, see export_frame(). Images are encoded to
+        export_format ("png" or "jpg") by export_workers processes, at most export_queue_depth frames at a time,
+        further frames being dropped so that the simulation never waits for them. "cpu" device avoids a copy per frame.
+        session_pooling keeps the streamer open for session_idle_timeout seconds once the annotator is destroyed, so that
+        an annotator streaming again with the same settings reuses it instead of initializing the ZED SDK encoder.
+        defer_graph leaves the streaming graph to be built by ZEDAnnotator.build_graphs(), which builds those of a whole
+        fleet of cameras in a single graph edit.
+        share_time_nodes triggers the camera from the sync gate and time nodes shared by every ZED camera of the synthetic
+        data graph, which waits for the annotators of all of them. False gives the camera its own, e.g. to stream it
+        independently from the others.
+        render_decimation renders the camera only on the simulation frames its fps streams instead of on every frame, the
+        render products being idle in between, see RenderDecimator. Cameras sharing time nodes are then triggered by the
+        sync gate of their frame rate, and render the same frames, see ZEDRenderDecimation.
+        batch_streaming streams the cameras of a tiled_render built together, e.g. by create_tiled(), from one ZED Multi
+        Stream node instead of one ZED Stream node each, when they share their streaming settings, see ZEDStreamBatch.
+        Cameras using asynchronous streaming, pipelined copies, session pooling or their own time nodes are never batched.
+        Batched cameras send their IMU at imu_rate, or at their frame rate when it is 0.
         """
 
         # Get stage and synthetic data interface
         self.stage = omni.usd.get_context().get_stage()
 
+        # Read by destroy(), which must also clean up an annotator rejected below
+        self.port = streaming_port
+        self.nodes = []
+        self.zed_ = None
+        self._batch = None
+        self.graph = None
+        self.imu_graph = None
+        self._time_nodes = None
+        self._exec_sources = []
+        self.render_decimation = render_decimation
+        self.render_decimator = None
+        self._render_decimation = None
+        self._render_updates = True
+        self.tiled_render = None
+        self.dataset_writer = None
+        self._export_sub = None
+        self.annotators = {}
+        self.parked = False
+
          # Normalize input
         if len(camera_prim) == 1:
             carb.log_info("Single prim provided, assuming mono or stereo camera based on model.")
@@ -58,27 +482,43 @@ class ZEDAnnotator:
             self.camera_prim_path = []
             self.custom_stereo = False
             self.is_stereo = False
-            self.nodes = []
-            self.zed_ = None
-            self.graph = None
-            self.port = streaming_port
             return
 
         self.camera_prim_path = camera_prim
         self.serial_number = virtual_serial_number
         self.camera_model = camera_model
-        self.port = streaming_port
+        self.resolution_name = resolution
         self.resolution = get_resolution(camera_model, resolution)
         self.fps = ZEDAnnotator.check_frame_rate(fps)
         self.bitrate = bitrate
         self.chunk_size = chunk_size
         self.transport_layer_mode = transport_layer_mode
+        self.async_streaming = async_streaming
+        self.overflow_policy = overflow_policy
+        self.queue_depth = queue_depth
+        self.imu_rate = imu_rate
+        if device not in ZEDAnnotator.INPUT_LOCATIONS:
+            carb.log_warn(f"Invalid annotator device passed: {device}. Defaulting to cuda.")
+            device = "cuda"
+        self.device = device
+        self.pack_pixels = pack_pixels
+        self.yuv_layout = yuv_layout
+        self.pipeline_depth = pipeline_depth
+        self.session_pooling = session_pooling
+        self.session_idle_timeout = session_idle_timeout
+        self.defer_graph = defer_graph
+        self.share_time_nodes = share_time_nodes
+        self.batch_streaming = batch_streaming
 
         # Stereo if model is stereo OR user provides 2 prims
         self.is_stereo = is_stereo_camera(camera_model) or self.custom_stereo
-
-        self.nodes = []
-        self.zed_ = None
+        self.side_by_side = side_by_side and self.is_stereo
+        self.tiled_render = tiled_render
+        self.tiles = (0, -1)
+        self.export_dir = export_dir
+        self.export_format = export_format
+        self.export_workers = export_workers
+        self.export_queue_depth = export_queue_depth
 
         self.build_annotators()
         print(
@@ -86,26 +526,74 @@ class ZEDAnnotator:
             f"{'custom stereo' if self.custom_stereo else ('stereo' if self.is_stereo else 'mono')} camera."
         )
 
+    def init_cameras(self, camera_prim_paths, resolution, is_4mm) -> list:
+        """
+        Sets the optics of the camera model on every camera prim, in a single USD change block so that the stage is
+        notified once. Returns whether each camera prim is valid.
+        """
+        pixel_size = get_pixel_size(self.camera_model) * 1e-3
+        f = get_focal_length(self.camera_model, resolution, is_4mm)
+        optics = {
+            "focalLength": f * pixel_size,
+            "horizontalAperture": pixel_size * resolution[0],
+            "verticalAperture": pixel_size * resolution[1],
+            "fStop": 0, # disable focusing
+        }
+
+        cam_prims = []
+        for camera_prim_path in camera_prim_paths:
+            if is_prim_path_valid(camera_prim_path):
+                cam_prims.append(get_prim_at_path(prim_path=camera_prim_path))
+            else:
+                carb.log_error(f"Camera prim path {camera_prim_path} is not valid.")
+                cam_prims.append(None)
+
+        with Sdf.ChangeBlock():
+            for cam_prim in cam_prims:
+                if cam_prim is not None:
+                    for name, value in optics.items():
+                        cam_prim.GetAttribute(name).Set(value)
+        return [cam_prim is not None for cam_prim in cam_prims]
+
     def init_camera(self, camera_prim_path : str, resolution, is_4mm):
-        result = False
-        if is_prim_path_valid(camera_prim_path) == True:
-                cam_prim = get_prim_at_path(prim_path=camera_prim_path)
-                pixel_size = get_pixel_size(self.camera_model) * 1e-3
-                f_stop = 0 # disable focusing
-                f = get_focal_length(self.camera_model, resolution, is_4mm)
-
-                horizontal_aperture = pixel_size * resolution[0]
-                vertical_aperture = pixel_size * resolution[1]
-                focal_length = f * pixel_size
-
-                cam_prim.GetAttribute("focalLength").Set(focal_length)
-                cam_prim.GetAttribute("horizontalAperture").Set(horizontal_aperture)
-                cam_prim.GetAttribute("verticalAperture").Set(vertical_aperture)
-                cam_prim.GetAttribute("fStop").Set(f_stop)
-                result = True
-        else:
-            carb.log_error(f"Camera prim path {camera_prim_path} is not valid.")
-        return result
+        return self.init_cameras([camera_prim_path], resolution, is_4mm)[0]
+
+    @staticmethod
+    def create_tiled(camera_prims, camera_model = "ZED_X", streaming_port = 30000, resolution = "HD1200", device = "cuda", **kwargs) -> list:
+        """
+        Creates the annotators of several ZED cameras of the same model and resolution, all rendered into one shared
+        tiled render product instead of one render product per eye.
+        camera_prims holds the camera_prim argument of each camera, which streams on the port streaming_port + 2 * i.
+        Other arguments are those of ZEDAnnotator. The streaming graphs of all the cameras are built in a single edit.
+        """
+        eye_paths = [path for camera_prim in camera_prims for path in ZEDAnnotator.get_eye_paths(camera_prim, camera_model)]
+        tiled_render = ZEDTiledRenderProduct(
+            eye_paths, get_resolution(camera_model, resolution), device, f"zed_tiled_rp_{streaming_port}"
+        )
+        annotators = [
+            ZEDAnnotator(camera_prim, camera_model, streaming_port + 2 * i, resolution, device=device, tiled_render=tiled_render,
+                         defer_graph=True, **kwargs)
+            for i, camera_prim in enumerate(camera_prims)
+        ]
+        ZEDAnnotator.build_graphs(annotators)
+        carb.log_info(f"[ZED] {len(annotators)} cameras rendered in {len(eye_paths)} tiles of {tiled_render.path}")
+        return annotators
+
+    @staticmethod
+    def get_eye_paths(camera_prim, camera_model: str) -> list:
+        """
+        Paths of the camera of each eye of a ZED camera, left first, or of its single camera for mono cameras.
+        """
+        base_camera_model = get_camera_model(camera_model)
+        if len(camera_prim) == 2:
+            cam_path = "/base_link/" + base_camera_model + "/Camera"
+            return [camera_prim[0].pathString + cam_path, camera_prim[1].pathString + cam_path]
+        if is_stereo_camera(camera_model):
+            return [
+                camera_prim[0].pathString + "/base_link/" + base_camera_model + "/CameraLeft",
+                camera_prim[0].pathString + "/base_link/" + base_camera_model + "/CameraRight",
+            ]
+        return [camera_prim[0].pathString + "/base_link/" + base_camera_model + "/Camera"]
 
     @staticmethod
     def check_frame_rate(camera_frame_rate: int):
@@ -115,20 +603,42 @@ class ZEDAnnotator:
         return camera_frame_rate
 
     def build_annotators(self) -> None:
-        # Set device based on mode (CUDA for OGN nodes)
-        device = "cuda"
+        device = self.device
         cams = []
         self.annotators = {}
 
         is_4mm = is_4mm_camera(self.camera_model)
         base_camera_model = get_camera_model(self.camera_model)
-         # Case 1: user gave 2 prims (custom stereo)
-        if self.custom_stereo:
+        eye_paths = ZEDAnnotator.get_eye_paths(self.camera_prim_path, self.camera_model)
+        valid_eyes = dict(zip(eye_paths, self.init_cameras(eye_paths, self.resolution, is_4mm)))
+        # Case 1: tiles of a render product shared with other cameras, or both eyes in one side-by-side image
+        if self.tiled_render is not None or self.side_by_side:
+            if all(valid_eyes.values()):
+                if self.tiled_render is not None:
+                    self.tiled_render.acquire()
+                    self.tiles = (self.tiled_render.tile_of(eye_paths[0]), self.tiled_render.tile_of(eye_paths[1]) if self.is_stereo else -1)
+                    self.annotators["Left"] = self.tiled_render.rgb_annot
+                    cams.append(["Left", self.tiled_render.path])
+                else:
+                    # Two tiles on a single row: the left eye on the left half, as in the native ZED layout
+                    name_stereo = f"{self.camera_prim_path[0].pathString.split('/')[-1]}_stereo_rp"
+                    self._stereo_rp = rep.create.render_product_tiled(
+                        cameras=eye_paths, tile_resolution=self.resolution, name=name_stereo
+                    )
+                    self.stereo_rp = self._stereo_rp.path
+                    self.stereo_rgb_annot = rep.AnnotatorRegistry.get_annotator("rgb", device=device)
+                    self.stereo_rgb_annot.attach(self.stereo_rp)
+                    self.annotators["Left"] = self.stereo_rgb_annot
+                    cams.append(["Left", name_stereo])
+            else:
+                carb.log_warn(f"[{self.camera_prim_path[0].pathString}] Invalid or non existing zed camera, try to re-import your camera prim.")
+        # Case 2: user gave 2 prims (custom stereo)
+        elif self.custom_stereo:
             cam_path = "/base_link/" + base_camera_model + "/Camera"
             left_full_path = self.camera_prim_path[0].pathString + cam_path
             right_full_path = self.camera_prim_path[1].pathString + cam_path
 
-            if self.init_camera(left_full_path, self.resolution, is_4mm):
+            if valid_eyes.get(left_full_path):
                 name_left = f"{self.camera_prim_path[0].pathString.split('/')[-1]}_left_rp"
                 self._left_rp = viewport_manager.get_render_product(left_full_path, self.resolution, False, name_left)
                 self.left_rp = self._left_rp.hydra_texture.get_render_product_path()
@@ -137,7 +647,7 @@ class ZEDAnnotator:
                 self.annotators["Left"] = self.left_rgb_annot
                 cams.append(["Left", name_left])
 
-            if self.init_camera(right_full_path, self.resolution, is_4mm):
+            if valid_eyes.get(right_full_path):
                 name_right = f"{self.camera_prim_path[1].pathString.split('/')[-1]}_right_rp"
                 self._right_rp = viewport_manager.get_render_product(right_full_path, self.resolution, False, name_right)
                 self.right_rp = self._right_rp.hydra_texture.get_render_product_path()
@@ -145,7 +655,7 @@ class ZEDAnnotator:
                 self.right_rgb_annot.attach(self.right_rp)
                 self.annotators["Right"] = self.right_rgb_annot
                 cams.append(["Right", name_right])
-        # Case 2: one prim (mono or stereo)
+        # Case 3: one prim (mono or stereo)
         else:
             if self.is_stereo is True:
                 left_path = "/base_link/" + base_camera_model + "/CameraLeft"
@@ -154,7 +664,7 @@ class ZEDAnnotator:
 
             left_full_path = self.camera_prim_path[0].pathString + left_path
             # Init left camra (or mono camera)
-            if self.init_camera(left_full_path, self.resolution, is_4mm):
+            if valid_eyes.get(left_full_path):
                 name_left = f"{self.camera_prim_path[0].pathString.split('/')[-1]}_left_rp"
                 self._left_rp = viewport_manager.get_render_product(left_full_path, self.resolution, False, name_left)
                 self.left_rp = self._left_rp.hydra_texture.get_render_product_path()
@@ -169,7 +679,7 @@ class ZEDAnnotator:
             if self.is_stereo:
                 right_path = "/base_link/" + base_camera_model + "/CameraRight"
                 right_full_path = self.camera_prim_path[0].pathString + right_path
-                if self.init_camera(right_full_path, self.resolution, is_4mm):
+                if valid_eyes.get(right_full_path):
                     name_right = f"{self.camera_prim_path[0].pathString.split('/')[-1]}_right_rp"
                     self._right_rp = viewport_manager.get_render_product(right_full_path, self.resolution, False, name_right)
                     self.right_rp = self._right_rp.hydra_texture.get_render_product_path()
@@ -180,9 +690,14 @@ class ZEDAnnotator:
                 else:
                     carb.log_warn(f"[{self.camera_prim_path[0].pathString}] Invalid or non existing zed camera, try to re-import your camera prim.")
 
-
-        self.init_graph()
-        self.build_graph(cams)
+        # Kept to rebuild the streaming graph on resume()
+        self._cams = cams
+        if self.render_decimation and self.annotators:
+            self._start_render_decimation()
+        if self.export_dir is not None:
+            self.start_export()
+        elif not self.defer_graph:
+            self.build_graph(cams)
 
     def init_graph(self) -> None:
 
@@ -195,114 +710,439 @@ class ZEDAnnotator:
             SyntheticData.Get().activate_node_template("PostProcessDispatch")
             self.graph = og.Controller.graph(self._graph_path)
 
+    def graph_edit(self, cams, edit: dict, stale_paths: list) -> None:
+        """
+        Adds to edit, for og.Controller.edit, the nodes streaming this camera and their connections to the time nodes,
+        and to stale_paths the prims to remove first. Nodes are named after the port, those left by a previous
+        annotator on the port are replaced. A batched camera only connects its annotators to the time nodes, it is
+        streamed by the node of its ZEDStreamBatch.
+        """
+        keys = og.Controller.Keys
+        imu_path = "/base_link/" + get_camera_model(self.camera_model) + "/Imu_Sensor"
+        self._imu_prim_path = self.camera_prim_path[0].pathString + imu_path
 
-        frame_gate_node_path = f"{self._graph_path}/DispatchSync"
-        frame_gate_node = og.Controller.node(frame_gate_node_path)
-        frame_gate_node.get_attribute("inputs:enabled").set(True)
+        # get the annotator nodes, connected to the sync node and to the zed node
+        time_nodes = self._time_nodes
+        ptr_nodes = {cam[0]: self.annotators[cam[0]].get_node() for cam in cams if self.annotators.get(cam[0])}
+        self._exec_sources = [ptr_node.get_attribute("outputs:exec").get_path() for ptr_node in ptr_nodes.values()]
+        time_nodes.acquire(self.graph, self._exec_sources, edit, stale_paths)
+        if self._batch is not None:
+            self._node_paths = {}
+            return
 
-        # create/assign sync and time nodes (unique per camera using port)
-        _physics_nodes = {
-            f"sync_{self.port}": {"node_type": "omni.graph.action.RationalTimeSyncGate", "node": None},
-            f"sim_time_{self.port}": {"node_type": "isaacsim.core.nodes.IsaacReadSimulationTime", "node": None},
-            f"sys_time_{self.port}": {"node_type": "isaacsim.core.nodes.IsaacReadSystemTime", "node": None},
-            f"imu_sensor_{self.port}": {"node_type": "isaacsim.sensors.physics.IsaacReadIMU", "node": None}
+        node_types = {
+            "imu": ("imu_sensor", "isaacsim.sensors.physics.IsaacReadIMU"),
+            "zed": ("zed", "sl.sensor.camera.OgnZEDSimCameraNode"),
         }
-
         stage = omni.usd.get_context().get_stage()
-        for node_name, _ in _physics_nodes.items():
-            node_path = self._graph_path + f"/{node_name}"
-            node = self.graph.get_node(node_path)
-            if not node.is_valid():
+        paths = {}
+        for role, (name, node_type) in node_types.items():
+            node_name = f"{name}_{self.port}"
+            paths[role] = f"{self._graph_path}/{node_name}"
+            if self.graph.get_node(paths[role]).is_valid():
+                edit.setdefault(keys.DELETE_NODES, []).append(paths[role])
+            elif stage.GetPrimAtPath(paths[role]):
                 # Remove stale prim if it exists from a previous session
-                if stage.GetPrimAtPath(node_path):
-                    stage.RemovePrim(node_path)
-                node = self.graph.create_node(node_path, _["node_type"], True)
-            _["node"] = node
+                stale_paths.append(paths[role])
+            edit.setdefault(keys.CREATE_NODES, []).append((node_name, node_type))
+
+        def attr(role: str, name: str) -> str:
+            return f"{paths[role]}.{name}"
+
+        connect = [
+            (time_nodes.attr("sim_time", "outputs:simulationTime"), attr("zed", "inputs:simulationTime")),
+            (time_nodes.attr("sys_time", "outputs:systemTime"), attr("zed", "inputs:systemTime")),
+            # connect sync node to zed node to trigger the stream
+            (time_nodes.attr("sync", "outputs:execOut"), attr("imu", "inputs:execIn")),
+            (attr("imu", "outputs:orientation"), attr("zed", "inputs:orientation")),
+            (attr("imu", "outputs:linAcc"), attr("zed", "inputs:linearAcceleration")),
+            (attr("imu", "outputs:execOut"), attr("zed", "inputs:execIn")),
+        ]
+        for eye, ptr_node in ptr_nodes.items():
+            for p in ["bufferSize", "dataPtr"]:
+                connect.append((ptr_node.get_attribute(f"outputs:{p}"), attr("zed", f"inputs:{p}{eye}")))
+        edit.setdefault(keys.CONNECT, []).extend(connect)
 
-        # assign to vars for clarity
-        self.sync_node = _physics_nodes[f"sync_{self.port}"]["node"]
-        self.sim_time = _physics_nodes[f"sim_time_{self.port}"]["node"]
-        self.sys_time = _physics_nodes[f"sys_time_{self.port}"]["node"]
-        self.imu = _physics_nodes[f"imu_sensor_{self.port}"]["node"]
+        zed_inputs = {
+            "port": self.port,
+            "width": self.resolution[0],
+            "height": self.resolution[1],
+            "fps": self.fps,
+            "stream": True,
+            "cameraModel": "VIRTUAL_ZED_X" if self.custom_stereo else self.camera_model,
+            "serialNumber": self.serial_number if self.serial_number else "-1",
+            "bitrate": self.bitrate,
+            "chunkSize": self.chunk_size,
+            "transportLayerMode": self.transport_layer_mode,
+            "asyncStreaming": self.async_streaming,
+            "overflowPolicy": self.overflow_policy,
+            "queueDepth": self.queue_depth,
+            "inputLocation": ZEDAnnotator.INPUT_LOCATIONS[self.device],
+            "packPixels": self.pack_pixels,
+            "yuvLayout": self.yuv_layout,
+            "pipelineDepth": self.pipeline_depth,
+            "sideBySide": self.side_by_side,
+            "tileColumns": self.tiled_render.columns if self.tiled_render is not None else 0,
+            "tileLeft": self.tiles[0],
+            "tileRight": self.tiles[1],
+            "highRateImu": self.imu_rate > 0,
+            "sessionPooling": self.session_pooling,
+            "sessionIdleTimeout": self.session_idle_timeout,
+        }
+        edit.setdefault(keys.SET_VALUES, []).append((attr("imu", "inputs:imuPrim"), self._imu_prim_path))
+        edit[keys.SET_VALUES].extend((attr("zed", f"inputs:{name}"), value) for name, value in zed_inputs.items())
+
+        self._node_paths = paths
 
     def build_graph(self, cams) -> None:
         """
         Build the OGN graph for streaming camera data.
 
-        This method creates the OGN nodes needed for streaming of camera data
+        This method creates the OGN nodes needed for streaming of camera data, in a single graph edit.
+        """
+        ZEDAnnotator.build_graphs([self], [cams])
 
+    @staticmethod
+    def build_graphs(annotators, cams_list = None) -> None:
         """
-        # get the graph dispatcher node
-        dispacher_node = self.graph.get_node(self._graph_path + "/PostProcessDispatcher")
-        # connect dispacth to sync node
-        dispacher_node.get_attribute("outputs:referenceTimeDenominator").connect(
-            self.sync_node.get_attribute("inputs:rationalTimeDenominator"), True
-        )
-        dispacher_node.get_attribute("outputs:referenceTimeNumerator").connect(
-            self.sync_node.get_attribute("inputs:rationalTimeNumerator"), True
+        Builds the streaming graphs of several annotators, e.g. created with defer_graph, in a single edit of the
+        synthetic data graph instead of one per camera. cams_list holds the cams of each annotator, those it was
+        created with by default. Annotators in export mode are skipped. The cameras of a tiled render product are
+        streamed by a ZED Multi Stream node, see batch_streaming.
+        """
+        if cams_list is None:
+            cams_list = [annotator._cams for annotator in annotators]
+        pending = [(annotator, cams) for annotator, cams in zip(annotators, cams_list) if annotator.export_dir is None]
+        if not pending:
+            return
+
+        for annotator, _ in pending:
+            if annotator._time_nodes is not None:
+                annotator.destroy_graph()
+            annotator.init_graph()
+            annotator._time_nodes = ZEDTimeNodes.get(annotator._graph_path, annotator._time_nodes_suffix())
+            annotator._time_nodes.validate(annotator.graph)
+        batches = ZEDStreamBatch.group([annotator for annotator, _ in pending])
+
+        edit = {}
+        stale_paths = []
+        for annotator, cams in pending:
+            annotator.graph_edit(cams, edit, stale_paths)
+        for batch in batches:
+            batch.graph_edit(edit, stale_paths)
+
+        stage = omni.usd.get_context().get_stage()
+        if stale_paths:
+            with Sdf.ChangeBlock():
+                for path in stale_paths:
+                    stage.RemovePrim(path)
+        og.Controller.edit(pending[0][0].graph, edit)
+
+        for batch in batches:
+            batch.node = og.Controller.node(batch.path)
+            carb.log_info(f"[ZED] {len(batch.annotators)} cameras streamed by the multi stream node {batch.name}")
+
+        for annotator, _ in pending:
+            if annotator._batch is not None:
+                # The multi stream node only reads the IMU from the ZED IMU Stream node of each camera
+                annotator.build_imu_graph(annotator._imu_prim_path, annotator.imu_rate if annotator.imu_rate > 0 else annotator.fps)
+                continue
+
+            # assign to vars for clarity, the time nodes are not owned by the annotator
+            annotator.imu = og.Controller.node(annotator._node_paths["imu"])
+            annotator.zed_ = og.Controller.node(annotator._node_paths["zed"])
+            annotator.nodes = [annotator.imu, annotator.zed_]
+
+            if annotator.imu_rate > 0:
+                annotator.build_imu_graph(annotator._imu_prim_path)
+
+    def _time_nodes_suffix(self) -> str:
+        if not self.share_time_nodes:
+            return str(self.port)
+        # A decimated camera renders on the frames of its frame rate only, and the sync gate would hold back every
+        # camera connected to it until then: cameras of each rate get their own
+        return f"zed_{self.fps}fps" if self.render_decimation else "zed"
+
+    def build_imu_graph(self, imu_full_path: str, imu_rate = None) -> None:
+        """
+        Build an OGN graph evaluated on every physics step that sends IMU samples to the ZED node
+        at imu_rate (the one of the annotator by default), instead of once per rendered frame.
+        """
+        self._imu_graph_path = f"/ZEDImuGraph_{self.port}"
+        keys = og.Controller.Keys
+
+        # Keep the graph out of the user stage, like the synthetic data graph
+        stage = omni.usd.get_context().get_stage()
+        with Usd.EditContext(stage, stage.GetSessionLayer()):
+            if stage.GetPrimAtPath(self._imu_graph_path):
+                stage.RemovePrim(self._imu_graph_path)
+
+            (self.imu_graph, _, _, _) = og.Controller.edit(
+                {
+                    "graph_path": self._imu_graph_path,
+                    "evaluator_name": "execution",
+                    "pipeline_stage": og.GraphPipelineStage.GRAPH_PIPELINE_STAGE_ONDEMAND,
+                },
+                {
+                    keys.CREATE_NODES: [
+                        ("on_physics_step", "isaacsim.core.nodes.OnPhysicsStep"),
+                        ("imu", "isaacsim.sensors.physics.IsaacReadIMU"),
+                        ("sim_time", "isaacsim.core.nodes.IsaacReadSimulationTime"),
+                        ("zed_imu", "sl.sensor.camera.OgnZEDSimImuNode"),
+                    ],
+                    keys.CONNECT: [
+                        ("on_physics_step.outputs:step", "imu.inputs:execIn"),
+                        ("imu.outputs:execOut", "zed_imu.inputs:execIn"),
+                        ("imu.outputs:orientation", "zed_imu.inputs:orientation"),
+                        ("imu.outputs:linAcc", "zed_imu.inputs:linearAcceleration"),
+                        ("imu.outputs:angVel", "zed_imu.inputs:angularVelocity"),
+                        ("sim_time.outputs:simulationTime", "zed_imu.inputs:simulationTime"),
+                    ],
+                    keys.SET_VALUES: [
+                        ("imu.inputs:imuPrim", imu_full_path),
+                        ("imu.inputs:useLatestData", True),
+                        ("zed_imu.inputs:port", self.port),
+                        ("zed_imu.inputs:imuRate", imu_rate if imu_rate is not None else self.imu_rate),
+                    ],
+                },
+            )
+
+    def start_export(self) -> None:
+        """
+        Writes the calibration to the export folder and exports a frame after every update while the timeline plays,
+        at most fps frames per simulated second.
+        """
+        from isaacsim.sensors.physics import _sensor
+
+        from .dataset_export import DatasetWriter
+
+        self.dataset_writer = DatasetWriter(self.export_dir, self.export_format, self.export_workers, self.export_queue_depth)
+        self.write_calibration()
+        self._imu_interface = _sensor.acquire_imu_sensor_interface()
+        self._imu_path = self.camera_prim_path[0].pathString + "/base_link/" + get_camera_model(self.camera_model) + "/Imu_Sensor"
+        self._export_frame = 0
+        self._last_export_time = None
+        self._subscribe_export()
+        carb.log_info(f"[ZED] Exporting {self.camera_prim_path[0].pathString} to {self.export_dir}")
+
+    def _subscribe_export(self) -> None:
+        self._export_sub = omni.kit.app.get_app().get_post_update_event_stream().create_subscription_to_pop(
+            self._on_export_update, name=f"zed_export_{self.port}"
         )
 
-        # create ZED node
-        zed_path = self._graph_path + f"/zed_{self.port}"
-        self.zed_ = self.graph.get_node(zed_path)
-        if not self.zed_.is_valid():
-            stage = omni.usd.get_context().get_stage()
-            if stage.GetPrimAtPath(zed_path):
-                stage.RemovePrim(zed_path)
-            self.zed_ = self.graph.create_node(zed_path, "sl.sensor.camera.OgnZEDSimCameraNode", True)
-        self.zed_.get_attribute("inputs:port").set(self.port)
-        self.zed_.get_attribute("inputs:width").set(self.resolution[0])
-        self.zed_.get_attribute("inputs:height").set(self.resolution[1])
-        self.zed_.get_attribute("inputs:fps").set(self.fps)
-
-        for cam in cams:
-            # get the annotator nodes and connect them to the zed node
-            annot_var_mapping = {}
-            if self.annotators.get(cam[0]):
-                annot_var_mapping[cam[0]] = {
-                    "attr_suffix": "",
-                    "attrs": ["bufferSize", "dataPtr"],
-                }
-
-            for side, _params in annot_var_mapping.items():
-                ptr_node = self.annotators[side].get_node()
-                ptr_node.get_attribute("outputs:exec").connect(self.sync_node.get_attribute("inputs:execIn"), True)
-                for p in _params["attrs"]:
-                    target_attr = self.zed_.get_attribute(f"inputs:{p}{side}{_params['attr_suffix']}")
-                    ptr_node.get_attribute(f"outputs:{p}").connect(target_attr, True)
-
-        self.sim_time.get_attribute("outputs:simulationTime").connect(self.zed_.get_attribute("inputs:simulationTime"), True)
-        self.sys_time.get_attribute("outputs:systemTime").connect(self.zed_.get_attribute("inputs:systemTime"), True)
-
-        self.zed_.get_attribute("inputs:stream").set(value=True)
-        self.zed_.get_attribute("inputs:cameraModel").set("VIRTUAL_ZED_X" if self.custom_stereo else self.camera_model)
-        self.zed_.get_attribute("inputs:serialNumber").set(self.serial_number if self.serial_number else "-1")
-
-        # connect sync node to zed node to trigger the stream
-        self.sync_node.get_attribute("outputs:execOut").connect(self.imu.get_attribute("inputs:execIn"), True)
-        self.sync_node.get_attribute("outputs:rationalTimeDenominator").connect(self.sim_time.get_attribute("inputs:referenceTimeDenominator"), True)
-        self.sync_node.get_attribute("outputs:rationalTimeNumerator").connect(self.sim_time.get_attribute("inputs:referenceTimeNumerator"), True)
+    def write_calibration(self) -> None:
+        """
+        Writes calibration.conf to the export folder: the intrinsics of each eye, and for stereo cameras the extrinsics
+        computed by the ZED Calibration Exporter extension when it is enabled.
+        """
+        cfg = None
+        eye_paths = ZEDAnnotator.get_eye_paths(self.camera_prim_path, self.camera_model)
+        if self.is_stereo:
+            try:
+                from sl.sensor.camera.calibration_exporter.calibration import compute_stereo_calibration
+                cfg = compute_stereo_calibration(eye_paths[0], eye_paths[1], self.camera_model)
+            except ImportError:
+                carb.log_warn("[ZED] Enable the ZED Calibration Exporter extension to export the stereo extrinsics.")
+        if cfg is None:
+            cfg = configparser.ConfigParser()
+        elif not self.custom_stereo:
+            # Only meaningful for virtual stereo cameras
+            cfg.remove_section("SIM")
 
-        imu_path = "/base_link/" + get_camera_model(self.camera_model) + "/Imu_Sensor"
-        imu_full_path = self.camera_prim_path[0].pathString + imu_path
-        self.imu.get_attribute("inputs:imuPrim").set(imu_full_path)
-        self.zed_.get_attribute("inputs:bitrate").set(self.bitrate)
-        self.zed_.get_attribute("inputs:chunkSize").set(self.chunk_size)
-        self.zed_.get_attribute("inputs:transportLayerMode").set(self.transport_layer_mode)
-        self.imu.get_attribute("outputs:orientation").connect(self.zed_.get_attribute("inputs:orientation"), True)
-        self.imu.get_attribute("outputs:linAcc").connect(self.zed_.get_attribute("inputs:linearAcceleration"), True)
-        self.imu.get_attribute("outputs:execOut").connect(self.zed_.get_attribute("inputs:execIn"), True)
+        # Cameras are set up by init_camera: square pixels and a centered principal point
+        width, height = self.resolution
+        focal_length = get_focal_length(self.camera_model, self.resolution, is_4mm_camera(self.camera_model))
+        resolution_name = ZEDAnnotator.CALIBRATION_RESOLUTIONS.get(self.resolution_name, self.resolution_name)
+        for side in (["LEFT", "RIGHT"] if self.is_stereo else ["LEFT"]):
+            cfg[f"{side}_CAM_{resolution_name}"] = {
+                "fx": f"{focal_length:.4f}",
+                "fy": f"{focal_length:.4f}",
+                "cx": f"{width / 2:.4f}",
+                "cy": f"{height / 2:.4f}",
+                "k1": "0", "k2": "0", "p1": "0", "p2": "0", "k3": "0",
+            }
 
-        self.nodes = [self.sync_node, self.sim_time, self.sys_time, self.imu, self.zed_]
+        with open(os.path.join(self.export_dir, "calibration.conf"), "w") as f:
+            cfg.write(f)
 
-    def destroy(self) -> None:
+    def _on_export_update(self, event) -> None:
+        timeline = omni.timeline.get_timeline_interface()
+        if not timeline.is_playing():
+            return
+        # The images of a frame that was not rendered are those of the previous one
+        if not self._render_updates:
+            return
+        simulation_time = timeline.get_current_time()
+        # Updates faster than the camera frame rate are skipped, like in the ZED node. The time goes back on restart.
+        if (self._last_export_time is not None and self._last_export_time <= simulation_time
+                and simulation_time - self._last_export_time < (1.0 - 1e-3) / self.fps):
+            return
+        if self.export_frame(simulation_time):
+            self._last_export_time = simulation_time
+
+    def export_frame(self, simulation_time: float) -> bool:
         """
-        Clean up resources used by the annotator.
+        Queues the last rendered frame and the current IMU sample for writing. Returns False if no frame is rendered yet
+        or if it is dropped because the workers fall behind.
+        """
+        left, right = self.get_eye_images()
+        if left is None:
+            return False
 
-        This method detaches all annotators from the render product,
-        destroys OGN nodes if they were created, and destroys the render product.
+        reading = self._imu_interface.get_sensor_reading(self._imu_path, use_latest_data=True)
+        imu = ZEDAnnotator.imu_sample(reading) if reading.is_valid else None
+
+        written = self.dataset_writer.write(self._export_frame, simulation_time, left, right, imu)
+        self._export_frame += 1
+        return written
+
+    @staticmethod
+    def imu_sample(reading) -> list:
+        """
+        IMU sample of a reading of the IMU sensor interface, as written by DatasetWriter: the orientation (x, y, z, w),
+        as the reading holds it, then the linear acceleration and the angular velocity.
         """
+        return [*reading.orientation, reading.lin_acc_x, reading.lin_acc_y, reading.lin_acc_z,
+                reading.ang_vel_x, reading.ang_vel_y, reading.ang_vel_z]
 
+    def get_eye_images(self) -> tuple:
+        """
+        Host images of the left and right eyes of the last rendered frame, right being None for mono cameras,
+        or (None, None) if nothing is rendered yet.
+        """
+        def host_image(annotator):
+            data = annotator.get_data()
+            image = data.numpy() if hasattr(data, "numpy") else np.asarray(data)
+            return image if image.ndim == 3 and image.size > 0 else None
+
+        if "Left" not in self.annotators:
+            return None, None
+        left = host_image(self.annotators["Left"])
+        if left is None:
+            return None, None
+
+        if self.tiled_render is not None or self.side_by_side:
+            # Tiles are numbered row by row, the side-by-side image being a single row of two tiles
+            columns, tiles = (self.tiled_render.columns, self.tiles) if self.tiled_render is not None else (2, (0, 1))
+            width, height = self.resolution
+
+            def tile(index):
+                row, column = divmod(index, columns)
+                return left[row * height:(row + 1) * height, column * width:(column + 1) * width]
+
+            return tile(tiles[0]), tile(tiles[1]) if self.is_stereo and tiles[1] >= 0 else None
+
+        right = host_image(self.annotators["Right"]) if "Right" in self.annotators else None
+        return left, right
+
+    def get_export_stats(self) -> dict:
+        """
+        Returns the export progress (frames written, dropped and failed, written frame rate), empty if not exporting.
+        """
+        return self.dataset_writer.get_stats() if self.dataset_writer is not None else {}
+
+    def get_stream_stats(self) -> dict:
+        """
+        Returns the streaming performance reported by the ZED node outputs
+        (achieved fps, copy and stream call times and total copy stall time in ms, frame counters).
+        """
+        if self._batch is not None:
+            return self._batch.get_stream_stats(self)
+        if self.zed_ is None or not self.zed_.is_valid():
+            return {}
+
+        names = ["streamFps", "copyTime", "copyTimeAverage", "streamCallTime", "streamCallTimeAverage",
+                 "streamStatus", "framesStreamed", "framesSkipped", "framesDropped",
+                 "framesGated", "stallTime"]
+        return {name: self.zed_.get_attribute(f"outputs:{name}").get() for name in names}
+
+    def get_render_stats(self) -> dict:
+        """
+        Returns the frames rendered and not rendered by the render decimation, since the first camera of its
+        ZEDRenderDecimation started, empty if it is disabled.
+        """
+        return self.render_decimator.get_stats() if self.render_decimator is not None else {}
+
+    def get_render_products(self) -> list:
+        """Render products owned by this annotator, a tiled render product shared with other cameras excluded."""
+        return [getattr(self, name) for name in ("_left_rp", "_right_rp", "_stereo_rp") if hasattr(self, name)]
+
+    def set_render_updates(self, enabled: bool) -> None:
+        """Enables or disables the rendering of the render products owned by this annotator."""
+        for render_product in self.get_render_products():
+            render_product.hydra_texture.set_updates_enabled(enabled)
+
+    def _start_render_decimation(self) -> None:
+        self._render_decimation = ZEDRenderDecimation.get(self._time_nodes_suffix(), self.fps)
+        self.render_decimator = self._render_decimation.decimator
+        self._render_decimation.add(self)
+
+    def _stop_render_decimation(self) -> None:
+        """Stops the render decimation, the render products being rendered on every frame again."""
+        if self._render_decimation is None:
+            return
+        self._render_decimation.remove(self)
+        self._render_decimation = None
+        if self.tiled_render is not None:
+            self.tiled_render.request_render(self, None)
+        if not self._render_updates:
+            self.set_render_updates(True)
+            self._render_updates = True
+
+    def _apply_render_updates(self, render_updates: bool) -> None:
+        """Renders the next frame or not, as decided by the ZEDRenderDecimation of the camera."""
+        if self.tiled_render is not None:
+            self.tiled_render.request_render(self, render_updates)
+        if render_updates != self._render_updates:
+            self.set_render_updates(render_updates)
+            self._render_updates = render_updates
+
+    def park(self) -> None:
+        """
+        Stops streaming, or exporting, but keeps the render products and annotators so that resume() restarts without
+        rebuilding them. The streaming nodes are destroyed, closing the ZED SDK streamer, and the render products are
+        not rendered until resume().
+        """
+        if self.parked:
+            return
+        self._stop_render_decimation()
+        if self.dataset_writer is not None:
+            if self._export_sub is not None:
+                self._export_sub.unsubscribe()
+                self._export_sub = None
+        else:
+            self.destroy_graph()
+        self.set_render_updates(False)
+        self.parked = True
+        carb.log_info(f"[ZED][port {self.port}] Annotator parked.")
+
+    def can_resume(self) -> bool:
+        """Whether the cameras of a parked annotator still exist, so that its render products can be reused."""
+        eye_paths = ZEDAnnotator.get_eye_paths(self.camera_prim_path, self.camera_model)
+        return self.parked and bool(self.annotators) and all(is_prim_path_valid(path) for path in eye_paths)
+
+    def resume(self) -> None:
+        """Streams, or exports, again from the render products and annotators kept by park()."""
+        if not self.parked:
+            return
+        self.set_render_updates(True)
+        if self.render_decimation:
+            self._start_render_decimation()
+        if self.dataset_writer is not None:
+            self._subscribe_export()
+        else:
+            self.build_graph(self._cams)
+        self.parked = False
+        carb.log_info(f"[ZED][port {self.port}] Annotator resumed.")
+
+    def destroy_graph(self) -> None:
+        """Destroys the OGN nodes streaming the annotator data, the annotators and render products are kept."""
+        if self._batch is not None:
+            try:
+                self._batch.release(self)
+            except:
+                carb.log_warn(f"[ZED][port {self.port}] Multi stream node not found")
+                self._batch = None
         for node in self.nodes:
             try:
                 if node.is_valid():
@@ -311,6 +1151,47 @@ class ZEDAnnotator:
             except:
                 carb.log_warn("Node {} not found".format(node))
         self.nodes = []
+        self.zed_ = None
+
+        if self._time_nodes is not None:
+            try:
+                self._time_nodes.release(self.graph, self._exec_sources)
+            except:
+                carb.log_warn(f"[ZED][port {self.port}] Time nodes not found")
+            self._time_nodes = None
+            self._exec_sources = []
+
+        if self.imu_graph is not None:
+            stage = omni.usd.get_context().get_stage()
+            with Usd.EditContext(stage, stage.GetSessionLayer()):
+                stage.RemovePrim(self._imu_graph_path)
+            self.imu_graph = None
+
+    def destroy(self) -> None:
+        """
+        Clean up resources used by the annotator.
+
+        This method detaches all annotators from the render product,
+        destroys OGN nodes if they were created, and destroys the render product.
+        """
+
+        self.destroy_graph()
+        self._stop_render_decimation()
+
+        if self.dataset_writer is not None:
+            if self._export_sub is not None:
+                self._export_sub.unsubscribe()
+                self._export_sub = None
+            self.dataset_writer.close()
+            carb.log_info(f"[ZED][port {self.port}] Export to {self.export_dir} finished: {self.dataset_writer.get_stats()}")
+            self.dataset_writer = None
+
+        if self.tiled_render is not None and "Left" in self.annotators:
+            self.tiled_render.release()
+
+        if hasattr(self, "stereo_rgb_annot"):
+            self.stereo_rgb_annot.detach(self.stereo_rp)
+            self._stereo_rp.destroy()
 
         if hasattr(self, "left_rgb_annot"):
             self.left_rgb_annot.detach(self.left_rp)
@@ -0,0 +1,210 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+# Writes stereo datasets to disk, the images being encoded by a pool of worker processes.
+# Workers are spawned from a plain Python interpreter and only import zed_export_worker: forking Kit, which runs many
+# threads, or spawning the Kit binary, which would load the extension again, is never safe.
+
+import collections
+import concurrent.futures
+import contextlib
+import csv
+import importlib.util
+import multiprocessing
+import os
+import site
+import sys
+import time
+import types
+
+import numpy as np
+
+_WORKER_DIR = os.path.dirname(os.path.abspath(__file__))
+_WORKER_MODULE = "zed_export_worker"
+
+
+def _load_worker():
+    """Loads zed_export_worker as a top-level module, the name under which the workers unpickle its functions."""
+    worker = sys.modules.get(_WORKER_MODULE)
+    if worker is None:
+        spec = importlib.util.spec_from_file_location(_WORKER_MODULE, os.path.join(_WORKER_DIR, _WORKER_MODULE + ".py"))
+        worker = importlib.util.module_from_spec(spec)
+        sys.modules[_WORKER_MODULE] = worker
+        spec.loader.exec_module(worker)
+    return worker
+
+
+_worker = _load_worker()
+IMAGE_FORMATS = _worker.IMAGE_FORMATS
+
+# Columns of frames.csv, one row per written frame, in capture order
+FRAME_COLUMNS = [
+    "frame", "simulation_time", "system_time_ns", "left", "right",
+    "orientation_x", "orientation_y", "orientation_z", "orientation_w",
+    "linear_acceleration_x", "linear_acceleration_y", "linear_acceleration_z",
+    "angular_velocity_x", "angular_velocity_y", "angular_velocity_z",
+]
+
+
+def python_executable():
+    """Python interpreter to spawn the workers with, None if not found. In Kit, sys.executable is the Kit binary."""
+    if os.path.basename(sys.executable).lower().startswith("python"):
+        return sys.executable
+    names = ["python.exe"] if os.name == "nt" else [os.path.join("bin", "python3"), os.path.join("bin", "python")]
+    for prefix in dict.fromkeys([sys.exec_prefix, sys.base_exec_prefix, sys.prefix]):
+        for name in names:
+            path = os.path.join(prefix, name)
+            if os.path.isfile(path):
+                return path
+    return None
+
+
+def _create_executor(workers: int, start_method: str) -> concurrent.futures.Executor:
+    """Pool of worker processes started with start_method, or of threads if no Python interpreter is found."""
+    executable = python_executable()
+    if executable is None:
+        # Pillow releases the GIL while encoding, threads still encode images in parallel
+        return concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zed_export")
+
+    context = multiprocessing.get_context(start_method)
+    if executable != sys.executable:
+        context.set_executable(executable)
+    # The workers find zed_export_worker in this folder, without importing the sl.sensor.camera package
+    return concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                                  initializer=site.addsitedir, initargs=(_WORKER_DIR,))
+
+
+@contextlib.contextmanager
+def _main_hidden():
+    """
+    Hides the main module from the worker processes started meanwhile. Spawned workers run the main module of the
+    process starting them again, e.g. the script of a standalone Isaac Sim app, which would start Kit in every worker.
+    """
+    main = sys.modules.get("__main__")
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = main
+
+
+class DatasetWriter:
+    """
+    Writes the frames of a camera to output_dir: left/ and right/ images named after the frame number,
+    and their timestamps and IMU sample in frames.csv.
+
+    Frames are encoded by a pool of workers worker processes. At most queue_depth frames are being encoded at a time,
+    further frames are dropped instead of waiting for the workers, unless block is True.
+    start_method is "spawn" or "forkserver" (POSIX only), "fork" is rejected. Without a Python interpreter to start
+    the workers with, images are encoded by threads instead and processes is False.
+    """
+
+    def __init__(self, output_dir: str, image_format = "png", workers = 4, queue_depth = 8, block = False, jpeg_quality = 95,
+                 start_method = "spawn"):
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unknown image format {image_format}, expected one of {list(IMAGE_FORMATS)}")
+        if start_method not in ("spawn", "forkserver"):
+            raise ValueError(f"Unsupported start method {start_method}, expected spawn or forkserver")
+        self.output_dir = output_dir
+        self.image_format = image_format
+        self.workers = max(1, workers)
+        self.queue_depth = max(1, queue_depth)
+        self.block = block
+        self.jpeg_quality = jpeg_quality
+
+        for side in ("left", "right"):
+            os.makedirs(os.path.join(output_dir, side), exist_ok=True)
+        self._csv_file = open(os.path.join(output_dir, "frames.csv"), "w", newline="")
+        self._csv = csv.writer(self._csv_file)
+        self._csv.writerow(FRAME_COLUMNS)
+
+        self._executor = _create_executor(self.workers, start_method)
+        self.processes = isinstance(self._executor, concurrent.futures.ProcessPoolExecutor)
+        # Frames being encoded, oldest first: (csv row, futures of its images)
+        self._pending = collections.deque()
+        self._start = None
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.errors = 0
+        self.bytes_written = 0
+
+    def write(self, frame: int, simulation_time: float, left: np.ndarray, right = None, imu = None, system_time_ns = None) -> bool:
+        """
+        Queues a frame for encoding and returns without waiting for it, or returns False if it is dropped.
+        imu holds the orientation (x, y, z, w), linear acceleration and angular velocity, 10 values.
+        """
+        if self._start is None:
+            self._start = time.perf_counter()
+        self._collect(wait=False)
+        if len(self._pending) >= self.queue_depth:
+            if not self.block:
+                self.frames_dropped += 1
+                return False
+            self._collect(wait=True, keep=self.queue_depth - 1)
+
+        names = [f"{frame:06d}.{self.image_format}", f"{frame:06d}.{self.image_format}" if right is not None else ""]
+        futures = [self._submit("left", names[0], left)]
+        if right is not None:
+            futures.append(self._submit("right", names[1], right))
+
+        imu_values = list(imu) if imu is not None else [float("nan")] * 10
+        row = [frame, f"{simulation_time:.9f}", system_time_ns if system_time_ns is not None else time.time_ns(), *names,
+               *imu_values]
+        self._pending.append((row, futures))
+        return True
+
+    def close(self) -> None:
+        """Waits for the frames being encoded and stops the workers."""
+        if self._executor is None:
+            return
+        self._collect(wait=True, keep=0)
+        self._executor.shutdown()
+        self._executor = None
+        self._csv_file.close()
+
+    def get_stats(self) -> dict:
+        """Frames written, dropped and failed, and the written frame rate since the first frame."""
+        elapsed = time.perf_counter() - self._start if self._start is not None else 0.0
+        return {
+            "framesWritten": self.frames_written,
+            "framesDropped": self.frames_dropped,
+            "framesPending": len(self._pending),
+            "errors": self.errors,
+            "bytesWritten": self.bytes_written,
+            "fps": self.frames_written / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def worker_modules(self) -> list:
+        """
+        Modules of Kit, of the extension or of the main module imported by a worker process, see
+        zed_export_worker.unexpected_modules(). The workers must import none of them. Empty without worker processes.
+        """
+        if not self.processes:
+            return []
+        return self._submit_task(_worker.unexpected_modules).result()
+
+    def _submit_task(self, fn, *args) -> concurrent.futures.Future:
+        # Workers are started by the submissions that find none of them idle
+        if not self.processes:
+            return self._executor.submit(fn, *args)
+        with _main_hidden():
+            return self._executor.submit(fn, *args)
+
+    def _submit(self, side: str, name: str, image: np.ndarray) -> concurrent.futures.Future:
+        path = os.path.join(self.output_dir, side, name)
+        return self._submit_task(_worker.encode_image, path, image, self.image_format, self.jpeg_quality)
+
+    def _collect(self, wait: bool, keep = 0) -> None:
+        """Writes the rows of the oldest encoded frames, waiting for them until at most keep frames are pending if wait."""
+        while self._pending:
+            row, futures = self._pending[0]
+            if not wait or len(self._pending) <= keep:
+                if not all(future.done() for future in futures):
+                    return
+            try:
+                self.bytes_written += sum(future.result() for future in futures)
+                self._csv.writerow(row)
+                self.frames_written += 1
+            except Exception:
+                self.errors += 1
+            self._pending.popleft()
@@ -3,6 +3,7 @@ This is the implementation of the OGN node defined in SlVirtualCameraStreamer.og
 """
 import carb
 from dataclasses import dataclass
+import time
 import traceback
 import omni.kit.commands
 from carb.events import IEvent
@@ -23,13 +24,41 @@ class SlCameraOneStreamer:
         annotator: ZEDAnnotator = None
         port: int = None
         timeline_stop_sub = None
+        # Inputs the annotator was built with, a parked annotator is only resumed with the same ones
+        config: tuple = None
+        warm_restart: bool = False
 
     @staticmethod
     def internal_state() -> State:
         return SlCameraOneStreamer.State()
 
+    @staticmethod
+    def get_config(db) -> tuple:
+        return (
+            tuple(str(path) for path in db.inputs.leftCameraPrim),
+            tuple(str(path) for path in db.inputs.rightCameraPrim),
+            db.inputs.cameraModel,
+            db.inputs.resolution,
+            db.inputs.fps,
+            db.inputs.bitrate,
+            db.inputs.chunkSize,
+            db.inputs.transportLayerMode,
+            db.inputs.serialNumber,
+            db.inputs.streamingPort,
+            db.inputs.warmRestart,
+        )
+
     def compute(db) -> bool:
         state = db.per_instance_state
+        if state.initialized and state.annotator is not None and state.annotator.parked:
+            # Warm restart: stream again from the parked render products, unless an input or the camera changed
+            if state.config == SlCameraOneStreamer.get_config(db) and state.annotator.can_resume():
+                start = time.perf_counter()
+                state.annotator.resume()
+                carb.log_info(f"[ZED] Port {state.port} resumed in {1e3 * (time.perf_counter() - start):.1f} ms")
+                return True
+            SlCameraOneStreamer.release(state)
+
         if state.initialized is False:
             try:
                 port = db.inputs.streamingPort
@@ -51,6 +80,7 @@ class SlCameraOneStreamer:
                     return False
 
                 state.port = port
+                start = time.perf_counter()
                 state.annotator = ZEDAnnotator(
                     cameraPrims,
                     db.inputs.cameraModel,
@@ -60,14 +90,21 @@ class SlCameraOneStreamer:
                     db.inputs.bitrate,
                     db.inputs.chunkSize,
                     db.inputs.transportLayerMode,
-                    db.inputs.serialNumber)
+                    db.inputs.serialNumber,
+                    session_pooling=db.inputs.warmRestart)
+                state.config = SlCameraOneStreamer.get_config(db)
+                state.warm_restart = db.inputs.warmRestart
+                carb.log_info(f"[ZED] Port {port} built in {1e3 * (time.perf_counter() - start):.1f} ms")
          
                 state.initialized = True
                 # Mark the port as used
                 SlCameraOneStreamer.used_ports.add(port)
 
                 def cleanup(event, _state=state):
-                    SlCameraOneStreamer.release(_state)
+                    if _state.warm_restart and _state.annotator is not None:
+                        _state.annotator.park()
+                    else:
+                        SlCameraOneStreamer.release(_state)
 
                 timeline = omni.timeline.get_timeline_interface()
 
@@ -91,8 +128,9 @@ class SlCameraOneStreamer:
             state = None
             pass
 
+        # Parked annotators outlive the timeline, they are destroyed with the node
         if state is not None:
-            state.reset()
+            SlCameraOneStreamer.release(state)
 
     @staticmethod
     def release(state):
@@ -127,6 +165,7 @@ class SlCameraOneStreamer:
             state.initialized = False
             state.port = None
             state.timeline_stop_sub = None
+            state.config = None
 
         except Exception:
             carb.log_error(traceback.format_exc())
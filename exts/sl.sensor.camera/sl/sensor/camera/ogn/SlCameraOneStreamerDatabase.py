@@ -40,6 +40,7 @@ class SlCameraOneStreamerDatabase(og.Database):
             inputs.serialNumber
             inputs.streamingPort
             inputs.transportLayerMode
+            inputs.warmRestart
 
     Predefined Tokens:
         tokens.ZED_XONE_UHD
@@ -79,6 +80,7 @@ class SlCameraOneStreamerDatabase(og.Database):
         ('inputs:serialNumber', 'string', 0, 'Serial Number', 'Serial number of the stereo cam. Only used for virtual ZED X cameras.', {'uiGroup': 'Configuration', ogn.MetadataKeys.DEFAULT: '"119999999"'}, True, "119999999", False, ''),
         ('inputs:streamingPort', 'uint', 0, 'Streaming Port', 'Unique port per camera.', {'uiGroup': 'Streaming', ogn.MetadataKeys.DEFAULT: '30000'}, True, 30000, False, ''),
         ('inputs:transportLayerMode', 'token', 0, 'Transport layer mode', 'Communication protocol used to send data to the ZED SDK. IPC (Only available on Linux)improves streaming performances when streaming to the same machine', {ogn.MetadataKeys.ALLOWED_TOKENS: 'BOTH,NETWORK,IPC', ogn.MetadataKeys.ALLOWED_TOKENS_RAW: '["BOTH", "NETWORK", "IPC"]', ogn.MetadataKeys.DEFAULT: '"BOTH"'}, True, "BOTH", False, ''),
+        ('inputs:warmRestart', 'bool', 0, 'Warm Restart', 'Keeps the render products and annotators when the timeline stops, and reuses them on the next play if no input changed, instead of rebuilding them.', {'uiGroup': 'Streaming', ogn.MetadataKeys.DEFAULT: 'false'}, True, False, False, ''),
     ])
 
     class tokens:
@@ -105,14 +107,14 @@ class SlCameraOneStreamerDatabase(og.Database):
         return role_data
 
     class ValuesForInputs(og.DynamicAttributeAccess):
-        LOCAL_PROPERTY_NAMES = {"bitrate", "cameraModel", "chunkSize", "execIn", "fps", "resolution", "serialNumber", "streamingPort", "transportLayerMode", "_setting_locked", "_batchedReadAttributes", "_batchedReadValues"}
+        LOCAL_PROPERTY_NAMES = {"bitrate", "cameraModel", "chunkSize", "execIn", "fps", "resolution", "serialNumber", "streamingPort", "transportLayerMode", "warmRestart", "_setting_locked", "_batchedReadAttributes", "_batchedReadValues"}
         """Helper class that creates natural hierarchical access to input attributes"""
         def __init__(self, node: og.Node, attributes, dynamic_attributes: og.DynamicAttributeInterface):
             """Initialize simplified access for the attribute data"""
             context = node.get_graph().get_default_graph_context()
             super().__init__(context, node, attributes, dynamic_attributes)
-            self._batchedReadAttributes = [self._attributes.bitrate, self._attributes.cameraModel, self._attributes.chunkSize, self._attributes.execIn, self._attributes.fps, self._attributes.resolution, self._attributes.serialNumber, self._attributes.streamingPort, self._attributes.transportLayerMode]
-            self._batchedReadValues = [8000, "ZED_XONE_GS", 4096, 0, 60, "HD1200", "119999999", 30000, "BOTH"]
+            self._batchedReadAttributes = [self._attributes.bitrate, self._attributes.cameraModel, self._attributes.chunkSize, self._attributes.execIn, self._attributes.fps, self._attributes.resolution, self._attributes.serialNumber, self._attributes.streamingPort, self._attributes.transportLayerMode, self._attributes.warmRestart]
+            self._batchedReadValues = [8000, "ZED_XONE_GS", 4096, 0, 60, "HD1200", "119999999", 30000, "BOTH", False]
 
         @property
         def leftCameraPrim(self):
@@ -212,6 +214,14 @@ class SlCameraOneStreamerDatabase(og.Database):
         def transportLayerMode(self, value):
             self._batchedReadValues[8] = value
 
+        @property
+        def warmRestart(self):
+            return self._batchedReadValues[9]
+
+        @warmRestart.setter
+        def warmRestart(self, value):
+            self._batchedReadValues[9] = value
+
         def __getattr__(self, item: str):
             if item in self.LOCAL_PROPERTY_NAMES:
                 return object.__getattribute__(self, item)
@@ -38,6 +38,7 @@ class SlCameraStreamerDatabase(og.Database):
             inputs.resolution
             inputs.streamingPort
             inputs.transportLayerMode
+            inputs.warmRestart
 
     Predefined Tokens:
         tokens.ZED_X
@@ -74,6 +75,7 @@ class SlCameraStreamerDatabase(og.Database):
         ('inputs:resolution', 'token', 0, 'Resolution', 'Camera stream resolution.', {ogn.MetadataKeys.ALLOWED_TOKENS: 'HD1200,HD1080,SVGA', ogn.MetadataKeys.ALLOWED_TOKENS_RAW: '["HD1200", "HD1080", "SVGA"]', ogn.MetadataKeys.DEFAULT: '"HD1200"'}, True, "HD1200", False, ''),
         ('inputs:streamingPort', 'uint', 0, 'Streaming Port', 'Unique port per camera.', {ogn.MetadataKeys.DEFAULT: '30000'}, True, 30000, False, ''),
         ('inputs:transportLayerMode', 'token', 0, 'Transport layer mode', 'Communication protocol used to send data to the ZED SDK. IPC (Only available on Linux)improves streaming performances when streaming to the same machine', {ogn.MetadataKeys.ALLOWED_TOKENS: 'BOTH,NETWORK,IPC', ogn.MetadataKeys.ALLOWED_TOKENS_RAW: '["BOTH", "NETWORK", "IPC"]', ogn.MetadataKeys.DEFAULT: '"BOTH"'}, True, "BOTH", False, ''),
+        ('inputs:warmRestart', 'bool', 0, 'Warm Restart', 'Keeps the render products and annotators when the timeline stops, and reuses them on the next play if no input changed, instead of rebuilding them.', {ogn.MetadataKeys.DEFAULT: 'false'}, True, False, False, ''),
     ])
 
     class tokens:
@@ -97,14 +99,14 @@ class SlCameraStreamerDatabase(og.Database):
         return role_data
 
     class ValuesForInputs(og.DynamicAttributeAccess):
-        LOCAL_PROPERTY_NAMES = {"bitrate", "cameraModel", "chunkSize", "execIn", "fps", "resolution", "streamingPort", "transportLayerMode", "_setting_locked", "_batchedReadAttributes", "_batchedReadValues"}
+        LOCAL_PROPERTY_NAMES = {"bitrate", "cameraModel", "chunkSize", "execIn", "fps", "resolution", "streamingPort", "transportLayerMode", "warmRestart", "_setting_locked", "_batchedReadAttributes", "_batchedReadValues"}
         """Helper class that creates natural hierarchical access to input attributes"""
         def __init__(self, node: og.Node, attributes, dynamic_attributes: og.DynamicAttributeInterface):
             """Initialize simplified access for the attribute data"""
             context = node.get_graph().get_default_graph_context()
             super().__init__(context, node, attributes, dynamic_attributes)
-            self._batchedReadAttributes = [self._attributes.bitrate, self._attributes.cameraModel, self._attributes.chunkSize, self._attributes.execIn, self._attributes.fps, self._attributes.resolution, self._attributes.streamingPort, self._attributes.transportLayerMode]
-            self._batchedReadValues = [8000, "ZED_X", 4096, 0, 60, "HD1200", 30000, "BOTH"]
+            self._batchedReadAttributes = [self._attributes.bitrate, self._attributes.cameraModel, self._attributes.chunkSize, self._attributes.execIn, self._attributes.fps, self._attributes.resolution, self._attributes.streamingPort, self._attributes.transportLayerMode, self._attributes.warmRestart]
+            self._batchedReadValues = [8000, "ZED_X", 4096, 0, 60, "HD1200", 30000, "BOTH", False]
 
         @property
         def cameraPrim(self):
@@ -183,6 +185,14 @@ class SlCameraStreamerDatabase(og.Database):
         def transportLayerMode(self, value):
             self._batchedReadValues[7] = value
 
+        @property
+        def warmRestart(self):
+            return self._batchedReadValues[8]
+
+        @warmRestart.setter
+        def warmRestart(self, value):
+            self._batchedReadValues[8] = value
+
         def __getattr__(self, item: str):
             if item in self.LOCAL_PROPERTY_NAMES:
                 return object.__getattribute__(self, item)
@@ -27,6 +27,13 @@ class TestOgn(ogts.OmniGraphTestCase):
             return f"{node_type_name} {test_type} Test - {attribute.get_name()} value error"
 
 
+        self.assertTrue(test_node.get_attribute_exists("inputs:asyncStreaming"))
+        attribute = test_node.get_attribute("inputs:asyncStreaming")
+        self.assertTrue(attribute.is_valid())
+        expected_value = False
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
         self.assertTrue(test_node.get_attribute_exists("inputs:bitrate"))
         attribute = test_node.get_attribute("inputs:bitrate")
         self.assertTrue(attribute.is_valid())
@@ -97,6 +104,27 @@ class TestOgn(ogts.OmniGraphTestCase):
         actual_value = og.Controller.get(attribute)
         ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
 
+        self.assertTrue(test_node.get_attribute_exists("inputs:highRateImu"))
+        attribute = test_node.get_attribute("inputs:highRateImu")
+        self.assertTrue(attribute.is_valid())
+        expected_value = False
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:imuQueueSize"))
+        attribute = test_node.get_attribute("inputs:imuQueueSize")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 256
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:inputLocation"))
+        attribute = test_node.get_attribute("inputs:inputLocation")
+        self.assertTrue(attribute.is_valid())
+        expected_value = "DEVICE"
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
         self.assertTrue(test_node.get_attribute_exists("inputs:linearAcceleration"))
         attribute = test_node.get_attribute("inputs:linearAcceleration")
         self.assertTrue(attribute.is_valid())
@@ -111,6 +139,27 @@ class TestOgn(ogts.OmniGraphTestCase):
         actual_value = og.Controller.get(attribute)
         ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
 
+        self.assertTrue(test_node.get_attribute_exists("inputs:overflowPolicy"))
+        attribute = test_node.get_attribute("inputs:overflowPolicy")
+        self.assertTrue(attribute.is_valid())
+        expected_value = "LATEST"
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:packPixels"))
+        attribute = test_node.get_attribute("inputs:packPixels")
+        self.assertTrue(attribute.is_valid())
+        expected_value = False
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:pipelineDepth"))
+        attribute = test_node.get_attribute("inputs:pipelineDepth")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 1
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
         self.assertTrue(test_node.get_attribute_exists("inputs:port"))
         attribute = test_node.get_attribute("inputs:port")
         self.assertTrue(attribute.is_valid())
@@ -118,6 +167,27 @@ class TestOgn(ogts.OmniGraphTestCase):
         actual_value = og.Controller.get(attribute)
         ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
 
+        self.assertTrue(test_node.get_attribute_exists("inputs:queueDepth"))
+        attribute = test_node.get_attribute("inputs:queueDepth")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 4
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:recordingPath"))
+        attribute = test_node.get_attribute("inputs:recordingPath")
+        self.assertTrue(attribute.is_valid())
+        expected_value = ""
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:recordingSize"))
+        attribute = test_node.get_attribute("inputs:recordingSize")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 1024
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
         self.assertTrue(test_node.get_attribute_exists("inputs:serialNumber"))
         attribute = test_node.get_attribute("inputs:serialNumber")
         self.assertTrue(attribute.is_valid())
@@ -125,6 +195,27 @@ class TestOgn(ogts.OmniGraphTestCase):
         actual_value = og.Controller.get(attribute)
         ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
 
+        self.assertTrue(test_node.get_attribute_exists("inputs:sessionIdleTimeout"))
+        attribute = test_node.get_attribute("inputs:sessionIdleTimeout")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 30.0
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:sessionPooling"))
+        attribute = test_node.get_attribute("inputs:sessionPooling")
+        self.assertTrue(attribute.is_valid())
+        expected_value = False
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:sideBySide"))
+        attribute = test_node.get_attribute("inputs:sideBySide")
+        self.assertTrue(attribute.is_valid())
+        expected_value = False
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
         self.assertTrue(test_node.get_attribute_exists("inputs:simulationTime"))
         attribute = test_node.get_attribute("inputs:simulationTime")
         self.assertTrue(attribute.is_valid())
@@ -132,6 +223,13 @@ class TestOgn(ogts.OmniGraphTestCase):
         actual_value = og.Controller.get(attribute)
         ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
 
+        self.assertTrue(test_node.get_attribute_exists("inputs:splitEyeStreams"))
+        attribute = test_node.get_attribute("inputs:splitEyeStreams")
+        self.assertTrue(attribute.is_valid())
+        expected_value = False
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
         self.assertTrue(test_node.get_attribute_exists("inputs:stream"))
         attribute = test_node.get_attribute("inputs:stream")
         self.assertTrue(attribute.is_valid())
@@ -146,6 +244,27 @@ class TestOgn(ogts.OmniGraphTestCase):
         actual_value = og.Controller.get(attribute)
         ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
 
+        self.assertTrue(test_node.get_attribute_exists("inputs:tileColumns"))
+        attribute = test_node.get_attribute("inputs:tileColumns")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 0
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:tileLeft"))
+        attribute = test_node.get_attribute("inputs:tileLeft")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 0
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:tileRight"))
+        attribute = test_node.get_attribute("inputs:tileRight")
+        self.assertTrue(attribute.is_valid())
+        expected_value = -1
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
         self.assertTrue(test_node.get_attribute_exists("inputs:transportLayerMode"))
         attribute = test_node.get_attribute("inputs:transportLayerMode")
         self.assertTrue(attribute.is_valid())
@@ -159,3 +278,32 @@ class TestOgn(ogts.OmniGraphTestCase):
         expected_value = 1920
         actual_value = og.Controller.get(attribute)
         ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:yuvLayout"))
+        attribute = test_node.get_attribute("inputs:yuvLayout")
+        self.assertTrue(attribute.is_valid())
+        expected_value = "YUYV"
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:copyTime"))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:copyTimeAverage"))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:framesDropped"))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:framesGated"))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:framesSkipped"))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:framesStreamed"))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:stallTime"))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:streamCallTime"))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:streamCallTimeAverage"))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:streamFps"))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:streamStatus"))
@@ -0,0 +1,241 @@
+import os
+import omni.kit.test
+import omni.graph.core as og
+import omni.graph.core.tests as ogts
+from omni.graph.core.tests.omnigraph_test_utils import _TestGraphAndNode
+from omni.graph.core.tests.omnigraph_test_utils import _test_clear_scene
+from omni.graph.core.tests.omnigraph_test_utils import _test_setup_scene
+from omni.graph.core.tests.omnigraph_test_utils import _test_verify_scene
+
+
+class TestOgn(ogts.OmniGraphTestCase):
+
+    async def test_data_access(self):
+        test_file_name = "OgnZEDSimMultiCameraNodeTemplate.usda"
+        usd_path = os.path.join(os.path.dirname(__file__), "usd", test_file_name)
+        if not os.path.exists(usd_path):  # pragma: no cover
+            self.assertTrue(False, f"{usd_path} not found for loading test")
+        (result, error) = await ogts.load_test_file(usd_path)
+        self.assertTrue(result, f'{error} on {usd_path}')
+        test_node = og.Controller.node("/TestGraph/Template_sl_sensor_camera_OgnZEDSimMultiCameraNode")
+        self.assertTrue(test_node.is_valid())
+        node_type_name = test_node.get_type_name()
+        self.assertEqual(og.GraphRegistry().get_node_type_version(node_type_name), 1)
+
+        def _attr_error(attribute: og.Attribute, usd_test: bool) -> str:  # pragma no cover
+            test_type = "USD Load" if usd_test else "Database Access"
+            return f"{node_type_name} {test_type} Test - {attribute.get_name()} value error"
+
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:bitrate"))
+        attribute = test_node.get_attribute("inputs:bitrate")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 8000
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:bufferSize"))
+        attribute = test_node.get_attribute("inputs:bufferSize")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 0
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:bufferSizesLeft"))
+        attribute = test_node.get_attribute("inputs:bufferSizesLeft")
+        self.assertTrue(attribute.is_valid())
+        expected_value = []
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:bufferSizesRight"))
+        attribute = test_node.get_attribute("inputs:bufferSizesRight")
+        self.assertTrue(attribute.is_valid())
+        expected_value = []
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:cameraModels"))
+        attribute = test_node.get_attribute("inputs:cameraModels")
+        self.assertTrue(attribute.is_valid())
+        expected_value = []
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:chunkSize"))
+        attribute = test_node.get_attribute("inputs:chunkSize")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 4096
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:dataPtr"))
+        attribute = test_node.get_attribute("inputs:dataPtr")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 0
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:dataPtrsLeft"))
+        attribute = test_node.get_attribute("inputs:dataPtrsLeft")
+        self.assertTrue(attribute.is_valid())
+        expected_value = []
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:dataPtrsRight"))
+        attribute = test_node.get_attribute("inputs:dataPtrsRight")
+        self.assertTrue(attribute.is_valid())
+        expected_value = []
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:encoderThreads"))
+        attribute = test_node.get_attribute("inputs:encoderThreads")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 0
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:execIn"))
+        attribute = test_node.get_attribute("inputs:execIn")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 0
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:fps"))
+        attribute = test_node.get_attribute("inputs:fps")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 30
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:height"))
+        attribute = test_node.get_attribute("inputs:height")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 1200
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:highRateImu"))
+        attribute = test_node.get_attribute("inputs:highRateImu")
+        self.assertTrue(attribute.is_valid())
+        expected_value = False
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:imuQueueSize"))
+        attribute = test_node.get_attribute("inputs:imuQueueSize")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 256
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:inputLocation"))
+        attribute = test_node.get_attribute("inputs:inputLocation")
+        self.assertTrue(attribute.is_valid())
+        expected_value = "DEVICE"
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:linearAccelerations"))
+        attribute = test_node.get_attribute("inputs:linearAccelerations")
+        self.assertTrue(attribute.is_valid())
+        expected_value = []
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:orientations"))
+        attribute = test_node.get_attribute("inputs:orientations")
+        self.assertTrue(attribute.is_valid())
+        expected_value = []
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:packPixels"))
+        attribute = test_node.get_attribute("inputs:packPixels")
+        self.assertTrue(attribute.is_valid())
+        expected_value = False
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:ports"))
+        attribute = test_node.get_attribute("inputs:ports")
+        self.assertTrue(attribute.is_valid())
+        expected_value = []
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:serialNumbers"))
+        attribute = test_node.get_attribute("inputs:serialNumbers")
+        self.assertTrue(attribute.is_valid())
+        expected_value = []
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:simulationTime"))
+        attribute = test_node.get_attribute("inputs:simulationTime")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 0.0
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:stream"))
+        attribute = test_node.get_attribute("inputs:stream")
+        self.assertTrue(attribute.is_valid())
+        expected_value = False
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:tileColumns"))
+        attribute = test_node.get_attribute("inputs:tileColumns")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 0
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:tilesLeft"))
+        attribute = test_node.get_attribute("inputs:tilesLeft")
+        self.assertTrue(attribute.is_valid())
+        expected_value = []
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:tilesRight"))
+        attribute = test_node.get_attribute("inputs:tilesRight")
+        self.assertTrue(attribute.is_valid())
+        expected_value = []
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:transportLayerMode"))
+        attribute = test_node.get_attribute("inputs:transportLayerMode")
+        self.assertTrue(attribute.is_valid())
+        expected_value = "BOTH"
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:width"))
+        attribute = test_node.get_attribute("inputs:width")
+        self.assertTrue(attribute.is_valid())
+        expected_value = 1920
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:yuvLayout"))
+        attribute = test_node.get_attribute("inputs:yuvLayout")
+        self.assertTrue(attribute.is_valid())
+        expected_value = "YUYV"
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:framesDropped"))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:framesGated"))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:framesStreamed"))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:streamFps"))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:streamStatuses"))
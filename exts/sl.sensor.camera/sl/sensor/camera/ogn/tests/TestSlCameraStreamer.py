@@ -113,6 +113,15 @@ class TestOgn(ogts.OmniGraphTestCase):
         actual_value = og.Controller.get(attribute)
         ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
         ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+        self.assertTrue(test_node.get_attribute_exists("inputs:warmRestart"))
+        attribute = test_node.get_attribute("inputs:warmRestart")
+        self.assertTrue(attribute.is_valid())
+        db_value = database.inputs.warmRestart
+        database.inputs.warmRestart = db_value
+        expected_value = False
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
         temp_setting = database.inputs._setting_locked
         database.inputs._testing_sample_value = True
         database.inputs._setting_locked = temp_setting
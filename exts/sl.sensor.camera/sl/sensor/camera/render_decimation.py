@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+# Schedules the rendering of a camera on the frames its frame rate streams.
+
+
+class RenderDecimator:
+    """
+    Decides which simulation frames a camera of fps frames per second renders, on the schedule of the frame rate gate
+    of the ZED node: a frame is rendered once its simulation time reaches the next due time, which then moves one
+    period later. A frame that missed a whole period, after a pause or a jump of the simulation clock, restarts the
+    schedule one period after it, so that the missed frames are not caught up in a burst.
+
+    The decision is taken before the frame is simulated, its time is predicted from the previous frame and the last
+    simulation step. A frame that is not rendered keeps the previous image, which the ZED node does not stream again.
+    """
+
+    def __init__(self, fps: float):
+        self.period = 1.0 / fps if fps > 0 else 0.0
+        self.reset()
+
+    def reset(self) -> None:
+        self._next_time = None
+        self._last_time = None
+        self._step = 0.0
+        self._rendered_last = False
+        self.frames_rendered = 0
+        self.frames_skipped = 0
+
+    def should_render(self, simulation_time: float) -> bool:
+        """Called before each frame with the simulation time of the previous one, returns whether to render the frame."""
+        # Time went backwards: the simulation was restarted
+        if self._last_time is not None and simulation_time < self._last_time:
+            self.reset()
+        if self._last_time is not None and simulation_time > self._last_time:
+            self._step = simulation_time - self._last_time
+        self._last_time = simulation_time
+
+        # The time of the previous frame is now known, the schedule moves on from it if it was rendered
+        if self._rendered_last:
+            if self._next_time is None or simulation_time >= self._next_time + self.period:
+                self._next_time = simulation_time + self.period
+            else:
+                self._next_time += self.period
+
+        frame_time = simulation_time + self._step
+        # Tolerance absorbs the floating point error accumulated by the simulation clock, like in the ZED node
+        self._rendered_last = self._next_time is None or frame_time + self.period * 1e-3 >= self._next_time
+        if self._rendered_last:
+            self.frames_rendered += 1
+        else:
+            self.frames_skipped += 1
+        return self._rendered_last
+
+    def get_stats(self) -> dict:
+        return {"framesRendered": self.frames_rendered, "framesNotRendered": self.frames_skipped}
@@ -0,0 +1,6 @@
+from .test_frame_rate_gating import *
+from .test_dataset_export import *
+from .test_annotator_teardown import *
+from .test_high_rate_imu import *
+from .test_render_decimation import *
+from .test_stream_batch import *
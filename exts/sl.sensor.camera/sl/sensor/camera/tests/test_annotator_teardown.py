@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+import omni.kit.test
+import omni.usd
+from pxr import Sdf
+
+from ..annotators import ZEDAnnotator
+
+
+class TestAnnotatorTeardown(omni.kit.test.AsyncTestCase):
+    """Annotators rejected for their camera prims are destroyed without error."""
+
+    async def setUp(self):
+        await omni.usd.get_context().new_stage_async()
+
+    async def test_destroy_without_camera_prims(self):
+        for render_decimation in (False, True):
+            annotator = ZEDAnnotator([], render_decimation=render_decimation)
+            annotator.destroy()
+            self.assertEqual(annotator.nodes, [])
+            self.assertEqual(annotator.get_stream_stats(), {})
+
+    async def test_destroy_with_too_many_camera_prims(self):
+        camera_prims = [Sdf.Path(f"/World/ZED_{i}") for i in range(3)]
+        annotator = ZEDAnnotator(camera_prims, streaming_port=30010, export_dir="unused")
+        annotator.destroy()
+        self.assertIsNone(annotator.dataset_writer)
+        self.assertEqual(annotator.get_render_products(), [])
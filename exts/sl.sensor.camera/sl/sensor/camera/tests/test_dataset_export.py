@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+import csv
+import math
+import multiprocessing
+import os
+import tempfile
+
+import numpy as np
+import omni.kit.test
+
+from ..dataset_export import DatasetWriter
+
+
+class TestDatasetExport(omni.kit.test.AsyncTestCase):
+    """Frames are encoded by worker processes and listed in capture order."""
+
+    async def setUp(self):
+        self.output = tempfile.TemporaryDirectory()
+        self.image = np.zeros((40, 64, 4), dtype=np.uint8)
+        self.image[..., 0] = np.arange(64, dtype=np.uint8)
+
+    async def tearDown(self):
+        self.output.cleanup()
+
+    def read_rows(self, output = None):
+        with open(os.path.join(output or self.output.name, "frames.csv"), newline="") as f:
+            return list(csv.DictReader(f))
+
+    async def test_frames_written_in_order(self):
+        # The workers must neither fork Kit nor import it, the extension or the main module of this process
+        start_methods = [method for method in ("spawn", "forkserver") if method in multiprocessing.get_all_start_methods()]
+        for start_method in start_methods:
+            with self.subTest(start_method=start_method):
+                output = os.path.join(self.output.name, start_method)
+                writer = DatasetWriter(output, "png", workers=2, queue_depth=4, block=True, start_method=start_method)
+                self.assertTrue(writer.processes)
+                self.assertEqual(writer.worker_modules(), [])
+                imu = [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 9.81, 0.0, 0.0, 0.0]
+                for frame in range(10):
+                    self.assertTrue(writer.write(frame, frame / 30.0, self.image, self.image, imu))
+                writer.close()
+
+                stats = writer.get_stats()
+                self.assertEqual((stats["framesWritten"], stats["framesDropped"], stats["errors"]), (10, 0, 0))
+                rows = self.read_rows(output)
+                self.assertEqual([int(row["frame"]) for row in rows], list(range(10)))
+                self.assertEqual(float(rows[3]["linear_acceleration_z"]), 9.81)
+                for side in ("left", "right"):
+                    self.assertTrue(os.path.getsize(os.path.join(output, side, rows[9][side])) > 0)
+
+    async def test_fork_rejected(self):
+        with self.assertRaises(ValueError):
+            DatasetWriter(self.output.name, start_method="fork")
+
+    async def test_frames_dropped_when_workers_fall_behind(self):
+        writer = DatasetWriter(self.output.name, "jpg", workers=1, queue_depth=1)
+        accepted = [writer.write(frame, frame / 30.0, self.image) for frame in range(20)]
+        writer.close()
+
+        self.assertTrue(accepted[0])
+        stats = writer.get_stats()
+        self.assertEqual(stats["framesWritten"], accepted.count(True))
+        self.assertEqual(stats["framesDropped"], accepted.count(False))
+        self.assertTrue(all(row["right"] == "" for row in self.read_rows()))
+
+    async def test_imu_orientation_order(self):
+        # Body rotated by 60 degrees about z: (x, y, z, w) = (0, 0, 0.5, 0.866), in w, x, y, z order it reads (0.866, 0, 0, 0.5)
+        try:
+            from isaacsim.sensors.physics import _sensor
+        except ImportError:
+            self.skipTest("isaacsim.sensors.physics is not enabled")
+        import omni.kit.app
+        import omni.kit.commands
+        import omni.timeline
+        import omni.usd
+        from pxr import UsdGeom, UsdPhysics
+
+        from ..annotators import ZEDAnnotator
+
+        await omni.usd.get_context().new_stage_async()
+        stage = omni.usd.get_context().get_stage()
+        UsdPhysics.Scene.Define(stage, "/physicsScene")
+        body = UsdGeom.Xform.Define(stage, "/World/Body")
+        UsdGeom.XformCommonAPI(body).SetRotate((0.0, 0.0, 60.0))
+        UsdPhysics.RigidBodyAPI.Apply(body.GetPrim()).CreateKinematicEnabledAttr(True)
+        omni.kit.commands.execute("IsaacSensorCreateImuSensor", path="/Imu_Sensor", parent="/World/Body")
+
+        timeline = omni.timeline.get_timeline_interface()
+        timeline.play()
+        for _ in range(10):
+            await omni.kit.app.get_app().next_update_async()
+        reading = _sensor.acquire_imu_sensor_interface().get_sensor_reading("/World/Body/Imu_Sensor", use_latest_data=True)
+        timeline.stop()
+        self.assertTrue(reading.is_valid)
+
+        writer = DatasetWriter(self.output.name, workers=1, block=True)
+        writer.write(0, 0.0, self.image, imu=ZEDAnnotator.imu_sample(reading))
+        writer.close()
+        row = self.read_rows()[0]
+        orientation = [float(row[f"orientation_{axis}"]) for axis in "xyzw"]
+        # q and -q are the same rotation
+        sign = 1.0 if orientation[3] >= 0.0 else -1.0
+        expected = [0.0, 0.0, 0.5, math.cos(math.radians(30.0))]
+        for value, expected_value in zip(orientation, expected):
+            self.assertAlmostEqual(sign * value, expected_value, places=3)
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+import os
+import sys
+
+import numpy as np
+import omni.graph.core as og
+import omni.graph.core.tests as ogts
+import omni.kit.app
+
+# Simulation time at which the ZED Stream node initializes its streamer, frames start after it
+WARMUP_TIME = 1.0
+
+
+def get_stub_library_path():
+    """Path of the stand-in ZED streaming library built with the extension."""
+    ext_path = omni.kit.app.get_app().get_extension_manager().get_extension_path_by_module("sl.sensor.camera")
+    lib_name = "sl_zed_stub.dll" if sys.platform == "win32" else "libsl_zed_stub.so"
+    return os.path.join(ext_path, "bin", lib_name)
+
+
+class TestFrameRateGating(ogts.OmniGraphTestCase):
+    """Frames rendered faster than the camera frame rate are gated before any copy."""
+
+    async def setUp(self):
+        await super().setUp()
+        self.stub_path = get_stub_library_path()
+        if not os.path.exists(self.stub_path):
+            self.skipTest(f"{self.stub_path} not found")
+
+        # Read by the node when it is created
+        self.previous_library = os.environ.get("SL_ZED_LIBRARY")
+        os.environ["SL_ZED_LIBRARY"] = self.stub_path
+
+        # Host image streamed in place by the node, 4 bytes per pixel
+        self.width, self.height = 64, 40
+        self.image = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+
+    async def tearDown(self):
+        if self.previous_library is None:
+            os.environ.pop("SL_ZED_LIBRARY", None)
+        else:
+            os.environ["SL_ZED_LIBRARY"] = self.previous_library
+        await super().tearDown()
+
+    async def stream(self, fps, times, name):
+        """Renders frames at the given simulation times and returns the frames streamed and gated by the node."""
+        keys = og.Controller.Keys
+        (graph, (zed_node,), _, _) = og.Controller.edit(
+            {"graph_path": f"/TestGraph_{name}", "evaluator_name": "push"},
+            {
+                keys.CREATE_NODES: [("zed", "sl.sensor.camera.OgnZEDSimCameraNode")],
+                keys.SET_VALUES: [
+                    ("zed.inputs:stream", True),
+                    ("zed.inputs:cameraModel", "ZED_XONE_GS"),
+                    ("zed.inputs:transportLayerMode", "NETWORK"),
+                    ("zed.inputs:inputLocation", "HOST"),
+                    ("zed.inputs:fps", fps),
+                    ("zed.inputs:width", self.width),
+                    ("zed.inputs:height", self.height),
+                    ("zed.inputs:dataPtrLeft", self.image.ctypes.data),
+                    ("zed.inputs:bufferSizeLeft", self.image.nbytes),
+                    ("zed.inputs:simulationTime", WARMUP_TIME),
+                ],
+            },
+        )
+
+        # First evaluation initializes the streamer
+        await og.Controller.evaluate(graph)
+
+        for time in times:
+            og.Controller.set(og.Controller.attribute("inputs:simulationTime", zed_node), time)
+            await og.Controller.evaluate(graph)
+
+        self.assertEqual(og.Controller.get(og.Controller.attribute("outputs:streamStatus", zed_node)), 1)
+        streamed = og.Controller.get(og.Controller.attribute("outputs:framesStreamed", zed_node))
+        gated = og.Controller.get(og.Controller.attribute("outputs:framesGated", zed_node))
+        return streamed, gated
+
+    async def stream_one_second(self, fps, render_rate):
+        """Renders one simulated second at render_rate."""
+        times = [WARMUP_TIME + frame / render_rate for frame in range(1, render_rate + 1)]
+        return await self.stream(fps, times, f"{fps}_{render_rate}")
+
+    async def test_frames_streamed_per_simulated_second(self):
+        for fps, render_rate in [(30, 120), (15, 120), (30, 50), (60, 60)]:
+            with self.subTest(fps=fps, render_rate=render_rate):
+                expected = min(fps, render_rate)
+                streamed, gated = await self.stream_one_second(fps, render_rate)
+                self.assertEqual(streamed, expected)
+                self.assertEqual(gated, render_rate - expected)
+
+    async def test_time_jump_does_not_burst(self):
+        # Half a second at 60 Hz, then half a second after a 10 s jump of the simulation clock: a 30 fps camera streams
+        # every other frame in both halves, the frames missed during the jump are not caught up
+        times = [WARMUP_TIME + frame / 60 for frame in range(1, 31)]
+        times += [WARMUP_TIME + 10.0 + frame / 60 for frame in range(1, 31)]
+        streamed, gated = await self.stream(30, times, "jump")
+        self.assertEqual(streamed, 30)
+        self.assertEqual(gated, 30)
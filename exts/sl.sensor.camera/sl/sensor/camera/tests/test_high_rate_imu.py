@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import ctypes
+import math
+import os
+
+import numpy as np
+import omni.graph.core as og
+import omni.graph.core.tests as ogts
+
+from .test_frame_rate_gating import WARMUP_TIME, get_stub_library_path
+
+PORT = 30100
+
+
+class TestHighRateImu(ogts.OmniGraphTestCase):
+    """With the high-rate IMU channel, the ZED SDK receives the samples of the IMU Stream node only."""
+
+    async def setUp(self):
+        await super().setUp()
+        self.stub_path = get_stub_library_path()
+        if not os.path.exists(self.stub_path):
+            self.skipTest(f"{self.stub_path} not found")
+
+        self.previous_library = os.environ.get("SL_ZED_LIBRARY")
+        os.environ["SL_ZED_LIBRARY"] = self.stub_path
+
+        # Same library instance as the one loaded by the node
+        self.stub = ctypes.CDLL(self.stub_path)
+        self.stub.sl_zed_stub_last_imu.restype = ctypes.c_bool
+        self.stub.sl_zed_stub_last_imu.argtypes = [
+            ctypes.c_ushort, ctypes.POINTER(ctypes.c_longlong), ctypes.POINTER(ctypes.c_float),
+            ctypes.POINTER(ctypes.c_longlong), ctypes.POINTER(ctypes.c_float),
+        ]
+
+        self.width, self.height = 64, 40
+        self.image = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+
+    async def tearDown(self):
+        if self.previous_library is None:
+            os.environ.pop("SL_ZED_LIBRARY", None)
+        else:
+            os.environ["SL_ZED_LIBRARY"] = self.previous_library
+        await super().tearDown()
+
+    def last_imu(self):
+        """Last sample given with a frame and to ingest_imu, with their timestamps."""
+        frame_ts, ingested_ts = ctypes.c_longlong(), ctypes.c_longlong()
+        frame_imu, ingested_imu = (ctypes.c_float * 7)(), (ctypes.c_float * 7)()
+        self.assertTrue(self.stub.sl_zed_stub_last_imu(PORT, frame_ts, frame_imu, ingested_ts, ingested_imu))
+        return frame_ts.value, list(frame_imu), ingested_ts.value, list(ingested_imu)
+
+    async def test_frames_carry_channel_samples(self):
+        keys = og.Controller.Keys
+        (graph, (zed_node, imu_node), _, _) = og.Controller.edit(
+            {"graph_path": "/TestHighRateImu", "evaluator_name": "push"},
+            {
+                keys.CREATE_NODES: [
+                    ("zed", "sl.sensor.camera.OgnZEDSimCameraNode"),
+                    ("imu", "sl.sensor.camera.OgnZEDSimImuNode"),
+                ],
+                keys.SET_VALUES: [
+                    ("zed.inputs:stream", True),
+                    ("zed.inputs:cameraModel", "ZED_XONE_GS"),
+                    ("zed.inputs:transportLayerMode", "NETWORK"),
+                    ("zed.inputs:inputLocation", "HOST"),
+                    ("zed.inputs:port", PORT),
+                    ("zed.inputs:fps", 60),
+                    ("zed.inputs:width", self.width),
+                    ("zed.inputs:height", self.height),
+                    ("zed.inputs:dataPtrLeft", self.image.ctypes.data),
+                    ("zed.inputs:bufferSizeLeft", self.image.nbytes),
+                    ("zed.inputs:highRateImu", True),
+                    # Ignored while the IMU Stream node sends samples
+                    ("zed.inputs:linearAcceleration", [1.0, 2.0, 3.0]),
+                    ("zed.inputs:simulationTime", WARMUP_TIME),
+                    ("imu.inputs:port", PORT),
+                    ("imu.inputs:imuRate", 0),
+                    ("imu.inputs:linearAcceleration", [0.0, 0.0, 9.81]),
+                ],
+            },
+        )
+
+        # First evaluation initializes the streamer and the IMU channel
+        await og.Controller.evaluate(graph)
+
+        for frame in range(1, 31):
+            simulation_time = WARMUP_TIME + frame / 60.0
+            og.Controller.set(og.Controller.attribute("inputs:simulationTime", imu_node), simulation_time)
+            og.Controller.set(og.Controller.attribute("inputs:simulationTime", zed_node), simulation_time)
+            await og.Controller.evaluate(graph)
+        # Lets the channel thread ingest the last samples
+        await asyncio.sleep(0.1)
+
+        # The nodes are not ordered: a sample pushed at the time of a frame is either carried by that frame or superseded
+        # by it, so none may have been ingested (see benchmarks/high_rate_imu_benchmark.cpp, which runs both orders)
+        frame_ts, frame_imu, ingested_ts, ingested_imu = self.last_imu()
+        self.assertGreaterEqual(frame_ts, ingested_ts)
+        self.assertAlmostEqual(math.sqrt(sum(value * value for value in frame_imu[4:])), 9.81, places=4)
+        if ingested_ts > 0:
+            for frame_value, ingested_value in zip(frame_imu, ingested_imu):
+                self.assertAlmostEqual(frame_value, ingested_value, places=5)
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+from types import SimpleNamespace
+
+import omni.kit.test
+
+from ..annotators import ZEDRenderDecimation
+from ..render_decimation import RenderDecimator
+
+
+def rendered_frames(decimator, step, frame_count, start = 0.0):
+    """Frames rendered among frame_count frames simulated every step seconds, numbered from 1."""
+    frames = []
+    for frame in range(1, frame_count + 1):
+        # Called before each frame with the time of the previous one
+        if decimator.should_render(start + (frame - 1) * step):
+            frames.append(frame)
+    return frames
+
+
+def camera():
+    """Stand-in for a ZEDAnnotator, recording the frames it is asked to render."""
+    annotator = SimpleNamespace(decisions=[])
+    annotator._apply_render_updates = annotator.decisions.append
+    return annotator
+
+
+class TestRenderDecimation(omni.kit.test.AsyncTestCase):
+    """Cameras only render the frames their frame rate streams."""
+
+    async def test_divisor_rate(self):
+        decimator = RenderDecimator(15)
+        self.assertEqual(rendered_frames(decimator, 1.0 / 60.0, 12), [1, 5, 9])
+        self.assertEqual(decimator.get_stats(), {"framesRendered": 3, "framesNotRendered": 9})
+
+    async def test_rate_above_simulation(self):
+        decimator = RenderDecimator(60)
+        self.assertEqual(rendered_frames(decimator, 1.0 / 30.0, 10), list(range(1, 11)))
+
+    async def test_non_divisor_rate(self):
+        # 15 fps out of 50 simulated frames per second, on average
+        decimator = RenderDecimator(15)
+        frames = rendered_frames(decimator, 1.0 / 50.0, 500)
+        self.assertEqual(len(frames), 150)
+        gaps = {b - a for a, b in zip(frames, frames[1:])}
+        self.assertEqual(gaps, {3, 4})
+
+    async def test_restart(self):
+        decimator = RenderDecimator(30)
+        rendered_frames(decimator, 1.0 / 60.0, 7, start=10.0)
+        # The simulation time starts over, the next frame renders right away
+        self.assertTrue(decimator.should_render(0.0))
+        self.assertEqual(decimator.frames_rendered, 1)
+
+    async def test_time_jump_does_not_burst(self):
+        decimator = RenderDecimator(30)
+        self.assertEqual(rendered_frames(decimator, 1.0 / 60.0, 4), [1, 3])
+        # The simulation time jumps ahead: like the frame rate gate of the ZED node, the schedule restarts from the
+        # late frame instead of catching up on the missed ones
+        self.assertEqual(rendered_frames(decimator, 1.0 / 60.0, 8, start=10.0), [1, 3, 5, 7])
+
+    async def test_cameras_of_a_sync_gate_render_the_same_frames(self):
+        # Two 15 fps cameras of the same sync gate, the second one starting two frames after the first
+        render_decimation = ZEDRenderDecimation.get("zed_15fps_test", 15)
+        first, second = camera(), camera()
+        render_decimation.add(first)
+        try:
+            for frame in range(1, 13):
+                if frame == 3:
+                    self.assertIs(ZEDRenderDecimation.get("zed_15fps_test", 15), render_decimation)
+                    render_decimation.add(second)
+                render_decimation.update(True, (frame - 1) / 60.0)
+            self.assertEqual([frame for frame, rendered in enumerate(first.decisions, 1) if rendered], [1, 5, 9])
+            # The second camera joins the schedule of the first instead of rendering on the frame it starts
+            self.assertEqual(second.decisions, first.decisions[2:])
+        finally:
+            render_decimation.remove(first)
+            render_decimation.remove(second)
+        self.assertNotIn("zed_15fps_test", ZEDRenderDecimation._instances)
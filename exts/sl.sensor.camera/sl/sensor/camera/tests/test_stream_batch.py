@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+from types import SimpleNamespace
+
+import omni.kit.test
+
+from ..annotators import ZEDStreamBatch
+
+
+def camera(port, tiled_render, **settings):
+    """Stand-in for a ZEDAnnotator of a tiled fleet, with the attributes read to batch it."""
+    annotator = SimpleNamespace(
+        port=port, tiled_render=tiled_render, annotators={"Left": object()}, batch_streaming=True, share_time_nodes=True,
+        async_streaming=False, pipeline_depth=1, session_pooling=False, resolution=(960, 600), fps=30,
+        transport_layer_mode="BOTH", bitrate=10000, chunk_size=4096, device="cuda", pack_pixels=False,
+        yuv_layout="YUYV", graph=None, _graph_path="/Render/PostProcess/SDGPipeline", _batch=None,
+    )
+    annotator.__dict__.update(settings)
+    annotator._time_nodes_suffix = lambda: f"zed_{annotator.fps}fps"
+    return annotator
+
+
+class TestStreamBatch(omni.kit.test.AsyncTestCase):
+    """Cameras of a tiled render product sharing their streaming settings are streamed by one node."""
+
+    async def test_tiled_fleet(self):
+        tiled_render = object()
+        annotators = [camera(30000 + 2 * i, tiled_render) for i in range(4)]
+        batches = ZEDStreamBatch.group(annotators)
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0].annotators, annotators)
+        self.assertEqual(batches[0].name, "zed_multi_30000")
+        self.assertTrue(all(annotator._batch is batches[0] for annotator in annotators))
+
+    async def test_split_by_settings(self):
+        tiled_render = object()
+        annotators = [camera(30000, tiled_render), camera(30002, tiled_render, fps=15), camera(30004, tiled_render),
+                      camera(30006, tiled_render, fps=15)]
+        batches = ZEDStreamBatch.group(annotators)
+        self.assertEqual([[annotator.port for annotator in batch.annotators] for batch in batches],
+                         [[30000, 30004], [30002, 30006]])
+
+    async def test_cameras_not_batched(self):
+        tiled_render = object()
+        for settings in ({"batch_streaming": False}, {"async_streaming": True}, {"pipeline_depth": 2},
+                         {"session_pooling": True}, {"share_time_nodes": False}, {"annotators": {}}):
+            annotators = [camera(30000, tiled_render), camera(30002, tiled_render, **settings)]
+            self.assertEqual(ZEDStreamBatch.group(annotators), [], settings)
+            self.assertIsNone(annotators[0]._batch)
+
+        # Untiled cameras, and a single camera per tiled render product
+        self.assertEqual(ZEDStreamBatch.group([camera(30000, None), camera(30002, None)]), [])
+        self.assertEqual(ZEDStreamBatch.group([camera(30000, object()), camera(30002, object())]), [])
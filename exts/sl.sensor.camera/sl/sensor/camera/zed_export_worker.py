@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+# Image encoding run by the dataset export worker processes.
+# Imported by the workers as a top-level module, not as part of sl.sensor.camera, so that they load neither Kit nor
+# the extension: it must only depend on numpy and Pillow.
+
+import os
+import sys
+
+import numpy as np
+
+IMAGE_FORMATS = {"png": "PNG", "jpg": "JPEG"}
+
+# Modules the workers must not import: Kit and the extension. Nor may they run the main module of the process that
+# started them, imported by spawned workers as __mp_main__.
+UNEXPECTED_MODULES = ("carb", "omni.ext", "omni.kit.app", "sl.sensor.camera")
+
+
+def encode_image(path: str, image: np.ndarray, image_format: str, jpeg_quality: int) -> int:
+    """Encodes an RGB or RGBA image to path, the alpha channel is dropped. Returns the file size."""
+    from PIL import Image
+
+    Image.fromarray(np.ascontiguousarray(image[..., :3])).save(path, IMAGE_FORMATS[image_format], quality=jpeg_quality)
+    return os.path.getsize(path)
+
+
+def unexpected_modules() -> list:
+    """
+    Modules of UNEXPECTED_MODULES imported by this process, sorted, and __mp_main__ if it runs the main module of the
+    parent process. Otherwise __mp_main__ is the main module of the worker itself, which has no file.
+    """
+    modules = sorted(set(sys.modules) & set(UNEXPECTED_MODULES))
+    if getattr(sys.modules.get("__mp_main__"), "__file__", None) is not None:
+        modules.append("__mp_main__")
+    return modules
@@ -0,0 +1,312 @@
+// Stand-in for the ZED SDK streaming library (libsl_zed), exporting the C functions resolved by sl::ZedStreamer.
+// Frames are not encoded nor sent anywhere: every call only sleeps for a configurable time, so the streaming path
+// can be exercised and benchmarked deterministically without a ZED SDK or a GPU.
+//
+// Select it instead of the ZED SDK by setting SL_ZED_LIBRARY to its path before starting Isaac Sim.
+// It is configured with the following environment variables, read when the library is loaded:
+//   SL_ZED_STUB_ENCODE_LATENCY_US  time spent in each stream_rgb / stream_yuv call (default 0)
+//   SL_ZED_STUB_INIT_LATENCY_US    time spent in each init_streamer call (default 0)
+//   SL_ZED_STUB_FAIL_EVERY         every Nth stream call of a streamer returns an error (default 0, never)
+//   SL_ZED_STUB_FAIL_INIT          init_streamer returns an error when set to 1
+//   SL_ZED_STUB_SDK_VERSION        version reported to the extension (default "5.1.0")
+//   SL_ZED_STUB_LOG                path of a CSV file logging every call
+//
+// Build it standalone (Linux):
+//   g++ -O2 -std=c++17 -shared -fPIC -pthread -I../include sl_zed_stub.cpp -o libsl_zed_stub.so
+
+#include <algorithm>
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <map>
+#include <mutex>
+#include <string>
+#include <thread>
+
+#include "types_c.h"
+
+#ifdef _WIN32
+#define SL_STUB_EXPORT extern "C" __declspec(dllexport)
+#else
+#define SL_STUB_EXPORT extern "C" __attribute__((visibility("default")))
+#endif
+
+namespace
+{
+    using Clock = std::chrono::steady_clock;
+
+    // Error codes returned by the stub
+    constexpr int kStubErrorNotInitialized = -2;
+    constexpr int kStubErrorInjected = -3;
+
+    long long envInt(const char* name, long long default_value)
+    {
+        const char* value = std::getenv(name);
+        return value && *value ? std::atoll(value) : default_value;
+    }
+
+    struct StubConfig {
+        long long encode_latency_us{ 0 };
+        long long init_latency_us{ 0 };
+        long long fail_every{ 0 };
+        bool fail_init{ false };
+        int sdk_version[3]{ 5, 1, 0 };
+        std::string log_path;
+
+        StubConfig() {
+            encode_latency_us = envInt("SL_ZED_STUB_ENCODE_LATENCY_US", 0);
+            init_latency_us = envInt("SL_ZED_STUB_INIT_LATENCY_US", 0);
+            fail_every = envInt("SL_ZED_STUB_FAIL_EVERY", 0);
+            fail_init = envInt("SL_ZED_STUB_FAIL_INIT", 0) == 1;
+
+            const char* version = std::getenv("SL_ZED_STUB_SDK_VERSION");
+            if (version && *version) {
+                std::sscanf(version, "%d.%d.%d", &sdk_version[0], &sdk_version[1], &sdk_version[2]);
+            }
+            const char* log_path_env = std::getenv("SL_ZED_STUB_LOG");
+            if (log_path_env) {
+                log_path = log_path_env;
+            }
+        }
+    };
+
+    struct StubStreamer {
+        sl::StreamingParameters params;
+        unsigned long long frames{ 0 };
+        unsigned long long failures{ 0 };
+        unsigned long long imu_samples{ 0 };
+        long long last_timestamp_ns{ 0 };
+        // Last IMU sample given with a frame and to ingest_imu: qw, qx, qy, qz, lin_acc_x, lin_acc_y, lin_acc_z
+        float frame_imu[7]{ 1.f, 0.f, 0.f, 0.f, 0.f, 0.f, 0.f };
+        float ingested_imu[7]{ 1.f, 0.f, 0.f, 0.f, 0.f, 0.f, 0.f };
+        long long ingested_timestamp_ns{ 0 };
+    };
+
+    class Stub {
+    public:
+        static Stub& instance() {
+            static Stub stub;
+            return stub;
+        }
+
+        const StubConfig& config() const { return config_; }
+
+        int init(int streamer_id, const sl::StreamingParameters& params) {
+            sleepUs(config_.init_latency_us);
+            std::lock_guard<std::mutex> lock(mutex_);
+            const int status = config_.fail_init ? -1 : 1;
+            if (status > 0) {
+                StubStreamer streamer;
+                streamer.params = params;
+                streamers_[streamer_id] = streamer;
+            }
+            log("init_streamer", streamer_id, 0, 0, status);
+            return status;
+        }
+
+        int stream(const char* function, int streamer_id, long long timestamp_ns, const float* imu) {
+            const auto start = Clock::now();
+            int status = 1;
+            {
+                std::lock_guard<std::mutex> lock(mutex_);
+                auto it = streamers_.find(streamer_id);
+                if (it == streamers_.end()) {
+                    status = kStubErrorNotInitialized;
+                } else {
+                    StubStreamer& streamer = it->second;
+                    const unsigned long long call_index = streamer.frames + streamer.failures + 1;
+                    if (config_.fail_every > 0 && call_index % config_.fail_every == 0) {
+                        streamer.failures++;
+                        status = kStubErrorInjected;
+                    } else {
+                        streamer.frames++;
+                        streamer.last_timestamp_ns = timestamp_ns;
+                        std::copy(imu, imu + 7, streamer.frame_imu);
+                    }
+                }
+            }
+
+            // The encoding time of each streamer is independent, calls for different streamers overlap
+            if (status > 0) {
+                sleepUs(config_.encode_latency_us);
+            }
+
+            const long long duration_us = std::chrono::duration_cast<std::chrono::microseconds>(Clock::now() - start).count();
+            std::lock_guard<std::mutex> lock(mutex_);
+            log(function, streamer_id, timestamp_ns, duration_us, status);
+            return status;
+        }
+
+        int ingestImu(int streamer_id, long long timestamp_ns, const float* imu) {
+            std::lock_guard<std::mutex> lock(mutex_);
+            auto it = streamers_.find(streamer_id);
+            const int status = it == streamers_.end() ? kStubErrorNotInitialized : 1;
+            if (status > 0) {
+                it->second.imu_samples++;
+                it->second.ingested_timestamp_ns = timestamp_ns;
+                std::copy(imu, imu + 7, it->second.ingested_imu);
+            }
+            log("ingest_imu", streamer_id, timestamp_ns, 0, status);
+            return status;
+        }
+
+        void close(int streamer_id) {
+            std::lock_guard<std::mutex> lock(mutex_);
+            streamers_.erase(streamer_id);
+            log("close_streamer", streamer_id, 0, 0, 0);
+        }
+
+        void destroy() {
+            std::lock_guard<std::mutex> lock(mutex_);
+            streamers_.clear();
+            log("destroy_instance", -1, 0, 0, 0);
+            if (log_file_) {
+                std::fflush(log_file_);
+            }
+        }
+
+        bool counters(int streamer_id, unsigned long long* frames, unsigned long long* failures, unsigned long long* imu_samples) {
+            std::lock_guard<std::mutex> lock(mutex_);
+            auto it = streamers_.find(streamer_id);
+            if (it == streamers_.end())
+                return false;
+            *frames = it->second.frames;
+            *failures = it->second.failures;
+            *imu_samples = it->second.imu_samples;
+            return true;
+        }
+
+        bool lastImu(unsigned short port, long long* frame_timestamp_ns, float* frame_imu, long long* ingested_timestamp_ns,
+            float* ingested_imu) {
+            std::lock_guard<std::mutex> lock(mutex_);
+            for (const auto& entry : streamers_) {
+                const StubStreamer& streamer = entry.second;
+                if (streamer.params.port != port)
+                    continue;
+                *frame_timestamp_ns = streamer.last_timestamp_ns;
+                *ingested_timestamp_ns = streamer.ingested_timestamp_ns;
+                std::copy(streamer.frame_imu, streamer.frame_imu + 7, frame_imu);
+                std::copy(streamer.ingested_imu, streamer.ingested_imu + 7, ingested_imu);
+                return true;
+            }
+            return false;
+        }
+
+    private:
+        Stub() : start_(Clock::now()) {
+            if (!config_.log_path.empty()) {
+                log_file_ = std::fopen(config_.log_path.c_str(), "w");
+                if (log_file_) {
+                    std::fprintf(log_file_, "time_us,function,streamer_id,timestamp_ns,duration_us,status\n");
+                }
+            }
+        }
+
+        ~Stub() {
+            if (log_file_) {
+                std::fclose(log_file_);
+            }
+        }
+
+        static void sleepUs(long long us) {
+            if (us > 0) {
+                std::this_thread::sleep_for(std::chrono::microseconds(us));
+            }
+        }
+
+        // Called with the lock held
+        void log(const char* function, int streamer_id, long long timestamp_ns, long long duration_us, int status) {
+            if (!log_file_)
+                return;
+            const long long time_us = std::chrono::duration_cast<std::chrono::microseconds>(Clock::now() - start_).count();
+            std::fprintf(log_file_, "%lld,%s,%d,%lld,%lld,%d\n", time_us, function, streamer_id, timestamp_ns, duration_us, status);
+            // Complete lines only, the log is read while streaming
+            std::fflush(log_file_);
+        }
+
+        const StubConfig config_;
+        const Clock::time_point start_;
+        std::mutex mutex_;
+        std::map<int, StubStreamer> streamers_;
+        std::FILE* log_file_{ nullptr };
+    };
+}
+
+SL_STUB_EXPORT int getZEDSDKRuntimeVersion_C(int& major, int& minor, int& patch)
+{
+    const StubConfig& config = Stub::instance().config();
+    major = config.sdk_version[0];
+    minor = config.sdk_version[1];
+    patch = config.sdk_version[2];
+    return 0;
+}
+
+SL_STUB_EXPORT int init_streamer(int streamer_id, struct sl::StreamingParameters* streaming_params)
+{
+    if (!streaming_params)
+        return -1;
+    return Stub::instance().init(streamer_id, *streaming_params);
+}
+
+SL_STUB_EXPORT int stream_rgb(int streamer_id, unsigned char* left, unsigned char* right, long long timestamp_ns,
+    float qw, float qx, float qy, float qz, float lin_acc_x, float lin_acc_y, float lin_acc_z)
+{
+    const float imu[7] = { qw, qx, qy, qz, lin_acc_x, lin_acc_y, lin_acc_z };
+    return Stub::instance().stream("stream_rgb", streamer_id, timestamp_ns, imu);
+}
+
+SL_STUB_EXPORT int stream_yuv(int streamer_id, unsigned char* left, unsigned char* right, long long timestamp_ns,
+    float qw, float qx, float qy, float qz, float lin_acc_x, float lin_acc_y, float lin_acc_z)
+{
+    const float imu[7] = { qw, qx, qy, qz, lin_acc_x, lin_acc_y, lin_acc_z };
+    return Stub::instance().stream("stream_yuv", streamer_id, timestamp_ns, imu);
+}
+
+SL_STUB_EXPORT int ingest_imu(int streamer_id, long long timestamp_ns, float vx, float vy, float vz,
+    float lin_acc_x, float lin_acc_y, float lin_acc_z, float qw, float qx, float qy, float qz)
+{
+    const float imu[7] = { qw, qx, qy, qz, lin_acc_x, lin_acc_y, lin_acc_z };
+    return Stub::instance().ingestImu(streamer_id, timestamp_ns, imu);
+}
+
+SL_STUB_EXPORT void close_streamer(int streamer_id)
+{
+    Stub::instance().close(streamer_id);
+}
+
+SL_STUB_EXPORT void destroy_instance()
+{
+    Stub::instance().destroy();
+}
+
+SL_STUB_EXPORT int* get_virtual_camera_identifiers(int* size_out)
+{
+    if (size_out) {
+        *size_out = 0;
+    }
+    return nullptr;
+}
+
+SL_STUB_EXPORT bool is_sn_valid(int serial_number)
+{
+    return serial_number > 0;
+}
+
+// Stub only: counters of an initialized streamer, returns false for an unknown streamer
+SL_STUB_EXPORT bool sl_zed_stub_counters(int streamer_id, unsigned long long* frames, unsigned long long* failures,
+    unsigned long long* imu_samples)
+{
+    if (!frames || !failures || !imu_samples)
+        return false;
+    return Stub::instance().counters(streamer_id, frames, failures, imu_samples);
+}
+
+// Stub only: last IMU sample given with a frame and to ingest_imu by the streamer on port, with their timestamps.
+// Samples are qw, qx, qy, qz, lin_acc_x, lin_acc_y, lin_acc_z. Returns false if no streamer uses the port.
+SL_STUB_EXPORT bool sl_zed_stub_last_imu(unsigned short port, long long* frame_timestamp_ns, float* frame_imu,
+    long long* ingested_timestamp_ns, float* ingested_imu)
+{
+    if (!frame_timestamp_ns || !frame_imu || !ingested_timestamp_ns || !ingested_imu)
+        return false;
+    return Stub::instance().lastImu(port, frame_timestamp_ns, frame_imu, ingested_timestamp_ns, ingested_imu);
+}
@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+"""
+Compiles kernels/pixel_format_kernels.cu to PTX with NVRTC and embeds it in include/pixel_format_kernels_ptx.h, so
+that the plugin runs the kernels without being built with nvcc.
+
+NVRTC comes with the CUDA toolkit, or with pip install nvidia-cuda-nvrtc-cu11. The PTX of NVRTC 11.8 loads on any
+driver of CUDA 11.8 or later, a newer NVRTC requires a newer driver.
+
+Usage:
+    python tools/embed_ptx.py [--nvrtc path/to/libnvrtc.so] [--arch compute_52]
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import glob
+import os
+import sys
+
+EXT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE = os.path.join(EXT_DIR, "kernels", "pixel_format_kernels.cu")
+HEADER = os.path.join(EXT_DIR, "include", "pixel_format_kernels_ptx.h")
+INCLUDE_DIR = os.path.join(EXT_DIR, "include")
+
+
+def find_nvrtc():
+    """NVRTC of the CUDA toolkit, or of the nvidia-cuda-nvrtc pip package."""
+    library = ctypes.util.find_library("nvrtc")
+    if library:
+        return library
+    for path in sys.path:
+        candidates = sorted(glob.glob(os.path.join(path, "nvidia", "cuda_nvrtc", "lib", "libnvrtc.so*")))
+        candidates += sorted(glob.glob(os.path.join(path, "nvidia", "cuda_nvrtc", "bin", "nvrtc64_*.dll")))
+        if candidates:
+            return candidates[0]
+    return None
+
+
+def compile_ptx(nvrtc, arch):
+    with open(SOURCE, "rb") as f:
+        source = f.read()
+
+    def check(status, program=None):
+        if status != 0:
+            log = b""
+            if program is not None:
+                size = ctypes.c_size_t()
+                nvrtc.nvrtcGetProgramLogSize(program, ctypes.byref(size))
+                buffer = ctypes.create_string_buffer(size.value)
+                nvrtc.nvrtcGetProgramLog(program, buffer)
+                log = buffer.value
+            nvrtc.nvrtcGetErrorString.restype = ctypes.c_char_p
+            raise RuntimeError(f"NVRTC error: {nvrtc.nvrtcGetErrorString(status).decode()}\n{log.decode()}")
+
+    program = ctypes.c_void_p()
+    check(nvrtc.nvrtcCreateProgram(ctypes.byref(program), source, os.path.basename(SOURCE).encode(), 0, None, None))
+    options = [f"--gpu-architecture={arch}".encode(), f"--include-path={INCLUDE_DIR}".encode(), b"--std=c++14"]
+    try:
+        check(nvrtc.nvrtcCompileProgram(program, len(options), (ctypes.c_char_p * len(options))(*options)), program)
+        size = ctypes.c_size_t()
+        check(nvrtc.nvrtcGetPTXSize(program, ctypes.byref(size)))
+        ptx = ctypes.create_string_buffer(size.value)
+        check(nvrtc.nvrtcGetPTX(program, ptx))
+    finally:
+        nvrtc.nvrtcDestroyProgram(ctypes.byref(program))
+    return ptx.value.decode()
+
+
+def write_header(ptx, arch):
+    # One string literal per line of PTX, a single literal would exceed the limit of some compilers
+    lines = [
+        "// Generated by tools/embed_ptx.py from kernels/pixel_format_kernels.cu, do not edit.",
+        f"// PTX for {arch}, loaded by plugins/nodes/ZEDPixelConversion.h.",
+        "",
+        "#pragma once",
+        "",
+        "namespace sl",
+        "{",
+        "    inline const char* const kPixelFormatKernelsPtx =",
+    ]
+    for line in ptx.splitlines():
+        escaped = line.replace("\\", "\\\\").replace('"', '\\"').replace("\t", "    ")
+        lines.append(f'        "{escaped}\\n"')
+    lines[-1] += ";"
+    lines.append("}")
+    with open(HEADER, "w", newline="\n") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nvrtc", default=None, help="path to the NVRTC library, searched for by default")
+    parser.add_argument("--arch", default="compute_52", help="virtual architecture of the PTX, JIT compiled for newer GPUs")
+    args = parser.parse_args()
+
+    library = args.nvrtc or find_nvrtc()
+    if not library:
+        sys.exit("NVRTC not found, install the CUDA toolkit or nvidia-cuda-nvrtc-cu11, or give --nvrtc")
+    ptx = compile_ptx(ctypes.CDLL(library), args.arch)
+    write_header(ptx, args.arch)
+    print(f"Wrote {os.path.relpath(HEADER, EXT_DIR)} ({len(ptx)} bytes of PTX for {args.arch})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+// Streams a recording of the ZED Stream node (Recording Path input) to the ZED SDK again, without Isaac Sim.
+// Frames are handed to sl::ZedStreamer exactly as they were recorded, oldest first, with their IMU samples, which
+// reproduces a problematic sequence or loads the ZED SDK without a simulation. With several streamers, each one
+// encodes and streams the recording on its own port, so consumers can be load-tested with many more cameras than the
+// simulation renders.
+//
+// Usage:
+//   zed_replay <recording> [--pacing original|fixed|fast] [--fps N] [--loops N] [--streamers N] [--port N]
+//              [--transport NETWORK|IPC|BOTH] [--serial N] [--library PATH]
+//
+//   --pacing   original: frames are spaced like their recorded timestamps (default)
+//              fixed: one frame every 1/fps seconds, --fps defaults to the recorded frame rate
+//              fast: as fast as the ZED SDK accepts them
+//   --loops    number of times the recording is streamed, timestamps keep increasing across loops (default 1)
+//   --streamers  number of streamers replaying the recording at the same time, on ports port, port + 2, ... (default 1)
+//   --serial   serial number of the first streamer, the recorded one by default. The other streamers get serial
+//              numbers with the same leading digits.
+//   --library  ZED streaming library, SL_ZED_LIBRARY or the installed ZED SDK by default
+//
+// Build standalone (Linux), it is also built with the extension:
+//   g++ -O2 -std=c++17 -I../include zed_replay.cpp -ldl -o zed_replay
+
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <string>
+#include <thread>
+#include <unordered_set>
+#include <vector>
+
+#define CARB_LOG_INFO(...) ((void)0)
+#define CARB_LOG_WARN(...) ((void)0)
+#define CARB_LOG_ERROR(...) (std::fprintf(stderr, __VA_ARGS__), std::fprintf(stderr, "\n"))
+
+#include "zed_interface_loader.hpp"
+#include "frame_recording.hpp"
+#include "streamer_registry.hpp"
+
+namespace
+{
+    using Clock = std::chrono::steady_clock;
+
+    enum class Pacing { ORIGINAL, FIXED, FAST };
+
+    struct Options {
+        std::string recording;
+        Pacing pacing{ Pacing::ORIGINAL };
+        double fps{ 0.0 };
+        int loops{ 1 };
+        int streamers{ 1 };
+        int port{ 30000 };
+        int transport_layer_mode{ 0 };
+        int serial_number{ 0 };
+        std::string library;
+    };
+
+    struct Result {
+        unsigned long long streamed{ 0 };
+        unsigned long long errors{ 0 };
+        double stream_call_ms{ 0.0 };
+    };
+
+    int usage()
+    {
+        std::fprintf(stderr, "Usage: zed_replay <recording> [--pacing original|fixed|fast] [--fps N] [--loops N] [--streamers N]\n"
+                             "                  [--port N] [--transport NETWORK|IPC|BOTH] [--serial N] [--library PATH]\n");
+        return 2;
+    }
+
+    bool parseOptions(int argc, char** argv, Options& options)
+    {
+        for (int i = 1; i < argc; i++) {
+            const std::string arg = argv[i];
+            const char* value = i + 1 < argc ? argv[i + 1] : nullptr;
+            if (arg.rfind("--", 0) != 0) {
+                if (!options.recording.empty())
+                    return false;
+                options.recording = arg;
+                continue;
+            }
+            if (!value)
+                return false;
+            i++;
+
+            const std::string text = value;
+            if (arg == "--pacing") {
+                if (text == "original") options.pacing = Pacing::ORIGINAL;
+                else if (text == "fixed") options.pacing = Pacing::FIXED;
+                else if (text == "fast") options.pacing = Pacing::FAST;
+                else return false;
+            } else if (arg == "--fps") {
+                options.fps = std::atof(value);
+            } else if (arg == "--loops") {
+                options.loops = std::atoi(value);
+            } else if (arg == "--streamers") {
+                options.streamers = std::atoi(value);
+            } else if (arg == "--port") {
+                options.port = std::atoi(value);
+            } else if (arg == "--transport") {
+                if (text == "NETWORK") options.transport_layer_mode = 0;
+                else if (text == "IPC") options.transport_layer_mode = 1;
+                else if (text == "BOTH") options.transport_layer_mode = 2;
+                else return false;
+            } else if (arg == "--serial") {
+                options.serial_number = std::atoi(value);
+            } else if (arg == "--library") {
+                options.library = text;
+            } else {
+                return false;
+            }
+        }
+        return !options.recording.empty() && options.loops > 0 && options.streamers > 0;
+    }
+
+    // Streams every loop of the recording, paced from start. Timestamps keep increasing across loops, each loop
+    // lasting the recording and one frame period.
+    Result replay(sl::ZedStreamer& zed_streamer, int streamer_id, sl::INPUT_FORMAT input_format,
+        const sl::FrameRecordingReader& reader, const Options& options, Clock::time_point start)
+    {
+        const auto& frames = reader.frames();
+        const int64_t first_ns = frames.front().entry->timestamp_ns;
+        const int64_t span_ns = frames.back().entry->timestamp_ns - first_ns;
+        const int recorded_fps = reader.header().fps;
+        const double fixed_fps = options.fps > 0.0 ? options.fps : (recorded_fps > 0 ? recorded_fps : 30.0);
+        const int64_t period_ns = static_cast<int64_t>(1e9 / fixed_fps);
+        const int64_t loop_ns = span_ns + period_ns;
+
+        Result result;
+        for (int loop = 0; loop < options.loops; loop++) {
+            for (size_t i = 0; i < frames.size(); i++) {
+                const sl::RecordedFrame& entry = *frames[i].entry;
+                const int64_t offset_ns = options.pacing == Pacing::FIXED ?
+                    (loop * static_cast<int64_t>(frames.size()) + static_cast<int64_t>(i)) * period_ns :
+                    loop * loop_ns + (entry.timestamp_ns - first_ns);
+
+                if (options.pacing != Pacing::FAST) {
+                    std::this_thread::sleep_until(start + std::chrono::nanoseconds(offset_ns));
+                }
+
+                const auto call_start = Clock::now();
+                const int status = zed_streamer.stream(input_format, streamer_id,
+                    const_cast<unsigned char*>(frames[i].left), const_cast<unsigned char*>(frames[i].right()),
+                    first_ns + offset_ns,
+                    entry.imu[0], entry.imu[1], entry.imu[2], entry.imu[3], entry.imu[4], entry.imu[5], entry.imu[6]);
+                result.stream_call_ms += std::chrono::duration<double, std::milli>(Clock::now() - call_start).count();
+                if (status < 0) {
+                    result.errors++;
+                } else {
+                    result.streamed++;
+                }
+            }
+        }
+        return result;
+    }
+
+    void printResult(const char* name, const Result& result, double elapsed)
+    {
+        const unsigned long long calls = result.streamed + result.errors;
+        std::printf("%-10s %10llu %8llu %10.1f %12.3f\n", name, result.streamed, result.errors, calls / elapsed,
+            calls ? result.stream_call_ms / calls : 0.0);
+    }
+}
+
+int main(int argc, char** argv)
+{
+    Options options;
+    if (!parseOptions(argc, argv, options))
+        return usage();
+
+    sl::FrameRecordingReader reader;
+    if (!reader.open(options.recording)) {
+        std::fprintf(stderr, "%s is not a ZED recording\n", options.recording.c_str());
+        return 1;
+    }
+    const sl::RecordingHeader& recording = reader.header();
+    const auto& frames = reader.frames();
+    if (frames.empty()) {
+        std::fprintf(stderr, "%s holds no frame\n", options.recording.c_str());
+        return 1;
+    }
+
+    sl::ZedStreamer zed_streamer;
+    if (!zed_streamer.load_lib(options.library.empty() ? sl::zedLibraryPath() : options.library) || !zed_streamer.isZEDSDKCompatible()) {
+        std::fprintf(stderr, "Cannot load a compatible ZED SDK\n");
+        return 1;
+    }
+    zed_streamer.load_api();
+
+    // The first streamer keeps the recorded serial number, the others get generated ones sharing its leading digits,
+    // which needs enough trailing digits to pick from
+    const int first_serial = options.serial_number > 0 ? options.serial_number : recording.serial_number;
+    if (options.streamers > 1 && first_serial < 100000) {
+        std::fprintf(stderr, "Serial number %d is too short to derive %d streamers from it, use --serial\n", first_serial, options.streamers);
+        return 1;
+    }
+    std::vector<int> serial_numbers = { first_serial };
+    std::unordered_set<int> used_serials;
+    const auto generated = sl::StreamerRegistry::generateSerialNumbers("zed_replay", serial_numbers, options.streamers - 1, used_serials);
+    serial_numbers.insert(serial_numbers.end(), generated.begin(), generated.end());
+
+    sl::StreamingParameters params;
+    params.image_width = recording.image_width;
+    params.image_height = recording.image_height;
+    params.fps = recording.fps;
+    params.input_format = static_cast<sl::INPUT_FORMAT>(recording.input_format);
+    params.alpha_channel_included = recording.alpha_channel_included != 0;
+    params.transport_layer_mode = options.transport_layer_mode;
+    params.verbose = 0;
+
+    int opened = 0;
+    for (; opened < options.streamers; opened++) {
+        params.serial_number = serial_numbers[opened];
+        params.port = static_cast<unsigned short>(options.port + 2 * opened);
+        if (zed_streamer.initStreamer(opened, &params) <= 0) {
+            std::fprintf(stderr, "Cannot initialize streamer %d (port %d, serial number %d)\n", opened, params.port, params.serial_number);
+            break;
+        }
+    }
+
+    const sl::RecordingHeader& header = reader.header();
+    const double span_s = (frames.back().entry->timestamp_ns - frames.front().entry->timestamp_ns) * 1e-9;
+    std::printf("Replaying %zu frames (%dx%d, %s, %.2f s) on %d streamer(s) from port %d, %d loop(s)\n", frames.size(),
+        header.image_width, header.image_height, header.stereo ? "stereo" : "mono", span_s, opened, options.port, options.loops);
+
+    std::vector<Result> results(opened);
+    std::vector<std::thread> threads;
+    const auto start = Clock::now();
+    for (int i = 0; i < opened; i++) {
+        threads.emplace_back([&, i] {
+            results[i] = replay(zed_streamer, i, params.input_format, reader, options, start);
+        });
+    }
+    for (auto& thread : threads) {
+        thread.join();
+    }
+    const double elapsed = std::chrono::duration<double>(Clock::now() - start).count();
+
+    for (int i = 0; i < opened; i++) {
+        zed_streamer.closeStreamer(i);
+    }
+    zed_streamer.destroyInstance();
+
+    std::printf("%-10s %10s %8s %10s %12s\n", "streamer", "streamed", "errors", "fps", "call ms");
+    Result total;
+    for (int i = 0; i < opened; i++) {
+        const std::string name = std::to_string(i);
+        printResult(name.c_str(), results[i], elapsed);
+        total.streamed += results[i].streamed;
+        total.errors += results[i].errors;
+        total.stream_call_ms += results[i].stream_call_ms;
+    }
+    if (opened > 1) {
+        printResult("total", total, elapsed);
+    }
+    return opened == options.streamers && total.errors == 0 ? 0 : 1;
+}